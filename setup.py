@@ -25,6 +25,9 @@ setup(
         "rich>=13.7.0",
         "numpy>=1.26.0",
         "reportlab>=4.0.0",
+        "bitarray>=2.8.0",
+        "crcmod>=1.7",
+        "numba>=0.59.0",
     ],
     extras_require={
         "charts": ["pyqtgraph>=0.13.0"],
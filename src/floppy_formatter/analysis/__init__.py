@@ -13,6 +13,7 @@ Submodules:
     signal_quality: Signal quality metrics (SNR, jitter, weak bits)
     head_alignment: Head alignment diagnostics
     forensics: Copy protection and format forensics
+    alignment: Cross-correlation alignment of flux captures
 """
 
 from floppy_formatter.analysis.scanner import (
@@ -148,6 +149,13 @@ from floppy_formatter.analysis.forensics import (
     DATA_MARK_DELETED,
 )
 
+from floppy_formatter.analysis.alignment import (
+    correlation_by_offset,
+    find_alignment_offset,
+    index_alignment_offset,
+    INDEX_ALIGNMENT_WINDOW,
+)
+
 __all__ = [
     # =========================================================================
     # Scanner (Phase 4)
@@ -289,4 +297,12 @@ __all__ = [
     "PC_DD_SECTORS",
     "DATA_MARK_NORMAL",
     "DATA_MARK_DELETED",
+
+    # =========================================================================
+    # Alignment
+    # =========================================================================
+    "correlation_by_offset",
+    "find_alignment_offset",
+    "index_alignment_offset",
+    "INDEX_ALIGNMENT_WINDOW",
 ]
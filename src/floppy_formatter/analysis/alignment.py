@@ -0,0 +1,218 @@
+"""
+Cross-correlation alignment of flux timing sequences.
+
+Multi-capture recovery and forensic comparison both need the offset (in
+transitions) at which two captures of the same track line up best. This
+module computes the correlation at every candidate offset in one pass
+using FFT cross-correlation and sliding-window sums, instead of
+recomputing a Pearson correlation per offset.
+
+Key Functions:
+    correlation_by_offset: Correlation of two sequences at each offset in a range
+    find_alignment_offset: Best alignment offset, optionally coarse-to-fine
+        and bounded around an index-pulse estimate
+    index_alignment_offset: Offset implied by the first index pulse of each capture
+"""
+
+import logging
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Offsets searched either side of the index-pulse estimate. Index pulses
+# agree to within a few transitions between revolutions of one drive.
+INDEX_ALIGNMENT_WINDOW = 200
+
+
+# =============================================================================
+# Correlation
+# =============================================================================
+
+def _sliding_sums(values: np.ndarray, length: int, count: int) -> np.ndarray:
+    """Sums of values[o:o + length] for o in range(count)."""
+    cumulative = np.concatenate(([0.0], np.cumsum(values[:length + count - 1])))
+    return cumulative[length:length + count] - cumulative[:count]
+
+
+def _cross_sums(sliding: np.ndarray, fixed: np.ndarray, count: int) -> np.ndarray:
+    """
+    Dot products of fixed with sliding[o:o + len(fixed)] for o in range(count).
+
+    Computed as one FFT cross-correlation; the transform is long enough
+    that no product wraps around.
+    """
+    length = len(fixed)
+    size = 1 << int(length + count - 1 + length - 1).bit_length()
+    spectrum = np.fft.rfft(sliding[:length + count - 1], size)
+    spectrum *= np.conj(np.fft.rfft(fixed, size))
+    return np.fft.irfft(spectrum, size)[:count]
+
+
+def _window_correlation(sum_x: np.ndarray, sum_xx: np.ndarray,
+                        sum_y: float, sum_yy: float,
+                        sum_xy: np.ndarray, length: int) -> np.ndarray:
+    """
+    Correlation from window sums, NaN where either window is constant.
+
+    Matches the existing alignment code: population covariance divided by
+    the product of sample standard deviations.
+    """
+    covariance = (sum_xy - sum_x * sum_y / length) / length
+    ss_x = sum_xx - sum_x * sum_x / length
+    ss_y = sum_yy - sum_y * sum_y / length
+
+    # Rounding leaves tiny residues for constant windows; treat those as zero
+    tiny_x = ss_x <= 1e-12 * np.maximum(sum_xx, 1e-300)
+    tiny_y = ss_y <= 1e-12 * max(sum_yy, 1e-300)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = covariance / np.sqrt(ss_x * ss_y / (length - 1) ** 2)
+    correlation[tiny_x | tiny_y] = np.nan
+    return correlation
+
+
+def correlation_by_offset(reference: Sequence[float], target: Sequence[float],
+                          max_offset: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Correlate two timing sequences at every offset in [-max_offset, max_offset].
+
+    A window of length min(len) - max_offset is compared at each offset.
+    For a positive offset o the window starts at reference[o] and
+    target[0]; for a negative offset it starts at reference[0] and
+    target[-o].
+
+    Args:
+        reference: Reference timing sequence
+        target: Timing sequence to align against the reference
+        max_offset: Largest offset to evaluate in either direction
+
+    Returns:
+        Tuple of (offsets, correlations). Correlation is NaN where a window
+        has no variation.
+    """
+    ref = np.asarray(reference, dtype=np.float64)
+    tgt = np.asarray(target, dtype=np.float64)
+    offsets = np.arange(-max_offset, max_offset + 1)
+
+    length = min(len(ref), len(tgt)) - max_offset
+    if length < 2:
+        return offsets, np.full(len(offsets), np.nan)
+
+    count = max_offset + 1
+
+    # Offsets >= 0: reference window slides, target window fixed
+    positive = _window_correlation(
+        _sliding_sums(ref, length, count), _sliding_sums(ref * ref, length, count),
+        float(tgt[:length].sum()), float(np.dot(tgt[:length], tgt[:length])),
+        _cross_sums(ref, tgt[:length], count), length
+    )
+
+    # Offsets <= 0: target window slides, reference window fixed
+    negative = _window_correlation(
+        _sliding_sums(tgt, length, count), _sliding_sums(tgt * tgt, length, count),
+        float(ref[:length].sum()), float(np.dot(ref[:length], ref[:length])),
+        _cross_sums(tgt, ref[:length], count), length
+    )
+
+    return offsets, np.concatenate((negative[:0:-1], positive))
+
+
+# =============================================================================
+# Offset Search
+# =============================================================================
+
+def find_alignment_offset(
+    reference: Sequence[float],
+    target: Sequence[float],
+    max_offset: int,
+    coarse_step: int = 1,
+    index_offset: Optional[int] = None,
+    index_window: int = INDEX_ALIGNMENT_WINDOW
+) -> Tuple[int, float]:
+    """
+    Find the offset that best aligns target with reference.
+
+    Offsets are visited in the same order as a direct search: every
+    coarse_step-th offset from -max_offset upwards, then each offset within
+    coarse_step of the best one. An offset only wins if its correlation is
+    strictly higher, and offsets with correlation <= 0 never win.
+
+    Args:
+        reference: Reference timing sequence
+        target: Timing sequence to align
+        max_offset: Largest offset to consider in either direction
+        coarse_step: Step of the coarse pass (1 = examine every offset)
+        index_offset: Offset implied by index pulses, if known. Only offsets
+                     within index_window of it are considered.
+        index_window: Search radius around index_offset
+
+    Returns:
+        Tuple of (best_offset, correlation). (0, 0.0) if nothing correlates.
+    """
+    offsets, correlations = correlation_by_offset(reference, target, max_offset)
+    correlations = np.where(np.isnan(correlations), -np.inf, correlations)
+
+    if index_offset is not None:
+        outside = np.abs(offsets - index_offset) > index_window
+        correlations[outside] = -np.inf
+
+    best_offset = 0
+    best_correlation = 0.0
+
+    # Coarse pass: first strictly greater value wins
+    coarse = correlations[::coarse_step]
+    if len(coarse) and coarse.max() > best_correlation:
+        i = int(np.argmax(coarse))
+        best_offset = int(offsets[i * coarse_step])
+        best_correlation = float(coarse[i])
+
+    # Fine pass around the coarse winner
+    if coarse_step > 1:
+        lo = max(-max_offset, best_offset - coarse_step) + max_offset
+        hi = min(max_offset, best_offset + coarse_step) + max_offset
+        fine = correlations[lo:hi + 1]
+        if len(fine) and fine.max() > best_correlation:
+            i = int(np.argmax(fine))
+            best_offset = int(offsets[lo + i])
+            best_correlation = float(fine[i])
+
+    return best_offset, best_correlation
+
+
+def index_alignment_offset(reference_samples: Sequence[int], reference_index: Sequence[int],
+                           target_samples: Sequence[int],
+                           target_index: Sequence[int]) -> Optional[int]:
+    """
+    Estimate the alignment offset from the first index pulse of each capture.
+
+    Args:
+        reference_samples: Reference flux intervals in sample ticks
+        reference_index: Reference index pulse positions in sample ticks
+        target_samples: Target flux intervals in sample ticks
+        target_index: Target index pulse positions in sample ticks
+
+    Returns:
+        Transition offset of the reference index relative to the target
+        index, or None if either capture has no index pulse
+    """
+    if len(reference_index) == 0 or len(target_index) == 0:
+        return None
+
+    ref_pos = np.searchsorted(np.cumsum(reference_samples), reference_index[0])
+    tgt_pos = np.searchsorted(np.cumsum(target_samples), target_index[0])
+    return int(ref_pos - tgt_pos)
+
+
+__all__ = [
+    'INDEX_ALIGNMENT_WINDOW',
+    'correlation_by_offset',
+    'find_alignment_offset',
+    'index_alignment_offset',
+]
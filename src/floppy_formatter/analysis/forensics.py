@@ -35,6 +35,8 @@ from typing import List, Optional, Dict, Tuple, TYPE_CHECKING, Any
 
 import numpy as np
 
+from floppy_formatter.analysis.alignment import find_alignment_offset
+
 if TYPE_CHECKING:
     from floppy_formatter.analysis.flux_analyzer import FluxCapture
 
@@ -838,11 +840,11 @@ def compare_flux_captures(
     # Align captures by finding best offset
     offset, correlation = _find_best_alignment(times1, times2)
 
-    # Apply offset for comparison
+    # Apply offset for comparison: times1[offset + k] lines up with times2[k]
     if offset > 0:
-        times2 = times2[offset:]
+        times1 = times1[offset:]
     elif offset < 0:
-        times1 = times1[-offset:]
+        times2 = times2[-offset:]
 
     # Compare aligned sequences
     min_len = min(len(times1), len(times2))
@@ -1311,46 +1313,10 @@ def _find_best_alignment(
         Tuple of (best_offset, correlation)
     """
     min_len = min(len(times1), len(times2))
-    if min_len < max_offset:
+    if min_len < max_offset or min_len - max_offset < 10:
         return 0, 0.0
 
-    best_offset = 0
-    best_correlation = 0.0
-
-    # Try different offsets
-    for offset in range(-max_offset, max_offset + 1):
-        # Apply offset
-        if offset >= 0:
-            t1 = times1[offset:offset + min_len - max_offset]
-            t2 = times2[:min_len - max_offset]
-        else:
-            t1 = times1[:min_len - max_offset]
-            t2 = times2[-offset:-offset + min_len - max_offset]
-
-        if len(t1) < 10 or len(t2) < 10:
-            continue
-
-        # Calculate correlation
-        try:
-            mean1 = statistics.mean(t1)
-            mean2 = statistics.mean(t2)
-            std1 = statistics.stdev(t1)
-            std2 = statistics.stdev(t2)
-
-            if std1 == 0 or std2 == 0:
-                continue
-
-            covariance = sum((a - mean1) * (b - mean2) for a, b in zip(t1, t2)) / len(t1)
-            correlation = covariance / (std1 * std2)
-
-            if correlation > best_correlation:
-                best_correlation = correlation
-                best_offset = offset
-
-        except statistics.StatisticsError:
-            continue
-
-    return best_offset, best_correlation
+    return find_alignment_offset(times1, times2, max_offset)
 
 
 # =============================================================================
@@ -592,7 +592,8 @@ def detect_weak_bits(
 
     Weak bits are detected by analyzing timing variance across multiple
     captures of the same track. Positions with high variance are flagged
-    as potentially unreliable.
+    as potentially unreliable. Statistics are computed column-wise over a
+    (captures x transitions) array.
 
     Args:
         captures: List of FluxCapture from multiple reads of same track
@@ -612,74 +613,73 @@ def detect_weak_bits(
         logger.warning("Need at least 2 captures for weak bit detection")
         return []
 
-    # Get all timings in microseconds
-    all_timings = [c.get_timings_microseconds() for c in captures]
-
-    # Find minimum length for alignment
-    min_len = min(len(t) for t in all_timings)
+    # Timings in microseconds, one row per capture, trimmed to the
+    # shortest capture so each column holds one transition from every read
+    min_len = min(len(c.raw_timings) if c.sample_rate else 0 for c in captures)
     if min_len < 100:
         return []
 
-    weak_bits = []
+    timings = np.empty((len(captures), min_len), dtype=np.float64)
+    for row, capture in zip(timings, captures, strict=True):
+        np.multiply(np.asarray(capture.raw_timings[:min_len], dtype=np.float64),
+                    1_000_000.0 / capture.sample_rate, out=row)
+
+    sample_count = len(captures)
     cylinder = captures[0].cylinder
     head = captures[0].head
 
-    # Calculate cumulative positions for bit position estimation
-    cumulative_pos = 0.0
+    # Column statistics: mean, cumulative position and coefficient of
+    # variation (normalized variance) at every transition
+    mean_timing = timings.mean(axis=0)
+    cumulative_pos = np.cumsum(mean_timing)
+    std_dev = timings.std(axis=0, ddof=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cv = np.where(mean_timing > 0, std_dev / mean_timing, 0.0)
 
-    # Analyze each position
-    for i in range(min_len):
-        # Get timings at this position across all captures
-        timings_at_pos = [t[i] for t in all_timings]
+    weak_bits = []
 
-        mean_timing = statistics.mean(timings_at_pos)
-        cumulative_pos += mean_timing
+    # Highest variance first; stable so equal variances keep track order
+    flagged = np.flatnonzero(cv >= variance_threshold)
+    flagged = flagged[np.argsort(-cv[flagged], kind='stable')]
 
-        # Calculate coefficient of variation (normalized variance)
-        if mean_timing > 0:
-            std_dev = statistics.stdev(timings_at_pos) if len(timings_at_pos) > 1 else 0
-            cv = std_dev / mean_timing
-        else:
-            cv = 0
-
-        # Check if variance exceeds threshold
-        if cv >= variance_threshold:
-            # Calculate timing spread
-            timing_spread_ns = (max(timings_at_pos) - min(timings_at_pos)) * 1000
-
-            # Classify weak bit type
-            weak_type = _classify_weak_bit_type(
-                timings_at_pos, mean_timing, cv, i, min_len
-            )
-
-            # Estimate bit position (assuming ~2us per bit cell for HD)
-            bit_position = int(cumulative_pos / HD_BIT_CELL_US)
-
-            # Estimate affected sector (18 sectors per track, ~12500 bits per sector)
-            bits_per_sector = 12500
-            affected_sector = (bit_position // bits_per_sector) + 1
-            if affected_sector > 18:
-                affected_sector = -1  # Unknown
-
-            # Confidence based on number of samples and consistency
-            confidence = min(1.0, len(timings_at_pos) / 10) * (1.0 - 1.0 / (1.0 + cv))
-
-            weak_bits.append(WeakBitPosition(
-                flux_index=i,
-                position_us=cumulative_pos,
-                bit_position=bit_position,
-                variance=cv,
-                confidence=confidence,
-                weak_type=weak_type,
-                timing_spread_ns=timing_spread_ns,
-                sample_count=len(timings_at_pos),
-                affected_sector=affected_sector,
-                cylinder=cylinder,
-                head=head,
-            ))
-
-    # Sort by variance (highest first)
-    weak_bits.sort(key=lambda wb: wb.variance, reverse=True)
+    for i in flagged.tolist():
+        timings_at_pos = timings[:, i].tolist()
+        variance = float(cv[i])
+        position_us = float(cumulative_pos[i])
+
+        # Calculate timing spread
+        timing_spread_ns = (max(timings_at_pos) - min(timings_at_pos)) * 1000
+
+        # Classify weak bit type
+        weak_type = _classify_weak_bit_type(
+            timings_at_pos, float(mean_timing[i]), variance, i, min_len
+        )
+
+        # Estimate bit position (assuming ~2us per bit cell for HD)
+        bit_position = int(position_us / HD_BIT_CELL_US)
+
+        # Estimate affected sector (18 sectors per track, ~12500 bits per sector)
+        bits_per_sector = 12500
+        affected_sector = (bit_position // bits_per_sector) + 1
+        if affected_sector > 18:
+            affected_sector = -1  # Unknown
+
+        # Confidence based on number of samples and consistency
+        confidence = min(1.0, sample_count / 10) * (1.0 - 1.0 / (1.0 + variance))
+
+        weak_bits.append(WeakBitPosition(
+            flux_index=i,
+            position_us=position_us,
+            bit_position=bit_position,
+            variance=variance,
+            confidence=confidence,
+            weak_type=weak_type,
+            timing_spread_ns=timing_spread_ns,
+            sample_count=sample_count,
+            affected_sector=affected_sector,
+            cylinder=cylinder,
+            head=head,
+        ))
 
     logger.debug("Detected %d weak bits from %d captures",
                  len(weak_bits), len(captures))
@@ -51,6 +51,7 @@ from floppy_formatter.core.sector_adapter import (
     # Cache management
     flush_flux_cache,
     invalidate_track_cache,
+    get_track_cache_stats,
     wake_up_device,
     reset_error_tracking,
 
@@ -199,6 +200,7 @@ __all__ = [
     # Cache management
     "flush_flux_cache",
     "invalidate_track_cache",
+    "get_track_cache_stats",
     "wake_up_device",
     "reset_error_tracking",
 
@@ -18,6 +18,7 @@ analysis and advanced recovery techniques.
 
 import time
 import logging
+import weakref
 from typing import Tuple, List, Dict, Optional, Any
 from dataclasses import dataclass
 
@@ -33,7 +34,9 @@ from floppy_formatter.hardware import (
     read_track_flux,
     write_track_flux,
     erase_track_flux,
+    add_track_write_listener,
 )
+from floppy_formatter.hardware.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +88,18 @@ _last_successful_read_time = 0.0
 # Track Cache for Efficient Operations
 # =============================================================================
 
+# Memory allowed for decoded tracks per device. An HD track read of 1.2
+# revolutions is ~300KB of flux plus 9KB of sector data, so this holds a
+# few dozen tracks.
+_TRACK_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Cached tracks older than this are read again. Every track written or
+# erased through a device is invalidated (see the write listener below),
+# so this only guards against changes the device does not see (such as a
+# disk swap).
+_TRACK_CACHE_MAX_AGE = 30.0
+
+
 @dataclass
 class TrackCache:
     """
@@ -99,7 +114,7 @@ class TrackCache:
     flux_data: Optional[FluxData]
     timestamp: float
 
-    def is_valid(self, max_age: float = 1.0) -> bool:
+    def is_valid(self, max_age: float = _TRACK_CACHE_MAX_AGE) -> bool:
         """Check if cache is still valid (not too old)."""
         return (time.time() - self.timestamp) < max_age
 
@@ -107,15 +122,90 @@ class TrackCache:
         """Get a sector from cache if available."""
         return self.sectors.get(sector_num)
 
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by the entry."""
+        size = sum(len(s.data) for s in self.sectors.values() if s.data)
+        if self.flux_data is not None:
+            size += self.flux_data.flux_array.nbytes
+        return size
+
+
+class TrackCacheLRU(LRUCache[TrackCache]):
+    """
+    Decoded tracks of one device, least recently used evicted first.
+
+    Keyed by (cylinder, head). Holds as many tracks as fit in max_bytes, so callers alternating
+    between tracks (FAT and data areas, both heads of a cylinder) are
+    served from memory instead of re-reading flux. Tracks older than
+    _TRACK_CACHE_MAX_AGE are read again.
+    """
+
+    def __init__(self, max_bytes: int = _TRACK_CACHE_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory allowed for cached tracks
+        """
+        super().__init__(max_bytes=max_bytes,
+                         size_of=lambda entry: entry.size_bytes,
+                         is_valid=lambda entry: entry.is_valid())
 
-# Global track cache (one track at a time)
-_track_cache: Optional[TrackCache] = None
 
+# Track caches per device; dropped with the device
+_track_caches: 'weakref.WeakKeyDictionary[Any, TrackCacheLRU]' = weakref.WeakKeyDictionary()
 
-def invalidate_track_cache() -> None:
-    """Invalidate the track cache (call after writes)."""
-    global _track_cache
-    _track_cache = None
+
+def _get_device_cache(device: Any) -> TrackCacheLRU:
+    """Get the track cache of a device, creating it on first use."""
+    cache = _track_caches.get(device)
+    if cache is None:
+        cache = _track_caches[device] = TrackCacheLRU()
+    return cache
+
+
+def invalidate_track_cache(device: Optional[Any] = None,
+                           cylinder: Optional[int] = None,
+                           head: Optional[int] = None) -> None:
+    """
+    Invalidate cached tracks.
+
+    Device writes and erases invalidate their track through a write
+    listener; call this to force fresh reads otherwise.
+
+    Args:
+        device: Device whose cache to invalidate, or None for all devices
+        cylinder: Cylinder of the track to drop; with head. If omitted,
+                 every track of the device is dropped.
+        head: Head of the track to drop
+    """
+    caches = [_track_caches.get(device)] if device is not None else list(_track_caches.values())
+    for cache in caches:
+        if cache is None:
+            continue
+        if cylinder is not None and head is not None:
+            cache.invalidate((cylinder, head))
+        else:
+            cache.clear()
+
+
+# Writes and erases by any caller (surface treatment, the format, restore
+# and image writers) drop the track from its device's cache
+add_track_write_listener(invalidate_track_cache)
+
+
+def get_track_cache_stats(device: Any) -> Dict[str, int]:
+    """
+    Get the track cache statistics of a device.
+
+    Args:
+        device: Device to report on
+
+    Returns:
+        Dictionary with hits, misses, evictions, entries (tracks) and bytes
+    """
+    return _get_device_cache(device).get_stats()
 
 
 def _cache_track(device: GreaseweazleDevice, cylinder: int, head: int,
@@ -132,14 +222,12 @@ def _cache_track(device: GreaseweazleDevice, cylinder: int, head: int,
     Returns:
         TrackCache with decoded sectors
     """
-    global _track_cache
+    cache = _get_device_cache(device)
 
     # Check if we already have this track cached
-    if (_track_cache is not None
-            and _track_cache.cylinder == cylinder
-            and _track_cache.head == head
-            and _track_cache.is_valid()):
-        return _track_cache
+    entry = cache.get((cylinder, head))
+    if entry is not None:
+        return entry
 
     # Read flux data from track
     flux_data = read_track_flux(device, cylinder, head, revolutions)
@@ -147,19 +235,26 @@ def _cache_track(device: GreaseweazleDevice, cylinder: int, head: int,
     # Decode sectors from flux
     decoded_sectors = decode_flux_data(flux_data)
 
-    # Build sector dictionary (sector number -> SectorData)
-    sectors_dict = {s.sector: s for s in decoded_sectors}
+    # Build sector dictionary (sector number -> best SectorData): good
+    # copies first, then corrected ones
+    sectors_dict: Dict[int, SectorData] = {}
+    for s in decoded_sectors:
+        existing = sectors_dict.get(s.sector)
+        if existing is None or (s.is_good, s.is_recovered) > (existing.is_good,
+                                                                existing.is_recovered):
+            sectors_dict[s.sector] = s
 
     # Create and store cache
-    _track_cache = TrackCache(
+    entry = TrackCache(
         cylinder=cylinder,
         head=head,
         sectors=sectors_dict,
         flux_data=flux_data,
         timestamp=time.time()
     )
+    cache.put((cylinder, head), entry)
 
-    return _track_cache
+    return entry
 
 
 # =============================================================================
@@ -214,8 +309,8 @@ def read_sector(device: GreaseweazleDevice, cylinder: int, head: int,
             _consecutive_errors += 1
             return (False, None, ERROR_SECTOR_NOT_FOUND)
 
-        # Check if sector was decoded successfully
-        if not sector_data.is_good:
+        # Check if sector was decoded successfully; corrected data is usable
+        if not sector_data.is_recovered:
             # Sector has errors (CRC failure, etc.)
             logger.debug(
                 "read_sector: sector %d has status %s",
@@ -229,6 +324,12 @@ def read_sector(device: GreaseweazleDevice, cylinder: int, head: int,
             else:
                 return (False, None, ERROR_READ_FAULT)
 
+        if sector_data.is_corrected:
+            logger.debug(
+                "read_sector: sector %d recovered by correction (%d bits)",
+                sector, sector_data.corrected_bits
+            )
+
         # Success
         _consecutive_errors = 0
         _last_successful_read_time = time.time()
@@ -295,6 +396,8 @@ def read_track(device: GreaseweazleDevice, cylinder: int, head: int,
             - 'success': True if read succeeded
             - 'data': Sector data (bytes) if successful, None if failed
             - 'error': Error code
+            - 'corrected': True if the data only passed CRC after
+              correction (successful reads only)
     """
     results = []
     success_count = 0
@@ -318,12 +421,13 @@ def read_track(device: GreaseweazleDevice, cylinder: int, head: int,
     for sector_num in range(1, geometry.sectors_per_track + 1):
         sector_data = track_cache.get_sector(sector_num)
 
-        if sector_data is not None and sector_data.is_good:
+        if sector_data is not None and sector_data.is_recovered:
             results.append({
                 'sector': sector_num,
                 'success': True,
                 'data': sector_data.data,
-                'error': ERROR_SUCCESS
+                'error': ERROR_SUCCESS,
+                'corrected': sector_data.is_corrected,
             })
             success_count += 1
         elif sector_data is not None:
@@ -383,7 +487,7 @@ def read_sector_multiread(device: GreaseweazleDevice, cylinder: int, head: int,
                  cylinder, head, sector, max_attempts)
 
     # Invalidate cache since we need fresh reads
-    invalidate_track_cache()
+    invalidate_track_cache(device, cylinder, head)
 
     successful_reads = []
     last_error = ERROR_CRC
@@ -413,7 +517,7 @@ def read_sector_multiread(device: GreaseweazleDevice, cylinder: int, head: int,
                     # Find our target sector
                     for s in decoded:
                         if s.sector == sector:
-                            if s.is_good:
+                            if s.is_recovered:
                                 successful_reads.append(s.data)
                             elif s.data and len(s.data) == bytes_per_sector:
                                 # Even bad CRC data is useful for voting
@@ -538,9 +642,6 @@ def write_sector(device: GreaseweazleDevice, cylinder: int, head: int,
         flux_data = encode_sectors_to_flux(cylinder, head, sectors)
         write_track_flux(device, cylinder, head, flux_data, erase_first=True)
 
-        # Invalidate cache since track was modified
-        invalidate_track_cache()
-
         _consecutive_errors = 0
         _last_activity_time = time.time()
 
@@ -608,9 +709,6 @@ def write_track(device: GreaseweazleDevice, cylinder: int, head: int,
         flux_data = encode_sectors_to_flux(cylinder, head, sectors)
         write_track_flux(device, cylinder, head, flux_data, erase_first=True)
 
-        # Invalidate cache
-        invalidate_track_cache()
-
         # Build results
         results = []
         for sector_num, data in sector_data_list:
@@ -674,9 +772,6 @@ def write_track_pattern(device: GreaseweazleDevice, cylinder: int, head: int,
         flux_data = encode_sectors_to_flux(cylinder, head, sectors)
         write_track_flux(device, cylinder, head, flux_data, erase_first=True)
 
-        # Invalidate cache
-        invalidate_track_cache()
-
         # Build results
         results = []
         for sector_num in range(1, geometry.sectors_per_track + 1):
@@ -741,9 +836,6 @@ def format_track_low_level(
         flux_data = encode_sectors_to_flux(cylinder, head, sectors)
         write_track_flux(device, cylinder, head, flux_data, erase_first=False)
 
-        # Invalidate cache
-        invalidate_track_cache()
-
         # Verify by reading back
         # Re-read the track and check for errors
         verify_cache = _cache_track(device, cylinder, head)
@@ -785,13 +877,11 @@ def flush_flux_cache(device: GreaseweazleDevice) -> None:
     invalidation.
 
     Args:
-        device: Connected GreaseweazleDevice instance (not used, but
-                kept for interface compatibility)
+        device: Connected GreaseweazleDevice instance whose cached
+                tracks are dropped
     """
-    global _track_cache
-
     logger.debug("flush_flux_cache: invalidating track cache")
-    _track_cache = None
+    invalidate_track_cache(device)
 
 
 def wake_up_device(device: GreaseweazleDevice) -> bool:
@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QCheckBox,
     QSpinBox,
+    QDoubleSpinBox,
     QComboBox,
     QFrame,
     QLineEdit,
@@ -75,12 +76,18 @@ class BatchVerifyConfig:
         disk_count: Number of disks to verify
         disks: List of disk info objects
         use_serial_numbers: Whether serials are being used
+        analysis_depth: Analysis depth (Quick/Standard/Thorough/Forensic)
+        early_decision: Stop verifying a disk once its grade is decided
+        decision_confidence: Confidence required for an early grade
     """
     batch_name: str = "Batch Verification"
     brand: FloppyBrand = FloppyBrand.GENERIC
     disk_count: int = 1
     disks: List[FloppyDiskInfo] = field(default_factory=list)
     use_serial_numbers: bool = False
+    analysis_depth: str = "Standard"
+    early_decision: bool = False
+    decision_confidence: float = 0.99
 
 
 # =============================================================================
@@ -238,6 +245,41 @@ class BatchVerifyConfigDialog(QDialog):
 
         layout.addWidget(serial_group)
 
+        # Verification group
+        verify_group = QGroupBox("Verification")
+        verify_layout = QVBoxLayout(verify_group)
+        verify_layout.setSpacing(8)
+
+        self._early_decision_check = QCheckBox("Stop each disk once its grade is decided")
+        verify_layout.addWidget(self._early_decision_check)
+
+        # Decision confidence
+        confidence_row = QHBoxLayout()
+        confidence_row.setSpacing(12)
+        confidence_label = QLabel("Decision Confidence:")
+        confidence_label.setMinimumWidth(100)
+        confidence_row.addWidget(confidence_label)
+
+        self._confidence_spin = QDoubleSpinBox()
+        self._confidence_spin.setRange(80.0, 99.9)
+        self._confidence_spin.setDecimals(1)
+        self._confidence_spin.setSingleStep(0.5)
+        self._confidence_spin.setSuffix("%")
+        self._confidence_spin.setValue(BatchVerifyConfig.decision_confidence * 100)
+        self._confidence_spin.setMinimumWidth(80)
+        self._confidence_spin.setToolTip(
+            "Confidence that a disk's grade will not change if the remaining "
+            "tracks are read (80-99.9%)"
+        )
+        self._confidence_spin.setEnabled(False)
+        confidence_row.addWidget(self._confidence_spin)
+        confidence_row.addStretch()
+        verify_layout.addLayout(confidence_row)
+
+        self._update_early_decision_tooltip()
+
+        layout.addWidget(verify_group)
+
         # Spacer
         layout.addStretch()
 
@@ -317,19 +359,21 @@ class BatchVerifyConfigDialog(QDialog):
                 background-color: #0e639c;
                 border-color: #0e639c;
             }
-            QSpinBox {
+            QSpinBox, QDoubleSpinBox {
                 background-color: #3a3d41;
                 color: #cccccc;
                 border: 1px solid #6c6c6c;
                 border-radius: 4px;
                 padding: 4px 8px;
             }
-            QSpinBox::up-button, QSpinBox::down-button {
+            QSpinBox::up-button, QSpinBox::down-button,
+            QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
                 background-color: #4e5157;
                 border: none;
                 width: 20px;
             }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+            QSpinBox::up-button:hover, QSpinBox::down-button:hover,
+            QDoubleSpinBox::up-button:hover, QDoubleSpinBox::down-button:hover {
                 background-color: #5a5d63;
             }
             QComboBox {
@@ -406,6 +450,16 @@ class BatchVerifyConfigDialog(QDialog):
         """Connect widget signals."""
         self._disk_count_spin.valueChanged.connect(self._update_serial_inputs)
         self._use_serials_check.toggled.connect(self._on_use_serials_toggled)
+        self._early_decision_check.toggled.connect(self._confidence_spin.setEnabled)
+        self._confidence_spin.valueChanged.connect(self._update_early_decision_tooltip)
+
+    def _update_early_decision_tooltip(self) -> None:
+        """Show the configured decision confidence in the early decision tooltip."""
+        self._early_decision_check.setToolTip(
+            "Read tracks spread across the disk first and stop as soon as the "
+            "remaining tracks can no longer change the grade "
+            f"({self._confidence_spin.value():g}% confidence)."
+        )
 
     def _on_use_serials_toggled(self, checked: bool) -> None:
         """Handle use serial numbers checkbox toggle."""
@@ -490,6 +544,8 @@ class BatchVerifyConfigDialog(QDialog):
             disk_count=disk_count,
             disks=disks,
             use_serial_numbers=self._use_serials_check.isChecked(),
+            early_decision=self._early_decision_check.isChecked(),
+            decision_confidence=self._confidence_spin.value() / 100,
         )
 
     def set_config(self, config: BatchVerifyConfig) -> None:
@@ -516,6 +572,9 @@ class BatchVerifyConfigDialog(QDialog):
             if i < len(self._serial_inputs) and disk_info.serial_number:
                 self._serial_inputs[i].setText(disk_info.serial_number)
 
+        self._early_decision_check.setChecked(config.early_decision)
+        self._confidence_spin.setValue(config.decision_confidence * 100)
+
 
 def show_batch_verify_config_dialog(
     parent: Optional[QWidget] = None
@@ -13,7 +13,7 @@ Phase 7: Analytics Dashboard (integrated)
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum, auto
 
 from PyQt6.QtWidgets import (
@@ -475,6 +475,10 @@ class MainWindow(QMainWindow):
         self._last_operation_type: Optional[str] = None  # "scan", "format", "restore", "analyze"
         self._disk_health: Optional[int] = None
 
+        # Track last reported by the running scan or analysis; sweeps
+        # start wherever the head is, so progress alone does not give it
+        self._progress_track: Tuple[int, int] = (0, 0)
+
         # Worker and thread for background operations
         self._scan_worker: Optional[ScanWorker] = None
         self._scan_thread: Optional[QThread] = None
@@ -1092,6 +1096,7 @@ class MainWindow(QMainWindow):
         # Reset scan tracking counters for Progress tab
         self._scan_good_count = 0
         self._scan_bad_count = 0
+        self._progress_track = (0, 0)
 
         # Reset sector map to pending state (no animation for instant visual update)
         total_sectors = self._geometry.total_sectors
@@ -1164,6 +1169,7 @@ class MainWindow(QMainWindow):
         """Handle track scan completion."""
         logger.debug("Track scanned: cyl=%d, head=%d, good=%d, bad=%d",
                      cylinder, head, track_result.good_count, track_result.bad_count)
+        self._progress_track = (cylinder, head)
 
         # Track cumulative sector counts for Progress tab
         if not hasattr(self, '_scan_good_count'):
@@ -1332,12 +1338,9 @@ class MainWindow(QMainWindow):
         # Update operation toolbar progress bar (now a no-op, kept for compatibility)
         self._operation_toolbar.set_progress(progress)
 
-        # Update Progress tab with live progress
-        # Calculate current position from progress percentage
-        total_physical_tracks = self._geometry.cylinders * self._geometry.heads
-        current_physical_track = int((progress / 100) * total_physical_tracks)
-        current_head = current_physical_track % 2
-        current_cylinder = current_physical_track // 2
+        # Update Progress tab with live progress at the track last
+        # reported, which need not follow the percentage
+        current_cylinder, current_head = self._progress_track
 
         self._analytics_panel.update_progress(progress)
         self._analytics_panel.update_progress_track(current_cylinder, current_head)
@@ -1905,6 +1908,7 @@ class MainWindow(QMainWindow):
     def _start_analyze_operation(self) -> None:
         """Start the analyze operation with worker thread."""
         self._cleanup_analyze_worker()
+        self._progress_track = (0, 0)
 
         # Clear analytics tabs from previous operations
         self._analytics_panel.clear_overview()
@@ -2003,6 +2007,7 @@ class MainWindow(QMainWindow):
         """Handle track analysis completion."""
         logger.debug("Track analyzed: cyl=%d, head=%d, grade=%s",
                      cylinder, head, result.grade)
+        self._progress_track = (cylinder, head)
 
         track_number = cylinder * 2 + head
         start_sector = track_number * self._geometry.sectors_per_track
@@ -2142,12 +2147,9 @@ class MainWindow(QMainWindow):
         # Update operation toolbar progress bar (now a no-op, kept for compatibility)
         self._operation_toolbar.set_progress(progress)
 
-        # Update Progress tab with live progress
-        # Calculate current position from progress percentage
-        total_physical_tracks = self._geometry.cylinders * self._geometry.heads
-        current_physical_track = int((progress / 100) * total_physical_tracks)
-        current_head = current_physical_track % 2
-        current_cylinder = current_physical_track // 2
+        # Update Progress tab with live progress at the track last
+        # reported, which need not follow the percentage
+        current_cylinder, current_head = self._progress_track
 
         self._analytics_panel.update_progress(progress)
         self._analytics_panel.update_progress_track(current_cylinder, current_head)
@@ -4197,6 +4199,9 @@ class MainWindow(QMainWindow):
             disk_info=disk_info,
             analysis_depth=self._batch_config.analysis_depth,
             session=self._active_session,
+            early_decision=self._batch_config.early_decision,
+            decision_confidence=self._batch_config.decision_confidence,
+            priority_tracks=self._batch_weak_tracks(),
         )
         self._batch_verify_thread = QThread()
         self._batch_verify_worker.moveToThread(self._batch_verify_thread)
@@ -4211,6 +4216,16 @@ class MainWindow(QMainWindow):
 
         self._batch_verify_thread.start()
 
+    def _batch_weak_tracks(self) -> List[Tuple[int, int]]:
+        """Tracks with errors on earlier disks of the batch, most frequent first."""
+        counts: Dict[Tuple[int, int], int] = {}
+        for result in self._batch_results:
+            for track in result.track_results:
+                if track.has_errors:
+                    key = (track.cylinder, track.head)
+                    counts[key] = counts.get(key, 0) + 1
+        return sorted(counts, key=lambda key: -counts[key])
+
     def _on_disk_verified(self, result: SingleDiskResult) -> None:
         """Handle single disk verification completion."""
         self._batch_results.append(result)
@@ -104,6 +104,14 @@ from floppy_formatter.gui.workers.batch_verify_worker import (
     DiskGrade,
 )
 
+# Track pipeline
+from floppy_formatter.gui.workers.track_pipeline import (
+    TrackPipeline,
+    TrackOutcome,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_DECODE_WORKERS,
+)
+
 
 __all__ = [
     # Base workers
@@ -181,4 +189,10 @@ __all__ = [
     'SingleDiskResult',
     'BatchVerificationResult',
     'DiskGrade',
+
+    # Track pipeline
+    'TrackPipeline',
+    'TrackOutcome',
+    'DEFAULT_PIPELINE_DEPTH',
+    'DEFAULT_DECODE_WORKERS',
 ]
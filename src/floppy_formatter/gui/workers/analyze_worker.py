@@ -10,14 +10,16 @@ Updated Phase 3: Session-aware analysis with timing parameters
 
 import logging
 import time
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Dict, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
 
 from floppy_formatter.gui.workers.base_worker import GreaseweazleWorker
+from floppy_formatter.gui.workers.track_pipeline import TrackPipeline
 
 if TYPE_CHECKING:
     from floppy_formatter.hardware import GreaseweazleDevice
@@ -25,7 +27,7 @@ if TYPE_CHECKING:
     from floppy_formatter.core.session import DiskSession
     from floppy_formatter.analysis.flux_analyzer import TimingStatistics
     from floppy_formatter.analysis.signal_quality import TrackQuality
-    # FluxCapture imported at runtime in run() method
+    # FluxCapture imported at runtime in _analyze_track()
 
 logger = logging.getLogger(__name__)
 
@@ -295,14 +297,6 @@ class AnalyzeWorker(GreaseweazleWorker):
         Analyzes all tracks according to configuration, building
         a comprehensive disk quality assessment.
         """
-        from floppy_formatter.hardware import read_track_flux
-        from floppy_formatter.analysis.flux_analyzer import (
-            FluxCapture, analyze_flux_timing, detect_encoding_type,
-        )
-        from floppy_formatter.analysis.signal_quality import (
-            grade_track_quality,
-        )
-
         start_time = time.time()
 
         # Initialize result
@@ -332,57 +326,30 @@ class AnalyzeWorker(GreaseweazleWorker):
         quality_scores = []
         encoding_counts: Dict[str, int] = {}
 
-        # Analyze each track
+        # Analyze each track, capturing the next while the last is analyzed
+        pipeline = TrackPipeline(self._capture_track, self._analyze_track,
+                                 is_cancelled=self.is_cancelled)
         analyzed_count = 0
-        for cylinder, head in tracks_to_analyze:
-            if self._cancelled:
-                logger.info("Analysis cancelled at track %d/%d", cylinder, head)
-                break
-
-            track_start = time.time()
-
-            # Ensure drive is still selected (safety measure for long analysis)
-            # motor_on() re-selects drive at hardware level and returns quickly if already on
-            self._device.motor_on()
-
-            # Seek and capture flux
-            self._device.seek(cylinder, head)
-            revolutions = self._config.capture_revolutions
-            if self._config.depth == AnalysisDepth.COMPREHENSIVE:
-                revolutions = max(3, revolutions)
-
-            flux_data = read_track_flux(self._device, cylinder, head, revolutions=revolutions)
-            capture = FluxCapture.from_flux_data(flux_data)
-            capture.cylinder = cylinder
-            capture.head = head
-
-            # Save flux if configured
-            if self._config.save_flux:
-                self._flux_cache[(cylinder, head)] = capture
-
-            # Initialize track result
-            track_result = TrackAnalysisResult(cylinder=cylinder, head=head)
-
-            # Perform analysis based on enabled components
-            try:
-                # Flux timing analysis
-                if self._config.includes(AnalysisComponent.FLUX_TIMING):
-                    timing_stats = analyze_flux_timing(capture)
-                    track_result.timing_stats = timing_stats
-                    track_result.peak_positions = timing_stats.peak_positions
-                    track_result.bit_cell_us = timing_stats.bit_cell_estimate_us
-
-                # Encoding detection
-                if self._config.includes(AnalysisComponent.ENCODING):
-                    encoding, confidence = detect_encoding_type(capture)
-                    track_result.encoding_type = encoding.name
-                    track_result.encoding_confidence = confidence
-                    encoding_counts[encoding.name] = encoding_counts.get(encoding.name, 0) + 1
-
-                # Signal quality analysis
-                if self._config.includes(AnalysisComponent.SIGNAL_QUALITY):
-                    quality = grade_track_quality(capture)
-                    track_result.quality = quality
+        with closing(pipeline.run(tracks_to_analyze)) as outcomes:
+            for outcome in outcomes:
+                if self._cancelled:
+                    logger.info("Analysis cancelled at track %d/%d",
+                                outcome.cylinder, outcome.head)
+                    break
+
+                cylinder, head = outcome.cylinder, outcome.head
+                capture, track_result, encoding_name = outcome.unwrap()
+                track_result.analysis_time_ms = outcome.elapsed_seconds * 1000
+
+                # Save flux if configured
+                if self._config.save_flux:
+                    self._flux_cache[(cylinder, head)] = capture
+
+                if encoding_name is not None:
+                    encoding_counts[encoding_name] = encoding_counts.get(encoding_name, 0) + 1
+
+                if track_result.quality is not None:
+                    quality = track_result.quality
                     snr_values.append(quality.snr_db)
                     jitter_values.append(quality.jitter_rms_ns)
                     quality_scores.append(quality.score)
@@ -390,58 +357,21 @@ class AnalyzeWorker(GreaseweazleWorker):
                     # Emit quality update
                     self.flux_quality_update.emit(cylinder, head, quality.score)
 
-                # Weak bit detection (comprehensive mode only)
-                if (self._config.includes(AnalysisComponent.WEAK_BITS) and
-                        self._config.depth == AnalysisDepth.COMPREHENSIVE):
-                    # Would need multiple captures for proper weak bit detection
-                    # For now, estimate from jitter metrics
-                    if track_result.quality:
-                        track_result.weak_bit_count = int(
-                            track_result.quality.jitter_rms_ns / 50
-                        )
-
-                # Forensics analysis (copy protection and format analysis)
-                if self._config.includes(AnalysisComponent.FORENSICS):
-                    from floppy_formatter.analysis.forensics import (
-                        detect_copy_protection, analyze_format_type
-                    )
-
-                    # Analyze copy protection
-                    protection_result = detect_copy_protection(capture)
-                    track_result.copy_protection = protection_result
+                # Store result
+                result.track_results.append(track_result)
 
-                    # Analyze format type
-                    format_result = analyze_format_type(capture)
-                    track_result.format_analysis = format_result
+                # Emit track result
+                self.track_analyzed.emit(cylinder, head, track_result)
 
-                    logger.debug(
-                        "Forensics C%d:H%d: protected=%s, format=%s",
-                        cylinder, head,
-                        protection_result.is_protected,
-                        format_result.format_type.name
-                    )
+                # Update progress
+                analyzed_count += 1
+                progress = int((analyzed_count / total_to_analyze) * 100)
+                self.progress.emit(progress)
 
-            except Exception as e:
-                logger.warning("Analysis failed for C%d:H%d: %s", cylinder, head, e)
-                track_result.encoding_type = "ERROR"
-
-            track_result.analysis_time_ms = (time.time() - track_start) * 1000
-
-            # Store result
-            result.track_results.append(track_result)
-
-            # Emit track result
-            self.track_analyzed.emit(cylinder, head, track_result)
-
-            # Update progress
-            analyzed_count += 1
-            progress = int((analyzed_count / total_to_analyze) * 100)
-            self.progress.emit(progress)
-
-            logger.debug(
-                "Track C%d:H%d analyzed: grade=%s, %.1f ms",
-                cylinder, head, track_result.grade, track_result.analysis_time_ms
-            )
+                logger.debug(
+                    "Track C%d:H%d analyzed: grade=%s, %.1f ms",
+                    cylinder, head, track_result.grade, track_result.analysis_time_ms
+                )
 
         # Calculate overall statistics
         result.tracks_analyzed = analyzed_count
@@ -522,6 +452,121 @@ class AnalyzeWorker(GreaseweazleWorker):
         self.analysis_complete.emit(result)
         self.finished.emit()
 
+    def _capture_track(self, cylinder: int, head: int) -> Any:
+        """
+        Read a track's flux. Runs on the pipeline's capture thread.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+
+        Returns:
+            FluxData read from the track
+        """
+        from floppy_formatter.hardware import read_track_flux
+
+        # Ensure drive is still selected (safety measure for long analysis)
+        # motor_on() re-selects drive at hardware level and returns quickly if already on
+        self._device.motor_on()
+
+        # Seek and capture flux
+        self._device.seek(cylinder, head)
+        revolutions = self._config.capture_revolutions
+        if self._config.depth == AnalysisDepth.COMPREHENSIVE:
+            revolutions = max(3, revolutions)
+
+        return read_track_flux(self._device, cylinder, head, revolutions=revolutions)
+
+    def _analyze_track(self, cylinder: int, head: int,
+                       flux_data: Any) -> Tuple[Any, TrackAnalysisResult, Optional[str]]:
+        """
+        Analyze a captured track.
+
+        Runs on a pipeline thread, so it must not touch the device or emit
+        signals. Failures of individual analyses are logged and mark the
+        track's encoding as ERROR.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            flux_data: FluxData read from the track
+
+        Returns:
+            Tuple of (FluxCapture, TrackAnalysisResult, detected encoding
+            name or None if encoding detection did not run)
+        """
+        from floppy_formatter.analysis.flux_analyzer import (
+            FluxCapture, analyze_flux_timing, detect_encoding_type,
+        )
+        from floppy_formatter.analysis.signal_quality import (
+            grade_track_quality,
+        )
+
+        capture = FluxCapture.from_flux_data(flux_data)
+        capture.cylinder = cylinder
+        capture.head = head
+
+        # Initialize track result
+        track_result = TrackAnalysisResult(cylinder=cylinder, head=head)
+        encoding_name = None
+
+        # Perform analysis based on enabled components
+        try:
+            # Flux timing analysis
+            if self._config.includes(AnalysisComponent.FLUX_TIMING):
+                timing_stats = analyze_flux_timing(capture)
+                track_result.timing_stats = timing_stats
+                track_result.peak_positions = timing_stats.peak_positions
+                track_result.bit_cell_us = timing_stats.bit_cell_estimate_us
+
+            # Encoding detection
+            if self._config.includes(AnalysisComponent.ENCODING):
+                encoding, confidence = detect_encoding_type(capture)
+                track_result.encoding_type = encoding.name
+                track_result.encoding_confidence = confidence
+                encoding_name = encoding.name
+
+            # Signal quality analysis
+            if self._config.includes(AnalysisComponent.SIGNAL_QUALITY):
+                track_result.quality = grade_track_quality(capture)
+
+            # Weak bit detection (comprehensive mode only)
+            if (self._config.includes(AnalysisComponent.WEAK_BITS) and
+                    self._config.depth == AnalysisDepth.COMPREHENSIVE):
+                # Would need multiple captures for proper weak bit detection
+                # For now, estimate from jitter metrics
+                if track_result.quality:
+                    track_result.weak_bit_count = int(
+                        track_result.quality.jitter_rms_ns / 50
+                    )
+
+            # Forensics analysis (copy protection and format analysis)
+            if self._config.includes(AnalysisComponent.FORENSICS):
+                from floppy_formatter.analysis.forensics import (
+                    detect_copy_protection, analyze_format_type
+                )
+
+                # Analyze copy protection
+                protection_result = detect_copy_protection(capture)
+                track_result.copy_protection = protection_result
+
+                # Analyze format type
+                format_result = analyze_format_type(capture)
+                track_result.format_analysis = format_result
+
+                logger.debug(
+                    "Forensics C%d:H%d: protected=%s, format=%s",
+                    cylinder, head,
+                    protection_result.is_protected,
+                    format_result.format_type.name
+                )
+
+        except Exception as e:
+            logger.warning("Analysis failed for C%d:H%d: %s", cylinder, head, e)
+            track_result.encoding_type = "ERROR"
+
+        return capture, track_result, encoding_name
+
     def _get_tracks_to_analyze(self) -> List[tuple]:
         """
         Get list of tracks to analyze based on depth.
@@ -538,19 +583,11 @@ class AnalyzeWorker(GreaseweazleWorker):
                 0, cylinders // 4, cylinders // 2,
                 3 * cylinders // 4, cylinders - 1
             ]
-            tracks = []
-            for cyl in key_cylinders:
-                for head in range(heads):
-                    tracks.append((cyl, head))
-            return tracks
+            return self._track_scheduler.sweep(key_cylinders, heads)
 
         else:
             # All tracks for STANDARD and COMPREHENSIVE
-            return [
-                (cyl, head)
-                for cyl in range(cylinders)
-                for head in range(heads)
-            ]
+            return self._track_scheduler.sweep(range(cylinders), heads)
 
     def _score_to_grade(self, score: float) -> str:
         """Convert numeric score to letter grade."""
@@ -18,6 +18,8 @@ from typing import Optional, TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from floppy_formatter.hardware.track_scheduler import TrackScheduler
+
 if TYPE_CHECKING:
     from floppy_formatter.hardware import GreaseweazleDevice
     from floppy_formatter.core.session import DiskSession
@@ -241,6 +243,9 @@ class GreaseweazleWorker(QObject):
         self._running = False
         self._motor_was_on = False
 
+        # Orders track work from the head's current position
+        self._track_scheduler = TrackScheduler(device)
+
         # Create codec adapter if session is provided
         if session is not None:
             self._init_codec_adapter(session)
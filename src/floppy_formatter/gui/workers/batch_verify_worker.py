@@ -9,15 +9,18 @@ Updated: Now uses CodecAdapter for fast, accurate sector decoding
 """
 
 import logging
+import math
 import time
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Iterable, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
 
 from floppy_formatter.gui.workers.base_worker import GreaseweazleWorker
+from floppy_formatter.gui.workers.track_pipeline import TrackPipeline
 from floppy_formatter.gui.dialogs.batch_verify_config_dialog import (
     FloppyDiskInfo, BatchVerifyConfig
 )
@@ -30,6 +33,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Confidence that an early grade is the one a full read would give
+DEFAULT_DECISION_CONFIDENCE = 0.99
+
+# Sampled tracks needed before the grade may be decided statistically.
+# Grades that can no longer change whatever the unread tracks hold are
+# decided at any point.
+MIN_SAMPLED_TRACKS = 16
+
+# Jeffreys prior on the fraction of tracks with errors
+_PRIOR_BAD = 0.5
+_PRIOR_CLEAN = 0.5
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -81,7 +101,8 @@ class TrackVerifyResult:
         good_sectors: Number of sectors with good CRC
         bad_sectors: Number of sectors with CRC errors
         missing_sectors: Number of sectors not found
-        weak_sectors: Number of weak/marginal sectors
+        weak_sectors: Number of weak/marginal sectors, including sectors
+                     that only read after bit correction or fusion
         total_expected: Expected number of sectors
         sector_errors: Dict mapping sector number to error description
         verify_time_ms: Time taken to verify this track
@@ -129,6 +150,9 @@ class SingleDiskResult:
         recommendations: List of recommendations
         skipped: Whether the disk was skipped
         error_message: Error message if verification failed
+        tracks_skipped: Tracks left unread because the grade was decided
+        grade_confidence: Confidence in the grade; 1.0 when every track
+                         was read or the grade could not change
     """
     disk_info: FloppyDiskInfo
     grade: DiskGrade = DiskGrade.FAILED
@@ -146,6 +170,8 @@ class SingleDiskResult:
     recommendations: List[str] = field(default_factory=list)
     skipped: bool = False
     error_message: Optional[str] = None
+    tracks_skipped: int = 0
+    grade_confidence: float = 1.0
 
     @property
     def is_passing(self) -> bool:
@@ -245,6 +271,220 @@ class BatchVerificationResult:
         )
 
 
+# =============================================================================
+# Sequential Grading
+# =============================================================================
+
+def sequential_track_order(
+    cylinders: int,
+    heads: int,
+    priority: Iterable[Tuple[int, int]] = ()
+) -> List[Tuple[int, int]]:
+    """
+    Order every track so that any prefix samples the whole disk.
+
+    Priority tracks (those weak on earlier disks) come first. The
+    outermost and innermost cylinders follow, then the cylinders halfway
+    between those already read, level by level. Each level is swept in
+    the opposite direction to the last, so the head crosses the disk once
+    per level rather than once per track. Both heads of a cylinder are
+    read together.
+
+    Args:
+        cylinders: Number of cylinders
+        heads: Number of heads
+        priority: (cylinder, head) pairs to read first
+
+    Returns:
+        All (cylinder, head) pairs, each once
+    """
+    levels = [[0, cylinders - 1] if cylinders > 1 else [0]]
+    intervals = [(0, cylinders - 1)]
+    while intervals:
+        midpoints = []
+        split = []
+        for low, high in intervals:
+            if high - low < 2:
+                continue
+            middle = (low + high) // 2
+            midpoints.append(middle)
+            split.extend([(low, middle), (middle, high)])
+        if midpoints:
+            levels.append(midpoints)
+        intervals = split
+
+    order: List[Tuple[int, int]] = []
+    seen = set()
+    for cyl, head in priority:
+        if 0 <= cyl < cylinders and 0 <= head < heads and (cyl, head) not in seen:
+            seen.add((cyl, head))
+            order.append((cyl, head))
+
+    for level, level_cylinders in enumerate(levels):
+        if level % 2:
+            level_cylinders = level_cylinders[::-1]
+        for cyl in level_cylinders:
+            for head in range(heads):
+                if (cyl, head) not in seen:
+                    seen.add((cyl, head))
+                    order.append((cyl, head))
+    return order
+
+
+def _beta_binomial_cdf(trials: int, alpha: float, beta: float) -> List[float]:
+    """Cumulative Beta-binomial probabilities for 0..trials successes."""
+    log_norm = math.lgamma(alpha + beta) - math.lgamma(alpha) - math.lgamma(beta)
+    total_log = math.lgamma(trials + alpha + beta)
+    cdf = []
+    cumulative = 0.0
+    for k in range(trials + 1):
+        log_pmf = (
+            math.lgamma(trials + 1) - math.lgamma(k + 1) - math.lgamma(trials - k + 1)
+            + math.lgamma(k + alpha) + math.lgamma(trials - k + beta)
+            - total_log + log_norm
+        )
+        cumulative += math.exp(log_pmf)
+        cdf.append(min(cumulative, 1.0))
+    return cdf
+
+
+class GradeEstimator:
+    """
+    Running bounds on a disk's final grade while tracks are verified.
+
+    The final score is the fraction of the disk's sectors that read good.
+    Unread tracks can contribute anywhere from none to all of their
+    sectors, which gives bounds that always hold. Tighter bounds come from
+    the sampled tracks: the number of unread tracks with errors is
+    modelled as Beta-binomial from the fraction of sampled tracks with
+    errors. For the lower bound each such track loses all its sectors; for
+    the upper bound each loses as few as the least damaged track seen.
+
+    The grade is decided once both bounds give the same grade. Tracks read
+    out of sample order (known-weak tracks) count towards the totals but
+    not towards the error rate, so they do not bias the estimate.
+
+    Example:
+        >>> estimator = GradeEstimator(total_tracks=160, sectors_per_track=18)
+        >>> estimator.observe(good_sectors=18, expected_sectors=18)
+        >>> if estimator.is_decided():
+        ...     grade = estimator.grade()
+    """
+
+    def __init__(
+        self,
+        total_tracks: int,
+        sectors_per_track: int,
+        confidence: float = DEFAULT_DECISION_CONFIDENCE,
+        min_sampled: int = MIN_SAMPLED_TRACKS
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            total_tracks: Tracks on the disk
+            sectors_per_track: Sectors per track
+            confidence: Probability that the decided grade is the final one
+            min_sampled: Sampled tracks before a statistical decision
+        """
+        self._total_tracks = total_tracks
+        self._sectors_per_track = sectors_per_track
+        self._confidence = confidence
+        self._min_sampled = min_sampled
+
+        self.tracks_read = 0
+        self.good_sectors = 0
+        self.sampled_tracks = 0
+        self.sampled_bad_tracks = 0
+        self.sampled_good_sectors = 0
+        self._least_loss: Optional[int] = None
+
+    @property
+    def total_sectors(self) -> int:
+        """Sectors on the disk."""
+        return self._total_tracks * self._sectors_per_track
+
+    @property
+    def remaining_tracks(self) -> int:
+        """Tracks not yet read."""
+        return max(0, self._total_tracks - self.tracks_read)
+
+    def observe(self, good_sectors: int, expected_sectors: int, sampled: bool = True) -> None:
+        """
+        Record a verified track.
+
+        Args:
+            good_sectors: Sectors that read good
+            expected_sectors: Sectors the track should hold
+            sampled: False for tracks read out of sample order
+        """
+        self.tracks_read += 1
+        self.good_sectors += good_sectors
+        if not sampled:
+            return
+
+        self.sampled_tracks += 1
+        self.sampled_good_sectors += good_sectors
+        loss = expected_sectors - good_sectors
+        if loss > 0:
+            self.sampled_bad_tracks += 1
+            self._least_loss = loss if self._least_loss is None else min(self._least_loss, loss)
+
+    def score_bounds(self) -> Tuple[float, float]:
+        """
+        Get the final score bounds at the configured confidence.
+
+        Returns:
+            Tuple of (lower, upper) score, 0-100
+        """
+        if self.total_sectors <= 0:
+            return 0.0, 0.0
+
+        remaining = self.remaining_tracks
+        worst = self.good_sectors
+        best = self.good_sectors + remaining * self._sectors_per_track
+
+        if remaining and self.sampled_tracks >= self._min_sampled:
+            cdf = _beta_binomial_cdf(
+                remaining,
+                _PRIOR_BAD + self.sampled_bad_tracks,
+                _PRIOR_CLEAN + self.sampled_tracks - self.sampled_bad_tracks
+            )
+            tail = (1.0 - self._confidence) / 2
+            most_bad = next(k for k, p in enumerate(cdf) if p >= 1.0 - tail)
+            fewest_bad = next(k for k, p in enumerate(cdf) if p > tail)
+            worst = max(worst, best - most_bad * self._sectors_per_track)
+            best -= fewest_bad * (self._least_loss or 1)
+
+        return worst * 100 / self.total_sectors, best * 100 / self.total_sectors
+
+    def is_decided(self) -> bool:
+        """True once the unread tracks can no longer change the grade."""
+        lower, upper = self.score_bounds()
+        return DiskGrade.from_score(lower) == DiskGrade.from_score(upper)
+
+    def grade(self) -> DiskGrade:
+        """Grade at the lower score bound."""
+        return DiskGrade.from_score(self.score_bounds()[0])
+
+    def projected_score(self) -> float:
+        """
+        Expected final score, within the decided grade's bounds.
+
+        Unread tracks are assumed to read like the sampled ones.
+        """
+        if self.total_sectors <= 0:
+            return 0.0
+
+        if self.sampled_tracks:
+            per_track = self.sampled_good_sectors / self.sampled_tracks
+        else:
+            per_track = self._sectors_per_track
+        projected = (self.good_sectors + per_track * self.remaining_tracks) * 100
+        lower, upper = self.score_bounds()
+        return min(max(projected / self.total_sectors, lower), upper)
+
+
 # =============================================================================
 # Batch Verify Worker
 # =============================================================================
@@ -257,6 +497,11 @@ class BatchVerifyWorker(GreaseweazleWorker):
     Decodes actual sector data and validates CRCs rather than using
     flux quality estimates.
 
+    With early_decision, every track is eligible but tracks are read in
+    sequential_track_order() and verification stops as soon as the
+    GradeEstimator decides the grade at the configured confidence. The
+    reported score is then projected from the tracks read.
+
     Signals:
         disk_verified(SingleDiskResult): Emitted when disk verification completes
         verification_failed(str): Emitted if verification fails
@@ -283,6 +528,9 @@ class BatchVerifyWorker(GreaseweazleWorker):
         disk_info: FloppyDiskInfo,
         analysis_depth: str,
         session: Optional['DiskSession'] = None,
+        early_decision: bool = False,
+        decision_confidence: float = DEFAULT_DECISION_CONFIDENCE,
+        priority_tracks: Optional[List[Tuple[int, int]]] = None,
     ):
         """
         Initialize batch verify worker.
@@ -295,6 +543,11 @@ class BatchVerifyWorker(GreaseweazleWorker):
             analysis_depth: Analysis depth (Quick/Standard/Thorough/Forensic)
             session: Optional DiskSession for session-aware operations.
                     When provided, uses session parameters for accurate verification.
+            early_decision: Stop once the grade can no longer change at
+                           decision_confidence
+            decision_confidence: Confidence required for an early grade
+            priority_tracks: Tracks read first in early decision mode,
+                            such as tracks weak on earlier disks of the batch
         """
         super().__init__(device, session)
 
@@ -308,6 +561,10 @@ class BatchVerifyWorker(GreaseweazleWorker):
 
         self._disk_info = disk_info
         self._analysis_depth = analysis_depth
+        self._early_decision = early_decision
+        self._decision_confidence = decision_confidence
+        self._priority_tracks = list(priority_tracks or [])
+        self._grade_decided = False
 
         logger.info(
             "BatchVerifyWorker initialized for disk %d (serial=%s, depth=%s, session=%s)",
@@ -343,6 +600,11 @@ class BatchVerifyWorker(GreaseweazleWorker):
             # Get tracks to verify based on depth
             tracks = self._get_tracks_to_verify()
             total_tracks = len(tracks)
+            estimator = GradeEstimator(
+                total_tracks, self._geometry.sectors_per_track,
+                confidence=self._decision_confidence
+            )
+            priority = set(self._priority_tracks)
 
             logger.info("Verifying disk %d: scanning %d tracks with sector decoding",
                         self._disk_info.index + 1, total_tracks)
@@ -356,78 +618,105 @@ class BatchVerifyWorker(GreaseweazleWorker):
 
             sectors_per_track = self._geometry.sectors_per_track
 
-            for i, (cyl, head) in enumerate(tracks):
-                if self._cancelled:
-                    logger.info("Verification cancelled")
-                    break
-
-                track_start = time.time()
-
-                try:
-                    # Determine revolutions based on depth
-                    revolutions = self._get_revolutions()
+            # Determine revolutions based on depth
+            revolutions = self._get_revolutions()
 
-                    # Read flux data
-                    flux_data = read_track_flux(
-                        self._device, cyl, head, revolutions=revolutions
-                    )
-
-                    # Decode sectors using CodecAdapter if available, else fallback
-                    sectors = self._decode_track(flux_data, cyl, head)
-
-                    # Process decoded sectors
-                    track_result = self._process_decoded_sectors(
-                        cyl, head, sectors, sectors_per_track
-                    )
-                    track_result.verify_time_ms = int((time.time() - track_start) * 1000)
-
-                    # Accumulate totals
-                    total_good += track_result.good_sectors
-                    total_bad += track_result.bad_sectors
-                    total_weak += track_result.weak_sectors
-                    total_missing += track_result.missing_sectors
-
-                    track_results.append(track_result)
-
-                    # Emit track progress
-                    self.track_verified.emit(cyl, head, track_result)
-
-                    # Log progress
-                    logger.debug(
-                        "Track C%d:H%d verified: %d good, %d bad, %d missing (%.0fms)",
-                        cyl, head,
-                        track_result.good_sectors,
-                        track_result.bad_sectors,
-                        track_result.missing_sectors,
-                        track_result.verify_time_ms
-                    )
-
-                except Exception as e:
-                    logger.warning("Failed to verify track C%d:H%d: %s", cyl, head, e)
-
-                    # Record as all missing
-                    track_result = TrackVerifyResult(
-                        cylinder=cyl,
-                        head=head,
-                        missing_sectors=sectors_per_track,
-                        total_expected=sectors_per_track,
-                        sector_errors={s: str(e) for s in range(1, sectors_per_track + 1)},
-                        verify_time_ms=int((time.time() - track_start) * 1000)
-                    )
-                    total_missing += sectors_per_track
-                    track_results.append(track_result)
-                    self.track_verified.emit(cyl, head, track_result)
-
-                # Update progress
-                progress = int((i + 1) / total_tracks * 100)
-                self.progress.emit(progress)
+            # Read the next track while the last is decoded. Decoding uses
+            # the CodecAdapter if available, else the fallback decoders.
+            pipeline = TrackPipeline(
+                lambda cyl, head: read_track_flux(
+                    self._device, cyl, head, revolutions=revolutions
+                ),
+                lambda cyl, head, flux_data: self._decode_track(flux_data, cyl, head),
+                is_cancelled=lambda: self.is_cancelled() or self._grade_decided,
+            )
+            with closing(pipeline.run(tracks)) as outcomes:
+                for i, outcome in enumerate(outcomes):
+                    if self._cancelled:
+                        logger.info("Verification cancelled")
+                        break
+
+                    cyl, head = outcome.cylinder, outcome.head
+
+                    try:
+                        sectors = outcome.unwrap()
+
+                        # Process decoded sectors
+                        track_result = self._process_decoded_sectors(
+                            cyl, head, sectors, sectors_per_track
+                        )
+                        track_result.verify_time_ms = int(outcome.elapsed_seconds * 1000)
+
+                        # Accumulate totals
+                        total_good += track_result.good_sectors
+                        total_bad += track_result.bad_sectors
+                        total_weak += track_result.weak_sectors
+                        total_missing += track_result.missing_sectors
+
+                        track_results.append(track_result)
+
+                        # Emit track progress
+                        self.track_verified.emit(cyl, head, track_result)
+
+                        # Log progress
+                        logger.debug(
+                            "Track C%d:H%d verified: %d good, %d bad, %d missing (%.0fms)",
+                            cyl, head,
+                            track_result.good_sectors,
+                            track_result.bad_sectors,
+                            track_result.missing_sectors,
+                            track_result.verify_time_ms
+                        )
+
+                    except Exception as e:
+                        logger.warning("Failed to verify track C%d:H%d: %s", cyl, head, e)
+
+                        # Record as all missing
+                        track_result = TrackVerifyResult(
+                            cylinder=cyl,
+                            head=head,
+                            missing_sectors=sectors_per_track,
+                            total_expected=sectors_per_track,
+                            sector_errors={s: str(e) for s in range(1, sectors_per_track + 1)},
+                            verify_time_ms=int(outcome.elapsed_seconds * 1000)
+                        )
+                        total_missing += sectors_per_track
+                        track_results.append(track_result)
+                        self.track_verified.emit(cyl, head, track_result)
+
+                    # Update progress
+                    progress = int((i + 1) / total_tracks * 100)
+                    self.progress.emit(progress)
+
+                    if self._early_decision:
+                        estimator.observe(
+                            track_result.good_sectors, track_result.total_expected,
+                            sampled=(cyl, head) not in priority
+                        )
+                        if estimator.is_decided():
+                            self._grade_decided = True
+                            logger.info(
+                                "Disk %d grade %s decided after %d/%d tracks",
+                                self._disk_info.index + 1, estimator.grade().value,
+                                i + 1, total_tracks
+                            )
+                            self.progress.emit(100)
+                            break
 
             # Calculate final results
             elapsed_ms = int((time.time() - start_time) * 1000)
             total_sectors = self._geometry.total_sectors
 
             # Calculate score based on actual sector results
-            if total_sectors > 0:
+            tracks_skipped = 0
+            grade_confidence = 1.0
+            if self._grade_decided:
+                # Unread tracks are projected from the ones read
+                overall_score = estimator.projected_score()
+                tracks_skipped = estimator.remaining_tracks
+                if estimator.sampled_tracks >= MIN_SAMPLED_TRACKS:
+                    grade_confidence = self._decision_confidence
+            elif total_sectors > 0:
                 # Perfect = 100, each bad sector reduces score
                 good_ratio = total_good / total_sectors
                 overall_score = good_ratio * 100
@@ -458,7 +747,14 @@ class BatchVerifyWorker(GreaseweazleWorker):
                 recommendations=self._generate_recommendations(
                     overall_score, total_bad, total_missing, track_results
                 ),
+                tracks_skipped=tracks_skipped,
+                grade_confidence=grade_confidence,
             )
+            if tracks_skipped:
+                result.recommendations.append(
+                    f"Grade decided after {total_tracks - tracks_skipped} of "
+                    f"{total_tracks} tracks ({grade_confidence:.0%} confidence)"
+                )
 
             logger.info(
                 "Disk %d verification complete: grade=%s, score=%.1f%%, "
@@ -572,6 +868,11 @@ class BatchVerifyWorker(GreaseweazleWorker):
         """
         from floppy_formatter.hardware import SectorStatus
 
+        def rank(sector: Any) -> tuple:
+            # Good CRC first, then corrected, then bad CRC
+            corrected = getattr(sector, 'status', None) == SectorStatus.CORRECTED
+            return (bool(sector.crc_valid), bool(sector.crc_valid) or corrected)
+
         # Deduplicate sectors - keep best result for each sector number
         best_sectors: Dict[int, Any] = {}
 
@@ -585,10 +886,10 @@ class BatchVerifyWorker(GreaseweazleWorker):
                 best_sectors[sector_num] = sector
             else:
                 existing = best_sectors[sector_num]
-                # Prefer good CRC over bad CRC
-                if sector.crc_valid and not existing.crc_valid:
+                # Prefer good CRC, then corrected, over bad CRC
+                if rank(sector) > rank(existing):
                     best_sectors[sector_num] = sector
-                elif sector.crc_valid == existing.crc_valid:
+                elif rank(sector) == rank(existing):
                     # Both same CRC status, prefer better signal quality
                     if hasattr(sector, 'signal_quality') and hasattr(existing, 'signal_quality'):
                         if sector.signal_quality > existing.signal_quality:
@@ -610,8 +911,11 @@ class BatchVerifyWorker(GreaseweazleWorker):
             else:
                 sector = best_sectors[sector_num]
 
-                # Check CRC status
-                if sector.crc_valid:
+                # Check CRC status; corrected data is readable but marginal
+                if getattr(sector, 'status', None) == SectorStatus.CORRECTED:
+                    weak_count += 1
+                    self.sector_status.emit(cyl, head, sector_num, True, "Corrected")
+                elif sector.crc_valid:
                     # Check for weak/marginal quality
                     quality = getattr(sector, 'signal_quality', 1.0)
                     if quality < 0.7:
@@ -649,19 +953,25 @@ class BatchVerifyWorker(GreaseweazleWorker):
         """
         Get list of (cylinder, head) tuples to verify based on depth.
 
+        In early decision mode all tracks are returned in sample order.
+
         Returns:
             List of (cylinder, head) tuples
         """
         cylinders = self._geometry.cylinders
         heads = self._geometry.heads
 
+        if self._early_decision:
+            # Every track, best sample first; reading stops once graded
+            return sequential_track_order(cylinders, heads, self._priority_tracks)
+
         if self._analysis_depth == "Quick":
             # Sample tracks: 0, 20, 40, 60, 79
             sample_cyls = [0, 20, 40, 60, min(79, cylinders - 1)]
-            return [(c, h) for c in sample_cyls for h in range(heads)]
+            return self._track_scheduler.sweep(sample_cyls, heads)
         else:
             # All tracks for Standard/Thorough/Forensic
-            return [(c, h) for c in range(cylinders) for h in range(heads)]
+            return self._track_scheduler.sweep(range(cylinders), heads)
 
     def _get_revolutions(self) -> float:
         """Get number of revolutions based on analysis depth."""
@@ -766,4 +1076,7 @@ __all__ = [
     'BatchVerificationResult',
     'TrackVerifyResult',
     'DiskGrade',
+    'GradeEstimator',
+    'sequential_track_order',
+    'DEFAULT_DECISION_CONFIDENCE',
 ]
@@ -10,17 +10,20 @@ Updated Phase 3: Session-aware formatting with codec adapter support
 
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
 
 from floppy_formatter.gui.workers.base_worker import GreaseweazleWorker
+from floppy_formatter.hardware.lru_cache import LRUCache
 
 if TYPE_CHECKING:
     from floppy_formatter.hardware import GreaseweazleDevice, SectorData
+    from floppy_formatter.hardware.flux_io import FluxData
     from floppy_formatter.core.geometry import DiskGeometry
     from floppy_formatter.core.session import DiskSession
 
@@ -90,6 +93,11 @@ PATTERN_55 = 0x55
 # Secure erase patterns (multiple overwrites)
 SECURE_ERASE_PATTERNS = [PATTERN_ZERO, PATTERN_ONE, PATTERN_AA, PATTERN_55, PATTERN_ZERO]
 
+# Memory allowed for encoded tracks shared by all format workers. An HD
+# track encodes to ~200KB of flux, so this holds a whole disk of one
+# pattern.
+ENCODED_TRACK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 # =============================================================================
 # Enums
@@ -185,6 +193,35 @@ class FormatResult:
         return (self.tracks_formatted / self.total_tracks) * 100.0
 
 
+# =============================================================================
+# Encoded Track Cache
+# =============================================================================
+
+class EncodedTrackCache(LRUCache['FluxData']):
+    """
+    Thread-safe LRU of encoded pattern tracks, bounded by memory.
+
+    A pattern track depends only on the format, the track and the fill
+    byte, so a pattern written twice (secure erase ends with the pattern
+    it starts with) or a disk formatted again is served without encoding.
+    Entries are keyed by (format key, cylinder, head, pattern) and hold
+    the FluxData itself; its flux array is read-only, so it is shared.
+    """
+
+    def __init__(self, max_bytes: int = ENCODED_TRACK_CACHE_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory allowed for cached flux
+        """
+        super().__init__(max_bytes=max_bytes, size_of=lambda flux: flux.flux_array.nbytes)
+
+
+# Shared by all format workers so a repeated format reuses encodings
+_encoded_track_cache = EncodedTrackCache()
+
+
 # =============================================================================
 # Format Worker
 # =============================================================================
@@ -203,6 +240,8 @@ class FormatWorker(GreaseweazleWorker):
     - Multiple format types (standard, refresh, secure)
     - Real-time progress reporting
     - Session-aware encoding for non-IBM formats (Phase 3)
+    - Next track encoded in the background while the current one is
+      written; encoded pattern tracks cached across passes and runs
 
     Session Integration (Phase 3):
         When a DiskSession is provided, the worker uses the session's
@@ -306,19 +345,32 @@ class FormatWorker(GreaseweazleWorker):
             total_tracks, self._format_type.name, len(patterns)
         )
 
-        # Process each track
-        track_count = 0
-        for cylinder in range(self._geometry.cylinders):
-            for head in range(self._geometry.heads):
+        # Encode the next track's patterns while the current one is written
+        tracks = [
+            (cylinder, head)
+            for cylinder in range(self._geometry.cylinders)
+            for head in range(self._geometry.heads)
+        ]
+        encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="track-encode")
+        next_encoded = encoder.submit(self._encode_track_patterns, *tracks[0], patterns)
+
+        try:
+            for track_count, (cylinder, head) in enumerate(tracks, start=1):
                 # Check for cancellation
                 if self._cancelled:
                     logger.info("Format cancelled at track %d/%d", cylinder, head)
                     result.success = False
                     break
 
+                encoded = next_encoded
+                if track_count < len(tracks):
+                    next_encoded = encoder.submit(
+                        self._encode_track_patterns, *tracks[track_count], patterns
+                    )
+
                 # Format the track
                 track_result = self._format_track(
-                    cylinder, head, patterns
+                    cylinder, head, patterns, encoded
                 )
 
                 # Verify if requested
@@ -347,12 +399,10 @@ class FormatWorker(GreaseweazleWorker):
                 )
 
                 # Update progress
-                track_count += 1
                 progress = int((track_count / total_tracks) * 100)
                 self.progress.emit(progress)
-
-            if self._cancelled:
-                break
+        finally:
+            encoder.shutdown(wait=True, cancel_futures=True)
 
         # Calculate duration
         result.format_duration = time.time() - start_time
@@ -393,24 +443,26 @@ class FormatWorker(GreaseweazleWorker):
         self,
         cylinder: int,
         head: int,
-        patterns: List[int]
+        patterns: List[int],
+        encoded: Optional['Future'] = None
     ) -> TrackFormatResult:
         """
         Format a single track with the specified patterns.
 
-        Uses the session's codec adapter for encoding when available (Phase 3),
-        otherwise falls back to the default MFM encoder.
+        The track is erased while its patterns finish encoding in the
+        background, then each pattern is written.
 
         Args:
             cylinder: Cylinder number
             head: Head number
             patterns: List of fill patterns to write
+            encoded: Future from _encode_track_patterns() for this track.
+                    If None, the patterns are encoded here.
 
         Returns:
             TrackFormatResult with format data
         """
         from floppy_formatter.hardware import erase_track_flux, write_track_flux
-        from floppy_formatter.hardware.mfm_codec import encode_sectors_to_flux
 
         track_start = time.time()
 
@@ -423,32 +475,19 @@ class FormatWorker(GreaseweazleWorker):
             # Step 1: Bulk erase the track (DC erase)
             erase_track_flux(self._device, cylinder, head)
 
+            if encoded is not None:
+                fluxes = encoded.result()
+            else:
+                fluxes = self._encode_track_patterns(cylinder, head, patterns)
+
             # Step 2: Write each pattern
-            for pattern in patterns:
+            for flux in fluxes:
                 # Check for cancellation between patterns
                 if self._cancelled:
                     result.format_success = False
                     result.error_message = "Cancelled"
                     break
 
-                # Create sector data with fill pattern
-                sector_data = self._create_sector_data(
-                    cylinder, head, pattern
-                )
-
-                # Encode to flux - use session codec adapter if available (Phase 3)
-                if self._codec_adapter is not None:
-                    # Session-aware encoding for any Greaseweazle format
-                    flux = self._codec_adapter.encode_track(sector_data, cylinder, head)
-                    logger.debug(
-                        "Track C%d:H%d: codec adapter encoded %d sectors",
-                        cylinder, head, len(sector_data)
-                    )
-                else:
-                    # Fall back to default MFM encoder (IBM formats only)
-                    # NOTE: Argument order is (cylinder, head, sectors)
-                    flux = encode_sectors_to_flux(cylinder, head, sector_data)
-
                 # Write to disk
                 write_track_flux(self._device, cylinder, head, flux)
 
@@ -469,6 +508,80 @@ class FormatWorker(GreaseweazleWorker):
 
         return result
 
+    def _encode_track_patterns(
+        self,
+        cylinder: int,
+        head: int,
+        patterns: List[int]
+    ) -> List['FluxData']:
+        """
+        Get the flux for each pattern of a track, encoding on a cache miss.
+
+        Runs on the background encoder thread and must not touch the device.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            patterns: List of fill patterns
+
+        Returns:
+            FluxData per pattern, in pattern order
+        """
+        fluxes = []
+        for pattern in patterns:
+            key = self._encode_key(cylinder, head, pattern)
+            flux = _encoded_track_cache.get(key)
+            if flux is None:
+                flux = self._encode_pattern(cylinder, head, pattern)
+                _encoded_track_cache.put(key, flux)
+            fluxes.append(flux)
+        return fluxes
+
+    def _encode_key(self, cylinder: int, head: int, pattern: int) -> Tuple:
+        """Cache key of a pattern track: everything the encoding depends on."""
+        if self._codec_adapter is not None:
+            return (
+                self._session.gw_format if self._session else None,
+                self._codec_adapter.get_sectors_for_track(cylinder, head),
+                self._session.bytes_per_sector if self._session else 512,
+                cylinder, head, pattern,
+            )
+        return ('mfm', self._geometry.sectors_per_track, 512, cylinder, head, pattern)
+
+    def _encode_pattern(self, cylinder: int, head: int, pattern: int) -> 'FluxData':
+        """
+        Encode a track filled with a pattern.
+
+        Uses the session's codec adapter for encoding when available (Phase 3),
+        otherwise falls back to the default MFM encoder.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            pattern: Fill byte value
+
+        Returns:
+            FluxData ready for writing
+        """
+        from floppy_formatter.hardware.mfm_codec import encode_sectors_to_flux
+
+        # Create sector data with fill pattern
+        sector_data = self._create_sector_data(cylinder, head, pattern)
+
+        # Encode to flux - use session codec adapter if available (Phase 3)
+        if self._codec_adapter is not None:
+            # Session-aware encoding for any Greaseweazle format
+            flux = self._codec_adapter.encode_track(sector_data, cylinder, head)
+            logger.debug(
+                "Track C%d:H%d: codec adapter encoded %d sectors",
+                cylinder, head, len(sector_data)
+            )
+            return flux
+
+        # Fall back to default MFM encoder (IBM formats only)
+        # NOTE: Argument order is (cylinder, head, sectors)
+        return encode_sectors_to_flux(cylinder, head, sector_data)
+
     def _verify_track(self, cylinder: int, head: int) -> bool:
         """
         Verify a track by reading back and checking data.
@@ -662,6 +775,8 @@ __all__ = [
     'FormatType',
     'FormatResult',
     'TrackFormatResult',
+    'EncodedTrackCache',
+    'ENCODED_TRACK_CACHE_MAX_BYTES',
     'PATTERN_ZERO',
     'PATTERN_ONE',
     'PATTERN_E5',
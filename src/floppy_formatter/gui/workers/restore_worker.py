@@ -13,17 +13,20 @@ import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import List, Dict, Optional, Set, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal
 
 from floppy_formatter.gui.workers.base_worker import GreaseweazleWorker
 from floppy_formatter.hardware import SectorData, SectorStatus
+from floppy_formatter.recovery.capture_store import TrackCaptureStore
+from floppy_formatter.recovery.scheduler import TechniqueScheduler
 
 if TYPE_CHECKING:
     from floppy_formatter.hardware import GreaseweazleDevice
     from floppy_formatter.core.geometry import DiskGeometry
     from floppy_formatter.core.session import DiskSession
+    from floppy_formatter.recovery.pll_tuning import PLLParameterMemory, PLLSearchPool
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +114,9 @@ class RestoreConfig:
         recovery_level: Recovery effort level (STANDARD/AGGRESSIVE/FORENSIC)
         pll_tuning: Enable PLL parameter search for marginal sectors
         bit_slip_recovery: Enable bit-slip recovery for sync errors
+        time_budget: Seconds allowed for the restore, or None for no limit.
+                    Techniques that no longer fit are skipped and passes
+                    stop once it is used up.
     """
     convergence_mode: bool = False
     passes: int = 5
@@ -122,6 +128,7 @@ class RestoreConfig:
     recovery_level: RecoveryLevel = RecoveryLevel.STANDARD
     pll_tuning: bool = False
     bit_slip_recovery: bool = False
+    time_budget: Optional[float] = None
 
 
 @dataclass
@@ -135,12 +142,14 @@ class PassStats:
         bad_count_after: Bad sector count at end of pass
         sectors_recovered: Sectors recovered in this pass
         duration_seconds: Time taken for this pass
+        seek_steps: Cylinders the head stepped between tracks
     """
     pass_num: int
     bad_count_before: int
     bad_count_after: int
     sectors_recovered: int
     duration_seconds: float
+    seek_steps: int = 0
 
     @property
     def improvement(self) -> int:
@@ -187,6 +196,15 @@ class RecoveryStats:
         pass_history: Per-pass statistics
         recovered_sectors: List of recovered sector details
         techniques_used: Count of recoveries per technique
+        technique_performance: Attempts, success rate, mean cost and
+                              expected rate per technique
+        budget_exhausted: Whether recovery stopped on the time budget
+        seek_steps: Cylinders the head stepped between tracks, all scans
+                   and passes included
+        corrected_sectors: Sectors the final scan could only read after
+                          bit correction or fusion of copies; they are
+                          counted as bad, since the medium still needs
+                          refreshing there
     """
     initial_bad_sectors: int
     final_bad_sectors: int
@@ -198,6 +216,10 @@ class RecoveryStats:
     pass_history: List[PassStats] = field(default_factory=list)
     recovered_sectors: List[RecoveredSector] = field(default_factory=list)
     techniques_used: Dict[str, int] = field(default_factory=dict)
+    technique_performance: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    budget_exhausted: bool = False
+    seek_steps: int = 0
+    corrected_sectors: List[int] = field(default_factory=list)
 
     @property
     def success_rate(self) -> float:
@@ -308,8 +330,25 @@ class RestoreWorker(GreaseweazleWorker):
         # Recovery state
         self._bad_sectors: List[int] = []
         self._recovered_sectors: List[RecoveredSector] = []
+        self._corrected_sectors: Set[int] = set()
         self._pass_history: List[PassStats] = []
 
+        # Best PLL parameters per track, shared across passes so tuning
+        # can start from what worked on neighbouring tracks
+        self._pll_memory: Optional['PLLParameterMemory'] = None
+
+        # Search processes started by the first full-grid PLL search and
+        # kept until the restore finishes
+        self._pll_pool: Optional['PLLSearchPool'] = None
+
+        # Revolutions read from each track since it was last written, so
+        # software-only techniques reuse them instead of reading again
+        self._captures = TrackCaptureStore()
+
+        # Orders techniques per track by measured payoff and enforces
+        # the time budget
+        self._scheduler = TechniqueScheduler(time_budget=self._config.time_budget)
+
         logger.info(
             "RestoreWorker initialized: level=%s, mode=%s, passes=%d, session=%s",
             self._config.recovery_level.name,
@@ -327,8 +366,22 @@ class RestoreWorker(GreaseweazleWorker):
         performs a final verification scan. If verification fails,
         retries the entire restore up to 3 times.
         """
+        try:
+            self._run_restore()
+        finally:
+            self._close_pll_pool()
+
+    def _close_pll_pool(self) -> None:
+        """Stop the PLL search processes, if any were started."""
+        if self._pll_pool is not None:
+            self._pll_pool.close()
+            self._pll_pool = None
+
+    def _run_restore(self) -> None:
+        """Run the scan, recovery passes and verification for run()."""
         MAX_RESTORE_ATTEMPTS = 3
         start_time = time.time()
+        self._scheduler.start()
 
         # Initialize statistics
         stats = RecoveryStats(
@@ -405,6 +458,10 @@ class RestoreWorker(GreaseweazleWorker):
                     logger.info("Recovery cancelled at pass %d", pass_num)
                     break
 
+                if self._scheduler.budget_exhausted():
+                    logger.info("Time budget used up before pass %d", pass_num)
+                    break
+
                 if not self._bad_sectors:
                     logger.info("All sectors recovered")
                     break
@@ -482,20 +539,25 @@ class RestoreWorker(GreaseweazleWorker):
         # Perform one final scan to get accurate count
         final_bad = self._perform_initial_scan()
         stats.final_bad_sectors = len(final_bad)
+        stats.corrected_sectors = sorted(self._corrected_sectors)
         stats.sectors_recovered = stats.initial_bad_sectors - stats.final_bad_sectors
         stats.converged = converged
         stats.elapsed_time = time.time() - start_time
         stats.pass_history = self._pass_history
         stats.recovered_sectors = self._recovered_sectors
+        stats.technique_performance = self._scheduler.get_summary()
+        stats.budget_exhausted = self._scheduler.budget_exhausted()
+        stats.seek_steps = self._track_scheduler.total_steps
 
         # Count techniques used
         for rs in self._recovered_sectors:
             stats.techniques_used[rs.technique] = stats.techniques_used.get(rs.technique, 0) + 1
 
         logger.info(
-            "Recovery complete: %d/%d recovered, %d passes, %.1fs",
-            stats.sectors_recovered, stats.initial_bad_sectors,
-            total_passes_completed, stats.elapsed_time
+            "Recovery complete: %d/%d recovered, %d corrected, %d passes, %.1fs, "
+            "%d seek steps",
+            stats.sectors_recovered, stats.initial_bad_sectors, len(stats.corrected_sectors),
+            total_passes_completed, stats.elapsed_time, stats.seek_steps
         )
 
         self.restore_complete.emit(stats)
@@ -526,7 +588,7 @@ class RestoreWorker(GreaseweazleWorker):
         # Group originally bad sectors by track for efficient verification
         track_sectors = self._group_by_track(originally_bad_sectors)
 
-        for (cylinder, head), sector_nums in track_sectors.items():
+        for (cylinder, head), sector_nums in self._track_scheduler.order(track_sectors.items()):
             if self._cancelled:
                 return still_bad
 
@@ -550,7 +612,7 @@ class RestoreWorker(GreaseweazleWorker):
             found_good = set()
             for sector in sectors:
                 if sector.sector >= 1 and sector.sector <= sectors_per_track:
-                    if sector.data is not None and sector.crc_valid:
+                    if sector.data is not None and sector.is_good:
                         # Convert to linear sector number
                         base = (cylinder * self._geometry.heads + head) * sectors_per_track
                         linear = base + (sector.sector - 1)
@@ -579,68 +641,77 @@ class RestoreWorker(GreaseweazleWorker):
         Uses the session's codec adapter for decoding when available (Phase 3),
         otherwise falls back to the default decoder chain.
 
+        Sectors that only read after bit correction or fusion of copies
+        are marginal and count as bad, so they are queued for refresh;
+        they are also collected in self._corrected_sectors.
+
+        Scan reads go into the capture store, so recovery of the most
+        recently scanned tracks starts from the revolution already read.
+
         Returns:
             List of bad sector numbers
         """
-        from floppy_formatter.hardware import read_track_flux
-
         bad_sectors = []
+        self._corrected_sectors = set()
 
-        for cylinder in range(self._geometry.cylinders):
-            for head in range(self._geometry.heads):
-                if self._cancelled:
-                    return bad_sectors
+        tracks = self._track_scheduler.sweep(
+            range(self._geometry.cylinders), self._geometry.heads
+        )
+        for track_count, (cylinder, head) in enumerate(tracks, start=1):
+            if self._cancelled:
+                return bad_sectors
 
-                # Get sectors per track - use codec adapter for variable formats (Phase 3)
-                if self._codec_adapter is not None:
-                    sectors_per_track = self._codec_adapter.get_sectors_for_track(cylinder, head)
-                else:
-                    sectors_per_track = self._geometry.sectors_per_track
+            # Get sectors per track - use codec adapter for variable formats (Phase 3)
+            if self._codec_adapter is not None:
+                sectors_per_track = self._codec_adapter.get_sectors_for_track(cylinder, head)
+            else:
+                sectors_per_track = self._geometry.sectors_per_track
 
-                # Seek and read track
-                self._device.seek(cylinder, head)
-                flux = read_track_flux(self._device, cylinder, head, revolutions=1.2)
+            # Seek and read track
+            self._device.seek(cylinder, head)
+            flux = self._read_track(cylinder, head, 1.2)
 
-                # Decode sectors - use session codec adapter if available (Phase 3)
-                if self._codec_adapter is not None:
-                    sectors = self._codec_adapter.decode_track(flux, cylinder, head)
+            # Decode sectors - use session codec adapter if available (Phase 3)
+            if self._codec_adapter is not None:
+                sectors = self._codec_adapter.decode_track(flux, cylinder, head)
+            else:
+                sectors = decode_flux_data(flux)
+
+            base_sector = (cylinder * self._geometry.heads + head) * sectors_per_track
+
+            # Deduplicate sectors by sector number
+            best_sectors = {}
+            for sector in sectors:
+                sector_num = sector.sector
+                if sector_num < 1 or sector_num > sectors_per_track:
+                    continue
+                existing = best_sectors.get(sector_num)
+                if existing is None or (sector.is_good, sector.is_recovered) > (
+                    existing.is_good, existing.is_recovered
+                ):
+                    best_sectors[sector_num] = sector
+
+            # Check all expected sectors
+            for sector_num in range(1, sectors_per_track + 1):
+                linear = base_sector + (sector_num - 1)
+                if sector_num in best_sectors:
+                    sector = best_sectors[sector_num]
+                    is_good = sector.data is not None and sector.is_good
+                    if sector.data is not None and sector.is_corrected:
+                        self._corrected_sectors.add(linear)
                 else:
-                    sectors = decode_flux_data(flux)
-
-                base_sector = (cylinder * self._geometry.heads + head) * sectors_per_track
-
-                # Deduplicate sectors by sector number
-                best_sectors = {}
-                for sector in sectors:
-                    sector_num = sector.sector
-                    if sector_num < 1 or sector_num > sectors_per_track:
-                        continue
-                    if sector_num not in best_sectors:
-                        best_sectors[sector_num] = sector
-                    elif sector.crc_valid and not best_sectors[sector_num].crc_valid:
-                        best_sectors[sector_num] = sector
-
-                # Check all expected sectors
-                for sector_num in range(1, sectors_per_track + 1):
-                    linear = base_sector + (sector_num - 1)
-                    if sector_num in best_sectors:
-                        sector = best_sectors[sector_num]
-                        is_good = sector.data is not None and sector.crc_valid
-                    else:
-                        is_good = False
-
-                    if not is_good:
-                        bad_sectors.append(linear)
-
-                    self.initial_scan_sector.emit(linear, is_good)
-
-                # Update progress
-                track_num = cylinder * self._geometry.heads + head
-                total_tracks = self._geometry.cylinders * self._geometry.heads
-                progress = int((track_num / total_tracks) * 50)  # 0-50% for scan
-                self.progress.emit(progress)
+                    is_good = False
 
-        return bad_sectors
+                if not is_good:
+                    bad_sectors.append(linear)
+
+                self.initial_scan_sector.emit(linear, is_good)
+
+            # Update progress
+            progress = int((track_count / len(tracks)) * 50)  # 0-50% for scan
+            self.progress.emit(progress)
+
+        return sorted(bad_sectors)
 
     def _run_recovery_pass(self, pass_num: int) -> PassStats:
         """
@@ -659,23 +730,21 @@ class RestoreWorker(GreaseweazleWorker):
         # Determine recovery techniques based on level
         techniques = self._get_techniques_for_pass(pass_num)
 
-        # Group bad sectors by track for efficiency
+        # Group bad sectors by track, visited in the fewest head steps
         track_sectors = self._group_by_track(self._bad_sectors)
+        steps_before = self._track_scheduler.total_steps
 
-        for (cylinder, head), sectors in track_sectors.items():
+        for (cylinder, head), sectors in self._track_scheduler.order(track_sectors.items()):
             if self._cancelled:
                 break
 
-            for sector_num in sectors:
-                if self._cancelled:
-                    break
+            # Each technique runs once for the whole track
+            recovered = self._recover_track(cylinder, head, sectors, techniques)
 
-                # Try recovery techniques
-                recovered, technique = self._recover_sector(
-                    sector_num, cylinder, head, techniques
-                )
+            for sector_num in sectors:
+                technique = recovered.get(sector_num)
 
-                if recovered:
+                if technique is not None:
                     # Remove from bad list
                     if sector_num in self._bad_sectors:
                         self._bad_sectors.remove(sector_num)
@@ -694,7 +763,7 @@ class RestoreWorker(GreaseweazleWorker):
 
                     recovered_this_pass += 1
                     self.sector_recovered.emit(sector_num, technique)
-                else:
+                elif not self._cancelled:
                     self.sector_failed.emit(sector_num, "All techniques exhausted")
 
         pass_duration = time.time() - pass_start
@@ -705,12 +774,16 @@ class RestoreWorker(GreaseweazleWorker):
             bad_count_after=len(self._bad_sectors),
             sectors_recovered=recovered_this_pass,
             duration_seconds=pass_duration,
+            seek_steps=self._track_scheduler.total_steps - steps_before,
         )
 
     def _get_techniques_for_pass(self, pass_num: int) -> List[str]:
         """
         Get list of techniques to try based on pass number and level.
 
+        These are the techniques allowed for the pass; the scheduler
+        decides their order per track.
+
         Args:
             pass_num: Current pass number
 
@@ -745,64 +818,79 @@ class RestoreWorker(GreaseweazleWorker):
 
         return ["format_refresh"]
 
-    def _recover_sector(
+    def _recover_track(
         self,
-        sector_num: int,
         cylinder: int,
         head: int,
+        sector_nums: List[int],
         techniques: List[str]
-    ) -> Tuple[bool, str]:
+    ) -> Dict[int, str]:
         """
-        Attempt to recover a single sector using specified techniques.
+        Attempt to recover a track's bad sectors using specified techniques.
+
+        Each technique captures and decodes the track once and is credited
+        with every pending sector it recovers. A CRC-valid sector in the
+        technique's own decode counts as verified; format refresh, which
+        decodes nothing, is verified with one read of the track. Later
+        techniques only run while sectors are still pending.
+
+        Before each attempt the scheduler orders the techniques not yet
+        tried on the track by expected sectors recovered per second,
+        dropping those that no longer pay or fit the time budget, and the
+        first is run. The scheduler is told how each attempt went.
 
         Args:
-            sector_num: Linear sector number
             cylinder: Cylinder number
             head: Head number
+            sector_nums: Linear sector numbers of the bad sectors on this track
             techniques: List of techniques to try
 
         Returns:
-            Tuple of (recovered, technique_that_worked)
+            Dictionary mapping each recovered linear sector number to the
+            technique that recovered it
         """
-        sector_in_track = (sector_num % self._geometry.sectors_per_track) + 1
+        sectors_per_track = self._geometry.sectors_per_track
+        pending = {(n % sectors_per_track) + 1: n for n in sector_nums}
+        recovered: Dict[int, str] = {}
+        untried = list(techniques)
 
-        for technique in techniques:
-            if self._cancelled:
-                return False, ""
+        while untried and pending and not self._cancelled:
+            scheduled = self._scheduler.order(untried, len(pending))
+            if not scheduled:
+                break
+            technique = scheduled[0]
+            untried.remove(technique)
 
-            self.sector_recovering.emit(sector_num, technique)
+            for sector_num in pending.values():
+                self.sector_recovering.emit(sector_num, technique)
 
-            success = False
+            targets = set(pending)
+            good: Set[int] = set()
+            started = time.monotonic()
 
             if technique == "format_refresh":
-                success = self._try_format_refresh(cylinder, head)
+                if self._try_format_refresh(cylinder, head):
+                    good = self._verify_track(cylinder, head)
 
             elif technique == "multi_capture":
-                success = self._try_multi_capture(
-                    cylinder, head, sector_in_track
-                )
+                good = self._try_multi_capture(cylinder, head, targets)
 
             elif technique == "pll_tuning":
-                success = self._try_pll_tuning(
-                    cylinder, head, sector_in_track
-                )
+                good = self._try_pll_tuning(cylinder, head, targets)
 
             elif technique == "bit_slip":
-                success = self._try_bit_slip_recovery(
-                    cylinder, head, sector_in_track
-                )
+                good = self._try_bit_slip_recovery(cylinder, head, targets)
 
             elif technique == "maximum_effort":
-                success = self._try_maximum_effort(
-                    cylinder, head, sector_in_track
-                )
+                good = self._try_maximum_effort(cylinder, head, targets)
 
-            if success:
-                # Verify the sector is now readable
-                if self._verify_sector(cylinder, head, sector_in_track):
-                    return True, technique
+            self._scheduler.record(technique, len(targets), len(good & targets),
+                                   time.monotonic() - started)
 
-        return False, ""
+            for sector in sorted(good & targets):
+                recovered[pending.pop(sector)] = technique
+
+        return recovered
 
     def _try_format_refresh(self, cylinder: int, head: int) -> bool:
         """
@@ -825,6 +913,9 @@ class RestoreWorker(GreaseweazleWorker):
             # Seek to track
             self._device.seek(cylinder, head)
 
+            # Anything read before the write no longer describes the track
+            self._captures.invalidate(cylinder, head)
+
             # DC erase
             erase_track_flux(self._device, cylinder, head)
 
@@ -874,130 +965,162 @@ class RestoreWorker(GreaseweazleWorker):
         self,
         cylinder: int,
         head: int,
-        sector: int
-    ) -> bool:
+        sectors: Set[int]
+    ) -> Set[int]:
         """
         Try multi-capture statistical recovery.
 
-        Captures multiple revolutions and uses bit voting to recover data.
-        Uses the session's codec adapter for decoding when available (Phase 3).
+        Captures revolutions one at a time, decoding and voting after each,
+        until every target sector decodes or voting stops improving. Uses
+        the session's codec adapter for decoding when available (Phase 3).
 
         Args:
             cylinder: Cylinder number
             head: Head number
-            sector: 1-based sector number
+            sectors: 1-based sector numbers to recover
 
         Returns:
-            True if sector recovered
+            Target sectors that decoded with a valid CRC as read; ones
+            that only decode after correction are still marginal
         """
-        from floppy_formatter.hardware import read_track_flux
+        from floppy_formatter.recovery.multi_capture import capture_until_converged
 
         try:
             # Seek to track
             self._device.seek(cylinder, head)
 
-            # Capture multiple revolutions
-            revolutions = self._config.multiread_attempts
-            flux = read_track_flux(self._device, cylinder, head, revolutions=revolutions)
-
-            # Decode using session codec adapter if available (Phase 3)
-            if self._codec_adapter is not None:
-                sectors = self._codec_adapter.decode_track(flux, cylinder, head)
-            else:
-                sectors = decode_flux_data(flux)
+            # Start from the revolutions already read since the last write
+            result = capture_until_converged(
+                self._device, cylinder, head,
+                max_revolutions=self._config.multiread_attempts,
+                expected_sectors=sectors,
+                decoder=lambda flux: self._decode_track(flux, cylinder, head),
+                is_cancelled=self.is_cancelled,
+                stored_revolutions=self._captures.revolutions(cylinder, head),
+                reader=lambda: self._read_track(cylinder, head, 1.2),
+            )
 
-            # Check if our target sector decoded
-            for s in sectors:
-                if s.sector == sector and s.data is not None and s.crc_valid:
-                    return True
+            logger.debug("Multi-capture C%d:H%d used %d revolutions",
+                         cylinder, head, result.revolutions_used)
 
-            return False
+            return {s.sector_number for s in result.sectors if s.crc_valid} & sectors
 
         except Exception as e:
-            logger.warning("Multi-capture failed for C%d:H%d:S%d: %s", cylinder, head, sector, e)
-            return False
+            logger.warning("Multi-capture failed for C%d:H%d: %s", cylinder, head, e)
+            return set()
 
     def _try_pll_tuning(
         self,
         cylinder: int,
         head: int,
-        sector: int
-    ) -> bool:
+        sectors: Set[int]
+    ) -> Set[int]:
         """
         Try PLL parameter tuning for marginal sectors.
 
         Args:
             cylinder: Cylinder number
             head: Head number
-            sector: 1-based sector number
+            sectors: 1-based sector numbers to recover
 
         Returns:
-            True if sector recovered
+            Target sectors recovered by any parameter set
         """
-        from floppy_formatter.hardware import read_track_flux
-        from floppy_formatter.recovery.pll_tuning import try_pll_variations, default_pll_parameters
+        from floppy_formatter.recovery.pll_tuning import (
+            PLLParameterMemory, PLLSearchPool, adaptive_pll_search, try_pll_variations,
+            default_pll_parameters, default_search_workers
+        )
+
+        if self._pll_memory is None:
+            self._pll_memory = PLLParameterMemory()
 
         try:
-            # Seek and capture
-            self._device.seek(cylinder, head)
-            flux = read_track_flux(self._device, cylinder, head, revolutions=3)
+            # At least 3 revolutions, reusing any already read
+            flux = self._stored_flux(cylinder, head, 3)
+
+            # Adaptive search first: it usually finds the sectors in a few
+            # dozen decodes and stops as soon as it does. It starts from
+            # parameters that worked on nearby tracks when there are any.
+            result = adaptive_pll_search(
+                flux, default_pll_parameters(),
+                target_sectors=sectors,
+                is_cancelled=self.is_cancelled,
+                memory=self._pll_memory,
+            )
+            recovered = set(result.get_recovered_sectors()) & sectors
+            if recovered == sectors or result.cancelled:
+                return recovered
+
+            # Fall back to the full grid, spread across cores. The pool's
+            # processes are reused for every track of this restore.
+            if self._pll_pool is None:
+                self._pll_pool = PLLSearchPool(default_search_workers())
+            result = try_pll_variations(
+                flux, default_pll_parameters(),
+                is_cancelled=self.is_cancelled,
+                target_sectors=sectors - recovered,
+                pool=self._pll_pool,
+            )
+            if result.best_params is not None:
+                self._pll_memory.record(cylinder, head, result.best_params,
+                                        result.best_sector_count)
 
-            # Try PLL variations with default parameters as base
-            result = try_pll_variations(flux, default_pll_parameters())
-
-            # Check if target sector was recovered by any parameter set
-            if result.sectors_recovered:
-                for recovered_sectors in result.sectors_recovered.values():
-                    if sector in recovered_sectors:
-                        return True
-            return False
+            # Target sectors recovered by any parameter set
+            return recovered | (set(result.get_recovered_sectors()) & sectors)
 
         except Exception as e:
-            logger.warning("PLL tuning failed for C%d:H%d:S%d: %s", cylinder, head, sector, e)
-            return False
+            logger.warning("PLL tuning failed for C%d:H%d: %s", cylinder, head, e)
+            return set()
 
     def _try_bit_slip_recovery(
         self,
         cylinder: int,
         head: int,
-        sector: int
-    ) -> bool:
+        sectors: Set[int]
+    ) -> Set[int]:
         """
         Try bit-slip recovery for synchronization errors.
 
         Args:
             cylinder: Cylinder number
             head: Head number
-            sector: 1-based sector number
+            sectors: 1-based sector numbers to recover
 
         Returns:
-            True if sector recovered
+            Target sectors reconstructed with a valid CRC
         """
-        from floppy_formatter.hardware import read_track_flux
         from floppy_formatter.recovery.bit_slip_recovery import reconstruct_slipped_sector
 
         try:
-            # Seek and capture
-            self._device.seek(cylinder, head)
-            flux = read_track_flux(self._device, cylinder, head, revolutions=5)
+            # At least 5 revolutions, reusing any already read
+            flux = self._stored_flux(cylinder, head, 5)
 
-            # Try bit-slip recovery
-            result = reconstruct_slipped_sector(flux, sector)
+        except Exception as e:
+            logger.warning("Bit-slip capture failed for C%d:H%d: %s", cylinder, head, e)
+            return set()
 
-            return result is not None and result.crc_valid
+        recovered = set()
+        for sector in sorted(sectors):
+            if self._cancelled:
+                break
+            try:
+                # Try bit-slip recovery on the shared capture
+                result = reconstruct_slipped_sector(flux, sector)
+                if result is not None and result.crc_valid:
+                    recovered.add(sector)
+            except Exception as e:
+                logger.warning(
+                    "Bit-slip recovery failed for C%d:H%d:S%d: %s", cylinder, head, sector, e
+                )
 
-        except Exception as e:
-            logger.warning(
-                "Bit-slip recovery failed for C%d:H%d:S%d: %s", cylinder, head, sector, e
-            )
-            return False
+        return recovered
 
     def _try_maximum_effort(
         self,
         cylinder: int,
         head: int,
-        sector: int
-    ) -> bool:
+        sectors: Set[int]
+    ) -> Set[int]:
         """
         Try maximum effort recovery combining all techniques.
 
@@ -1006,72 +1129,106 @@ class RestoreWorker(GreaseweazleWorker):
         Args:
             cylinder: Cylinder number
             head: Head number
-            sector: 1-based sector number
+            sectors: 1-based sector numbers to recover
 
         Returns:
-            True if sector recovered
+            Target sectors that decoded with a valid CRC
         """
         # Format refresh first
         self._try_format_refresh(cylinder, head)
 
         # Then try multi-capture with extra revolutions
-        from floppy_formatter.hardware import read_track_flux
-
         try:
-            self._device.seek(cylinder, head)
-
             # Maximum revolutions
-            flux = read_track_flux(self._device, cylinder, head, revolutions=20)
-
-            # Decode using session codec adapter if available (Phase 3)
-            if self._codec_adapter is not None:
-                sectors = self._codec_adapter.decode_track(flux, cylinder, head)
-            else:
-                sectors = decode_flux_data(flux)
-
-            for s in sectors:
-                if s.sector == sector and s.data is not None and s.crc_valid:
-                    return True
+            flux = self._stored_flux(cylinder, head, 20)
 
-            return False
+            return self._good_sectors(self._decode_track(flux, cylinder, head)) & sectors
 
         except Exception as e:
-            logger.warning("Maximum effort failed for C%d:H%d:S%d: %s", cylinder, head, sector, e)
-            return False
+            logger.warning("Maximum effort failed for C%d:H%d: %s", cylinder, head, e)
+            return set()
 
-    def _verify_sector(self, cylinder: int, head: int, sector: int) -> bool:
+    def _verify_track(self, cylinder: int, head: int) -> Set[int]:
         """
-        Verify a sector is now readable.
+        Read a track once and report which sectors are now readable.
 
         Uses the session's codec adapter for decoding when available (Phase 3).
 
         Args:
             cylinder: Cylinder number
             head: Head number
-            sector: 1-based sector number
 
         Returns:
-            True if sector reads correctly
+            1-based sector numbers that read correctly
+        """
+        try:
+            flux = self._read_track(cylinder, head, 1.2)
+            return self._good_sectors(self._decode_track(flux, cylinder, head))
+
+        except Exception:
+            return set()
+
+    def _read_track(self, cylinder: int, head: int, revolutions: float):
+        """
+        Read flux from a track and keep its revolutions for reuse.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            revolutions: Revolutions to read
+
+        Returns:
+            FluxData as read
         """
         from floppy_formatter.hardware import read_track_flux
 
-        try:
-            flux = read_track_flux(self._device, cylinder, head, revolutions=1.2)
+        flux = read_track_flux(self._device, cylinder, head, revolutions=revolutions)
+        self._captures.add(flux)
+        return flux
 
-            # Decode using session codec adapter if available (Phase 3)
-            if self._codec_adapter is not None:
-                sectors = self._codec_adapter.decode_track(flux, cylinder, head)
-            else:
-                sectors = decode_flux_data(flux)
+    def _stored_flux(self, cylinder: int, head: int, revolutions: int):
+        """
+        Get every revolution read since the track was last written.
 
-            for s in sectors:
-                if s.sector == sector:
-                    return s.data is not None and s.crc_valid
+        Only the revolutions still missing are read from the drive.
 
-            return False
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            revolutions: Minimum number of revolutions needed
 
-        except Exception:
-            return False
+        Returns:
+            FluxData joining all stored revolutions of the track, or the
+            read itself if none of it could be stored
+        """
+        flux = None
+        missing = revolutions - self._captures.count(cylinder, head)
+        if missing > 0:
+            self._device.seek(cylinder, head)
+            flux = self._read_track(cylinder, head, missing + 0.2)
+        combined = self._captures.combined(cylinder, head)
+        return combined if combined is not None else flux
+
+    def _decode_track(self, flux, cylinder: int, head: int) -> List[SectorData]:
+        """
+        Decode a track with the session codec adapter if available (Phase 3).
+
+        Args:
+            flux: FluxData read from the track
+            cylinder: Cylinder number
+            head: Head number
+
+        Returns:
+            List of decoded sectors
+        """
+        if self._codec_adapter is not None:
+            return self._codec_adapter.decode_track(flux, cylinder, head)
+        return decode_flux_data(flux)
+
+    @staticmethod
+    def _good_sectors(sectors: List[SectorData]) -> Set[int]:
+        """Get the sector numbers that decoded with a valid CRC, without correction."""
+        return {s.sector for s in sectors if s.data is not None and s.is_good}
 
     def _group_by_track(
         self,
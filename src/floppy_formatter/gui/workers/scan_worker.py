@@ -12,6 +12,7 @@ Updated Phase 3: Session-aware scanning with codec adapter support
 import logging
 import random
 import time
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -20,6 +21,7 @@ from typing import List, Dict, Optional, Tuple, Any, TYPE_CHECKING
 from PyQt6.QtCore import pyqtSignal
 
 from floppy_formatter.gui.workers.base_worker import GreaseweazleWorker
+from floppy_formatter.gui.workers.track_pipeline import TrackOutcome, TrackPipeline
 
 if TYPE_CHECKING:
     from floppy_formatter.hardware import GreaseweazleDevice
@@ -113,6 +115,8 @@ class SectorResult:
         crc_valid: True if CRC check passed
         data_hash: Hash of sector data (for comparison)
         flux_quality: Signal quality score (0.0-1.0) if available
+        corrected: True if the data only passed CRC after bit correction
+                  or fusion of copies (counted as good)
     """
     sector_num: int
     linear_sector: int
@@ -121,6 +125,7 @@ class SectorResult:
     crc_valid: bool = True
     data_hash: Optional[str] = None
     flux_quality: float = 1.0
+    corrected: bool = False
 
 
 @dataclass
@@ -132,8 +137,9 @@ class TrackResult:
         cylinder: Cylinder number (0-79)
         head: Head number (0-1)
         sector_results: List of results for each sector
-        good_count: Number of good sectors
+        good_count: Number of good sectors, corrected ones included
         bad_count: Number of bad sectors
+        corrected_count: Number of good sectors that needed correction
         flux_captured: True if raw flux was saved
         average_quality: Average signal quality (0.0-1.0)
         scan_time_ms: Time to scan this track in milliseconds
@@ -143,6 +149,7 @@ class TrackResult:
     sector_results: List[SectorResult] = field(default_factory=list)
     good_count: int = 0
     bad_count: int = 0
+    corrected_count: int = 0
     flux_captured: bool = False
     average_quality: float = 1.0
     scan_time_ms: float = 0.0
@@ -175,6 +182,7 @@ class ScanResult:
         total_sectors: Total number of sectors scanned
         good_sectors: List of good sector numbers
         bad_sectors: List of bad sector numbers
+        corrected_sectors: Good sectors that needed correction
         error_types: Mapping of sector number to error description
         track_results: List of per-track results
         scan_duration: Total scan time in seconds
@@ -184,6 +192,7 @@ class ScanResult:
     total_sectors: int
     good_sectors: List[int] = field(default_factory=list)
     bad_sectors: List[int] = field(default_factory=list)
+    corrected_sectors: List[int] = field(default_factory=list)
     error_types: Dict[int, str] = field(default_factory=dict)
     track_results: List[TrackResult] = field(default_factory=list)
     scan_duration: float = 0.0
@@ -221,6 +230,7 @@ class ScanWorker(GreaseweazleWorker):
 
     Features:
     - Efficient track-at-a-time scanning (one flux capture per track)
+    - Capture of the next track overlapped with decoding (TrackPipeline)
     - Optional raw flux data capture for analysis
     - Multiple scan modes (quick/standard/thorough)
     - Real-time progress and sector status reporting
@@ -335,34 +345,24 @@ class ScanWorker(GreaseweazleWorker):
 
         logger.info("Scanning %d tracks in %s mode", total_tracks, self._mode.name)
 
-        # Scan each track
+        # Scan each track, capturing the next while the last is decoded
+        pipeline = TrackPipeline(self._capture_track, self._decode_track,
+                                 is_cancelled=self.is_cancelled)
         scanned_count = 0
-        for cylinder, head in tracks_to_scan:
-            # Check for cancellation
-            if self._cancelled:
-                logger.info("Scan cancelled at track %d/%d", cylinder, head)
-                break
-
-            # Scan the track
-            track_result = self._scan_track(cylinder, head)
-            result.track_results.append(track_result)
-
-            # Update overall results
-            for sector_result in track_result.sector_results:
-                if sector_result.is_good:
-                    result.good_sectors.append(sector_result.linear_sector)
-                else:
-                    result.bad_sectors.append(sector_result.linear_sector)
-                    if sector_result.error_type:
-                        result.error_types[sector_result.linear_sector] = sector_result.error_type
-
-            # Emit track result
-            self.track_scanned.emit(cylinder, head, track_result)
-
-            # Update progress
-            scanned_count += 1
-            progress = int((scanned_count / total_tracks) * 100)
-            self.progress.emit(progress)
+        with closing(pipeline.run(tracks_to_scan)) as outcomes:
+            for outcome in outcomes:
+                # Check for cancellation
+                if self._cancelled:
+                    logger.info("Scan cancelled at track %d/%d",
+                                outcome.cylinder, outcome.head)
+                    break
+
+                self._record_track(outcome, result)
+
+                # Update progress
+                scanned_count += 1
+                progress = int((scanned_count / total_tracks) * 100)
+                self.progress.emit(progress)
 
         # Calculate duration
         result.scan_duration = time.time() - start_time
@@ -378,6 +378,46 @@ class ScanWorker(GreaseweazleWorker):
         # This must happen after scan_complete so handlers can process the result first
         self.finished.emit()
 
+    def _record_track(self, outcome: TrackOutcome, result: ScanResult) -> None:
+        """
+        Add a pipelined track to the scan result and emit its signals.
+
+        Args:
+            outcome: Pipeline outcome of the track
+            result: Scan result being built
+        """
+        cylinder, head = outcome.cylinder, outcome.head
+        capture, sectors, avg_quality = outcome.unwrap()
+
+        # Emit flux if capturing
+        if self._capture_flux:
+            self.flux_captured.emit(cylinder, head, capture)
+            self._flux_cache[(cylinder, head)] = capture
+
+        track_result = self._build_track_result(cylinder, head, sectors, avg_quality)
+        track_result.scan_time_ms = outcome.elapsed_seconds * 1000
+        result.track_results.append(track_result)
+
+        logger.debug(
+            "Track C%d:H%d scanned: %d/%d good (%.1f ms)",
+            cylinder, head, track_result.good_count,
+            len(track_result.sector_results), track_result.scan_time_ms
+        )
+
+        # Update overall results
+        for sector_result in track_result.sector_results:
+            if sector_result.is_good:
+                result.good_sectors.append(sector_result.linear_sector)
+                if sector_result.corrected:
+                    result.corrected_sectors.append(sector_result.linear_sector)
+            else:
+                result.bad_sectors.append(sector_result.linear_sector)
+                if sector_result.error_type:
+                    result.error_types[sector_result.linear_sector] = sector_result.error_type
+
+        # Emit track result
+        self.track_scanned.emit(cylinder, head, track_result)
+
     def _get_tracks_to_scan(self) -> List[Tuple[int, int]]:
         """
         Get list of tracks to scan based on mode.
@@ -410,37 +450,25 @@ class ScanWorker(GreaseweazleWorker):
                 random.shuffle(all_tracks)
                 tracks.extend(all_tracks[:sample_size])
 
-            # Sort by cylinder for efficient seeking
-            tracks.sort(key=lambda t: (t[0], t[1]))
-            return tracks
+            # Order for the fewest head steps
+            return self._track_scheduler.order(tracks)
 
         else:
             # STANDARD and THOROUGH: All tracks
-            return [
-                (cyl, head)
-                for cyl in range(cylinders)
-                for head in range(heads)
-            ]
+            return self._track_scheduler.sweep(range(cylinders), heads)
 
-    def _scan_track(self, cylinder: int, head: int) -> TrackResult:
+    def _capture_track(self, cylinder: int, head: int) -> Any:
         """
-        Scan a single track.
-
-        Uses the session's codec adapter for decoding when available (Phase 3),
-        otherwise falls back to the default decoder chain.
+        Read a track's flux. Runs on the pipeline's capture thread.
 
         Args:
             cylinder: Cylinder number
             head: Head number
 
         Returns:
-            TrackResult with scan data
+            FluxData read from the track
         """
         from floppy_formatter.hardware import read_track_flux
-        from floppy_formatter.analysis.flux_analyzer import FluxCapture
-        from floppy_formatter.analysis.signal_quality import calculate_snr
-
-        track_start = time.time()
 
         # Seek to track
         self._device.seek(cylinder, head)
@@ -451,19 +479,33 @@ class ScanWorker(GreaseweazleWorker):
         else:
             revolutions = 1.2
 
-        # Capture flux
-        flux = read_track_flux(self._device, cylinder, head, revolutions=revolutions)
+        return read_track_flux(self._device, cylinder, head, revolutions=revolutions)
+
+    def _decode_track(self, cylinder: int, head: int, flux: Any) -> Tuple[Any, list, float]:
+        """
+        Decode a captured track and measure its signal quality.
+
+        Runs on a pipeline thread, so it must not touch the device or emit
+        signals. Uses the session's codec adapter for decoding when
+        available (Phase 3), otherwise falls back to the default decoder
+        chain.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            flux: FluxData read from the track
+
+        Returns:
+            Tuple of (FluxCapture, decoded sectors, quality 0.0-1.0)
+        """
+        from floppy_formatter.analysis.flux_analyzer import FluxCapture
+        from floppy_formatter.analysis.signal_quality import calculate_snr
 
         # Convert to FluxCapture for analysis
         capture = FluxCapture.from_flux_data(flux)
         capture.cylinder = cylinder
         capture.head = head
 
-        # Emit flux if capturing
-        if self._capture_flux:
-            self.flux_captured.emit(cylinder, head, capture)
-            self._flux_cache[(cylinder, head)] = capture
-
         # Decode sectors - use session codec adapter if available (Phase 3)
         if self._codec_adapter is not None:
             # Session-aware decoding for any Greaseweazle format
@@ -490,6 +532,22 @@ class ScanWorker(GreaseweazleWorker):
         except Exception:
             avg_quality = 0.8  # Default if quality calculation fails
 
+        return capture, sectors, avg_quality
+
+    def _build_track_result(self, cylinder: int, head: int, sectors: list,
+                            avg_quality: float) -> TrackResult:
+        """
+        Build a track result from decoded sectors, emitting sector status.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            sectors: Decoded sectors
+            avg_quality: Track signal quality (0.0-1.0)
+
+        Returns:
+            TrackResult with scan data
+        """
         # Process results
         track_result = TrackResult(
             cylinder=cylinder,
@@ -517,11 +575,13 @@ class ScanWorker(GreaseweazleWorker):
             if sector_num not in best_sectors:
                 best_sectors[sector_num] = sector
             else:
-                # Prefer good CRC over bad CRC
+                # Prefer good CRC, then corrected, over bad CRC
                 existing = best_sectors[sector_num]
-                if sector.crc_valid and not existing.crc_valid:
+                rank = (sector.is_good, sector.is_recovered)
+                existing_rank = (existing.is_good, existing.is_recovered)
+                if rank > existing_rank:
                     best_sectors[sector_num] = sector
-                elif sector.crc_valid == existing.crc_valid:
+                elif rank == existing_rank:
                     # Both same CRC status, prefer better signal quality
                     if hasattr(sector, 'signal_quality') and hasattr(existing, 'signal_quality'):
                         if sector.signal_quality > existing.signal_quality:
@@ -538,7 +598,7 @@ class ScanWorker(GreaseweazleWorker):
 
             if sector_num in best_sectors:
                 sector = best_sectors[sector_num]
-                is_good = sector.data is not None and sector.crc_valid
+                is_good = sector.data is not None and sector.is_recovered
                 error_type = None
 
                 if not is_good:
@@ -556,6 +616,7 @@ class ScanWorker(GreaseweazleWorker):
                     error_type=error_type,
                     crc_valid=sector.crc_valid,
                     flux_quality=avg_quality,
+                    corrected=is_good and sector.is_corrected,
                 )
             else:
                 # Sector not found in any revolution
@@ -574,6 +635,8 @@ class ScanWorker(GreaseweazleWorker):
 
             if is_good:
                 track_result.good_count += 1
+                if sector_result.corrected:
+                    track_result.corrected_count += 1
             else:
                 track_result.bad_count += 1
 
@@ -584,14 +647,6 @@ class ScanWorker(GreaseweazleWorker):
                 error_type or ""
             )
 
-        track_result.scan_time_ms = (time.time() - track_start) * 1000
-
-        logger.debug(
-            "Track C%d:H%d scanned: %d/%d good (%.1f ms)",
-            cylinder, head, track_result.good_count,
-            sectors_per_track, track_result.scan_time_ms
-        )
-
         return track_result
 
     def get_geometry(self) -> 'DiskGeometry':
@@ -0,0 +1,258 @@
+"""
+Capture/decode pipeline for whole-disk workers.
+
+Workers that visit every track spend part of each track waiting for the
+drive and part decoding and measuring in Python. Run strictly in turn,
+the drive idles while Python works and the CPU idles while the disk
+turns. The pipeline overlaps the two: a capture thread reads track N+1
+from the device while a small thread pool processes track N.
+
+Outcomes are delivered on the calling thread in track order, so workers
+keep emitting their signals from their own thread exactly as before.
+The capture thread is the only thread that touches the device while the
+pipeline runs, and it runs at most a few tracks ahead of processing.
+
+Key Classes:
+    TrackPipeline: Overlaps device capture with track processing
+    TrackOutcome: Result (or error) and timings of one track
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Tracks captured or being processed ahead of the one being delivered.
+# Two keeps the drive busy while bounding flux held in memory.
+DEFAULT_PIPELINE_DEPTH = 2
+
+# Threads processing captured tracks
+DEFAULT_DECODE_WORKERS = 2
+
+# Poll interval for the capture thread when the queue is full (seconds)
+_QUEUE_POLL_INTERVAL = 0.05
+
+# Marks the end of the capture stream
+_END = object()
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class TrackOutcome:
+    """
+    Outcome of one track through the pipeline.
+
+    Attributes:
+        cylinder: Cylinder number
+        head: Head number
+        result: Value returned by the process function
+        error: Exception raised by capture or processing, if any
+        capture_seconds: Time spent capturing the track
+        process_seconds: Time spent processing the track
+    """
+    cylinder: int
+    head: int
+    result: Any = None
+    error: Optional[BaseException] = None
+    capture_seconds: float = 0.0
+    process_seconds: float = 0.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Capture plus processing time."""
+        return self.capture_seconds + self.process_seconds
+
+    def unwrap(self) -> Any:
+        """Return the result, re-raising the track's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+class TrackPipeline:
+    """
+    Overlap device capture with track processing.
+
+    capture(cylinder, head) runs on a dedicated thread, one track at a
+    time and in order. process(cylinder, head, captured) runs on a thread
+    pool and must not touch the device. Outcomes are yielded in track
+    order. Both the capture queue and the processing queue hold at most
+    depth tracks, so a slow consumer stalls capture instead of growing
+    memory.
+
+    A failed capture or process call does not stop the pipeline; its
+    outcome carries the error. Closing the generator (or leaving a
+    closing() block) stops capture after the current track and waits for
+    the threads.
+
+    Example:
+        >>> pipeline = TrackPipeline(read_flux, decode, is_cancelled=worker.is_cancelled)
+        >>> with closing(pipeline.run(tracks)) as outcomes:
+        ...     for outcome in outcomes:
+        ...         emit(outcome.cylinder, outcome.head, outcome.unwrap())
+    """
+
+    def __init__(
+        self,
+        capture: Callable[[int, int], Any],
+        process: Callable[[int, int, Any], Any],
+        depth: int = DEFAULT_PIPELINE_DEPTH,
+        workers: int = DEFAULT_DECODE_WORKERS,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            capture: Reads a track from the device
+            process: Processes a captured track
+            depth: Tracks allowed ahead of the one being delivered
+            workers: Threads processing captured tracks
+            is_cancelled: Polled before each capture; capture stops once
+                         it returns True
+        """
+        self._capture = capture
+        self._process = process
+        self._depth = max(1, depth)
+        self._workers = max(1, workers)
+        self._is_cancelled = is_cancelled or (lambda: False)
+
+    def run(self, tracks: Iterable[Tuple[int, int]]) -> Iterator[TrackOutcome]:
+        """
+        Capture and process tracks, yielding outcomes in track order.
+
+        Args:
+            tracks: (cylinder, head) pairs in capture order
+
+        Yields:
+            TrackOutcome per track captured
+        """
+        tracks = list(tracks)
+        captured: 'queue.Queue' = queue.Queue(maxsize=self._depth)
+        stop = threading.Event()
+
+        capture_thread = threading.Thread(
+            target=self._capture_all, args=(tracks, captured, stop),
+            name="track-capture", daemon=True
+        )
+        pool = ThreadPoolExecutor(max_workers=self._workers,
+                                  thread_name_prefix="track-process")
+        pending: Deque[Tuple[TrackOutcome, Optional[Future]]] = deque()
+        capture_done = False
+
+        capture_thread.start()
+        try:
+            while True:
+                # Deliver finished tracks in order
+                while pending and (pending[0][1] is None or pending[0][1].done()):
+                    yield self._finish(*pending.popleft())
+
+                if capture_done and not pending:
+                    break
+
+                if not capture_done and len(pending) < self._depth:
+                    # Take the next capture, but keep checking the track
+                    # at the head of the queue while processing runs
+                    try:
+                        item = captured.get(timeout=_QUEUE_POLL_INTERVAL if pending else None)
+                    except queue.Empty:
+                        continue
+                    if item is _END:
+                        capture_done = True
+                        continue
+                    outcome, data = item
+                    future = None
+                    if outcome.error is None:
+                        future = pool.submit(self._timed_process, outcome, data)
+                    pending.append((outcome, future))
+                else:
+                    wait([pending[0][1]], return_when=FIRST_COMPLETED)
+        finally:
+            stop.set()
+            # Unblock the capture thread if it is waiting on a full queue
+            while capture_thread.is_alive():
+                try:
+                    captured.get_nowait()
+                except queue.Empty:
+                    pass
+                capture_thread.join(_QUEUE_POLL_INTERVAL)
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _capture_all(self, tracks, captured: 'queue.Queue', stop: threading.Event) -> None:
+        """Capture each track in turn and queue it for processing."""
+        try:
+            for cylinder, head in tracks:
+                if stop.is_set() or self._is_cancelled():
+                    break
+
+                outcome = TrackOutcome(cylinder=cylinder, head=head)
+                data = None
+                started = time.monotonic()
+                try:
+                    data = self._capture(cylinder, head)
+                except Exception as e:
+                    logger.debug("Capture failed for C%d:H%d: %s", cylinder, head, e)
+                    outcome.error = e
+                outcome.capture_seconds = time.monotonic() - started
+
+                if not self._put(captured, (outcome, data), stop):
+                    return
+        finally:
+            self._put(captured, _END, stop)
+
+    @staticmethod
+    def _put(captured: 'queue.Queue', item: Any, stop: threading.Event) -> bool:
+        """Queue an item, giving up if the pipeline is stopped."""
+        while not stop.is_set():
+            try:
+                captured.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _timed_process(self, outcome: TrackOutcome, data: Any) -> Any:
+        """Process a captured track, recording the time taken."""
+        started = time.monotonic()
+        try:
+            return self._process(outcome.cylinder, outcome.head, data)
+        finally:
+            outcome.process_seconds = time.monotonic() - started
+
+    @staticmethod
+    def _finish(outcome: TrackOutcome, future: Optional[Future]) -> TrackOutcome:
+        """Fill in the outcome of a processed track."""
+        if future is not None:
+            try:
+                outcome.result = future.result()
+            except Exception as e:
+                logger.debug("Processing failed for C%d:H%d: %s",
+                             outcome.cylinder, outcome.head, e)
+                outcome.error = e
+        return outcome
+
+
+__all__ = [
+    'TrackPipeline',
+    'TrackOutcome',
+    'DEFAULT_PIPELINE_DEPTH',
+    'DEFAULT_DECODE_WORKERS',
+]
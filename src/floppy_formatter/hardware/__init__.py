@@ -204,6 +204,7 @@ class SectorStatus(IntEnum):
     MISSING = 2        # Sector header not found
     WEAK = 3           # Sector decoded but signal quality poor
     NO_DATA = 4        # Header found but data field missing/corrupted
+    CORRECTED = 5      # CRC only valid after software bit correction or copy fusion
 
 
 # =============================================================================
@@ -244,8 +245,9 @@ class SectorData:
     sector: int
     data: bytes
     status: SectorStatus
-    crc_valid: bool
+    crc_valid: bool  # CRC matched the data as read; False for CORRECTED sectors
     signal_quality: float  # 0.0 to 1.0, higher is better
+    corrected_bits: int = 0  # Bits changed by CRC error correction or fusion
 
     @property
     def chs(self) -> Tuple[int, int, int]:
@@ -257,6 +259,16 @@ class SectorData:
         """Check if sector was read successfully."""
         return self.status == SectorStatus.GOOD and self.crc_valid
 
+    @property
+    def is_corrected(self) -> bool:
+        """Check if the CRC only passed after bit correction or copy fusion."""
+        return self.status == SectorStatus.CORRECTED
+
+    @property
+    def is_recovered(self) -> bool:
+        """Check if the sector data is usable: read good or corrected."""
+        return self.is_good or self.is_corrected
+
 
 # =============================================================================
 # Abstract Interface
@@ -353,12 +365,12 @@ class IFloppyDevice(ABC):
         pass
 
     @abstractmethod
-    def get_current_position(self) -> Tuple[int, int]:
+    def get_current_position(self) -> Tuple[Optional[int], Optional[int]]:
         """
         Get current head position.
 
         Returns:
-            Tuple of (cylinder, head)
+            Tuple of (cylinder, head), None where the position is unknown
         """
         pass
 
@@ -493,6 +505,8 @@ __all__ = [
     'SectorCallback',
     # From greaseweazle_device.py
     'GreaseweazleDevice',
+    'add_track_write_listener',
+    'remove_track_write_listener',
     # From flux_io.py
     'FluxData',
     'FluxReader',
@@ -521,15 +535,20 @@ __all__ = [
     'AlignmentResult',
     'DriveHealth',
     'HealthGrade',
+    'SettleCalibration',
     'calibrate_drive',
     'quick_calibration',
     'measure_rpm',
     'measure_bit_timing',
     'check_head_alignment',
+    'calibrate_settle_times',
     'format_calibration_report',
     # From codec_adapter.py
     'CodecAdapter',
     'TrackTiming',
+    # From track_scheduler.py
+    'TrackScheduler',
+    'count_steps',
 ]
 
 # =============================================================================
@@ -538,7 +557,9 @@ __all__ = [
 
 # Import classes from submodules - these depend on base classes defined above
 from .flux_io import FluxData, FluxReader, FluxWriter  # noqa: E402
-from .greaseweazle_device import GreaseweazleDevice  # noqa: E402
+from .greaseweazle_device import (  # noqa: E402
+    GreaseweazleDevice, add_track_write_listener, remove_track_write_listener,
+)
 from .mfm_codec import (  # noqa: E402
     MFMDecoder, MFMEncoder, MFMBitstream,
     decode_flux_to_sectors, encode_sectors_to_flux,
@@ -547,9 +568,9 @@ from .mfm_codec import (  # noqa: E402
 )
 from .drive_calibration import (  # noqa: E402
     DriveCalibration, RPMMeasurement, BitTimingMeasurement,
-    AlignmentResult, DriveHealth, HealthGrade,
+    AlignmentResult, DriveHealth, HealthGrade, SettleCalibration,
     calibrate_drive, quick_calibration, measure_rpm,
-    measure_bit_timing, check_head_alignment,
+    measure_bit_timing, check_head_alignment, calibrate_settle_times,
     format_calibration_report,
 )
 
@@ -562,6 +583,9 @@ from .flux_io import (  # noqa: E402
 # Import codec adapter
 from .codec_adapter import CodecAdapter, TrackTiming  # noqa: E402
 
+# Import track scheduler
+from .track_scheduler import TrackScheduler, count_steps  # noqa: E402
+
 
 # =============================================================================
 # PLL Decoder Helper
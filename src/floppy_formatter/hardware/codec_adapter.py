@@ -27,9 +27,11 @@ Example:
 
 from __future__ import annotations
 
+import copy
 import logging
 import sys
 import io
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
@@ -37,6 +39,7 @@ from typing import List, Optional, Dict, Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from floppy_formatter.core.session import DiskSession
     from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.lru_cache import LRUCache
 
 # Greaseweazle imports
 try:
@@ -51,9 +54,60 @@ except ImportError:
 
 from floppy_formatter.hardware import SectorData, SectorStatus
 from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_tables import CORRECTED_SECTOR_QUALITY
+from floppy_formatter.hardware.sector_fusion import fuse_dam_copies
 
 logger = logging.getLogger(__name__)
 
+# Decoded tracks remembered across all adapters (~10KB each for HD)
+DECODE_CACHE_MAX_ENTRIES = 256
+
+
+class DecodeCache(LRUCache[List[SectorData]]):
+    """
+    Thread-safe LRU of decoded tracks keyed by flux content.
+
+    The scan, analysis and verify paths often decode the very same capture
+    again (a GUI tab re-rendering, a verifier re-grading); the cache turns
+    those repeats into a lookup. Entries are keyed by format, track and
+    FluxData.content_digest(), so equal flux in different objects hits too.
+    Sectors are copied in and out, so callers may change what they get.
+    """
+
+    def __init__(self, max_entries: int = DECODE_CACHE_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Decoded tracks kept
+        """
+        super().__init__(max_entries=max_entries)
+
+    def get(self, key: tuple) -> Optional[List[SectorData]]:
+        """
+        Get the sectors decoded for a key, counting the hit or miss.
+
+        Returns:
+            Copies of the cached sectors, or None if not cached
+        """
+        sectors = super().get(key)
+        if sectors is None:
+            return None
+        return [copy.copy(s) for s in sectors]
+
+    def put(self, key: tuple, sectors: List[SectorData]) -> None:
+        """Store the sectors decoded for a key, evicting the oldest entries."""
+        super().put(key, [copy.copy(s) for s in sectors])
+
+
+# Shared by all adapters: decode_flux_data() creates a new adapter per call
+_decode_cache = DecodeCache()
+
+# Shared stdout redirection state for _suppress_stdout()
+_stdout_lock = threading.Lock()
+_stdout_depth = 0
+_stdout_saved = None
+
 
 @contextmanager
 def _suppress_stdout():
@@ -61,14 +115,24 @@ def _suppress_stdout():
     Context manager to suppress stdout.
 
     Used to suppress debug print statements from the Greaseweazle library
-    (e.g., "Unknown mark xx" messages from ibm.py).
+    (e.g., "Unknown mark xx" messages from ibm.py). Nested and concurrent
+    uses (decodes running on a thread pool) share one redirection, so the
+    real stdout is restored only when the last of them exits.
     """
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
+    global _stdout_saved, _stdout_depth
+    with _stdout_lock:
+        if _stdout_depth == 0:
+            _stdout_saved = sys.stdout
+            sys.stdout = io.StringIO()
+        _stdout_depth += 1
     try:
         yield
     finally:
-        sys.stdout = old_stdout
+        with _stdout_lock:
+            _stdout_depth -= 1
+            if _stdout_depth == 0:
+                sys.stdout = _stdout_saved
+                _stdout_saved = None
 
 
 # =============================================================================
@@ -229,6 +293,11 @@ class CodecAdapter:
         self._track_cache.clear()
         logger.debug("Track cache cleared")
 
+    @staticmethod
+    def get_decode_cache() -> DecodeCache:
+        """Get the decode cache shared by all adapters."""
+        return _decode_cache
+
     def debug_decode_raw_flux(self, gw_flux, cyl: int, head: int) -> dict:
         """
         Debug function to decode raw Greaseweazle Flux directly.
@@ -344,6 +413,18 @@ class CodecAdapter:
             >>> good_count = sum(1 for s in sectors if s.is_good)
             >>> print(f"Decoded {good_count}/{len(sectors)} good sectors")
         """
+        key = (self._gw_format, cyl, head, flux_data.content_digest())
+        sectors = _decode_cache.get(key)
+        if sectors is not None:
+            logger.debug("C%d:H%d: decode served from cache", cyl, head)
+            return sectors
+
+        sectors = self._decode_flux(flux_data, cyl, head)
+        _decode_cache.put(key, sectors)
+        return sectors
+
+    def _decode_flux(self, flux_data: 'FluxData', cyl: int, head: int) -> List[SectorData]:
+        """Decode flux to sectors with the Greaseweazle codec (uncached)."""
         # Create a fresh track object for decoding (don't use cache)
         track = self._get_track(cyl, head, use_cache=False)
 
@@ -473,6 +554,15 @@ class CodecAdapter:
 
                 # Calculate signal quality
                 signal_quality = self._calculate_signal_quality(gw_sec, status)
+                corrected_bits = 0
+
+                # No good copy: try fusing the failed copies from each revolution
+                if status == SectorStatus.CRC_ERROR:
+                    fused = self._fuse_failed_copies(track, gw_sec)
+                    if fused is not None:
+                        data, corrected_bits = fused
+                        status, crc_valid = SectorStatus.CORRECTED, False
+                        signal_quality = CORRECTED_SECTOR_QUALITY
 
                 sector = SectorData(
                     cylinder=cyl,
@@ -481,7 +571,8 @@ class CodecAdapter:
                     data=data,
                     status=status,
                     crc_valid=crc_valid,
-                    signal_quality=signal_quality
+                    signal_quality=signal_quality,
+                    corrected_bits=corrected_bits
                 )
                 found_sectors[sec_num] = sector
 
@@ -512,6 +603,49 @@ class CodecAdapter:
 
         return sectors
 
+    def _fuse_failed_copies(self, track, gw_sec) -> Optional[tuple]:
+        """
+        Fuse the CRC-failed copies of a sector found across revolutions.
+
+        Fixed-layout IBM tracks keep every copy the raw decode found in
+        track.raw; other tracks list their copies directly.
+
+        Args:
+            track: Decoded Greaseweazle track
+            gw_sec: The track's entry for the sector
+
+        Returns:
+            Tuple of (fused sector data, bits flipped), or None if the
+            sector cannot be recovered this way
+        """
+        idam = getattr(gw_sec, 'idam', None)
+        if idam is None:
+            return None
+        key = (getattr(idam, 'c', None), getattr(idam, 'h', None),
+               getattr(idam, 'r', None), getattr(idam, 'n', None))
+
+        raw = getattr(track, 'raw', None)
+        candidates = getattr(raw, 'sectors', None) or getattr(track, 'sectors', [])
+
+        copies = []
+        for candidate in candidates:
+            copy_idam, dam = getattr(candidate, 'idam', None), getattr(candidate, 'dam', None)
+            if copy_idam is None or dam is None or getattr(dam, 'data', None) is None:
+                continue
+            if getattr(copy_idam, 'crc', None) != 0:
+                continue
+            if (copy_idam.c, copy_idam.h, copy_idam.r, copy_idam.n) != key:
+                continue
+            copies.append((dam.mark, bytes(dam.data), dam.crc))
+
+        if len(copies) < 2:
+            return None
+
+        fused = fuse_dam_copies(copies)
+        if fused is not None:
+            logger.debug("Sector R=%s recovered by fusing %d copies", key[2], len(copies))
+        return fused
+
     def _get_sector_number(self, gw_sec, default_idx: int) -> int:
         """
         Get sector number from Greaseweazle sector object.
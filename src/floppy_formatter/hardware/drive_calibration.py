@@ -11,12 +11,14 @@ Key Functions:
     measure_rpm: Measure drive rotation speed
     measure_bit_timing: Measure actual bit cell width
     check_head_alignment: Assess head positioning accuracy
+    calibrate_settle_times: Find the shortest reliable head settle times
     get_drive_health: Overall drive health assessment
 
 Key Classes:
     DriveCalibration: Results from calibration procedure
     AlignmentResult: Head alignment measurement results
     DriveHealth: Overall drive health assessment
+    SettleCalibration: Head settle times measured for a drive
 """
 
 import logging
@@ -26,7 +28,10 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import List, Optional, Dict, TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from .flux_io import FluxData
     from .greaseweazle_device import GreaseweazleDevice
 
 from . import (
@@ -36,6 +41,7 @@ from . import (
     SectorStatus,
 )
 from .flux_io import analyze_flux_quality
+from .greaseweazle_device import HEAD_SETTLE_TIME, SEEK_SETTLE_TIME
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +62,15 @@ CAL_TRACK_OUTER = 2      # Track near outer edge
 CAL_TRACK_MIDDLE = 40    # Track in middle
 CAL_TRACK_INNER = 78     # Track near inner edge
 
+# Settle time calibration: candidates tried from longest to shortest (ms)
+SETTLE_STEP_CANDIDATES_MS = (12.0, 10.0, 8.0, 6.0, 4.0, 3.0)
+SETTLE_HEAD_CANDIDATES_MS = (20.0, 15.0, 10.0, 6.0, 4.0, 2.0)
+SETTLE_MARGIN = 1.5            # Multiply the shortest passing time by this
+SETTLE_WINDOW_MS = 4.0         # Flux compared right after the settle
+SETTLE_FLUX_TOLERANCE = 0.05   # Max deviation outside the settled reads' range
+SETTLE_TRIALS = 2              # Reads per candidate that must all pass
+SETTLE_REFERENCE_READS = 3     # Settled reads per head the trials are compared with
+
 # Health score thresholds
 HEALTH_EXCELLENT = 0.9
 HEALTH_GOOD = 0.7
@@ -164,6 +179,27 @@ class DriveHealth:
         return f"Drive Health: {self.grade_letter} ({self.score:.0%})"
 
 
+@dataclass
+class SettleCalibration:
+    """Head settle times measured for a drive."""
+    step_settle_ms: float
+    head_settle_ms: float
+    default_step_ms: float
+    default_head_ms: float
+    reference_transitions: int
+    reads: int
+
+    @property
+    def saved_per_step_ms(self) -> float:
+        """Settle time saved on each cylinder step versus the default."""
+        return self.default_step_ms - self.step_settle_ms
+
+    @property
+    def saved_per_head_switch_ms(self) -> float:
+        """Settle time saved on each head switch versus the default."""
+        return self.default_head_ms - self.head_settle_ms
+
+
 @dataclass
 class DriveCalibration:
     """Complete drive calibration results."""
@@ -174,6 +210,7 @@ class DriveCalibration:
     alignment: Dict[int, AlignmentResult]  # Track -> result
     health: DriveHealth
     calibration_successful: bool
+    settle: Optional[SettleCalibration] = None  # Full calibration only
 
     @property
     def optimal_bit_cell_us(self) -> float:
@@ -403,6 +440,199 @@ def check_head_alignment(
     return results
 
 
+def _window_transitions(flux: 'FluxData', start: float, width: float) -> Optional[int]:
+    """
+    Count transitions ending in a window of a capture.
+
+    Args:
+        flux: Captured flux
+        start: Window start in sample ticks from the capture start
+        width: Window length in sample ticks
+
+    Returns:
+        Transitions ending after start and up to start + width, or None if
+        the window is not wholly within the capture
+    """
+    ends = flux.get_cumulative_samples()
+    if not ends.size or start < 0 or start + width > ends[-1]:
+        return None
+    return int(np.searchsorted(ends, start + width, side='right')
+               - np.searchsorted(ends, start, side='right'))
+
+
+def _start_angle(flux: 'FluxData', period: float) -> Optional[float]:
+    """
+    Get where on the track a capture started.
+
+    Args:
+        flux: Captured flux
+        period: Revolution length in sample ticks
+
+    Returns:
+        Ticks from the index pulse to the capture start, or None if the
+        capture saw no index pulse
+    """
+    boundaries = flux.get_index_boundaries()
+    if not boundaries.size:
+        return None
+    return -float(boundaries[0]) % period
+
+
+def _window_at_angle(flux: 'FluxData', angle: float, width: float,
+                     period: float) -> Optional[int]:
+    """
+    Count transitions in the window starting angle ticks after the index pulse.
+
+    Args:
+        flux: Captured flux
+        angle: Window start in ticks after the index pulse
+        width: Window length in sample ticks
+        period: Revolution length in sample ticks
+
+    Returns:
+        Transition count, or None if the capture does not hold the window
+    """
+    boundaries = flux.get_index_boundaries()
+    if not boundaries.size:
+        return None
+    first = float(boundaries[0])
+    for start in (first + angle, first + angle - period):
+        count = _window_transitions(flux, start, width)
+        if count is not None:
+            return count
+    return None
+
+
+def calibrate_settle_times(
+    device: 'GreaseweazleDevice', cylinder: int = CAL_TRACK_MIDDLE,
+    trials: int = SETTLE_TRIALS, apply: bool = True
+) -> SettleCalibration:
+    """
+    Find the shortest head settle times that still give clean reads.
+
+    Reads both heads of a cylinder SETTLE_REFERENCE_READS times with the
+    default settle times as a reference. Each candidate time is then
+    tried from longest to shortest: the head is stepped in from the
+    neighbouring cylinder (or switched to the other head) and the track
+    read immediately after the settle. Only the first SETTLE_WINDOW_MS of
+    each read is compared, as that is the flux a head still moving would
+    damage; across a whole revolution the damage is lost in the count.
+    The trial read's index pulse places that window on the track, and the
+    same stretch of track is counted in each reference read. A candidate
+    passes if every read's first window is within the range of those
+    settled counts, widened by SETTLE_FLUX_TOLERANCE. The shortest passing
+    time, with SETTLE_MARGIN added and capped at the default, is the
+    result.
+
+    Works on any disk with flux on the calibration cylinder; it does not
+    need to be formatted.
+
+    Args:
+        device: Connected GreaseweazleDevice with motor running
+        cylinder: Cylinder to calibrate on (must not be 0)
+        trials: Reads per candidate that must all pass
+        apply: If True, set the results on the device; otherwise the
+              device's settle times are left unchanged
+
+    Returns:
+        SettleCalibration with the chosen settle times
+
+    Raises:
+        GreaseweazleError: If the calibration cylinder has no flux
+    """
+    logger.info("Calibrating head settle times on cylinder %d", cylinder)
+
+    original = device.settle_times
+    reads = 0
+
+    def capture(head: int) -> 'FluxData':
+        nonlocal reads
+        reads += 1
+        return device.read_track(cylinder, head, revolutions=1)
+
+    def read_ok(head: int) -> bool:
+        flux = capture(head)
+        width = SETTLE_WINDOW_MS / 1000 * flux.sample_freq
+        count = _window_transitions(flux, 0, width)
+        angle = _start_angle(flux, period)
+        if count is None or angle is None:
+            return False
+
+        settled = [_window_at_angle(ref, angle, width, period) for ref in reference[head]]
+        settled = [n for n in settled if n is not None]
+        if not settled:
+            return False
+        low = min(settled) * (1 - SETTLE_FLUX_TOLERANCE)
+        high = max(settled) * (1 + SETTLE_FLUX_TOLERANCE)
+        return low <= count <= high
+
+    def step_in(head: int) -> bool:
+        device.seek(cylinder - 1, head)
+        return read_ok(head)
+
+    def switch_heads(head: int) -> bool:
+        # Read the other head first so each read follows a head switch
+        return read_ok(1 - head) and read_ok(head)
+
+    def shortest(candidates, apply_candidate, trial) -> Optional[float]:
+        passed = None
+        for candidate_ms in candidates:
+            apply_candidate(candidate_ms / 1000)
+            if not all(trial(0) for _ in range(trials)):
+                logger.debug("Settle %.1fms failed", candidate_ms)
+                break
+            passed = candidate_ms
+        return passed
+
+    try:
+        device.set_settle_times(SEEK_SETTLE_TIME, HEAD_SETTLE_TIME)
+        device.seek(cylinder, 0)
+        reference = {0: [], 1: []}
+        for _ in range(SETTLE_REFERENCE_READS):
+            for head in (0, 1):
+                reference[head].append(capture(head))
+
+        captures = reference[0] + reference[1]
+        if not all(flux.transition_count for flux in captures):
+            raise GreaseweazleError(
+                f"No flux on cylinder {cylinder} - insert a disk with data for calibration"
+            )
+        revolutions = np.concatenate([np.diff(flux.get_index_boundaries())
+                                      for flux in captures])
+        period = (float(np.median(revolutions)) if revolutions.size
+                  else captures[0].sample_freq * 60 / NOMINAL_RPM)
+
+        step_ms = shortest(SETTLE_STEP_CANDIDATES_MS,
+                           lambda t: device.set_settle_times(step=t), step_in)
+        device.set_settle_times(step=SEEK_SETTLE_TIME)
+        head_ms = shortest(SETTLE_HEAD_CANDIDATES_MS,
+                           lambda t: device.set_settle_times(head=t), switch_heads)
+    finally:
+        device.set_settle_times(*original)
+
+    default_step_ms = SEEK_SETTLE_TIME * 1000
+    default_head_ms = HEAD_SETTLE_TIME * 1000
+    result = SettleCalibration(
+        step_settle_ms=(min(default_step_ms, step_ms * SETTLE_MARGIN)
+                        if step_ms is not None else default_step_ms),
+        head_settle_ms=(min(default_head_ms, head_ms * SETTLE_MARGIN)
+                        if head_ms is not None else default_head_ms),
+        default_step_ms=default_step_ms,
+        default_head_ms=default_head_ms,
+        reference_transitions=reference[0][0].transition_count,
+        reads=reads,
+    )
+
+    if apply:
+        device.set_settle_times(result.step_settle_ms / 1000, result.head_settle_ms / 1000)
+
+    logger.info("Settle times: step %.1fms (default %.1fms), head %.1fms (default %.1fms)",
+                result.step_settle_ms, default_step_ms,
+                result.head_settle_ms, default_head_ms)
+
+    return result
+
+
 def assess_drive_health(
     rpm: RPMMeasurement, timing: BitTimingMeasurement,
     alignment: Dict[int, AlignmentResult]
@@ -565,6 +795,14 @@ def calibrate_drive(
 
     alignment = check_head_alignment(device, alignment_tracks)
 
+    # Tune head settle times for this drive
+    settle = None
+    if full_calibration:
+        try:
+            settle = calibrate_settle_times(device)
+        except (GreaseweazleError, SeekError) as e:
+            logger.warning("Settle time calibration failed, keeping defaults: %s", e)
+
     # Assess overall health
     health = assess_drive_health(rpm, timing, alignment)
 
@@ -582,7 +820,8 @@ def calibrate_drive(
         bit_timing=timing,
         alignment=alignment,
         health=health,
-        calibration_successful=True
+        calibration_successful=True,
+        settle=settle
     )
 
 
@@ -647,6 +886,16 @@ def format_calibration_report(cal: DriveCalibration) -> str:
             f"(signal: {result.signal_strength:.0%})"
         )
 
+    if cal.settle is not None:
+        lines.extend([
+            "",
+            "--- Head Settle ---",
+            f"  Step: {cal.settle.step_settle_ms:.1f}ms "
+            f"(default {cal.settle.default_step_ms:.1f}ms)",
+            f"  Head Switch: {cal.settle.head_settle_ms:.1f}ms "
+            f"(default {cal.settle.default_head_ms:.1f}ms)",
+        ])
+
     lines.extend([
         "",
         "--- Issues ---",
@@ -11,6 +11,7 @@ can be decoded into sector data using the MFM codec.
 
 Key Classes:
     FluxData: Container for raw flux timing data with analysis methods
+    FluxArrayView: Read-only list-compatible view over FluxData arrays
 
 Key Functions:
     read_track_flux: Capture flux from a track
@@ -19,10 +20,14 @@ Key Functions:
     analyze_flux_quality: Calculate signal quality metrics
 """
 
+import hashlib
 import logging
 import statistics
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Iterator, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, Iterator, Union, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from .greaseweazle_device import GreaseweazleDevice
@@ -67,6 +72,88 @@ DEFAULT_SAMPLE_FREQ = 72_000_000  # 72 MHz
 # Index pulse timing
 INDEX_PULSE_MIN_SAMPLES = 1000  # Minimum samples between valid indices
 
+# Storage types for FluxData arrays. Flux intervals are tick counts that fit
+# comfortably in 32 bits (~59s at 72MHz); index values are kept 64-bit so
+# cumulative positions never overflow.
+FLUX_DTYPE = np.uint32
+INDEX_DTYPE = np.int64
+
+
+def _as_readonly_array(values: Any, dtype: Any) -> np.ndarray:
+    """
+    Convert values to a contiguous read-only array of the given dtype.
+
+    Arrays that already have the right layout are wrapped without copying;
+    the read-only flag is set on a view so the caller's array is untouched.
+    """
+    if isinstance(values, FluxArrayView):
+        values = values.array
+    array = np.ascontiguousarray(values, dtype=dtype)
+    if array.ndim != 1:
+        array = array.reshape(-1)
+    if array is values or array.base is not None:
+        array = array.view()
+    array.flags.writeable = False
+    return array
+
+
+class FluxArrayView(Sequence):
+    """
+    Read-only, list-compatible view over a FluxData sample array.
+
+    FluxData stores its flux and index values as NumPy arrays. This view
+    keeps the historical ``List[int]`` API working (len, truth testing,
+    indexing, iteration, ``copy()``, equality with lists) without
+    materialising a Python list. Hot paths should use ``.array`` instead.
+    """
+
+    __slots__ = ('_array',)
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    @property
+    def array(self) -> np.ndarray:
+        """Get the underlying read-only NumPy array (zero-copy)."""
+        return self._array
+
+    def tolist(self) -> List[int]:
+        """Materialise the values as a Python list of ints."""
+        return self._array.tolist()
+
+    def copy(self) -> List[int]:
+        """Return a mutable list copy, matching ``list.copy()``."""
+        return self._array.tolist()
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self._array.dtype:
+            return self._array.copy() if copy else self._array
+        return self._array.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __bool__(self) -> bool:
+        return len(self._array) > 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, 'FluxArrayView']:
+        if isinstance(index, slice):
+            return FluxArrayView(self._array[index])
+        return int(self._array[index])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._array.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FluxArrayView):
+            return np.array_equal(self._array, other._array)
+        if isinstance(other, (list, tuple, np.ndarray)):
+            return np.array_equal(self._array, np.asarray(other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FluxArrayView(len={len(self._array)}, dtype={self._array.dtype})"
+
 
 @dataclass
 class FluxData:
@@ -77,10 +164,20 @@ class FluxData:
     timing values. Each value in flux_times represents the time (in
     sample counts) since the previous transition.
 
+    Flux and index values are stored as contiguous NumPy arrays
+    (``uint32`` and ``int64``). ``flux_times`` and ``index_positions``
+    accept lists or arrays on construction and read back as
+    FluxArrayView objects so existing list-style code keeps working;
+    ``flux_array``/``index_array`` expose the arrays themselves.
+    Derived arrays such as the microsecond timings are computed once
+    and cached until the flux is replaced.
+
     Attributes:
-        flux_times: List of timing values between flux transitions
+        flux_times: Timing values between flux transitions
         sample_freq: Sample frequency in Hz (typically 72MHz for Greaseweazle)
-        index_positions: Sample positions of index pulses
+        index_positions: Index pulses, either as Greaseweazle's index_list
+            (ticks between pulses) or as sample positions starting at 0;
+            see get_index_boundaries()
         cylinder: Cylinder number this flux was captured from
         head: Head number this flux was captured from
         revolutions: Number of revolutions captured
@@ -102,14 +199,29 @@ class FluxData:
         quality = flux.calculate_quality_score()
     """
 
-    flux_times: List[int] = field(default_factory=list)
+    flux_times: FluxArrayView = field(default_factory=list)
     sample_freq: int = DEFAULT_SAMPLE_FREQ
-    index_positions: List[int] = field(default_factory=list)
+    index_positions: FluxArrayView = field(default_factory=list)
     cylinder: int = 0
     head: int = 0
     revolutions: float = 1.0
     index_cued: bool = True  # Whether flux starts at index pulse
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store flux/index values as arrays and drop stale derived data."""
+        if name == 'flux_times':
+            array = _as_readonly_array(value, FLUX_DTYPE)
+            object.__setattr__(self, '_flux_array', array)
+            object.__setattr__(self, '_derived', {})
+            value = FluxArrayView(array)
+        elif name == 'index_positions':
+            array = _as_readonly_array(value, INDEX_DTYPE)
+            object.__setattr__(self, '_index_array', array)
+            value = FluxArrayView(array)
+        elif name == 'sample_freq':
+            object.__setattr__(self, '_derived', {})
+        object.__setattr__(self, name, value)
+
     @classmethod
     def from_greaseweazle_flux(
         cls, gw_flux: 'Flux', cylinder: int = 0, head: int = 0
@@ -127,28 +239,28 @@ class FluxData:
         """
         # Extract the timing data from Greaseweazle's format
         # gw_flux.list is a flat list of flux transition times in sample ticks
-        flux_times = list(gw_flux.list)
+        flux_times = np.asarray(gw_flux.list, dtype=FLUX_DTYPE)
 
         # Diagnostic logging for flux data interpretation
         sample_freq = gw_flux.sample_freq
         logger.info("Greaseweazle Flux data: sample_freq=%d Hz (%.2f MHz)",
                     sample_freq, sample_freq / 1_000_000)
 
-        if flux_times:
+        if flux_times.size:
             # Show raw sample counts
-            raw_samples = flux_times[:10]
+            raw_samples = flux_times[:10].tolist()
             logger.info("First 10 raw flux_times (sample ticks): %s", raw_samples)
 
             # Show min/max/mean of raw values
-            raw_min = min(flux_times)
-            raw_max = max(flux_times)
-            raw_mean = sum(flux_times) / len(flux_times)
+            raw_min = int(flux_times.min())
+            raw_max = int(flux_times.max())
+            raw_mean = float(flux_times.mean())
             logger.info("Raw flux_times stats: min=%d, max=%d, mean=%.1f ticks",
                         raw_min, raw_max, raw_mean)
 
             # Convert to microseconds for verification
             us_factor = 1_000_000 / sample_freq
-            us_values = [t * us_factor for t in flux_times[:10]]
+            us_values = [t * us_factor for t in raw_samples]
             us_min = raw_min * us_factor
             us_max = raw_max * us_factor
             us_mean = raw_mean * us_factor
@@ -175,18 +287,19 @@ class FluxData:
             t3_min, t3_max = bit_cell * 3 * 0.7, bit_cell * 3 * 1.3  # 3T pulse
             t4_min, t4_max = bit_cell * 4 * 0.7, bit_cell * 4 * 1.3  # 4T pulse
 
-            short_count = sum(1 for t in flux_times if t2_min <= t * us_factor < t2_max)
-            medium_count = sum(1 for t in flux_times if t3_min <= t * us_factor < t3_max)
-            long_count = sum(1 for t in flux_times if t4_min <= t * us_factor < t4_max)
-            noise_count = sum(1 for t in flux_times if t * us_factor < t2_min)
-            other_count = sum(1 for t in flux_times if t * us_factor >= t4_max)
+            times_us = flux_times * us_factor
+            short_count = int(np.count_nonzero((times_us >= t2_min) & (times_us < t2_max)))
+            medium_count = int(np.count_nonzero((times_us >= t3_min) & (times_us < t3_max)))
+            long_count = int(np.count_nonzero((times_us >= t4_min) & (times_us < t4_max)))
+            noise_count = int(np.count_nonzero(times_us < t2_min))
+            other_count = int(np.count_nonzero(times_us >= t4_max))
             logger.info("MFM pulse distribution (%s): 2T(%.1fµs)=%d, 3T(%.1fµs)=%d, "
                         "4T(%.1fµs)=%d, noise(<%.1fµs)=%d, other(>%.1fµs)=%d",
                         format_name, bit_cell*2, short_count, bit_cell*3, medium_count,
                         bit_cell*4, long_count, t2_min, noise_count, t4_max, other_count)
 
         # Get index positions
-        index_positions = list(gw_flux.index_list) if gw_flux.index_list else []
+        index_positions = gw_flux.index_list if gw_flux.index_list else []
 
         # Preserve the index_cued flag - this is CRITICAL!
         # If index_cued=False, the first entry in index_list is a partial revolution
@@ -223,7 +336,7 @@ class FluxData:
             raise ImportError("greaseweazle package not installed")
 
         # Validate we have flux data to write
-        if not self.flux_times:
+        if not self._flux_array.size:
             raise ValueError("Cannot create Greaseweazle Flux from empty flux data")
 
         # Greaseweazle Flux.index_list contains REVOLUTION TIMES (in sample ticks),
@@ -236,7 +349,7 @@ class FluxData:
             # Use existing index list (already contains revolution times)
             # Note: We renamed our field to index_positions but it actually stores
             # the same data as Greaseweazle's index_list (revolution times)
-            index_list = list(self.index_positions)
+            index_list = self._index_array.tolist()
             logger.debug(
                 "Using existing index_list with %d entries: %s",
                 len(index_list),
@@ -245,7 +358,7 @@ class FluxData:
         else:
             # No index data - calculate total samples as one revolution
             # This assumes the flux data represents complete revolutions
-            total_samples = sum(self.flux_times)
+            total_samples = self.total_samples
             # For index-cued data, index_list contains revolution times
             # A single entry means one complete revolution
             index_list = [total_samples]
@@ -260,15 +373,93 @@ class FluxData:
         # cue_at_index() will properly clip the initial partial revolution.
         return Flux(
             index_list=index_list,
-            flux_list=self.flux_times,
+            flux_list=self._flux_array.tolist(),
             sample_freq=self.sample_freq,
             index_cued=self.index_cued
         )
 
+    @property
+    def flux_array(self) -> np.ndarray:
+        """Get flux times as a read-only ``uint32`` array (zero-copy)."""
+        return self._flux_array
+
+    @property
+    def index_array(self) -> np.ndarray:
+        """Get index positions as a read-only ``int64`` array (zero-copy)."""
+        return self._index_array
+
+    def _cached(self, key: str, compute) -> Any:
+        """Return a derived value, computing it on first use."""
+        derived: Dict[str, Any] = self._derived
+        value = derived.get(key)
+        if value is None:
+            value = compute()
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            derived[key] = value
+        return value
+
     @property
     def total_samples(self) -> int:
         """Get total number of samples in the flux capture."""
-        return sum(self.flux_times)
+        return self._cached(
+            'total_samples', lambda: int(self._flux_array.sum(dtype=np.int64))
+        )
+
+    def content_digest(self) -> bytes:
+        """
+        Get a digest of the flux, index and sample rate.
+
+        Two captures with the same digest decode identically, so the
+        digest can key decode caches. Hashing the flux is cached until it
+        is replaced.
+
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        flux_digest = self._cached(
+            'flux_digest',
+            lambda: hashlib.blake2b(self._flux_array.data, digest_size=16).digest()
+        )
+        digest = hashlib.blake2b(flux_digest, digest_size=16)
+        digest.update(self._index_array.tobytes())
+        digest.update(int(self.sample_freq).to_bytes(8, 'little'))
+        digest.update(bytes([self.index_cued]))
+        return digest.digest()
+
+    def get_cumulative_samples(self) -> np.ndarray:
+        """
+        Get the running sample position after each flux transition.
+
+        Returns:
+            Read-only ``int64`` array where element i is sum(flux_times[:i + 1])
+        """
+        return self._cached(
+            'cumulative', lambda: np.cumsum(self._flux_array, dtype=np.int64)
+        )
+
+    def get_index_boundaries(self) -> np.ndarray:
+        """
+        Get the sample positions of the index pulses from the start of the capture.
+
+        Hardware captures hold Greaseweazle's index_list: the ticks between
+        index pulses. Unless the capture is index cued, its first entry is
+        the partial revolution before the first pulse. Captures assembled
+        in software (SCP images, synthetic tracks) hold positions starting
+        at 0 instead. A revolution cannot last 0 ticks, so a leading 0
+        marks a list of positions.
+
+        Returns:
+            Read-only ``int64`` array of index pulse positions, ascending
+        """
+        index = self._index_array
+        if not index.size or index[0] == 0:
+            return index
+        boundaries = np.cumsum(index, dtype=np.int64)
+        if self.index_cued:
+            boundaries = np.concatenate([np.zeros(1, dtype=np.int64), boundaries])
+        boundaries.flags.writeable = False
+        return boundaries
 
     @property
     def duration_seconds(self) -> float:
@@ -283,32 +474,42 @@ class FluxData:
     @property
     def transition_count(self) -> int:
         """Get number of flux transitions."""
-        return len(self.flux_times)
+        return len(self._flux_array)
 
     @property
     def index_count(self) -> int:
         """Get number of index pulses detected."""
-        return len(self.index_positions)
+        return len(self._index_array)
 
-    def get_times_microseconds(self) -> List[float]:
+    def get_times_microseconds(self) -> np.ndarray:
         """
         Convert flux times to microseconds.
 
+        The result is computed once and cached; it is read-only, so use
+        ``.copy()`` or ``.tolist()`` if a mutable sequence is needed.
+
         Returns:
-            List of timing values in microseconds
+            Read-only float64 array of timing values in microseconds
         """
-        factor = 1_000_000 / self.sample_freq
-        return [t * factor for t in self.flux_times]
+        return self._cached(
+            'times_us',
+            lambda: self._flux_array * (1_000_000 / self.sample_freq)
+        )
 
-    def get_times_nanoseconds(self) -> List[float]:
+    def get_times_nanoseconds(self) -> np.ndarray:
         """
         Convert flux times to nanoseconds.
 
+        The result is computed once and cached; it is read-only, so use
+        ``.copy()`` or ``.tolist()`` if a mutable sequence is needed.
+
         Returns:
-            List of timing values in nanoseconds
+            Read-only float64 array of timing values in nanoseconds
         """
-        factor = 1_000_000_000 / self.sample_freq
-        return [t * factor for t in self.flux_times]
+        return self._cached(
+            'times_ns',
+            lambda: self._flux_array * (1_000_000_000 / self.sample_freq)
+        )
 
     def get_revolution_data(self, revolution: int = 0) -> 'FluxData':
         """
@@ -323,10 +524,11 @@ class FluxData:
         Raises:
             ValueError: If revolution number is out of range
         """
-        if len(self.index_positions) < 2:
+        boundaries = self.get_index_boundaries()
+        if len(boundaries) < 2:
             # No index information, return all data
             return FluxData(
-                flux_times=self.flux_times.copy(),
+                flux_times=self._flux_array,
                 sample_freq=self.sample_freq,
                 index_positions=[],
                 cylinder=self.cylinder,
@@ -334,31 +536,27 @@ class FluxData:
                 revolutions=1.0
             )
 
-        if revolution >= len(self.index_positions) - 1:
+        if revolution >= len(boundaries) - 1:
             raise ValueError(
                 f"Revolution {revolution} out of range "
-                f"(have {len(self.index_positions) - 1} revolutions)"
+                f"(have {len(boundaries) - 1} revolutions)"
             )
 
         # Find start and end positions in flux_times
-        start_pos = self.index_positions[revolution]
-        end_pos = self.index_positions[revolution + 1]
-
-        # Extract the flux times for this revolution
-        cumulative = 0
-        start_idx = 0
-        end_idx = len(self.flux_times)
-
-        for i, t in enumerate(self.flux_times):
-            if cumulative < start_pos:
-                start_idx = i
-            cumulative += t
-            if cumulative >= end_pos:
-                end_idx = i + 1
-                break
+        start_pos = int(boundaries[revolution])
+        end_pos = int(boundaries[revolution + 1])
+
+        # Locate the revolution on the running sample position. The first
+        # transition reaching end_pos closes the revolution; the revolution
+        # opens at the last transition that starts before start_pos.
+        cumulative = self.get_cumulative_samples()
+        end_idx = int(np.searchsorted(cumulative, end_pos, side='left')) + 1
+        end_idx = min(end_idx, len(cumulative))
+        starts_before = int(np.searchsorted(cumulative, start_pos, side='left'))
+        start_idx = min(starts_before, max(end_idx - 1, 0))
 
         return FluxData(
-            flux_times=self.flux_times[start_idx:end_idx],
+            flux_times=self._flux_array[start_idx:end_idx],
             sample_freq=self.sample_freq,
             index_positions=[0, end_pos - start_pos],
             cylinder=self.cylinder,
@@ -366,6 +564,75 @@ class FluxData:
             revolutions=1.0
         )
 
+    def split_revolutions(self, limit: Optional[int] = None) -> List['FluxData']:
+        """
+        Split the capture into single revolutions on its index pulses.
+
+        Unlike get_revolution_data(), each transition belongs only to the
+        revolution it ends in, so the revolutions partition the capture
+        without overlap; flux before the first or after the last index
+        pulse is dropped. Each revolution's index positions are 0 and the
+        ticks between its pulses. A capture with fewer than two index
+        pulses is returned whole as one revolution.
+
+        Args:
+            limit: Return at most this many revolutions
+
+        Returns:
+            List of single-revolution FluxData, empty if there is no flux
+        """
+        if not self._flux_array.size:
+            return []
+
+        index = self.get_index_boundaries()
+        if len(index) < 2:
+            index = np.array([0, self.total_samples], dtype=np.int64)
+        elif limit is not None:
+            index = index[:limit + 1]
+
+        bounds = np.searchsorted(self.get_cumulative_samples(), index, side='right')
+        revolutions = []
+        for i, (start, end) in enumerate(zip(bounds[:-1].tolist(), bounds[1:].tolist())):
+            if end > start:
+                revolutions.append(FluxData(
+                    flux_times=self._flux_array[start:end],
+                    sample_freq=self.sample_freq,
+                    index_positions=[0, int(index[i + 1] - index[i])],
+                    cylinder=self.cylinder,
+                    head=self.head,
+                    revolutions=1.0
+                ))
+        return revolutions
+
+    def resample(self, sample_freq: int) -> 'FluxData':
+        """
+        Get the flux timed at another sample frequency.
+
+        Transition positions are rescaled from the start of the capture
+        and rounded, so rounding error does not build up along the track.
+        Every interval stays at least one tick.
+
+        Args:
+            sample_freq: Target sample frequency in Hz
+
+        Returns:
+            Resampled FluxData, or this one if the frequency already matches
+        """
+        if sample_freq == self.sample_freq:
+            return self
+
+        ratio = sample_freq / self.sample_freq
+        ends = np.rint(self.get_cumulative_samples() * ratio).astype(np.int64)
+        return FluxData(
+            flux_times=np.maximum(np.diff(ends, prepend=0), 1),
+            sample_freq=sample_freq,
+            index_positions=np.rint(self._index_array * ratio).astype(np.int64),
+            cylinder=self.cylinder,
+            head=self.head,
+            revolutions=self.revolutions,
+            index_cued=self.index_cued
+        )
+
     def calculate_rpm(self) -> Optional[float]:
         """
         Calculate RPM from index pulse timing.
@@ -373,13 +640,14 @@ class FluxData:
         Returns:
             RPM value, or None if insufficient index data
         """
-        if len(self.index_positions) < 2:
+        boundaries = self.get_index_boundaries().tolist()
+        if len(boundaries) < 2:
             return None
 
         # Calculate time between consecutive indices
         times = []
-        for i in range(1, len(self.index_positions)):
-            samples = self.index_positions[i] - self.index_positions[i - 1]
+        for i in range(1, len(boundaries)):
+            samples = boundaries[i] - boundaries[i - 1]
             if samples > INDEX_PULSE_MIN_SAMPLES:  # Filter out noise
                 time_seconds = samples / self.sample_freq
                 times.append(time_seconds)
@@ -402,7 +670,7 @@ class FluxData:
         Returns:
             Quality score from 0.0 (poor) to 1.0 (excellent)
         """
-        if not self.flux_times:
+        if not self._flux_array.size:
             return 0.0
 
         times_us = self.get_times_microseconds()
@@ -411,17 +679,18 @@ class FluxData:
         scores = []
 
         # 1. Check for reasonable timing values (MFM range)
-        in_range = sum(1 for t in times_us
-                       if MFM_SHORT_US * 0.7 <= t <= MFM_LONG_US * 1.3)
-        range_score = in_range / len(times_us) if times_us else 0
+        in_range = np.count_nonzero(
+            (times_us >= MFM_SHORT_US * 0.7) & (times_us <= MFM_LONG_US * 1.3)
+        )
+        range_score = in_range / len(times_us)
         scores.append(range_score)
 
         # 2. Calculate jitter score (lower is better)
         if len(times_us) > 10:
             # Group by expected MFM values for HD (1µs bit cell → 2/3/4µs pulses)
-            short = [t for t in times_us if 1.4 <= t < 2.6]   # ~2µs (2T)
-            medium = [t for t in times_us if 2.6 <= t < 3.5]  # ~3µs (3T)
-            long = [t for t in times_us if 3.5 <= t < 5.0]    # ~4µs (4T)
+            short = times_us[(times_us >= 1.4) & (times_us < 2.6)]   # ~2µs (2T)
+            medium = times_us[(times_us >= 2.6) & (times_us < 3.5)]  # ~3µs (3T)
+            long = times_us[(times_us >= 3.5) & (times_us < 5.0)]    # ~4µs (4T)
 
             jitter_scores = []
             for group, expected in [
@@ -430,7 +699,7 @@ class FluxData:
                 (long, MFM_LONG_US)
             ]:
                 if len(group) > 5:
-                    std_dev = statistics.stdev(group)
+                    std_dev = float(np.std(group, ddof=1))
                     # Lower standard deviation is better
                     # Score of 1.0 if std_dev < 0.2us, 0.0 if > 1.0us
                     jitter_score = max(0, 1 - (std_dev - 0.2) / 0.8)
@@ -445,7 +714,7 @@ class FluxData:
         else:
             scores.append(0.5)
 
-        return statistics.mean(scores) if scores else 0.0
+        return float(statistics.mean(scores)) if scores else 0.0
 
     def get_pulse_histogram(
         self, bins: int = 50, min_us: float = 1.0, max_us: float = 6.0
@@ -464,20 +733,18 @@ class FluxData:
         times_us = self.get_times_microseconds()
 
         # Filter to range
-        filtered = [t for t in times_us if min_us <= t <= max_us]
+        filtered = times_us[(times_us >= min_us) & (times_us <= max_us)]
 
-        if not filtered:
+        if not filtered.size:
             return [], []
 
         # Create histogram
         bin_width = (max_us - min_us) / bins
-        counts = [0] * bins
         bin_centers = [min_us + (i + 0.5) * bin_width for i in range(bins)]
 
-        for t in filtered:
-            bin_idx = int((t - min_us) / bin_width)
-            if 0 <= bin_idx < bins:
-                counts[bin_idx] += 1
+        bin_idx = ((filtered - min_us) / bin_width).astype(np.int64)
+        bin_idx = bin_idx[bin_idx < bins]
+        counts = np.bincount(bin_idx, minlength=bins).tolist()
 
         return bin_centers, counts
 
@@ -527,8 +794,8 @@ class FluxData:
         """
         # First check if there's significant data below 3 µs - indicates 1µs bit cell (HD)
         times_us = self.get_times_microseconds()
-        if times_us:
-            below_3us = sum(1 for t in times_us if 1.5 < t < 3.0)
+        if times_us.size:
+            below_3us = int(np.count_nonzero((times_us > 1.5) & (times_us < 3.0)))
             total = len(times_us)
             # If more than 20% of pulses are in 1.5-3µs range, this is likely 1µs bit cell (HD)
             if total > 0 and below_3us / total > 0.20:
@@ -625,9 +892,18 @@ class FluxData:
 
         return None
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the defining fields, not cached derived arrays."""
+        return {f: getattr(self, f) for f in self.__dataclass_fields__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore fields through __setattr__ so arrays are rebuilt."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __len__(self) -> int:
         """Return number of flux transitions."""
-        return len(self.flux_times)
+        return len(self._flux_array)
 
     def __iter__(self) -> Iterator[int]:
         """Iterate over flux times."""
@@ -896,22 +1172,22 @@ def analyze_flux_quality(flux_data: FluxData) -> dict:
     times_us = flux_data.get_times_microseconds()
     jitter_metrics = {}
 
-    if times_us:
+    if times_us.size:
         # Group by MFM pulse type for HD (1µs bit cell → 2/3/4µs pulses)
         groups = {
-            'short': [t for t in times_us if 1.4 <= t < 2.6],   # ~2µs (2T)
-            'medium': [t for t in times_us if 2.6 <= t < 3.5],  # ~3µs (3T)
-            'long': [t for t in times_us if 3.5 <= t < 5.0],    # ~4µs (4T)
+            'short': times_us[(times_us >= 1.4) & (times_us < 2.6)],   # ~2µs (2T)
+            'medium': times_us[(times_us >= 2.6) & (times_us < 3.5)],  # ~3µs (3T)
+            'long': times_us[(times_us >= 3.5) & (times_us < 5.0)],    # ~4µs (4T)
         }
 
         for name, group in groups.items():
             if len(group) > 5:
                 jitter_metrics[name] = {
                     'count': len(group),
-                    'mean': statistics.mean(group),
-                    'std_dev': statistics.stdev(group),
-                    'min': min(group),
-                    'max': max(group),
+                    'mean': float(group.mean()),
+                    'std_dev': float(np.std(group, ddof=1)),
+                    'min': float(group.min()),
+                    'max': float(group.max()),
                 }
 
     result = {
@@ -972,21 +1248,15 @@ def compare_flux_captures(
         }
 
     # Compare timing values
-    differences = []
-    matches = 0
-
-    for t1, t2 in zip(times1[:min_len], times2[:min_len]):
-        diff = abs(t1 - t2)
-        differences.append(diff)
-        if diff <= tolerance_us:
-            matches += 1
+    differences = np.abs(times1[:min_len] - times2[:min_len])
+    matches = int(np.count_nonzero(differences <= tolerance_us))
 
     return {
         'match_ratio': matches / min_len,
         'length_diff': length_diff,
-        'timing_diff_mean': statistics.mean(differences),
-        'timing_diff_max': max(differences),
-        'timing_diff_std': statistics.stdev(differences) if len(differences) > 1 else 0,
+        'timing_diff_mean': float(differences.mean()),
+        'timing_diff_max': float(differences.max()),
+        'timing_diff_std': float(np.std(differences, ddof=1)) if min_len > 1 else 0,
     }
 
 
@@ -1024,22 +1294,19 @@ def merge_flux_captures(captures: List[FluxData]) -> FluxData:
     # Find minimum length (align by length)
     min_len = min(len(t) for t in all_times)
 
-    # Average the timing values
-    merged_times_us = []
-    for i in range(min_len):
-        values = [t[i] for t in all_times]
-        # Use median to reduce outlier impact
-        merged_times_us.append(statistics.median(values))
+    # Average the timing values, using the median to reduce outlier impact
+    stacked = np.stack([t[:min_len] for t in all_times])
+    merged_times_us = np.median(stacked, axis=0)
 
     # Convert back to sample counts
     factor = sample_freq / 1_000_000
-    merged_times = [int(t * factor) for t in merged_times_us]
+    merged_times = (merged_times_us * factor).astype(FLUX_DTYPE)
 
     # Use index positions and index_cued from first capture
     return FluxData(
         flux_times=merged_times,
         sample_freq=sample_freq,
-        index_positions=ref.index_positions.copy() if ref.index_positions else [],
+        index_positions=ref.index_array,
         cylinder=cylinder,
         head=head,
         revolutions=ref.revolutions,
@@ -9,6 +9,7 @@ and flux-level read/write operations.
 Key Features:
     - Direct motor control (no firmware timeout issues)
     - Accurate head positioning with verification
+    - Position-aware seeking with per-drive settle times
     - Raw flux capture and write operations
     - RPM measurement and drive detection
     - Full context manager support for safe resource cleanup
@@ -25,8 +26,10 @@ Example:
 from __future__ import annotations  # PEP 563: Postponed evaluation of annotations
 
 import logging
+import struct
 import time
-from typing import Optional, Tuple
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Greaseweazle imports
 try:
@@ -82,8 +85,86 @@ DD_35_RPM_NOMINAL = 300.0
 # Timing constants
 MOTOR_SPINUP_TIME = 0.5  # seconds to wait for motor to reach speed
 SEEK_SETTLE_TIME = 0.015  # seconds to wait for head to settle (15ms)
+HEAD_SETTLE_TIME = 0.030  # seconds to wait after switching heads (30ms)
+DRIVE_RESELECT_DELAY = 0.010  # seconds to stabilize after re-selecting the drive
+DRIVE_IDLE_RESELECT_TIME = 1.0  # re-select the drive after this long without commands
 INDEX_TIMEOUT = 2.0  # seconds to wait for index pulse
 
+# Greaseweazle command code for selecting a head without seeking
+CMD_HEAD = 3
+
+
+# =============================================================================
+# Track Write Listeners
+# =============================================================================
+
+# Called as listener(device, cylinder, head) whenever a track is written or
+# erased, so anything cached from the track can be dropped
+TrackWriteListener = Callable[[Any, int, int], None]
+
+_track_write_listeners: List[TrackWriteListener] = []
+
+
+def add_track_write_listener(listener: TrackWriteListener) -> None:
+    """
+    Register a callback for tracks written or erased through any device.
+
+    The listener runs after the write, also when it failed part way, since
+    the track may have changed either way.
+
+    Args:
+        listener: Called as listener(device, cylinder, head)
+    """
+    if listener not in _track_write_listeners:
+        _track_write_listeners.append(listener)
+
+
+def remove_track_write_listener(listener: TrackWriteListener) -> None:
+    """
+    Unregister a callback added with add_track_write_listener().
+
+    Args:
+        listener: Callback to remove; ignored if not registered
+    """
+    if listener in _track_write_listeners:
+        _track_write_listeners.remove(listener)
+
+
+def _notify_track_written(device: Any, cylinder: int, head: int) -> None:
+    """Tell every listener a track was written; listener errors are logged."""
+    for listener in list(_track_write_listeners):
+        try:
+            listener(device, cylinder, head)
+        except Exception as e:
+            logger.warning("Track write listener failed for C%d H%d: %s", cylinder, head, e)
+
+
+@dataclass
+class SeekStats:
+    """
+    Counters for head positioning requests.
+
+    Attributes:
+        requests: seek() calls, including those made by track operations
+        skipped: Requests already on the target track
+        head_switches: Requests served by selecting the other head only
+        cylinder_seeks: Requests that stepped to another cylinder
+        cylinders_stepped: Total cylinders stepped
+        reselects: Drive re-selections after an idle period
+        settle_seconds: Total time spent waiting for the head to settle
+    """
+    requests: int = 0
+    skipped: int = 0
+    head_switches: int = 0
+    cylinder_seeks: int = 0
+    cylinders_stepped: int = 0
+    reselects: int = 0
+    settle_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary for logging and reports."""
+        return asdict(self)
+
 
 class GreaseweazleDevice(IFloppyDevice):
     """
@@ -127,11 +208,17 @@ class GreaseweazleDevice(IFloppyDevice):
         self._unit: Optional[gw_usb.Unit] = None
         self._selected_drive: Optional[int] = None
         self._motor_running: bool = False
-        self._current_cylinder: int = 0
-        self._current_head: int = 0
+        self._current_cylinder: Optional[int] = 0
+        self._current_head: Optional[int] = 0
         self._drive_info: Optional[DriveInfo] = None
         self._device_info: Optional[str] = None
 
+        # Head settle times, calibrated per drive by calibrate_settle_times()
+        self._step_settle_time: float = SEEK_SETTLE_TIME
+        self._head_settle_time: float = HEAD_SETTLE_TIME
+        self._last_command_time: Optional[float] = None
+        self._seek_stats = SeekStats()
+
         logger.debug("GreaseweazleDevice initialized (usb_path=%s, bus_type=%d)",
                     usb_path, bus_type)
 
@@ -151,13 +238,13 @@ class GreaseweazleDevice(IFloppyDevice):
         return self._motor_running
 
     @property
-    def current_cylinder(self) -> int:
-        """Get current head cylinder position."""
+    def current_cylinder(self) -> Optional[int]:
+        """Get current head cylinder position (None if unknown)."""
         return self._current_cylinder
 
     @property
-    def current_head(self) -> int:
-        """Get current head side (0 or 1)."""
+    def current_head(self) -> Optional[int]:
+        """Get current head side (0 or 1, None if unknown)."""
         return self._current_head
 
     @property
@@ -469,6 +556,7 @@ class GreaseweazleDevice(IFloppyDevice):
         try:
             self._unit.drive_select(unit)
             self._selected_drive = unit
+            self._mark_drive_active()
             logger.debug("Drive %d selected", unit)
         except Exception as e:
             logger.error("Failed to select drive %d: %s", unit, e)
@@ -560,6 +648,7 @@ class GreaseweazleDevice(IFloppyDevice):
             # Wait for motor to spin up
             logger.debug("Waiting %.2fs for motor spinup", MOTOR_SPINUP_TIME)
             time.sleep(MOTOR_SPINUP_TIME)
+            self._mark_drive_active()
 
             logger.debug("Motor is running")
         except Exception as e:
@@ -685,6 +774,12 @@ class GreaseweazleDevice(IFloppyDevice):
         cylinder. The head parameter selects which side of the disk
         to use (0 = bottom, 1 = top).
 
+        Seeking is position-aware: a request for the current track returns
+        immediately, and a request for the other head of the current
+        cylinder only switches heads. The drive is re-selected only after
+        it has been idle long enough to have been deselected. After moving,
+        waits for the step or head settle time (see set_settle_times()).
+
         Args:
             cylinder: Target cylinder number (0-79 for 3.5" HD)
             head: Target head number (0 or 1)
@@ -706,49 +801,64 @@ class GreaseweazleDevice(IFloppyDevice):
         if head not in (0, 1):
             raise ValueError(f"Head must be 0 or 1, got {head}")
 
-        # Track if head is changing - need extra settle time for head changes
-        head_changing = (self._current_head != head)
+        stats = self._seek_stats
+        stats.requests += 1
+
+        same_cylinder = self._current_cylinder == cylinder
+        head_changing = self._current_head != head
+        idle = self._is_drive_idle()
 
-        # Check if already at position
-        if self._current_cylinder == cylinder and self._current_head == head:
+        # Nothing to do if already on the track and the drive has stayed selected
+        if same_cylinder and not head_changing and not idle:
+            stats.skipped += 1
             logger.debug("Already at C%d H%d", cylinder, head)
             return
 
-        logger.debug("Seeking to cylinder %d, head %d (head_change=%s)",
-                     cylinder, head, head_changing)
+        logger.debug("Seeking to cylinder %d, head %d (head_change=%s, reselect=%s)",
+                     cylinder, head, head_changing, idle)
 
         try:
-            # CRITICAL: Always re-select drive at hardware level before seeking.
-            # The Greaseweazle may have auto-deselected the drive if idle for too long
-            # during CPU-intensive operations (like PLL decoding or analysis).
-            # Our internal _selected_drive variable can get out of sync with hardware.
-            self._unit.drive_select(self._selected_drive)
-
-            # Small delay to let drive stabilize after re-selection
-            # This prevents "No Index" errors that can occur when the drive
-            # is re-selected after long idle periods.
-            time.sleep(0.010)  # 10ms stabilization
-
-            # Greaseweazle's seek takes cylinder and head parameters
-            # This sends both Cmd.Seek for cylinder and Cmd.Head for head selection
-            self._unit.seek(cylinder, head)
+            if idle:
+                # The Greaseweazle may have auto-deselected the drive if idle for
+                # too long during CPU-intensive operations (like PLL decoding or
+                # analysis), leaving our _selected_drive out of sync with hardware.
+                # Re-select and let the drive stabilize to prevent "No Index" errors.
+                self._unit.drive_select(self._selected_drive)
+                time.sleep(DRIVE_RESELECT_DELAY)
+                stats.reselects += 1
+
+            if same_cylinder:
+                # Only the head select line changes (or needs re-asserting after
+                # a re-select), so skip the step command entirely
+                self._select_head(head)
+                settle = self._head_settle_time
+                stats.head_switches += 1
+            else:
+                # Greaseweazle's seek sends Cmd.Seek for the cylinder and
+                # Cmd.Head for the head
+                self._unit.seek(cylinder, head)
+                settle = self._step_settle_time
+                if head_changing:
+                    settle = max(settle, self._head_settle_time)
+                stats.cylinder_seeks += 1
+                if self._current_cylinder is not None:
+                    stats.cylinders_stepped += abs(cylinder - self._current_cylinder)
 
             # Update position tracking
             self._current_cylinder = cylinder
             self._current_head = head
 
-            # Allow time for head to settle
-            # Add extra time when head changes to ensure reliable head selection
-            if head_changing:
-                # Head selection needs more time to settle - 30ms for head switch
-                time.sleep(SEEK_SETTLE_TIME + 0.015)
-                logger.debug("Head changed - added extra settle time")
-            else:
-                time.sleep(SEEK_SETTLE_TIME)
+            time.sleep(settle)
+            stats.settle_seconds += settle
+            self._mark_drive_active()
 
-            logger.debug("Seek complete, now at C%d H%d", cylinder, head)
+            logger.debug("Seek complete, now at C%d H%d (settled %.1fms)",
+                         cylinder, head, settle * 1000)
         except Exception as e:
             logger.error("Seek to C%d H%d failed: %s", cylinder, head, e)
+            # Head may have stopped anywhere; force a full seek next time
+            self._current_cylinder = None
+            self._current_head = None
             raise SeekError(
                 f"Seek failed: {e}",
                 target_cylinder=cylinder,
@@ -756,6 +866,63 @@ class GreaseweazleDevice(IFloppyDevice):
                 device_info=self._device_info
             ) from e
 
+    def _select_head(self, head: int) -> None:
+        """Send the Head command on its own, without seeking."""
+        self._unit._send_cmd(struct.pack("3B", CMD_HEAD, 3, head))
+
+    def _mark_drive_active(self) -> None:
+        """Record that the drive has just been sent a command."""
+        self._last_command_time = time.monotonic()
+
+    def _is_drive_idle(self) -> bool:
+        """Check whether the drive may have been deselected while idle."""
+        if self._last_command_time is None:
+            return True
+        return time.monotonic() - self._last_command_time > DRIVE_IDLE_RESELECT_TIME
+
+    @property
+    def settle_times(self) -> Tuple[float, float]:
+        """Get (step, head) settle times in seconds."""
+        return (self._step_settle_time, self._head_settle_time)
+
+    def set_settle_times(self, step: Optional[float] = None,
+                         head: Optional[float] = None) -> None:
+        """
+        Set the head settle times used by seek().
+
+        Args:
+            step: Seconds to settle after stepping to another cylinder,
+                 or None to leave unchanged
+            head: Seconds to settle after switching heads, or None to
+                 leave unchanged
+
+        Raises:
+            ValueError: If a settle time is negative
+        """
+        for name, value in (("step", step), ("head", head)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} settle time must be >= 0, got {value}")
+
+        if step is not None:
+            self._step_settle_time = step
+        if head is not None:
+            self._head_settle_time = head
+        logger.debug("Settle times: step=%.1fms, head=%.1fms",
+                     self._step_settle_time * 1000, self._head_settle_time * 1000)
+
+    def get_seek_stats(self) -> SeekStats:
+        """
+        Get head positioning statistics since the last reset.
+
+        Returns:
+            Copy of the current SeekStats
+        """
+        return SeekStats(**self._seek_stats.to_dict())
+
+    def reset_seek_stats(self) -> None:
+        """Reset head positioning statistics."""
+        self._seek_stats = SeekStats()
+
     def seek_track0(self) -> None:
         """
         Seek to track 0 (recalibrate).
@@ -771,12 +938,13 @@ class GreaseweazleDevice(IFloppyDevice):
         logger.info("Seeking to track 0 (recalibrate)")
         self.seek(0, 0)
 
-    def get_current_position(self) -> Tuple[int, int]:
+    def get_current_position(self) -> Tuple[Optional[int], Optional[int]]:
         """
         Get current head position.
 
         Returns:
-            Tuple of (cylinder, head)
+            Tuple of (cylinder, head), both None while the position is
+            unknown (after a failed seek or a reset)
         """
         return (self._current_cylinder, self._current_head)
 
@@ -814,23 +982,11 @@ class GreaseweazleDevice(IFloppyDevice):
                 device_info=self._device_info
             )
 
-        # Seek to the target track
+        # Seek to the target track. seek() re-selects the drive and re-asserts
+        # the head after an idle period, so a track the caller already sought
+        # to is read without further commands or settle delays.
         self.seek(cylinder, head)
 
-        # Force head selection before reading. The seek() above already re-selects
-        # the drive at hardware level, so we only need to ensure head selection here.
-        # Note: Don't call drive_select again - doing so twice in quick succession
-        # can cause "No Index" errors on some drives.
-        try:
-            import struct
-            # Send Head command directly (Cmd.Head = 3)
-            self._unit._send_cmd(struct.pack("3B", 3, 3, head))
-            logger.debug("Forced head %d before read", head)
-            # Small delay after head selection
-            time.sleep(0.005)  # 5ms settle time for head selection
-        except Exception as e:
-            logger.warning("Could not force head selection: %s", e)
-
         # Convert float revolutions to int for API (round up to ensure full coverage)
         revs_int = max(1, int(revolutions + 0.5))
 
@@ -842,6 +998,7 @@ class GreaseweazleDevice(IFloppyDevice):
         try:
             # Read the track using Greaseweazle
             flux = self._unit.read_track(revs=revs_int)
+            self._mark_drive_active()
 
             # Convert to our FluxData format
             flux_data = FluxData.from_greaseweazle_flux(flux, cylinder, head)
@@ -1023,22 +1180,9 @@ class GreaseweazleDevice(IFloppyDevice):
                 device_info=self._device_info
             )
 
-        # Seek to the target track
+        # Seek to the target track (re-asserts the head after an idle period)
         self.seek(cylinder, head)
 
-        # Force head selection before writing. The seek() above already re-selects
-        # the drive at hardware level, so we only need to ensure head selection here.
-        # Note: Don't call drive_select again - doing so twice in quick succession
-        # can cause "No Index" errors on some drives.
-        try:
-            import struct
-            # Send Head command directly (Cmd.Head = 3)
-            self._unit._send_cmd(struct.pack("3B", 3, 3, head))
-            logger.debug("Forced head %d before write", head)
-            time.sleep(0.005)  # 5ms settle time for head selection
-        except Exception as e:
-            logger.warning("Could not force head selection: %s", e)
-
         logger.info("Writing track C%d H%d (%d flux transitions)",
                     cylinder, head, len(flux_data.flux_times))
 
@@ -1054,10 +1198,15 @@ class GreaseweazleDevice(IFloppyDevice):
                     device_info=self._device_info
                 )
 
+            # Flux from images may be timed at another rate (SCP: 40MHz)
+            sample_rate = getattr(self._unit, 'sample_freq', flux_data.sample_freq)
+            flux_data = flux_data.resample(sample_rate)
+
             # Write the track with the raw flux timing list
             # terminate_at_index=True means write exactly one revolution
             # (stop when index pulse is detected after starting)
-            self._unit.write_track(flux_data.flux_times, terminate_at_index=True)
+            self._unit.write_track(flux_data.flux_times.tolist(), terminate_at_index=True)
+            self._mark_drive_active()
 
             logger.debug("Successfully wrote track C%d H%d", cylinder, head)
 
@@ -1070,6 +1219,8 @@ class GreaseweazleDevice(IFloppyDevice):
                 operation="write",
                 device_info=self._device_info
             ) from e
+        finally:
+            _notify_track_written(self, cylinder, head)
 
     def erase_track(self, cylinder: int, head: int) -> None:
         """
@@ -1096,19 +1247,9 @@ class GreaseweazleDevice(IFloppyDevice):
                 device_info=self._device_info
             )
 
-        # Seek to the target track
+        # Seek to the target track (re-asserts the head after an idle period)
         self.seek(cylinder, head)
 
-        # CRITICAL: Always force head selection before erasing
-        try:
-            import struct
-            # Send Head command directly (Cmd.Head = 3)
-            self._unit._send_cmd(struct.pack("3B", 3, 3, head))
-            logger.debug("Forced head selection to head %d before erase", head)
-            time.sleep(0.005)  # 5ms settle time for head selection
-        except Exception as e:
-            logger.warning("Could not force head selection: %s", e)
-
         logger.info("Erasing track C%d H%d", cylinder, head)
 
         try:
@@ -1122,6 +1263,7 @@ class GreaseweazleDevice(IFloppyDevice):
             erase_ticks = int((erase_duration_us / 1_000_000) * sample_rate)
 
             self._unit.erase_track(erase_ticks)
+            self._mark_drive_active()
             logger.debug(
                 "Successfully erased track C%d H%d (ticks=%d)",
                 cylinder, head, erase_ticks
@@ -1136,6 +1278,8 @@ class GreaseweazleDevice(IFloppyDevice):
                 operation="erase",
                 device_info=self._device_info
             ) from e
+        finally:
+            _notify_track_written(self, cylinder, head)
 
     # =========================================================================
     # Drive Information
@@ -1205,6 +1349,7 @@ class GreaseweazleDevice(IFloppyDevice):
 
             # Additional delay for head to settle
             time.sleep(0.2)
+            self._mark_drive_active()
 
             # Verify drive state using firmware query
             try:
@@ -1503,8 +1648,10 @@ class GreaseweazleDevice(IFloppyDevice):
         except MotorError as e:
             logger.warning("Error turning off motor during reset: %s", e)
 
-        self._current_cylinder = 0
-        self._current_head = 0
+        # Head position is not trusted after an error; the next seek() moves
+        # the head rather than being skipped as already on the track
+        self._current_cylinder = None
+        self._current_head = None
 
         logger.debug("Device reset complete")
 
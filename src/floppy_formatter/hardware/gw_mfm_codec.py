@@ -15,16 +15,13 @@ from dataclasses import dataclass
 
 # Import Greaseweazle components
 from bitarray import bitarray
-import crcmod.predefined
 
 from .flux_io import FluxData
+from .mfm_tables import crc16_ccitt, mfm_decode_bytes
 from . import SectorData, SectorStatus
 
 logger = logging.getLogger(__name__)
 
-# CRC calculator
-crc16 = crcmod.predefined.Crc('crc-ccitt-false')
-
 # =============================================================================
 # Constants from Greaseweazle
 # =============================================================================
@@ -69,16 +66,6 @@ for x in range(256):
         y |= (x >> (7-i)) & 1
     _encode_list.append(y)
 
-# Build decode lookup: 16-bit MFM -> 8-bit data
-_decode_list = bytearray()
-for x in range(0x5555 + 1):
-    y = 0
-    for i in range(16):
-        if x & (1 << (i * 2)):
-            y |= 1 << i
-    _decode_list.append(y)
-
-
 def encode(dat: bytes) -> bytes:
     """Encode data bytes to MFM (data bits only, no clock)."""
     out = bytearray()
@@ -89,10 +76,7 @@ def encode(dat: bytes) -> bytes:
 
 def decode(dat: bytes) -> bytes:
     """Decode MFM bytes to data bytes."""
-    out = bytearray()
-    for x, y in zip(dat[::2], dat[1::2]):
-        out.append(_decode_list[((x << 8) | y) & 0x5555])
-    return bytes(out)
+    return mfm_decode_bytes(dat)
 
 
 def mfm_encode(dat: bytes) -> bytes:
@@ -171,7 +155,7 @@ def encode_mfm_track(
 
         idam = bytes([0xa1, 0xa1, 0xa1, Mark.IDAM,
                       cylinder, head, sector.sector, 2])  # N=2 for 512 bytes
-        idam_crc = crc16.new(idam).crcValue
+        idam_crc = crc16_ccitt(idam)
         idam += struct.pack('>H', idam_crc)
         t += encode(idam[3:])  # Encode from FE onwards (syncs already added)
 
@@ -191,7 +175,7 @@ def encode_mfm_track(
             data = data[:512]
 
         dam = bytes([0xa1, 0xa1, 0xa1, Mark.DAM]) + data
-        dam_crc = crc16.new(dam).crcValue
+        dam_crc = crc16_ccitt(dam)
         dam += struct.pack('>H', dam_crc)
         t += encode(dam[3:])  # Encode from FB onwards (syncs already added)
 
@@ -334,7 +318,7 @@ def decode_mfm_track(flux_data: FluxData, bit_cell_us: float = 1.0) -> List[Sect
             c, h, r, n = struct.unpack(">4x4B2x", header)
 
             # Verify CRC
-            crc = crc16.new(header).crcValue
+            crc = crc16_ccitt(header)
 
             idam = DecodedIDAM(s, e, crc, c, h, r, n)
 
@@ -362,7 +346,7 @@ def decode_mfm_track(flux_data: FluxData, bit_cell_us: float = 1.0) -> List[Sect
             data = decode(data_bits.tobytes())
 
             # Verify CRC
-            crc = crc16.new(data).crcValue
+            crc = crc16_ccitt(data)
 
             # Extract sector data (skip A1 A1 A1 DAM, exclude CRC)
             sector_data = data[4:-2]
@@ -0,0 +1,167 @@
+"""
+Thread-safe LRU cache shared by the track caches.
+
+Decoded tracks, decode results and encoded pattern tracks are all kept in
+memory on the same terms: least recently used first out, bounded by entry
+count, by memory or both, with hit, miss and eviction counters. LRUCache
+holds that logic once; the caches built on it only say how big an entry
+is and when it goes stale.
+
+Key Classes:
+    LRUCache: Bounded, locked LRU mapping with statistics
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar('V')
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe LRU mapping bounded by entries, memory or both.
+
+    Entries over a bound are evicted least recently used first, but the
+    newest entry is always kept, even if it alone exceeds the memory
+    budget. An entry that is_valid rejects is dropped on lookup and
+    counted as a miss.
+
+    Example:
+        cache = LRUCache(max_bytes=1 << 20, size_of=lambda flux: flux.flux_array.nbytes)
+        cache.put((0, 0), flux)
+        flux = cache.get((0, 0))
+    """
+
+    def __init__(self, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 size_of: Optional[Callable[[V], int]] = None,
+                 is_valid: Optional[Callable[[V], bool]] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Entries kept, or None for no limit
+            max_bytes: Memory allowed for entries, or None for no limit
+            size_of: Memory held by an entry; needed with max_bytes
+            is_valid: Whether an entry may still be served
+        """
+        if max_bytes is not None and size_of is None:
+            raise ValueError("max_bytes needs size_of")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._is_valid = is_valid
+        self._entries: 'OrderedDict[Hashable, V]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Get an entry, counting the hit or miss.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            The entry, or None if not cached or no longer valid
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None and self._is_valid is not None and not self._is_valid(value):
+                self._remove(key)
+                value = None
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Store an entry, evicting the least recently used to stay in bounds.
+
+        Args:
+            key: Entry key
+            value: Entry to store; replaces any entry under key
+        """
+        size = self._size_of(value) if self._size_of is not None else 0
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+
+            while len(self._entries) > 1 and self._over_budget():
+                evicted = next(iter(self._entries))
+                self._remove(evicted)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drop an entry, for example after its track was written.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            True if an entry was dropped
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries and bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def _over_budget(self) -> bool:
+        """Check if the entries exceed either bound. Caller holds the lock."""
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> bool:
+        """Drop an entry and its size. Caller holds the lock."""
+        if key not in self._entries:
+            return False
+        del self._entries[key]
+        self._bytes -= self._sizes.pop(key)
+        return True
+
+
+__all__ = [
+    'LRUCache',
+]
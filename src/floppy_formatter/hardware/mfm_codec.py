@@ -24,10 +24,22 @@ Key Functions:
 
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
+from bitarray import bitarray
+from bitarray.util import ba2int
 
 from . import SectorStatus, SectorData
 from .flux_io import FluxData
+from .mfm_tables import (
+    CORRECTED_SECTOR_QUALITY,
+    FIELD_PREFIX_BITS,
+    MFM_DECODE_TABLE,
+    correct_crc_errors,
+    crc16_ccitt,
+    mfm_decode_bits,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +93,7 @@ DDAM_MARK = 0xF8       # Deleted Data Address Mark
 # Normal A1: 10100001 -> MFM: 0100010010001001
 # Special A1: 10100001 with clock missing -> 0100010010101001
 A1_SYNC_PATTERN = 0x4489  # 16-bit MFM pattern for A1 with missing clock
+A1_SYNC_BITS = bitarray(format(A1_SYNC_PATTERN, '016b'), endian='big')
 
 # Sector sizes
 SECTOR_SIZE_CODE = {
@@ -108,24 +121,11 @@ HD_35_PARAMS = {
 # =============================================================================
 
 class CRCCalculator:
-    """CRC-CCITT calculator for MFM sector data."""
-
-    def __init__(self):
-        """Initialize with lookup table for fast calculation."""
-        self._table = self._generate_table()
-
-    def _generate_table(self) -> List[int]:
-        """Generate CRC lookup table."""
-        table = []
-        for i in range(256):
-            crc = i << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ CRC_POLY) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
-            table.append(crc)
-        return table
+    """
+    CRC-CCITT calculator for MFM sector data.
+
+    Delegates to the shared bulk implementation in mfm_tables.
+    """
 
     def calculate(self, data: bytes, init: int = CRC_INIT) -> int:
         """
@@ -138,10 +138,7 @@ class CRCCalculator:
         Returns:
             16-bit CRC value
         """
-        crc = init
-        for byte in data:
-            crc = ((crc << 8) ^ self._table[(crc >> 8) ^ byte]) & 0xFFFF
-        return crc
+        return crc16_ccitt(data, init)
 
     def verify(self, data: bytes, expected_crc: int,
                init: int = CRC_INIT) -> bool:
@@ -177,16 +174,71 @@ def verify_crc(data: bytes, expected_crc: int) -> bool:
 # MFM Bit Stream Handling
 # =============================================================================
 
+def _merge_noise_pulses(times_us: np.ndarray,
+                        threshold_us: float) -> Tuple[np.ndarray, int]:
+    """
+    Fold pulses shorter than the noise threshold into the following pulses.
+
+    Starting at a short pulse, time is accumulated over following pulses
+    until the running total reaches the threshold; the total then stands
+    in for the whole run. A run still below threshold at the end of the
+    capture is dropped.
+
+    Args:
+        times_us: Pulse widths in microseconds
+        threshold_us: Minimum width of a valid pulse
+
+    Returns:
+        Tuple of (pulse widths after merging, number of pulses absorbed)
+    """
+    short = np.flatnonzero(times_us < threshold_us)
+    if not short.size:
+        return times_us, 0
+
+    merged = np.array(times_us, dtype=np.float64)
+    keep = np.ones(len(merged), dtype=bool)
+    next_free = 0
+    for start in short.tolist():
+        if start < next_free:
+            continue
+        accumulated = 0.0
+        end = start
+        while end < len(merged):
+            accumulated += merged[end]
+            if accumulated >= threshold_us:
+                break
+            keep[end] = False
+            end += 1
+        if end < len(merged):
+            merged[end] = accumulated
+        next_free = end + 1
+
+    return merged[keep], int(len(merged) - np.count_nonzero(keep))
+
+
 @dataclass
 class MFMBitstream:
     """
     Container for MFM-encoded bit stream.
 
     Provides methods for reading and writing MFM data at the bit level.
+    Bits are stored packed in a big-endian bitarray (one bit per cell);
+    a list of 0/1 ints is still accepted on construction.
+
+    A stream built from flux also keeps, per flux pulse, the cell where
+    it ends and how cleanly it fell on the bit cell grid, from which
+    data_bit_confidence() rates individual bits.
     """
 
-    bits: List[int] = field(default_factory=list)
+    bits: bitarray = field(default_factory=lambda: bitarray(endian='big'))
     position: int = 0
+    pulse_ends: Optional[np.ndarray] = field(default=None, repr=False)
+    pulse_confidence: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Pack bits given as a sequence of ints."""
+        if not isinstance(self.bits, bitarray):
+            self.bits = bitarray(list(self.bits), endian='big')
 
     @classmethod
     def from_flux(cls, flux_data: FluxData,
@@ -194,6 +246,11 @@ class MFMBitstream:
         """
         Convert flux timing data to MFM bit stream.
 
+        Each pulse becomes round(pulse / bit_cell) cells (clamped to the
+        valid 2-4 cell MFM range): that many minus one zeros followed by a
+        one. The conversion is vectorized; only noise pulses, which are
+        merged into the following pulse, are visited individually.
+
         Args:
             flux_data: FluxData containing raw timing values
             bit_cell_us: Expected bit cell width in microseconds
@@ -201,7 +258,6 @@ class MFMBitstream:
         Returns:
             MFMBitstream containing decoded bits
         """
-        bits = []
         times_us = flux_data.get_times_microseconds()
 
         # Noise filtering threshold - pulses shorter than this are considered noise
@@ -209,30 +265,7 @@ class MFMBitstream:
         # is 2 bit cells = 4µs, so anything under ~2.5µs is likely noise.
         noise_threshold_us = bit_cell_us * 1.25  # 2.5µs for HD
 
-        accumulated_time = 0.0
-        filtered_count = 0
-
-        for time_us in times_us:
-            # Accumulate time
-            accumulated_time += time_us
-
-            # If accumulated time is too short, it's noise - skip and accumulate more
-            if accumulated_time < noise_threshold_us:
-                filtered_count += 1
-                continue
-
-            # Determine number of bit cells (zeros before the 1)
-            num_cells = round(accumulated_time / bit_cell_us)
-
-            # Clamp to valid MFM range (2-4 bit cells)
-            num_cells = max(2, min(4, num_cells))
-
-            # Add zeros then a one
-            bits.extend([0] * (num_cells - 1))
-            bits.append(1)
-
-            # Reset accumulator
-            accumulated_time = 0.0
+        pulses_us, filtered_count = _merge_noise_pulses(times_us, noise_threshold_us)
 
         if filtered_count > 0:
             logger.debug(
@@ -240,7 +273,23 @@ class MFMBitstream:
                 filtered_count, noise_threshold_us
             )
 
-        return cls(bits=bits)
+        # Determine number of bit cells per pulse, clamped to valid MFM range
+        num_cells = np.clip(np.rint(pulses_us / bit_cell_us), 2, 4).astype(np.int64)
+
+        # Each pulse contributes (num_cells - 1) zeros then a one
+        pulse_ends = np.cumsum(num_cells)
+        cells = np.zeros(int(pulse_ends[-1]) if pulse_ends.size else 0, dtype=np.uint8)
+        cells[pulse_ends - 1] = 1
+
+        bits = bitarray(endian='big')
+        bits.frombytes(np.packbits(cells).tobytes())
+        del bits[len(cells):]
+
+        # 1.0 for a pulse on the cell grid, 0.0 half a cell (or more) off it
+        residual = np.abs(pulses_us / bit_cell_us - num_cells)
+        pulse_confidence = 1.0 - 2.0 * np.minimum(residual, 0.5)
+
+        return cls(bits=bits, pulse_ends=pulse_ends, pulse_confidence=pulse_confidence)
 
     def to_flux(self, sample_freq: int = 72_000_000,
                 bit_cell_us: float = BIT_CELL_US) -> FluxData:
@@ -254,33 +303,55 @@ class MFMBitstream:
         Returns:
             FluxData containing flux timing values
         """
-        flux_times = []
-        count = 0
-
-        for bit in self.bits:
-            count += 1
-            if bit == 1:
-                # Convert bit cells to sample counts
-                time_us = count * bit_cell_us
-                samples = int(time_us * sample_freq / 1_000_000)
-                flux_times.append(samples)
-                count = 0
-
-        # Handle any trailing zeros
-        if count > 0:
-            time_us = count * bit_cell_us
-            samples = int(time_us * sample_freq / 1_000_000)
-            if samples > 0:
-                flux_times.append(samples)
+        cells = np.unpackbits(
+            np.frombuffer(self.bits.tobytes(), dtype=np.uint8)
+        )[:len(self.bits)]
+        ones = np.flatnonzero(cells)
+
+        # Bit cells from the previous transition (or stream start) to each one,
+        # plus any trailing zeros after the last transition
+        counts = np.diff(ones, prepend=-1)
+        trailing = len(cells) - 1 - (int(ones[-1]) if ones.size else -1)
+        if trailing > 0:
+            counts = np.append(counts, trailing)
+
+        # Convert bit cells to sample counts
+        samples = (counts * bit_cell_us * sample_freq / 1_000_000).astype(np.int64)
+        if trailing > 0 and samples[-1] <= 0:
+            samples = samples[:-1]
 
         return FluxData(
-            flux_times=flux_times,
+            flux_times=samples,
             sample_freq=sample_freq
         )
 
+    def data_bit_confidence(self, start: int, count: int) -> Optional[np.ndarray]:
+        """
+        Rate the data bits of MFM bytes by flux timing.
+
+        A data bit is as reliable as the less regular of the pulses
+        holding its clock and data cells.
+
+        Args:
+            start: Bit position of the first clock bit
+            count: Number of MFM bytes
+
+        Returns:
+            Confidence (0-1) of each of the count * 8 data bits, MSB
+            first, or None if the stream was not built from flux
+        """
+        if self.pulse_ends is None or not self.pulse_ends.size:
+            return None
+
+        data_cells = start + 1 + 2 * np.arange(count * 8)
+        last = len(self.pulse_ends) - 1
+        data_pulse = np.minimum(np.searchsorted(self.pulse_ends, data_cells, 'right'), last)
+        clock_pulse = np.minimum(np.searchsorted(self.pulse_ends, data_cells - 1, 'right'), last)
+        return np.minimum(self.pulse_confidence[data_pulse], self.pulse_confidence[clock_pulse])
+
     def read_bits(self, count: int) -> List[int]:
         """Read specified number of bits from current position."""
-        result = self.bits[self.position:self.position + count]
+        result = self.bits[self.position:self.position + count].tolist()
         self.position += count
         return result
 
@@ -298,25 +369,23 @@ class MFMBitstream:
         if self.position + 16 > len(self.bits):
             return None
 
-        raw_bits = self.read_bits(16)
-
-        # Extract data bits (odd positions)
-        byte_val = 0
-        for i in range(8):
-            data_bit = raw_bits[i * 2 + 1]  # Data bits at odd positions
-            byte_val = (byte_val << 1) | data_bit
+        word = ba2int(self.bits[self.position:self.position + 16])
+        self.position += 16
 
-        return byte_val
+        # Data bits sit at the odd positions of the 16-bit word
+        return int(MFM_DECODE_TABLE[word])
 
     def read_bytes(self, count: int) -> bytes:
-        """Read and decode multiple MFM bytes."""
-        result = bytearray()
-        for _ in range(count):
-            byte_val = self.read_byte()
-            if byte_val is None:
-                break
-            result.append(byte_val)
-        return bytes(result)
+        """
+        Read and decode multiple MFM bytes.
+
+        The whole run is decoded in one table lookup; reading stops at the
+        last complete byte if the stream is too short.
+        """
+        count = max(0, min(count, (len(self.bits) - self.position) // 16))
+        result = mfm_decode_bits(self.bits, self.position, count)
+        self.position += count * 16
+        return result
 
     def write_byte(self, value: int, previous_bit: int = 0) -> int:
         """
@@ -362,8 +431,7 @@ class MFMBitstream:
         # Normal MFM would be: 01 00 01 00 01 00 00 01
         # With missing clock: 01 00 01 01 01 00 00 01
         # The pattern 0100 0100 1010 1001 = 0x4489
-        for bit in [0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]:
-            self.bits.append(bit)
+        self.bits.extend(A1_SYNC_BITS)
 
     def find_a1_sync(self) -> int:
         """
@@ -372,19 +440,9 @@ class MFMBitstream:
         Returns:
             Bit position of sync pattern, or -1 if not found
         """
-        # Look for the A1 sync pattern (0x4489)
-        target = [0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]
-
-        for i in range(self.position, len(self.bits) - 16):
-            match = True
-            for j, bit in enumerate(target):
-                if self.bits[i + j] != bit:
-                    match = False
-                    break
-            if match:
-                return i
-
-        return -1
+        # Look for the A1 sync pattern (0x4489). The pattern must finish
+        # before the final bit of the stream.
+        return self.bits.find(A1_SYNC_BITS, self.position, len(self.bits) - 1)
 
     def seek(self, position: int) -> None:
         """Move read position to specified bit offset."""
@@ -476,13 +534,13 @@ class MFMDecoder:
 
         # Log flux timing statistics for debugging
         times_us = flux_data.get_times_microseconds()
-        if times_us:
+        if times_us.size:
             # Count pulse widths in MFM ranges
-            short = sum(1 for t in times_us if 3.0 <= t < 5.0)
-            medium = sum(1 for t in times_us if 5.0 <= t < 7.0)
-            long = sum(1 for t in times_us if 7.0 <= t < 9.0)
-            too_short = sum(1 for t in times_us if t < 3.0)
-            too_long = sum(1 for t in times_us if t > 9.0)
+            short = int(np.count_nonzero((times_us >= 3.0) & (times_us < 5.0)))
+            medium = int(np.count_nonzero((times_us >= 5.0) & (times_us < 7.0)))
+            long = int(np.count_nonzero((times_us >= 7.0) & (times_us < 9.0)))
+            too_short = int(np.count_nonzero(times_us < 3.0))
+            too_long = int(np.count_nonzero(times_us > 9.0))
 
             logger.debug(
                 "Flux timing distribution: short(4µs)=%d, medium(6µs)=%d, "
@@ -492,11 +550,10 @@ class MFMDecoder:
 
             # Log actual timing statistics
             if len(times_us) > 100:
-                import statistics
-                min_t = min(times_us)
-                max_t = max(times_us)
-                mean_t = statistics.mean(times_us)
-                median_t = statistics.median(times_us)
+                min_t = float(times_us.min())
+                max_t = float(times_us.max())
+                mean_t = float(times_us.mean())
+                median_t = float(np.median(times_us))
                 logger.debug(
                     "Flux timing stats: min=%.2fµs, max=%.2fµs, "
                     "mean=%.2fµs, median=%.2fµs",
@@ -637,10 +694,17 @@ class MFMDecoder:
         # Verify header CRC (includes A1 A1 A1 FE + header)
         crc_data = bytes([A1_SYNC, A1_SYNC, A1_SYNC, IDAM_MARK]) + header_data
         header_crc_valid = verify_crc(crc_data, header_crc)
+        corrected_bits = 0
 
         if not header_crc_valid:
             logger.debug("Header CRC failed for sector C%d H%d S%d",
                          cylinder, head, sector)
+            corrected = self._correct_field(bitstream, sync_start, crc_data + crc_bytes)
+            if corrected is not None:
+                header_data = corrected[0][4:8]
+                cylinder, head, sector, size_code = header_data
+                header_crc_valid = True
+                corrected_bits = corrected[1]
 
         # Get sector size
         sector_size = SECTOR_SIZE_CODE.get(size_code, 512)
@@ -663,6 +727,7 @@ class MFMDecoder:
             )
 
         bitstream.seek(data_sync_pos)
+        data_start = data_sync_pos
 
         # Skip 3 A1 sync bytes
         for _ in range(3):
@@ -706,11 +771,22 @@ class MFMDecoder:
                 # CRC includes A1 A1 A1 DAM + data
                 crc_data = bytes([A1_SYNC, A1_SYNC, A1_SYNC, dam]) + data
                 data_crc_valid = verify_crc(crc_data, data_crc)
+                if not data_crc_valid:
+                    corrected = self._correct_field(
+                        bitstream, data_start, crc_data + data_crc_bytes[:2]
+                    )
+                    if corrected is not None:
+                        data = corrected[0][4:-2]
+                        data_crc_valid = True
+                        corrected_bits += corrected[1]
             else:
                 data_crc_valid = False
 
-        # Determine status
-        if header_crc_valid and data_crc_valid:
+        # Determine status; corrected sectors are flagged, not reported GOOD
+        if header_crc_valid and data_crc_valid and corrected_bits:
+            status = SectorStatus.CORRECTED
+            quality = CORRECTED_SECTOR_QUALITY
+        elif header_crc_valid and data_crc_valid:
             status = SectorStatus.GOOD
             quality = 1.0
         elif header_crc_valid and not data_crc_valid:
@@ -726,9 +802,35 @@ class MFMDecoder:
             sector=sector,
             data=data,
             status=status,
-            crc_valid=(header_crc_valid and data_crc_valid),
-            signal_quality=quality
+            crc_valid=(status == SectorStatus.GOOD),
+            signal_quality=quality,
+            corrected_bits=corrected_bits
+        )
+
+    def _correct_field(self, bitstream: MFMBitstream, start: int,
+                       field_bytes: bytes) -> Optional[Tuple[bytes, int]]:
+        """
+        Try CRC error correction on a field that failed its CRC.
+
+        Args:
+            bitstream: Bit stream the field was read from
+            start: Bit position of the field's first A1 sync
+            field_bytes: A1 A1 A1 + mark + contents + stored CRC
+
+        Returns:
+            Tuple of (corrected field, bits flipped), or None if the field
+            cannot be corrected
+        """
+        result = correct_crc_errors(
+            field_bytes, FIELD_PREFIX_BITS,
+            bitstream.data_bit_confidence(start, len(field_bytes))
         )
+        if result is None:
+            return None
+
+        corrected, positions = result
+        logger.debug("Corrected %d bit(s) at field bit(s) %s", len(positions), positions)
+        return corrected, len(positions)
 
 
 # =============================================================================
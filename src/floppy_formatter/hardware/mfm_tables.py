@@ -0,0 +1,350 @@
+"""
+Shared lookup tables for the MFM sector decode hot path.
+
+The MFM decoders (mfm_codec, pll_decoder and gw_mfm_codec) all need to
+turn raw 16-bit MFM cells into data bytes and to check CRC-CCITT over
+sector fields. This module provides both as bulk operations so a whole
+sector is handled in one call rather than one bit or byte at a time.
+
+Key Constants:
+    MFM_DECODE_TABLE: 65536-entry table mapping a raw MFM word to its data byte
+
+Key Functions:
+    mfm_decode_bytes: Decode packed raw MFM bytes to data bytes
+    mfm_decode_bits: Decode a run of MFM bytes from a bitarray at any offset
+    crc16_ccitt: CRC-CCITT (poly 0x1021, init 0xFFFF) over a bytes object
+    crc_error_positions: Candidate 1- and 2-bit error positions for a CRC syndrome
+    correct_crc_errors: Fix 1- and 2-bit errors in a field that fails CRC
+    stored_crc_from_syndrome: Recover a field's on-disk CRC from its syndrome
+"""
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# crcmod provides a C implementation; fall back to a table-driven version
+try:
+    import crcmod.predefined
+    CRCMOD_AVAILABLE = True
+except ImportError:
+    CRCMOD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CRC_CCITT_POLY = 0x1021
+CRC_CCITT_INIT = 0xFFFF
+
+# Multiplicative order of x modulo the CRC-CCITT polynomial. Single-bit
+# error syndromes repeat with this period, so fields up to this many bits
+# long have a unique syndrome for every bit position.
+CRC_CCITT_PERIOD = 32767
+
+# When per-bit confidence is known, only bits rated below this are
+# considered as error positions. A field failing CRC with no suspect bit
+# has more damage than correction can safely explain.
+SUSPECT_BIT_CONFIDENCE = 0.5
+
+# Without per-bit confidence almost any syndrome points at some bit or
+# adjacent pair of a long field, so a badly damaged data field would be
+# "corrected" into wrong data. Blind correction is limited to fields no
+# longer than an ID field (A1 A1 A1 FE C H R N + CRC).
+BLIND_CORRECTION_MAX_BITS = 10 * 8
+
+# A1 A1 A1 + address mark at the start of each CRC-protected field.
+# Decoders only reach a field through these, so correction and fusion
+# never flip them.
+FIELD_PREFIX_BITS = 4 * 8
+
+# Signal quality reported for sectors whose CRC only passes after bit
+# correction or fusion of several copies
+CORRECTED_SECTOR_QUALITY = 0.8
+
+
+def _build_decode_table() -> np.ndarray:
+    """
+    Build the raw MFM word to data byte table.
+
+    Each 16-bit word is C7 D7 C6 D6 ... C0 D0 (clock then data, MSB first),
+    so data bit i is word bit 2i. Clock bits are ignored.
+    """
+    words = np.arange(0x10000, dtype=np.uint32)
+    table = np.zeros(0x10000, dtype=np.uint32)
+    for i in range(8):
+        table |= ((words >> (2 * i)) & 1) << i
+    return table.astype(np.uint8)
+
+
+MFM_DECODE_TABLE = _build_decode_table()
+
+
+# =============================================================================
+# MFM Decoding
+# =============================================================================
+
+def mfm_decode_bytes(raw: bytes) -> bytes:
+    """
+    Decode packed raw MFM bytes to data bytes.
+
+    Every pair of raw bytes (one big-endian MFM word) yields one data
+    byte. A trailing odd byte is ignored.
+
+    Args:
+        raw: Raw MFM bit stream packed MSB first
+
+    Returns:
+        Decoded data bytes
+    """
+    words = np.frombuffer(raw, dtype='>u2', count=len(raw) // 2)
+    return MFM_DECODE_TABLE[words].tobytes()
+
+
+def mfm_decode_bits(bits, start: int, count: int) -> bytes:
+    """
+    Decode MFM bytes from a bitarray starting at any bit offset.
+
+    Args:
+        bits: Big-endian bitarray of raw MFM cells
+        start: Bit position of the first clock bit
+        count: Number of data bytes to decode
+
+    Returns:
+        Decoded data bytes (shorter than count if the stream ends early)
+    """
+    return mfm_decode_bytes(bits[start:start + count * 16].tobytes())
+
+
+# =============================================================================
+# CRC Calculation
+# =============================================================================
+
+def _build_crc_table() -> list:
+    """Build the byte-wise CRC-CCITT lookup table."""
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ CRC_CCITT_POLY) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+if CRCMOD_AVAILABLE:
+    _crc16_impl = crcmod.predefined.mkCrcFun('crc-ccitt-false')
+else:
+    _CRC_TABLE = _build_crc_table()
+
+    def _crc16_impl(data: bytes, crc: int = CRC_CCITT_INIT) -> int:
+        for byte in data:
+            crc = ((crc << 8) ^ _CRC_TABLE[(crc >> 8) ^ byte]) & 0xFFFF
+        return crc
+
+
+def crc16_ccitt(data: bytes, init: int = CRC_CCITT_INIT) -> int:
+    """
+    Calculate CRC-CCITT (poly 0x1021, no reflection, no final XOR).
+
+    Running the CRC over a field followed by its stored CRC gives 0 when
+    the field is intact.
+
+    Args:
+        data: Bytes to calculate CRC for
+        init: Initial CRC value (default 0xFFFF)
+
+    Returns:
+        16-bit CRC value
+    """
+    return _crc16_impl(data, init)
+
+
+# =============================================================================
+# CRC Error Correction
+# =============================================================================
+#
+# CRC-CCITT is linear: the CRC of a damaged field is the CRC of the intact
+# field XOR the CRC (with zero init) of the error pattern. Running the CRC
+# over a field and its stored CRC leaves just the error term, the
+# syndrome. A single flipped bit d bits from the end of the field gives
+# the syndrome x^(d+16) mod G, so a table of these maps syndromes back to
+# bit positions.
+#
+# G = (x + 1) * p(x), so the parity of the syndrome equals the parity of
+# the number of flipped bits: odd syndromes can only be single-bit errors
+# and even syndromes only two-bit errors, never each other.
+
+_syndrome_tables: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def _get_syndrome_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the single-bit syndrome table and its inverse, building on first use.
+
+    Returns:
+        Tuple of (syndrome by distance from the field end, distance by
+        syndrome with -1 for syndromes no single bit produces)
+    """
+    global _syndrome_tables
+    if _syndrome_tables is None:
+        syndromes = np.empty(CRC_CCITT_PERIOD, dtype=np.int64)
+        value = CRC_CCITT_POLY  # x^16 mod G
+        for distance in range(CRC_CCITT_PERIOD):
+            syndromes[distance] = value
+            value <<= 1
+            if value & 0x10000:
+                value ^= 0x10000 | CRC_CCITT_POLY
+        distances = np.full(0x10000, -1, dtype=np.int64)
+        distances[syndromes] = np.arange(CRC_CCITT_PERIOD)
+        _syndrome_tables = (syndromes, distances)
+    return _syndrome_tables
+
+
+def bit_syndromes(length_bits: int) -> Optional[np.ndarray]:
+    """
+    Get the syndrome a single flipped bit leaves at each position of a field.
+
+    Args:
+        length_bits: Field length in bits, including the stored CRC
+
+    Returns:
+        Syndrome per bit position from the start of the field, or None if
+        the field is too long for positions to have unique syndromes
+    """
+    if length_bits > CRC_CCITT_PERIOD:
+        return None
+    return _get_syndrome_tables()[0][length_bits - 1::-1]
+
+
+def stored_crc_from_syndrome(field: bytes, syndrome: int) -> int:
+    """
+    Recover the CRC stored after a field from the field and its syndrome.
+
+    Decoders that keep only the field contents and the CRC over contents
+    plus stored CRC (such as the Greaseweazle codec) still determine the
+    stored CRC: the syndrome is the difference between the stored and the
+    computed CRC, multiplied by x^16.
+
+    Args:
+        field: Field bytes without the stored CRC
+        syndrome: CRC over the field followed by its stored CRC
+
+    Returns:
+        The 16-bit CRC stored on disk
+    """
+    difference = syndrome
+    for _ in range(16):
+        if difference & 1:
+            difference = (difference ^ (0x10000 | CRC_CCITT_POLY)) >> 1
+        else:
+            difference >>= 1
+    return crc16_ccitt(field) ^ difference
+
+
+def crc_error_positions(syndrome: int, length_bits: int, protected_bits: int = 0,
+                        bit_confidence: Optional[Sequence[float]] = None
+                        ) -> Optional[List[int]]:
+    """
+    Find the 1 or 2 flipped bits that explain a CRC syndrome.
+
+    A single-bit syndrome has exactly one explanation. A two-bit syndrome
+    usually has several within a sector-sized field, so a pair is only
+    chosen when it is the lowest-confidence pair (with bit_confidence),
+    otherwise when it is the only pair of adjacent bits (one shifted flux
+    transition) or the only pair at all. With bit_confidence, every
+    flipped bit must also be rated below SUSPECT_BIT_CONFIDENCE. Without
+    it, only fields up to BLIND_CORRECTION_MAX_BITS are corrected.
+
+    Args:
+        syndrome: CRC over the field including its stored CRC
+        length_bits: Field length in bits, including the stored CRC
+        protected_bits: Leading bits known to be correct (sync and mark)
+        bit_confidence: Optional per-bit confidence (0-1) in field order;
+                       flipped bits are expected where it is low
+
+    Returns:
+        Bit positions from the start of the field, or None if the syndrome
+        is zero, the field is too long to locate errors, or no unambiguous
+        1- or 2-bit explanation exists
+    """
+    if syndrome == 0 or length_bits > CRC_CCITT_PERIOD:
+        return None
+    if bit_confidence is None and length_bits > BLIND_CORRECTION_MAX_BITS:
+        return None
+
+    syndromes, distances = _get_syndrome_tables()
+    limit = length_bits - protected_bits
+
+    # Confidence by distance from the field end, like the syndrome table
+    confidence = None
+    if bit_confidence is not None:
+        confidence = np.asarray(bit_confidence, dtype=np.float64)[::-1]
+
+    if bin(syndrome).count('1') % 2:
+        distance = int(distances[syndrome])
+        if not 0 <= distance < limit:
+            return None
+        if confidence is not None and confidence[distance] >= SUSPECT_BIT_CONFIDENCE:
+            return None
+        return [length_bits - 1 - distance]
+
+    # Two bits: pair every position with the one that completes the syndrome
+    first = np.arange(limit)
+    second = distances[syndromes[:limit] ^ syndrome]
+    valid = (second > first) & (second < limit)
+    if confidence is not None:
+        suspect = confidence[:limit] < SUSPECT_BIT_CONFIDENCE
+        valid &= suspect & suspect[np.clip(second, 0, limit - 1)]
+    pairs = np.flatnonzero(valid)
+    if not pairs.size:
+        return None
+
+    if confidence is not None:
+        scores = confidence[pairs] + confidence[second[pairs]]
+        order = np.argsort(scores, kind='stable')
+        if len(order) > 1 and scores[order[0]] == scores[order[1]]:
+            return None
+        chosen = pairs[order[0]]
+    else:
+        adjacent = pairs[second[pairs] == pairs + 1]
+        if len(adjacent) == 1:
+            chosen = adjacent[0]
+        elif len(pairs) == 1:
+            chosen = pairs[0]
+        else:
+            return None
+
+    return sorted(length_bits - 1 - int(d) for d in (chosen, second[chosen]))
+
+
+def correct_crc_errors(field: bytes, protected_bits: int = 0,
+                       bit_confidence: Optional[Sequence[float]] = None
+                       ) -> Optional[Tuple[bytes, List[int]]]:
+    """
+    Correct a field that fails CRC by flipping 1 or 2 bits.
+
+    Args:
+        field: Field bytes followed by their stored CRC (for example
+              A1 A1 A1 FB + data + CRC)
+        protected_bits: Leading bits known to be correct
+        bit_confidence: Optional per-bit confidence, see crc_error_positions
+
+    Returns:
+        Tuple of (corrected field, flipped bit positions), or None if the
+        field is intact or cannot be corrected
+    """
+    positions = crc_error_positions(crc16_ccitt(field), len(field) * 8,
+                                    protected_bits, bit_confidence)
+    if positions is None:
+        return None
+
+    corrected = bytearray(field)
+    for position in positions:
+        corrected[position >> 3] ^= 0x80 >> (position & 7)
+    return bytes(corrected), positions
@@ -16,7 +16,10 @@ Original code by Keir Fraser, released into public domain.
 import logging
 import struct
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numba
+import numpy as np
 
 # Try to import bitarray for efficient bit operations
 try:
@@ -26,17 +29,16 @@ except ImportError:
     BITARRAY_AVAILABLE = False
     bitarray = None
 
-# Try to import crcmod for CRC calculation
-try:
-    import crcmod.predefined
-    crc16 = crcmod.predefined.Crc('crc-ccitt-false')
-    CRCMOD_AVAILABLE = True
-except ImportError:
-    CRCMOD_AVAILABLE = False
-    crc16 = None
-
 from . import SectorStatus, SectorData
 from .flux_io import FluxData
+from .mfm_tables import (
+    CORRECTED_SECTOR_QUALITY,
+    FIELD_PREFIX_BITS,
+    correct_crc_errors,
+    crc16_ccitt,
+    mfm_decode_bytes,
+)
+from .sector_fusion import fuse_dam_copies
 
 logger = logging.getLogger(__name__)
 
@@ -60,46 +62,17 @@ class Mark:
 
 
 # =============================================================================
-# MFM Decode/Encode Tables
+# MFM Decode and CRC (shared table-driven implementations)
 # =============================================================================
 
-# Build decode lookup table: 16-bit MFM -> 8-bit data
-_decode_list = bytearray()
-for x in range(0x5555 + 1):
-    y = 0
-    for i in range(16):
-        if x & (1 << (i * 2)):
-            y |= 1 << i
-    _decode_list.append(y)
-
-
 def mfm_decode(dat: bytes) -> bytes:
     """Decode MFM-encoded bytes to data bytes."""
-    out = bytearray()
-    for x, y in zip(dat[::2], dat[1::2]):
-        out.append(_decode_list[((x << 8) | y) & 0x5555])
-    return bytes(out)
-
+    return mfm_decode_bytes(dat)
 
-# =============================================================================
-# CRC Calculation
-# =============================================================================
 
 def calculate_crc_ccitt(data: bytes) -> int:
     """Calculate CRC-CCITT (0xFFFF initial, no final XOR)."""
-    if CRCMOD_AVAILABLE:
-        return crc16.new(data).crcValue
-    else:
-        # Fallback implementation
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
-        return crc
+    return crc16_ccitt(data)
 
 
 # =============================================================================
@@ -113,6 +86,190 @@ class PLLConfig:
     phase_adj_pct: float = 60.0    # Clock phase adjustment rate (%)
     clock_max_adj: float = 0.30    # Maximum clock adjustment (±30%) - matches GW decoder
     lowpass_thresh: Optional[float] = None  # Optional noise filter threshold
+    batched: bool = True           # Batched engine (False = per-transition loop)
+
+
+# Transitions handed to the PLL kernel per batch
+PLL_BATCH_SIZE = 65536
+
+
+def _pll_kernel(dt, ticks, clock, clock_centre, clock_min, clock_max,
+                period_adj, phase_keep, zeros_out, clock_out):
+    """
+    Advance the PLL over one batch of transition intervals.
+
+    Performs exactly the same floating point operations, in the same
+    order, as the per-transition loop. Instead of emitting bits it records
+    one run per transition that produced bits: the number of 0s before the
+    1, and the adjusted bit time shared by every bit in the run.
+
+    Args:
+        dt: Transition intervals in seconds
+        ticks: Phase carried over from the previous batch
+        clock: Clock period carried over from the previous batch
+        clock_centre: Nominal clock period
+        clock_min: Lower clock clamp
+        clock_max: Upper clock clamp
+        period_adj: Fractional clock frequency adjustment
+        phase_keep: Fraction of the phase error kept (1 - phase adjustment)
+        zeros_out: Output buffer for 0-bit counts, at least len(dt) long
+        clock_out: Output buffer for run bit times, at least len(dt) long
+
+    Returns:
+        Tuple of (runs written, ticks, clock)
+    """
+    n = 0
+    for i in range(len(dt)):
+        # Gather enough ticks to generate at least one bitcell
+        ticks += dt[i]
+        if ticks < clock / 2:
+            continue
+
+        # Clock out zero or more 0s, followed by a 1
+        zeros = 0
+        while True:
+            ticks -= clock
+            if ticks < clock / 2:
+                break
+            zeros += 1
+
+        # Adjust clock window position according to phase mismatch and
+        # distribute the adjustment across the bits just emitted
+        new_ticks = ticks * phase_keep
+        zeros_out[n] = zeros
+        clock_out[n] = clock + (ticks - new_ticks) / (zeros + 1)
+        n += 1
+
+        # Adjust clock frequency according to phase mismatch
+        if zeros <= 3:
+            clock += ticks * period_adj
+        else:
+            clock += (clock_centre - clock) * period_adj
+
+        clock = min(max(clock, clock_min), clock_max)
+        ticks = new_ticks
+
+    return n, ticks, clock
+
+
+def _lowpass_kernel(samples, times, thresh, out):
+    """
+    Merge short noise pulses into their neighbours.
+
+    Same merge rules as PLLDecoder._lowpass_filter, written over indexed
+    buffers so it can be compiled alongside the PLL kernel.
+
+    Args:
+        samples: Transition intervals in sample ticks
+        times: The same intervals in seconds
+        thresh: Pulses at or below this many seconds are merged
+        out: Output buffer for merged intervals, at least len(samples) long
+
+    Returns:
+        Number of intervals written to out
+    """
+    n = 0
+    pending = 0
+    i = 0
+    count = len(samples)
+    while i < count:
+        x = samples[i]
+        t = times[i]
+        i += 1
+        if t <= thresh:
+            # Short pulse - merge with neighbors
+            if i < count:
+                y = samples[i]
+                i += 1
+                if times[i - 1] <= t:
+                    # y is shorter, merge x+y+next
+                    if i < count:
+                        pending += x + y + samples[i]
+                        i += 1
+                    else:
+                        pending += x + y
+                else:
+                    # x is shorter, merge pending+x+y to pending
+                    pending += x + y
+            else:
+                pending += x
+        elif pending > 0:
+            out[n] = pending + x
+            n += 1
+            pending = 0
+        else:
+            out[n] = x
+            n += 1
+
+    if pending > 0:
+        if n > 0:
+            out[n - 1] += pending
+        else:
+            out[n] = pending
+            n += 1
+
+    return n
+
+
+# The PLL recurrence is sequential, so the kernels are compiled rather
+# than vectorized
+_pll_kernel_jit = numba.njit(cache=True)(_pll_kernel)
+_lowpass_kernel_jit = numba.njit(cache=True)(_lowpass_kernel)
+
+
+def _split_revolutions(run_clocks: np.ndarray, run_lengths: np.ndarray,
+                       index_times: List[float]) -> List[int]:
+    """
+    Count bits per revolution from the per-run bit times.
+
+    Walks the bit stream subtracting each bit time from the time left to
+    the next index pulse, as the per-transition loop does. Bit times are
+    expanded one batch of runs at a time and the running subtraction is a
+    sequential accumulate, so the result is identical to the loop.
+
+    Args:
+        run_clocks: Bit time of each run
+        run_lengths: Number of bits in each run
+        index_times: Time between successive index pulses, ending with inf
+
+    Returns:
+        Number of bits in each revolution
+    """
+    revolutions: List[int] = []
+    index_iter = iter(index_times)
+    to_index = next(index_iter)
+    nbits = 0
+
+    for start in range(0, len(run_clocks), PLL_BATCH_SIZE):
+        stop = start + PLL_BATCH_SIZE
+        bit_clocks = np.repeat(run_clocks[start:stop], run_lengths[start:stop])
+        pos = 0
+        while pos < len(bit_clocks):
+            if to_index == float('inf'):
+                nbits += len(bit_clocks) - pos
+                break
+
+            remaining = np.subtract.accumulate(
+                np.concatenate(([to_index], bit_clocks[pos:]))
+            )[1:]
+            crossings = np.flatnonzero(remaining < 0)
+            if not crossings.size:
+                to_index = float(remaining[-1])
+                nbits += len(bit_clocks) - pos
+                break
+
+            # The crossing bit starts the next revolution
+            crossing = int(crossings[0])
+            revolutions.append(nbits + crossing)
+            to_index = float(remaining[crossing]) + next(index_iter, float('inf'))
+            nbits = 1
+            pos += crossing + 1
+
+    # Add final revolution if we have bits
+    if nbits > 0:
+        revolutions.append(nbits)
+
+    return revolutions
 
 
 class PLLDecoder:
@@ -143,19 +300,130 @@ class PLLDecoder:
         self.pll_period_adj = self.config.period_adj_pct / 100
         self.pll_phase_adj = self.config.phase_adj_pct / 100
 
-    def flux_to_bitcells(self, flux_data: FluxData) -> Tuple['bitarray', List[float], List[int]]:
+    def flux_to_bitcells(self, flux_data: FluxData,
+                         with_times: bool = True
+                         ) -> Tuple['bitarray', Optional[np.ndarray], List[int]]:
         """
         Convert flux timing data to bitcells using PLL.
 
+        Transitions are fed through the PLL in batches of PLL_BATCH_SIZE;
+        bit emission, per-bit timing and revolution splitting are then done
+        on whole arrays. Output is bit-identical to the per-transition loop
+        (set PLLConfig.batched=False to run that loop instead).
+
         Args:
             flux_data: Raw flux timing data
+            with_times: Build the per-bit time array. Callers that only need
+                the bits and revolution boundaries can pass False to skip it.
 
         Returns:
-            Tuple of (bitarray, time_array, revolution_boundaries)
+            Tuple of (bitarray, time_array, revolution_boundaries). The time
+            array is None when with_times is False.
         """
         if not BITARRAY_AVAILABLE:
             raise ImportError("bitarray package required for PLL decoder")
 
+        if not self.config.batched:
+            bit_array, time_array, revolutions = self._flux_to_bitcells_loop(flux_data)
+            times = np.array(time_array, dtype=np.float64) if with_times else None
+            return bit_array, times, revolutions
+
+        freq = float(flux_data.sample_freq)
+        index_times = self._index_times(flux_data, freq)
+
+        # Optional lowpass filtering for noise
+        samples = flux_data.flux_array
+        if self.config.lowpass_thresh is not None:
+            samples = self._lowpass(samples, freq, self.config.lowpass_thresh)
+        dt = samples / freq
+
+        # Each transition emits at most one run of 0s followed by a 1, so
+        # the per-run buffers can never outgrow the transition count
+        zeros = np.empty(len(dt), dtype=np.int64)
+        run_clocks = np.empty(len(dt), dtype=np.float64)
+        nruns = self._run_pll(dt, zeros, run_clocks)
+        zeros = zeros[:nruns]
+        run_clocks = run_clocks[:nruns]
+
+        # Every run is `zeros` 0-bits followed by a single 1-bit
+        run_lengths = zeros + 1
+        nbits = int(run_lengths.sum())
+        cells = np.zeros(nbits, dtype=np.uint8)
+        cells[np.cumsum(run_lengths) - 1] = 1
+        bit_array = bitarray(endian='big')
+        bit_array.frombytes(np.packbits(cells).tobytes())
+        del bit_array[nbits:]
+
+        revolutions = _split_revolutions(run_clocks, run_lengths, index_times)
+        times = np.repeat(run_clocks, run_lengths) if with_times else None
+
+        return bit_array, times, revolutions
+
+    def _run_pll(self, dt: np.ndarray, zeros_out: np.ndarray,
+                 clock_out: np.ndarray) -> int:
+        """
+        Run the PLL over transition intervals, carrying state across batches.
+
+        Args:
+            dt: Transition intervals in seconds
+            zeros_out: Preallocated buffer for the 0-bit count of each run
+            clock_out: Preallocated buffer for the bit time of each run
+
+        Returns:
+            Number of runs written to the output buffers
+        """
+        ticks = 0.0
+        clock = self.clock
+        nruns = 0
+
+        for start in range(0, len(dt), PLL_BATCH_SIZE):
+            batch = dt[start:start + PLL_BATCH_SIZE]
+            count, ticks, clock = _pll_kernel_jit(
+                batch, ticks, clock, self.clock, self.clock_min,
+                self.clock_max, self.pll_period_adj, 1 - self.pll_phase_adj,
+                zeros_out[nruns:], clock_out[nruns:]
+            )
+            nruns += count
+
+        return nruns
+
+    def _lowpass(self, samples: np.ndarray, freq: float,
+                 thresh: float) -> np.ndarray:
+        """Apply the lowpass filter to an array of transition intervals."""
+        times = samples / freq
+        out = np.empty(len(samples), dtype=np.int64)
+        count = _lowpass_kernel_jit(samples.astype(np.int64), times, thresh, out)
+        return out[:count]
+
+    def _index_times(self, flux_data: FluxData, freq: float) -> List[float]:
+        """Get the time from each index pulse to the next, ending with inf."""
+        if flux_data.index_positions and len(flux_data.index_positions) >= 2:
+            index_times = []
+            for i in range(1, len(flux_data.index_positions)):
+                idx_samples = flux_data.index_positions[i] - flux_data.index_positions[i-1]
+                index_times.append(idx_samples / freq)
+            return index_times + [float('inf')]
+
+        # No index info, calculate revolution time from RPM
+        # 300 RPM = 200ms/rev, 360 RPM = 166.7ms/rev
+        rpm = getattr(self, 'rpm', 300)  # Default 300 RPM
+        rev_time = 60.0 / rpm
+        return [rev_time, float('inf')]
+
+    def _flux_to_bitcells_loop(self, flux_data: FluxData
+                               ) -> Tuple['bitarray', List[float], List[int]]:
+        """
+        Convert flux timing data to bitcells one transition at a time.
+
+        This is the original PLL loop, kept as the reference for the
+        batched engine.
+
+        Args:
+            flux_data: Raw flux timing data
+
+        Returns:
+            Tuple of (bitarray, time_array, revolution_boundaries)
+        """
         freq = float(flux_data.sample_freq)
         clock_centre = self.clock
         clock = clock_centre
@@ -166,18 +434,7 @@ class PLLDecoder:
         revolutions: List[int] = []
 
         # Index iterator for revolution detection
-        if flux_data.index_positions and len(flux_data.index_positions) >= 2:
-            index_times = []
-            for i in range(1, len(flux_data.index_positions)):
-                idx_samples = flux_data.index_positions[i] - flux_data.index_positions[i-1]
-                index_times.append(idx_samples / freq)
-            index_iter = iter(index_times + [float('inf')])
-        else:
-            # No index info, calculate revolution time from RPM
-            # 300 RPM = 200ms/rev, 360 RPM = 166.7ms/rev
-            rpm = getattr(self, 'rpm', 300)  # Default 300 RPM
-            rev_time = 60.0 / rpm
-            index_iter = iter([rev_time, float('inf')])
+        index_iter = iter(self._index_times(flux_data, freq))
 
         # Optional lowpass filtering for noise
         flux_times = flux_data.flux_times
@@ -294,6 +551,7 @@ class DecodedIDAM:
     h: int          # Head
     r: int          # Sector (record)
     n: int          # Size code
+    corrected_bits: int = 0  # Bits fixed by CRC error correction
 
 
 @dataclass
@@ -304,6 +562,7 @@ class DecodedDAM:
     crc: int        # CRC value (0 = valid)
     mark: int       # Address mark (DAM or DDAM)
     data: bytes     # Sector data
+    corrected_bits: int = 0  # Bits fixed by CRC error correction
 
 
 @dataclass
@@ -316,6 +575,10 @@ class DecodedSector:
     def crc_valid(self) -> bool:
         return self.idam.crc == 0 and self.dam.crc == 0
 
+    @property
+    def corrected_bits(self) -> int:
+        return self.idam.corrected_bits + self.dam.corrected_bits
+
 
 class MFMSectorDecoder:
     """
@@ -376,14 +639,25 @@ class MFMSectorDecoder:
                 header = mfm_decode(header_bits.tobytes())
                 c, h, r, n = struct.unpack(">4x4B2x", header)
 
-                # Verify CRC
+                # Verify CRC, correcting 1-2 bit errors where possible. The
+                # short ID field is the only one corrected without per-bit
+                # confidence, which the PLL bitstream does not provide.
                 crc = calculate_crc_ccitt(header)
+                corrected_bits = 0
+                if crc != 0:
+                    corrected = correct_crc_errors(header, FIELD_PREFIX_BITS)
+                    if corrected is not None:
+                        header, positions = corrected
+                        c, h, r, n = struct.unpack(">4x4B2x", header)
+                        crc, corrected_bits = 0, len(positions)
+                        logger.debug("Corrected %d bit(s) in IDAM at %d",
+                                     corrected_bits, offs)
 
                 # Save previous IDAM if not matched with DAM
                 if idam is not None:
                     logger.debug("Orphan IDAM at %d (no DAM found)", idam.start)
 
-                idam = DecodedIDAM(s, e, crc, c, h, r, n)
+                idam = DecodedIDAM(s, e, crc, c, h, r, n, corrected_bits)
 
                 if crc == 0:
                     logger.debug("Found valid IDAM: C=%d H=%d R=%d N=%d", c, h, r, n)
@@ -495,7 +769,7 @@ class PLLMFMDecoder:
         # Create PLL decoder and convert flux to bits
         pll = PLLDecoder(clock, self.pll_config)
         try:
-            bits, times, revolutions = pll.flux_to_bitcells(flux_data)
+            bits, _, revolutions = pll.flux_to_bitcells(flux_data, with_times=False)
         except Exception as e:
             logger.error("PLL conversion failed: %s", e)
             return []
@@ -512,8 +786,12 @@ class PLLMFMDecoder:
         # Convert to SectorData format
         sectors = []
         for d in decoded:
-            status = SectorStatus.GOOD if d.crc_valid else SectorStatus.CRC_ERROR
-            quality = 1.0 if d.crc_valid else 0.5
+            if not d.crc_valid:
+                status, quality = SectorStatus.CRC_ERROR, 0.5
+            elif d.corrected_bits:
+                status, quality = SectorStatus.CORRECTED, CORRECTED_SECTOR_QUALITY
+            else:
+                status, quality = SectorStatus.GOOD, 1.0
 
             sectors.append(SectorData(
                 cylinder=d.idam.c,
@@ -521,16 +799,61 @@ class PLLMFMDecoder:
                 sector=d.idam.r,
                 data=d.dam.data,
                 status=status,
-                crc_valid=d.crc_valid,
-                signal_quality=quality
+                crc_valid=status == SectorStatus.GOOD,
+                signal_quality=quality,
+                corrected_bits=d.corrected_bits
             ))
 
+        sectors.extend(self._fuse_failed_copies(decoded))
+
         # Sort by sector number
         sectors.sort(key=lambda s: s.sector)
 
         return sectors
 
 
+    @staticmethod
+    def _fuse_failed_copies(decoded: List[DecodedSector]) -> List[SectorData]:
+        """
+        Fuse the CRC-failed copies of sectors that have no good copy.
+
+        Args:
+            decoded: Every sector copy found in the bitstream
+
+        Returns:
+            A CORRECTED SectorData for each sector recovered by fusion
+        """
+        copies: Dict[Tuple[int, int, int, int], List[DecodedSector]] = {}
+        recovered = set()
+        for d in decoded:
+            key = (d.idam.c, d.idam.h, d.idam.r, d.idam.n)
+            if d.crc_valid:
+                recovered.add(key)
+            elif d.idam.crc == 0:
+                copies.setdefault(key, []).append(d)
+
+        fused_sectors = []
+        for key, group in copies.items():
+            if key in recovered or len(group) < 2:
+                continue
+            fused = fuse_dam_copies([(d.dam.mark, d.dam.data, d.dam.crc) for d in group])
+            if fused is None:
+                continue
+            c, h, r, _ = key
+            logger.debug("Recovered C=%d H=%d R=%d by fusing %d copies", c, h, r, len(group))
+            fused_sectors.append(SectorData(
+                cylinder=c,
+                head=h,
+                sector=r,
+                data=fused[0],
+                status=SectorStatus.CORRECTED,
+                crc_valid=False,
+                signal_quality=CORRECTED_SECTOR_QUALITY,
+                corrected_bits=fused[1]
+            ))
+        return fused_sectors
+
+
 def decode_flux_with_pll(flux_data: FluxData,
                          bit_cell_us: float = 1.0,
                          rpm: int = 300) -> List[SectorData]:
@@ -0,0 +1,170 @@
+"""
+Consensus fusion of CRC-failed sector copies.
+
+A multi-revolution read often yields several copies of a sector that all
+fail CRC, each damaged in a different place. Voting bit by bit across the
+copies recovers most of the field; if only a few positions are disputed they
+are tried in every combination against the CRC. Copies that disagree in
+more places are not fused, as searching a subset of the disputed bits
+finds false matches. CRC-CCITT is linear, so each combination is checked by XOR-ing
+precomputed single-bit syndromes rather than by recomputing the CRC.
+
+Key Functions:
+    fuse_field_copies: Fuse copies of a CRC-protected field
+    fuse_dam_copies: Fuse data field copies as decoders report them
+"""
+
+import logging
+from collections import Counter
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .mfm_tables import (
+    FIELD_PREFIX_BITS,
+    bit_syndromes,
+    crc16_ccitt,
+    stored_crc_from_syndrome,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Most disputed bits tried in every combination. 2^10 combinations against
+# 65536 possible CRCs keeps the chance of a false match near 1.5%.
+MAX_DISPUTED_BITS = 10
+
+# Most bits the winning combination may flip against the majority vote
+MAX_FLIPPED_BITS = 6
+
+# Sync bytes preceding the address mark
+_SYNC_PREFIX = b'\xa1\xa1\xa1'
+
+
+# =============================================================================
+# Fusion
+# =============================================================================
+
+def fuse_field_copies(fields: Sequence[bytes],
+                      protected_bits: int = FIELD_PREFIX_BITS,
+                      max_disputed: int = MAX_DISPUTED_BITS,
+                      max_flipped: int = MAX_FLIPPED_BITS
+                      ) -> Optional[Tuple[bytes, int]]:
+    """
+    Fuse copies of a CRC-protected field into one that passes CRC.
+
+    Copies are aligned at the field start (the sync mark); copies of a
+    different length from the most common one are ignored. Each bit takes
+    the majority value, ties taking the first copy's. The disputed bits
+    are then flipped in every combination and the cheapest combination
+    that satisfies the CRC wins, cost being the votes overruled. Nothing
+    is returned if more than max_disputed bits are disputed, if the
+    winner flips more than max_flipped bits, or if equal cheapest
+    combinations make the result ambiguous.
+
+    Args:
+        fields: Field copies, each sync + mark + contents + stored CRC
+        protected_bits: Leading bits never flipped
+        max_disputed: Most disputed bits to combine
+        max_flipped: Most bits the winning combination may flip
+
+    Returns:
+        Tuple of (fused field, bits flipped against the majority), or None
+        if there are fewer than two copies or no unambiguous fusion
+    """
+    if len(fields) < 2:
+        return None
+
+    length = Counter(len(f) for f in fields).most_common(1)[0][0]
+    copies = [f for f in fields if len(f) == length]
+    if len(copies) < 2:
+        return None
+
+    bits = np.unpackbits(
+        np.frombuffer(b''.join(copies), dtype=np.uint8).reshape(len(copies), length),
+        axis=1
+    )
+    ones = bits.sum(axis=0, dtype=np.int64)
+    zeros = len(copies) - ones
+
+    majority = np.where(ones == zeros, bits[0], ones > zeros).astype(np.uint8)
+    fused = np.packbits(majority).tobytes()
+    syndrome = crc16_ccitt(fused)
+    if syndrome == 0:
+        return fused, 0
+
+    syndromes = bit_syndromes(length * 8)
+    margin = np.abs(ones - zeros)
+    disputed = np.flatnonzero(margin < len(copies))
+    disputed = disputed[disputed >= protected_bits]
+    if syndromes is None or not disputed.size:
+        return None
+
+    if disputed.size > max_disputed:
+        logger.debug("Fusion skipped: %d disputed bits (limit %d)", disputed.size, max_disputed)
+        return None
+
+    # Syndrome and cost of every combination, built one bit at a time
+    combined = np.zeros(1, dtype=np.int64)
+    cost = np.zeros(1, dtype=np.int64)
+    for position in disputed.tolist():
+        combined = np.concatenate((combined, combined ^ syndromes[position]))
+        cost = np.concatenate((cost, cost + margin[position]))
+
+    matches = np.flatnonzero(combined == syndrome)
+    if not matches.size:
+        return None
+    cheapest = matches[cost[matches] == cost[matches].min()]
+    if len(cheapest) > 1:
+        logger.debug("Fusion ambiguous: %d equally likely combinations", len(cheapest))
+        return None
+
+    flips = disputed[[(int(cheapest[0]) >> i) & 1 == 1 for i in range(len(disputed))]]
+    if len(flips) > max_flipped:
+        logger.debug("Fusion rejected: %d bits flipped (limit %d)", len(flips), max_flipped)
+        return None
+    majority[flips] ^= 1
+    return np.packbits(majority).tobytes(), len(flips)
+
+
+def fuse_dam_copies(copies: Sequence[Tuple[int, bytes, int]]
+                    ) -> Optional[Tuple[bytes, int]]:
+    """
+    Fuse data field copies given as (mark, data, syndrome).
+
+    This is the form decoders keep: the sector data without the stored
+    CRC, and the CRC computed over the field including it. The stored CRC
+    is recovered from the syndrome to rebuild each field.
+
+    Args:
+        copies: (address mark, sector data, syndrome) per copy
+
+    Returns:
+        Tuple of (fused sector data, bits flipped against the majority),
+        or None if the copies cannot be fused
+    """
+    fields = []
+    for mark, data, syndrome in copies:
+        field = _SYNC_PREFIX + bytes([mark]) + bytes(data)
+        stored = stored_crc_from_syndrome(field, syndrome)
+        fields.append(field + bytes([stored >> 8, stored & 0xFF]))
+
+    result = fuse_field_copies(fields)
+    if result is None:
+        return None
+
+    fused, flipped = result
+    logger.debug("Fused %d copies (%d disputed bits flipped)", len(fields), flipped)
+    return fused[4:-2], flipped
+
+
+__all__ = [
+    'MAX_DISPUTED_BITS',
+    'MAX_FLIPPED_BITS',
+    'fuse_field_copies',
+    'fuse_dam_copies',
+]
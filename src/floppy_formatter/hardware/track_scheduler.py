@@ -0,0 +1,167 @@
+"""
+Seek-aware ordering of track work.
+
+Stepping the head costs a few milliseconds per cylinder plus a settle
+time, so the order tracks are visited in matters whenever work hops
+around the disk: recovery passes over scattered bad sectors, sampled
+scans, and repeated passes that would otherwise each start back at
+cylinder 0.
+
+The scheduler orders tracks like an elevator. Both heads of a cylinder
+are visited before stepping. A sweep starts at the current head
+position and goes first towards whichever end costs fewer steps. The
+sweep direction carries over between calls, so successive passes run
+back and forth across the disk instead of returning to the start.
+
+Key Classes:
+    TrackScheduler: Orders tracks to minimise head steps
+
+Key Functions:
+    count_steps: Head steps needed to visit tracks in a given order
+"""
+
+import logging
+from typing import Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Step Counting
+# =============================================================================
+
+def count_steps(tracks: Iterable[Tuple[int, int]], start_cylinder: int = 0) -> int:
+    """
+    Count the head steps needed to visit tracks in order.
+
+    Args:
+        tracks: (cylinder, head) pairs in visiting order
+        start_cylinder: Cylinder the head starts on
+
+    Returns:
+        Total cylinders stepped
+    """
+    steps = 0
+    position = start_cylinder
+    for cylinder, _ in tracks:
+        steps += abs(cylinder - position)
+        position = cylinder
+    return steps
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+class TrackScheduler:
+    """
+    Order track work to minimise head steps.
+
+    When constructed with a device, each call to order() starts from the
+    device's current cylinder. Otherwise it starts where the previous
+    ordering ended. Steps of every ordering are added to total_steps.
+
+    Example:
+        >>> scheduler = TrackScheduler(device)
+        >>> for cylinder, head in scheduler.order(bad_tracks):
+        ...     recover(cylinder, head)
+        >>> logger.info("Recovery stepped %d cylinders", scheduler.total_steps)
+    """
+
+    def __init__(self, device: Optional[Any] = None, start_cylinder: int = 0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            device: Device whose current_cylinder is the starting point
+                   of each ordering, or None to track position here
+            start_cylinder: Starting cylinder when the device position is
+                           unknown
+        """
+        self._device = device
+        self._position = start_cylinder
+        self._ascending = True
+        self.total_steps = 0
+
+    @property
+    def position(self) -> int:
+        """Cylinder the next ordering starts from."""
+        cylinder = getattr(self._device, 'current_cylinder', None)
+        if isinstance(cylinder, int):
+            return cylinder
+        return self._position
+
+    @property
+    def ascending(self) -> bool:
+        """True if the last sweep ended moving towards higher cylinders."""
+        return self._ascending
+
+    def order(self, tracks: Iterable[Any]) -> List[Any]:
+        """
+        Order tracks for the fewest head steps from the current position.
+
+        Tracks are (cylinder, head) pairs or anything whose first item is
+        one, such as the items of a dict keyed by track. Duplicates are
+        kept next to each other.
+
+        Args:
+            tracks: Tracks to visit
+
+        Returns:
+            The same tracks in visiting order
+        """
+        items = list(tracks)
+        if not items:
+            return []
+
+        start = self.position
+        key = self._track_key
+        above = sorted((i for i in items if key(i)[0] >= start), key=key)
+        below = sorted((i for i in items if key(i)[0] < start),
+                       key=lambda i: (-key(i)[0], key(i)[1]))
+
+        # Sweep up then down, or down then up, whichever steps less;
+        # on a tie keep going the way the last sweep ended
+        up_first = above + below
+        down_first = (below + above) if below else above
+        up_steps = count_steps((key(i) for i in up_first), start)
+        down_steps = count_steps((key(i) for i in down_first), start)
+
+        if up_steps < down_steps or (up_steps == down_steps and self._ascending):
+            ordered, steps, ends_ascending = up_first, up_steps, not below
+        else:
+            ordered, steps, ends_ascending = down_first, down_steps, bool(above) or not below
+
+        if steps:
+            self._ascending = ends_ascending
+        self._position = key(ordered[-1])[0]
+        self.total_steps += steps
+        logger.debug("Ordered %d tracks from C%d: %d steps", len(ordered), start, steps)
+        return ordered
+
+    def sweep(self, cylinders: Iterable[int], heads: int) -> List[Tuple[int, int]]:
+        """
+        Order every head of the given cylinders.
+
+        Args:
+            cylinders: Cylinders to visit
+            heads: Heads per cylinder
+
+        Returns:
+            (cylinder, head) pairs in visiting order
+        """
+        return self.order([(cyl, head) for cyl in cylinders for head in range(heads)])
+
+    @staticmethod
+    def _track_key(item: Any) -> Tuple[int, int]:
+        """(cylinder, head) of a track or of a (track, value) item."""
+        first = item[0]
+        if isinstance(first, tuple):
+            return first
+        return item
+
+
+__all__ = [
+    'TrackScheduler',
+    'count_steps',
+]
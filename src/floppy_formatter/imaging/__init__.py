@@ -89,6 +89,11 @@ from .flux_image import (
     SCPHeader,
     HFEHeader,
     WriteResult,
+    # Streaming writers
+    FluxStreamWriter,
+    SCPStreamWriter,
+    HFEStreamWriter,
+    disk_fingerprint,
     # Conversion functions
     convert_sector_to_flux,
     convert_flux_to_sector,
@@ -160,6 +165,10 @@ __all__ = [
     'FluxImage',
     'SCPImage',
     'HFEImage',
+    'FluxStreamWriter',
+    'SCPStreamWriter',
+    'HFEStreamWriter',
+    'disk_fingerprint',
 
     # ==========================================================================
     # Format Detection & Metadata
@@ -13,12 +13,18 @@ Supported Formats:
 Part of Phase 11: Image Import/Export
 """
 
+import json
 import logging
+import mmap
+import os
 import struct
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
 
 from .image_formats import (
     ImageFormat,
@@ -28,6 +34,7 @@ from .image_formats import (
     ImageReadError,
     ImageWriteError,
     detect_format,
+    read_metadata,
     SCP_MAGIC,
     HFE_MAGIC,
 )
@@ -48,6 +55,18 @@ SCP_HEADER_SIZE = 16
 SCP_TRACK_HEADER_SIZE = 4
 SCP_VERSION = 0x18  # Version 2.4
 
+# SCP flux cells are big-endian 16-bit tick counts. A zero cell marks an
+# overflow: 65536 ticks with no transition, added to the next cell.
+SCP_FLUX_DTYPE = np.dtype('>u2')
+SCP_FLUX_OVERFLOW = 0x10000
+
+# SCP ticks are 25ns times (resolution + 1)
+SCP_BASE_FREQ = 40_000_000
+
+# Images written before the cells were big-endian hold little-endian
+# cells timed at DEFAULT_SAMPLE_FREQ
+SCP_LEGACY_FLUX_DTYPE = np.dtype('<u2')
+
 # SCP disk types
 SCP_DISK_TYPE_C64 = 0x00
 SCP_DISK_TYPE_AMIGA = 0x04
@@ -180,6 +199,92 @@ class WriteResult:
     errors: List[str] = field(default_factory=list)
 
 
+# =============================================================================
+# SCP Flux Encoding
+# =============================================================================
+
+def decode_scp_flux(rev_bytes: bytes) -> np.ndarray:
+    """
+    Decode one revolution of SCP flux cells into transition intervals.
+
+    Overflow (zero) cells are folded into the cell that follows them.
+    Overflow cells after the last transition carry no transition and are
+    dropped, as is a trailing odd byte.
+
+    Args:
+        rev_bytes: Flux data of one revolution
+
+    Returns:
+        Transition intervals in ticks, uint32
+    """
+    cells = np.frombuffer(rev_bytes, dtype=SCP_FLUX_DTYPE,
+                          count=len(rev_bytes) // 2).astype(np.int64)
+    if not cells.size:
+        return np.zeros(0, dtype=np.uint32)
+
+    overflow = cells == 0
+    if not overflow.any():
+        return cells.astype(np.uint32)
+
+    # Elapsed ticks at the end of every cell; transitions are the
+    # non-overflow cells, and each interval is the time between them
+    elapsed = np.cumsum(np.where(overflow, SCP_FLUX_OVERFLOW, cells))
+    ends = elapsed[~overflow]
+    return np.diff(ends, prepend=0).astype(np.uint32)
+
+
+def scp_sample_freq(resolution: int) -> int:
+    """
+    Get the sample frequency of SCP flux cells.
+
+    Args:
+        resolution: Header resolution, in 25ns steps above 25ns
+
+    Returns:
+        Sample frequency in Hz
+    """
+    return SCP_BASE_FREQ // (resolution + 1)
+
+
+def _is_legacy_scp_flux(rev_bytes: bytes) -> bool:
+    """
+    Check if flux cells were written little-endian by earlier versions.
+
+    Flux intervals are short, so the byte order that reads them as the
+    smaller values is the one they were written in.
+    """
+    count = len(rev_bytes) // 2
+    big = np.frombuffer(rev_bytes, dtype=SCP_FLUX_DTYPE, count=count)
+    little = np.frombuffer(rev_bytes, dtype=SCP_LEGACY_FLUX_DTYPE, count=count)
+    big, little = big[big > 0], little[little > 0]
+    if not big.size or not little.size:
+        return False
+    return float(np.median(little)) < float(np.median(big))
+
+
+def encode_scp_flux(flux_times) -> bytes:
+    """
+    Encode transition intervals as SCP flux cells.
+
+    Intervals of 65536 ticks or more are written as overflow cells
+    followed by the remainder. A remainder of zero cannot be stored and
+    is written as one tick.
+
+    Args:
+        flux_times: Transition intervals in ticks
+
+    Returns:
+        Flux data bytes for one revolution
+    """
+    intervals = np.asarray(flux_times, dtype=np.int64)
+    overflows = intervals // SCP_FLUX_OVERFLOW
+    remainders = np.maximum(intervals % SCP_FLUX_OVERFLOW, 1)
+
+    cells = np.zeros(int(overflows.sum()) + len(intervals), dtype=SCP_FLUX_DTYPE)
+    cells[np.cumsum(overflows + 1) - 1] = remainders
+    return cells.tobytes()
+
+
 # =============================================================================
 # FluxImage Abstract Base Class
 # =============================================================================
@@ -229,12 +334,14 @@ class FluxImage(ABC):
         pass
 
     @staticmethod
-    def open(filepath: str) -> 'FluxImage':
+    def open(filepath: str, use_mmap: bool = False) -> 'FluxImage':
         """
         Open a flux image file, auto-detecting format.
 
         Args:
             filepath: Path to image file
+            use_mmap: Memory-map SCP images and read tracks on demand
+                     (see SCPImage.load); ignored for other formats
 
         Returns:
             SCPImage or HFEImage instance
@@ -246,7 +353,7 @@ class FluxImage(ABC):
 
         if format_type == ImageFormat.SCP:
             image = SCPImage()
-            image.load(filepath)
+            image.load(filepath, use_mmap=use_mmap)
             return image
         elif format_type == ImageFormat.HFE:
             image = HFEImage()
@@ -276,6 +383,11 @@ class SCPImage(FluxImage):
         - Track data blocks (variable size per track)
         - Optional footer
 
+    A memory-mapped load parses only the header and track offset table;
+    each track's revolutions are read from the mapping on first access,
+    so large multi-revolution images open immediately and only the
+    tracks actually used take up memory.
+
     Example:
         # Load existing image
         scp = SCPImage()
@@ -286,6 +398,11 @@ class SCPImage(FluxImage):
 
         # Modify and save
         scp.save("modified.scp")
+
+        # Map a large archive and read tracks on demand
+        with SCPImage() as scp:
+            scp.load("archive.scp", use_mmap=True)
+            flux = scp.get_track_flux(40, 1)
     """
 
     def __init__(self):
@@ -294,7 +411,18 @@ class SCPImage(FluxImage):
         self._filepath: Optional[str] = None
         self._track_data: Dict[int, List[bytes]] = {}  # track_num -> [rev data]
         self._track_offsets: Dict[int, int] = {}
+        self._pending: Dict[int, int] = {}  # track_num -> offset, not yet read
+        self._mmap: Optional[mmap.mmap] = None
         self._modified: bool = False
+        self._legacy: Optional[bool] = None  # Little-endian cells, found on first read
+
+    def __enter__(self) -> 'SCPImage':
+        """Enter context; close() is called on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the file mapping, if any."""
+        self.close()
 
     @property
     def cylinders(self) -> int:
@@ -316,12 +444,25 @@ class SCPImage(FluxImage):
         """Number of revolutions stored per track."""
         return self._header.num_revolutions
 
-    def load(self, filepath: str) -> None:
+    @property
+    def is_mapped(self) -> bool:
+        """True while tracks are being read from a memory-mapped file."""
+        return self._mmap is not None
+
+    @property
+    def sample_freq(self) -> int:
+        """Sample frequency of the flux cells, from the header resolution."""
+        return scp_sample_freq(self._header.resolution)
+
+    def load(self, filepath: str, use_mmap: bool = False) -> None:
         """
         Load SCP image from file.
 
         Args:
             filepath: Path to SCP file
+            use_mmap: Map the file and read each track on first access
+                     instead of reading the whole file now. The mapping is
+                     held until close().
 
         Raises:
             ImageReadError: If file cannot be read
@@ -334,93 +475,193 @@ class SCPImage(FluxImage):
 
         logger.info("Loading SCP image: %s", filepath)
 
+        self.close()
+
         try:
             with open(filepath, 'rb') as f:
-                file_data = f.read()
+                if use_mmap and path.stat().st_size >= SCP_HEADER_SIZE:
+                    file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    file_data = f.read()
         except IOError as e:
             raise ImageReadError(f"Failed to read file: {e}", filepath)
 
-        if len(file_data) < SCP_HEADER_SIZE:
-            raise ImageCorruptError(
-                "File too small for SCP header", filepath,
-                expected_size=SCP_HEADER_SIZE,
-                actual_size=len(file_data)
-            )
-
-        # Parse header
-        self._parse_header(file_data[:SCP_HEADER_SIZE], filepath)
+        try:
+            if len(file_data) < SCP_HEADER_SIZE:
+                raise ImageCorruptError(
+                    "File too small for SCP header", filepath,
+                    expected_size=SCP_HEADER_SIZE,
+                    actual_size=len(file_data)
+                )
 
-        # Parse track offset table
-        num_tracks = self._header.end_track - self._header.start_track + 1
-        offset_table_size = num_tracks * 4
-        offset_table_start = SCP_HEADER_SIZE
+            # Parse header
+            self._parse_header(file_data[:SCP_HEADER_SIZE], filepath)
+
+            # Parse track offset table
+            num_tracks = self._header.end_track - self._header.start_track + 1
+            offset_table_size = num_tracks * 4
+            offset_table_start = SCP_HEADER_SIZE
+
+            if len(file_data) < offset_table_start + offset_table_size:
+                raise ImageCorruptError("File too small for track offset table", filepath)
+
+            # Read track offsets
+            self._track_offsets = {}
+            for i in range(num_tracks):
+                track_num = self._header.start_track + i
+                self._track_offsets[track_num] = struct.unpack_from(
+                    '<I', file_data, offset_table_start + i * 4
+                )[0]
+        except Exception:
+            if isinstance(file_data, mmap.mmap):
+                file_data.close()
+            raise
 
-        if len(file_data) < offset_table_start + offset_table_size:
-            raise ImageCorruptError("File too small for track offset table", filepath)
+        self._track_data = {}
+        self._legacy = None
+        self._filepath = filepath
+        self._pending = {
+            track_num: offset
+            for track_num, offset in self._track_offsets.items()
+            if offset != 0  # Empty track
+        }
 
-        # Read track offsets
-        for i in range(num_tracks):
-            track_num = self._header.start_track + i
-            offset_pos = offset_table_start + i * 4
-            self._track_offsets[track_num] = struct.unpack(
-                '<I', file_data[offset_pos:offset_pos + 4]
-            )[0]
+        if isinstance(file_data, mmap.mmap):
+            self._mmap = file_data
+        else:
+            # Read track data now
+            for track_num in list(self._pending):
+                self._read_track(track_num, file_data)
 
-        # Read track data
-        self._track_data = {}
-        for track_num, offset in self._track_offsets.items():
-            if offset == 0:
-                continue  # Empty track
+        self._modified = False
 
-            if offset >= len(file_data):
-                logger.warning("Track %d offset %d beyond file size", track_num, offset)
-                continue
+        if self.is_mapped:
+            logger.info(
+                "Mapped SCP: %d tracks, %d revolutions",
+                len(self._pending), self._header.num_revolutions
+            )
+        else:
+            logger.info(
+                "Loaded SCP: %d tracks, %d revolutions",
+                len(self._track_data), self._header.num_revolutions
+            )
 
-            # Read track header
-            if offset + 4 > len(file_data):
-                continue
+    def close(self) -> None:
+        """
+        Release the file mapping of a memory-mapped load.
 
-            track_header = file_data[offset:offset + 4]
-            if track_header[:3] != b'TRK':
-                logger.warning("Invalid track header at offset %d", offset)
-                continue
+        Tracks already read stay available; tracks not yet read are
+        dropped. Safe to call on an image that is not mapped.
+        """
+        if self._pending and self._mmap is not None:
+            logger.debug("Closing SCP mapping with %d tracks unread", len(self._pending))
+        self._pending = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _read_track(self, track_num: int,
+                    file_data: Union[bytes, mmap.mmap, None] = None) -> None:
+        """
+        Read a pending track's revolutions into the track data.
 
-            # Read revolution data
-            rev_data = []
-            rev_offset = offset + 4
+        Args:
+            track_num: Track number in the offset table
+            file_data: File contents, or None to use the mapping
+        """
+        offset = self._pending.pop(track_num, None)
+        if offset is None:
+            return
+        if file_data is None:
+            file_data = self._mmap
+        if file_data is None:
+            return
+
+        if offset >= len(file_data):
+            logger.warning("Track %d offset %d beyond file size", track_num, offset)
+            return
+
+        # Read track header
+        if offset + 4 > len(file_data):
+            return
+
+        track_header = file_data[offset:offset + 4]
+        if track_header[:3] != b'TRK':
+            logger.warning("Invalid track header at offset %d", offset)
+            return
+
+        # Read revolution data
+        rev_data = []
+        rev_offset = offset + 4
+
+        for rev in range(self._header.num_revolutions):
+            if rev_offset + 12 > len(file_data):
+                break
+
+            # Revolution header: index time (4), track length (4), data offset (4)
+            _, track_length, data_offset_rel = struct.unpack_from(
+                '<III', file_data, rev_offset
+            )
 
-            for rev in range(self._header.num_revolutions):
-                if rev_offset + 12 > len(file_data):
-                    break
+            # Calculate absolute data offset
+            data_offset = offset + data_offset_rel
 
-                # Revolution header: index time (4), track length (4), data offset (4)
-                rev_header = file_data[rev_offset:rev_offset + 12]
-                track_length = struct.unpack('<I', rev_header[4:8])[0]
-                data_offset_rel = struct.unpack('<I', rev_header[8:12])[0]
+            if data_offset + track_length * 2 > len(file_data):
+                logger.warning("Track %d rev %d data truncated", track_num, rev)
+                break
 
-                # Calculate absolute data offset
-                data_offset = offset + data_offset_rel
+            rev_offset += 12
 
-                if data_offset + track_length * 2 > len(file_data):
-                    logger.warning("Track %d rev %d data truncated", track_num, rev)
-                    break
+            # Revolutions the capture did not have are stored empty
+            if track_length == 0:
+                continue
 
-                # Read flux data (16-bit values)
-                flux_bytes = file_data[data_offset:data_offset + track_length * 2]
-                rev_data.append(flux_bytes)
+            # Read flux data (16-bit values)
+            flux_bytes = file_data[data_offset:data_offset + track_length * 2]
+            rev_data.append(flux_bytes)
 
-                rev_offset += 12
+        if rev_data:
+            self._track_data[track_num] = self._convert_legacy(rev_data)
 
-            if rev_data:
-                self._track_data[track_num] = rev_data
+    def _convert_legacy(self, rev_data: List[bytes]) -> List[bytes]:
+        """
+        Convert revolutions of a legacy little-endian image to SCP cells.
 
-        self._filepath = filepath
-        self._modified = False
+        Whether the image is legacy is decided on the first track read.
+        Legacy cells hold DEFAULT_SAMPLE_FREQ ticks and no overflow
+        cells; they are rescaled to the header resolution, so a save
+        writes a valid image.
+        """
+        from floppy_formatter.hardware import FluxData
 
-        logger.info(
-            "Loaded SCP: %d tracks, %d revolutions",
-            len(self._track_data), self._header.num_revolutions
-        )
+        if self._legacy is None:
+            self._legacy = _is_legacy_scp_flux(rev_data[0])
+            if self._legacy:
+                logger.warning(
+                    "%s has little-endian flux cells from an earlier version; converting",
+                    self._filepath or "SCP image"
+                )
+        if not self._legacy:
+            return rev_data
+
+        converted = []
+        for rev_bytes in rev_data:
+            cells = np.frombuffer(rev_bytes, dtype=SCP_LEGACY_FLUX_DTYPE,
+                                  count=len(rev_bytes) // 2)
+            flux = FluxData(flux_times=cells[cells > 0], sample_freq=DEFAULT_SAMPLE_FREQ)
+            converted.append(encode_scp_flux(flux.resample(self.sample_freq).flux_array))
+        return converted
+
+    def _track_revolutions(self, track_num: int) -> List[bytes]:
+        """Get a track's revolution data, reading it from the mapping if needed."""
+        if track_num in self._pending:
+            self._read_track(track_num)
+        return self._track_data.get(track_num, [])
+
+    def _read_all_tracks(self) -> None:
+        """Read every pending track from the mapping."""
+        for track_num in list(self._pending):
+            self._read_track(track_num)
 
     def _parse_header(self, header: bytes, filepath: str) -> None:
         """Parse SCP header bytes."""
@@ -444,6 +685,9 @@ class SCPImage(FluxImage):
         """
         Save SCP image to file.
 
+        Tracks are streamed to a partial file that replaces filepath once
+        complete, so a failed save leaves any existing file untouched.
+
         Args:
             filepath: Path to save to
 
@@ -452,102 +696,20 @@ class SCPImage(FluxImage):
         """
         logger.info("Saving SCP image: %s", filepath)
 
-        # Create parent directories
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # The target may be the mapped file itself
+        self._read_all_tracks()
+        self.close()
 
-        output = bytearray()
-
-        # Build header
-        header = bytearray(SCP_HEADER_SIZE)
-        header[0:3] = SCP_MAGIC
-        header[3] = self._header.version
-        header[4] = self._header.disk_type
-        header[5] = self._header.num_revolutions
-        header[6] = self._header.start_track
-        header[7] = self._header.end_track
-        header[8] = self._header.flags
-        header[9] = self._header.bit_cell_width
-        header[10] = self._header.heads
-        header[11] = self._header.resolution
-        # Checksum will be filled in later
-        output.extend(header)
-
-        # Build track offset table
-        num_tracks = self._header.end_track - self._header.start_track + 1
-        offset_table = bytearray(num_tracks * 4)
-
-        # Calculate where track data will start
-        track_data_start = SCP_HEADER_SIZE + len(offset_table)
-
-        # Build track data
-        track_data = bytearray()
-        current_offset = track_data_start
-
-        for i in range(num_tracks):
-            track_num = self._header.start_track + i
-
-            if track_num not in self._track_data or not self._track_data[track_num]:
-                # No data for this track
-                struct.pack_into('<I', offset_table, i * 4, 0)
-                continue
-
-            # Store offset
-            struct.pack_into('<I', offset_table, i * 4, current_offset)
-
-            # Build track block
-            track_block = bytearray()
-
-            # Track header: "TRK" + track number
-            track_block.extend(b'TRK')
-            track_block.append(track_num)
-
-            # Revolution headers and data
-            rev_headers_size = self._header.num_revolutions * 12
-            data_start_rel = 4 + rev_headers_size  # After track header + rev headers
-
-            rev_data_offset = data_start_rel
-            rev_headers = bytearray()
-            rev_datas = bytearray()
-
-            for rev, flux_bytes in enumerate(self._track_data[track_num]):
-                # Revolution header
-                index_time = 200000000 // DEFAULT_SAMPLE_FREQ  # ~200ms in samples
-                track_length = len(flux_bytes) // 2  # Number of 16-bit values
-
-                rev_header = bytearray(12)
-                struct.pack_into('<I', rev_header, 0, index_time)
-                struct.pack_into('<I', rev_header, 4, track_length)
-                struct.pack_into('<I', rev_header, 8, rev_data_offset)
-                rev_headers.extend(rev_header)
-
-                rev_datas.extend(flux_bytes)
-                rev_data_offset += len(flux_bytes)
-
-            track_block.extend(rev_headers)
-            track_block.extend(rev_datas)
-
-            track_data.extend(track_block)
-            current_offset += len(track_block)
-
-        output.extend(offset_table)
-        output.extend(track_data)
-
-        # Calculate and store checksum
-        checksum = sum(output[SCP_HEADER_SIZE:]) & 0xFFFFFFFF
-        struct.pack_into('<I', output, 12, checksum)
-
-        # Write file
-        try:
-            with open(filepath, 'wb') as f:
-                f.write(output)
-        except IOError as e:
-            raise ImageWriteError(f"Failed to write file: {e}", filepath)
+        with SCPStreamWriter(filepath, header=self._header) as writer:
+            for track_num in range(self._header.start_track, self._header.end_track + 1):
+                revs = self._track_data.get(track_num)
+                if revs:
+                    writer.write_track_data(track_num, revs)
 
         self._filepath = filepath
         self._modified = False
 
-        logger.info("Saved SCP: %d bytes", len(output))
+        logger.info("Saved SCP: %d bytes", writer.bytes_written)
 
     def get_track_flux(self, cyl: int, head: int) -> Optional['FluxData']:
         """
@@ -564,34 +726,24 @@ class SCPImage(FluxImage):
         from floppy_formatter.hardware import FluxData
 
         track_num = cyl * 2 + head
+        revs = self._track_revolutions(track_num)
 
-        if track_num not in self._track_data or not self._track_data[track_num]:
+        if not revs:
             return None
 
-        # Combine all revolutions into one FluxData
-        flux_times = []
-        index_positions = []
-        current_pos = 0
-
-        for rev_bytes in self._track_data[track_num]:
-            # Mark index position at start of each revolution
-            index_positions.append(current_pos)
-
-            # Parse 16-bit flux values
-            for i in range(0, len(rev_bytes), 2):
-                if i + 2 <= len(rev_bytes):
-                    value = struct.unpack('<H', rev_bytes[i:i + 2])[0]
-                    if value > 0:
-                        flux_times.append(value)
-                        current_pos += value
+        # Combine all revolutions into one FluxData, with index positions
+        # at the revolution boundaries
+        rev_flux = [decode_scp_flux(rev_bytes) for rev_bytes in revs]
+        rev_samples = [int(flux.sum(dtype=np.int64)) for flux in rev_flux]
+        index_positions = np.cumsum([0] + rev_samples, dtype=np.int64)
 
         return FluxData(
-            flux_times=flux_times,
-            sample_freq=DEFAULT_SAMPLE_FREQ,
+            flux_times=np.concatenate(rev_flux),
+            sample_freq=self.sample_freq,
             index_positions=index_positions,
             cylinder=cyl,
             head=head,
-            revolutions=len(self._track_data[track_num])
+            revolutions=len(revs)
         )
 
     def get_revolution(self, cyl: int, head: int, rev: int) -> Optional['FluxData']:
@@ -609,26 +761,14 @@ class SCPImage(FluxImage):
         from floppy_formatter.hardware import FluxData
 
         track_num = cyl * 2 + head
+        revs = self._track_revolutions(track_num)
 
-        if track_num not in self._track_data:
-            return None
-
-        revs = self._track_data[track_num]
         if rev >= len(revs):
             return None
 
-        rev_bytes = revs[rev]
-        flux_times = []
-
-        for i in range(0, len(rev_bytes), 2):
-            if i + 2 <= len(rev_bytes):
-                value = struct.unpack('<H', rev_bytes[i:i + 2])[0]
-                if value > 0:
-                    flux_times.append(value)
-
         return FluxData(
-            flux_times=flux_times,
-            sample_freq=DEFAULT_SAMPLE_FREQ,
+            flux_times=decode_scp_flux(revs[rev]),
+            sample_freq=self.sample_freq,
             index_positions=[0],
             cylinder=cyl,
             head=head,
@@ -639,6 +779,8 @@ class SCPImage(FluxImage):
         """
         Set flux data for a track.
 
+        The flux is resampled to the image's sample frequency.
+
         Args:
             cyl: Cylinder number
             head: Head number
@@ -646,15 +788,10 @@ class SCPImage(FluxImage):
         """
         track_num = cyl * 2 + head
 
-        # Convert FluxData to 16-bit values
-        rev_bytes = bytearray()
-        for time_val in flux.flux_times:
-            # Clamp to 16-bit range
-            clamped = min(65535, max(1, time_val))
-            rev_bytes.extend(struct.pack('<H', clamped))
-
         # Store as single revolution
-        self._track_data[track_num] = [bytes(rev_bytes)]
+        self._pending.pop(track_num, None)
+        flux = flux.resample(self.sample_freq)
+        self._track_data[track_num] = [encode_scp_flux(flux.flux_array)]
         self._modified = True
 
         # Update header track range if needed
@@ -682,8 +819,10 @@ class SCPImage(FluxImage):
             flags=SCP_FLAG_INDEX,
             heads=0 if heads == 2 else heads,
         )
+        self.close()
         self._track_data = {}
         self._track_offsets = {}
+        self._legacy = None
         self._filepath = None
         self._modified = True
 
@@ -748,6 +887,7 @@ class SCPImage(FluxImage):
             errors.append("Number of revolutions is zero")
 
         # Check track data
+        self._read_all_tracks()
         for track_num in range(self._header.start_track, self._header.end_track + 1):
             if track_num in self._track_data:
                 for rev, data in enumerate(self._track_data[track_num]):
@@ -758,6 +898,7 @@ class SCPImage(FluxImage):
 
     def calculate_checksum(self) -> int:
         """Calculate data checksum."""
+        self._read_all_tracks()
         total = 0
         for track_data in self._track_data.values():
             for rev_data in track_data:
@@ -920,6 +1061,9 @@ class HFEImage(FluxImage):
         """
         Save HFE image to file.
 
+        Cylinders are streamed to a partial file that replaces filepath
+        once complete, so a failed save leaves any existing file untouched.
+
         Args:
             filepath: Path to save to
 
@@ -928,85 +1072,17 @@ class HFEImage(FluxImage):
         """
         logger.info("Saving HFE image: %s", filepath)
 
-        # Create parent directories
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        output = bytearray()
-
-        # Build header
-        header = bytearray(HFE_HEADER_SIZE)
-        header[0:8] = HFE_MAGIC
-        header[8] = self._header.revision
-        header[9] = self._header.num_tracks
-        header[10] = self._header.num_sides
-        header[11] = self._header.track_encoding
-        struct.pack_into('<H', header, 12, self._header.bit_rate)
-        struct.pack_into('<H', header, 14, self._header.rpm)
-        header[16] = self._header.interface_mode
-        header[17] = 1  # Reserved
-        struct.pack_into('<H', header, 18, 1)  # Track list at block 1
-        # Write enable flag
-        header[20] = 0xFF
-        # Single/double step mode
-        header[21] = 0xFF
-
-        output.extend(header)
-
-        # Build track lookup table
-        lut = bytearray(HFE_TRACK_LUT_SIZE)
-        track_data_start = 2  # Start after header and LUT (2 blocks)
-        current_block = track_data_start
-
-        # Build interleaved track data
-        track_blocks = bytearray()
-
-        for cyl in range(self._header.num_tracks):
-            side0_data = self._track_data.get((cyl, 0), b'')
-            side1_data = self._track_data.get((cyl, 1), b'') if self._header.num_sides >= 2 else b''
-
-            # Ensure both sides are same length (pad if needed)
-            max_len = max(len(side0_data), len(side1_data))
-            if max_len == 0:
-                # Empty track
-                struct.pack_into('<H', lut, cyl * 4, 0)
-                struct.pack_into('<H', lut, cyl * 4 + 2, 0)
-                continue
-
-            # Pad to 256-byte boundary
-            block_count = (max_len + 255) // 256
-            padded_len = block_count * 256
-
-            side0_padded = side0_data.ljust(padded_len, b'\x00')
-            side1_padded = side1_data.ljust(padded_len, b'\x00')
-
-            # Interleave into 512-byte blocks
-            track_interleaved = bytearray()
-            for i in range(block_count):
-                track_interleaved.extend(side0_padded[i * 256:(i + 1) * 256])
-                track_interleaved.extend(side1_padded[i * 256:(i + 1) * 256])
-
-            # Store in LUT
-            struct.pack_into('<H', lut, cyl * 4, current_block)
-            struct.pack_into('<H', lut, cyl * 4 + 2, len(track_interleaved))
-
-            track_blocks.extend(track_interleaved)
-            current_block += len(track_interleaved) // 512
-
-        output.extend(lut)
-        output.extend(track_blocks)
-
-        # Write file
-        try:
-            with open(filepath, 'wb') as f:
-                f.write(output)
-        except IOError as e:
-            raise ImageWriteError(f"Failed to write file: {e}", filepath)
+        with HFEStreamWriter(filepath, header=self._header) as writer:
+            for cyl in range(self._header.num_tracks):
+                sides = [self._track_data.get((cyl, head), b'')
+                         for head in range(self._header.num_sides)]
+                if any(sides):
+                    writer.write_cylinder_data(cyl, sides)
 
         self._filepath = filepath
         self._modified = False
 
-        logger.info("Saved HFE: %d bytes", len(output))
+        logger.info("Saved HFE: %d bytes", writer.bytes_written)
 
     def get_track_flux(self, cyl: int, head: int) -> Optional['FluxData']:
         """
@@ -1068,35 +1144,7 @@ class HFEImage(FluxImage):
 
     def _flux_to_bits(self, flux: 'FluxData') -> bytes:
         """Convert flux timing to HFE bit stream."""
-        # Calculate samples per bit
-        bit_time_ns = 1000000000 / (self._header.bit_rate * 250)
-        samples_per_bit = int(bit_time_ns * flux.sample_freq / 1000000000)
-
-        # Generate bit stream
-        bits = []
-        sample_pos = 0
-
-        for time_val in flux.flux_times:
-            # Fill with zeros until transition
-            while sample_pos < time_val:
-                bits.append(0)
-                sample_pos += samples_per_bit
-            # Add transition
-            bits.append(1)
-            sample_pos = 0
-
-        # Convert bits to bytes
-        result = bytearray()
-        for i in range(0, len(bits), 8):
-            byte = 0
-            for j in range(8):
-                if i + j < len(bits):
-                    byte = (byte << 1) | bits[i + j]
-                else:
-                    byte = byte << 1
-            result.append(byte)
-
-        return bytes(result)
+        return _flux_to_hfe_bits(flux, self._header.bit_rate * 250)
 
     def set_track_flux(self, cyl: int, head: int, flux: 'FluxData') -> None:
         """
@@ -1212,6 +1260,628 @@ class HFEImage(FluxImage):
         return (len(errors) == 0, errors)
 
 
+# =============================================================================
+# Streaming Writers
+# =============================================================================
+
+# Suffix of the file a stream writer builds before it is complete
+PARTIAL_SUFFIX = '.partial'
+
+# Suffix added to the partial file's path for the record of its source disk
+SOURCE_SUFFIX = '.source'
+
+
+def disk_fingerprint(flux: 'FluxData') -> Dict[str, int]:
+    """
+    Identify a disk by the sectors of one of its tracks.
+
+    Args:
+        flux: Capture of a track, normally C0 H0
+
+    Returns:
+        Dictionary mapping sector number (as a string) to the CRC32 of
+        its data, for every sector that read with a valid CRC
+    """
+    from floppy_formatter.hardware import decode_flux_data
+
+    return {str(sector.sector): zlib.crc32(sector.data)
+            for sector in decode_flux_data(flux)
+            if sector.is_good and sector.data is not None}
+
+
+def _flux_to_hfe_bits(flux: 'FluxData', bit_rate: int) -> bytes:
+    """Convert flux timing to an HFE bit stream at bit_rate bps."""
+    # Calculate samples per bit
+    bit_time_ns = 1000000000 / bit_rate
+    samples_per_bit = int(bit_time_ns * flux.sample_freq / 1000000000)
+
+    # Generate bit stream
+    bits = []
+    sample_pos = 0
+
+    for time_val in flux.flux_times:
+        # Fill with zeros until transition
+        while sample_pos < time_val:
+            bits.append(0)
+            sample_pos += samples_per_bit
+        # Add transition
+        bits.append(1)
+        sample_pos = 0
+
+    # Convert bits to bytes
+    result = bytearray()
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for j in range(8):
+            if i + j < len(bits):
+                byte = (byte << 1) | bits[i + j]
+            else:
+                byte = byte << 1
+        result.append(byte)
+
+    return bytes(result)
+
+
+class FluxStreamWriter(ABC):
+    """
+    Base class for writers that append tracks to an image as they are read.
+
+    Tracks go to filepath + PARTIAL_SUFFIX and are synced to disk one at a
+    time, so only the track being written is held in memory and a crash
+    loses at most that track. A track's table entry is written after its
+    data, so the partial file never references data that is not there.
+    close() finishes the header and renames the partial file to filepath.
+
+    With resume=True an existing partial file is reopened, anything after
+    its last complete track is discarded, and has_track() reports the
+    tracks it already holds. When a source fingerprint is given it is
+    recorded beside the partial file, and a partial file is only resumed
+    if its recorded fingerprint agrees on every sector both hold.
+
+    Used as a context manager, the writer closes on success and leaves
+    the partial file in place for a later resume on error.
+    """
+
+    def __init__(self, filepath: str, resume: bool = False,
+                 source: Optional[Dict[str, int]] = None):
+        """
+        Open the partial file.
+
+        Args:
+            filepath: Path of the finished image
+            resume: Continue an existing partial file if there is one
+            source: Fingerprint of the disk being read (see
+                   disk_fingerprint()), or None to skip the check
+
+        Raises:
+            ImageWriteError: If the file cannot be opened, or the partial
+                            file does not match the image or disk being
+                            written
+        """
+        self._filepath = filepath
+        self._partial_path = filepath + PARTIAL_SUFFIX
+        self._source_path = self._partial_path + SOURCE_SUFFIX
+        self._source = source
+        self._bytes_written = 0
+        self._file = None
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            if resume and Path(self._partial_path).exists():
+                self._check_source()
+                self._file = open(self._partial_path, 'r+b')
+                self._end = self._resume()
+                self._file.truncate(self._end)
+                logger.info("Resuming %s with %d tracks", self._partial_path,
+                            len(self.completed_tracks))
+            else:
+                self._file = open(self._partial_path, 'w+b')
+                self._end = self._start()
+                self._record_source()
+        except IOError as e:
+            self._close_file()
+            raise ImageWriteError(f"Failed to open file: {e}", self._partial_path) from e
+        except Exception:
+            self._close_file()
+            raise
+
+    def __enter__(self) -> 'FluxStreamWriter':
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close on success; keep the partial file on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def partial_path(self) -> str:
+        """Path of the partial file."""
+        return self._partial_path
+
+    @property
+    def bytes_written(self) -> int:
+        """Size of the image so far."""
+        return self._end
+
+    @property
+    @abstractmethod
+    def completed_tracks(self) -> List[Tuple[int, int]]:
+        """(cylinder, head) of every track written, in file order."""
+        pass
+
+    def has_track(self, cyl: int, head: int) -> bool:
+        """True if the track is already in the image."""
+        return (cyl, head) in self.completed_tracks
+
+    @abstractmethod
+    def write_track(self, cyl: int, head: int, flux: 'FluxData') -> None:
+        """Append a captured track to the image."""
+        pass
+
+    @abstractmethod
+    def _start(self) -> int:
+        """Write the header of a new image and return the end offset."""
+        pass
+
+    @abstractmethod
+    def _resume(self) -> int:
+        """Read back a partial image and return the end of its last track."""
+        pass
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Complete the header before the image is renamed into place."""
+        pass
+
+    def _record_source(self) -> None:
+        """Record the source fingerprint beside a new partial file."""
+        if self._source is None:
+            Path(self._source_path).unlink(missing_ok=True)
+            return
+        with open(self._source_path, 'w') as f:
+            json.dump(self._source, f)
+
+    def _check_source(self) -> None:
+        """
+        Check the partial file was read from the disk being read now.
+
+        Sectors that read in one capture and not the other are ignored;
+        the disks differ if a sector both hold differs, or if only one
+        of them has readable sectors.
+
+        Raises:
+            ImageWriteError: If the partial file is from another disk, or
+                            has no record of its source disk
+        """
+        if self._source is None:
+            return
+
+        try:
+            with open(self._source_path) as f:
+                recorded = json.load(f)
+        except (IOError, ValueError):
+            raise ImageWriteError(
+                "Partial image has no record of its source disk; "
+                "delete it or write without resuming",
+                self._partial_path
+            ) from None
+
+        common = recorded.keys() & self._source.keys()
+        if (any(recorded[sector] != self._source[sector] for sector in common)
+                or (not common and (recorded or self._source))):
+            raise ImageWriteError(
+                "Partial image was read from another disk; "
+                "delete it or write without resuming",
+                self._partial_path
+            )
+        if not common:
+            logger.warning("No readable sectors to identify the disk; resuming %s",
+                           self._partial_path)
+
+    def _append(self, data: bytes) -> int:
+        """
+        Append data at the end of the image and sync it to disk.
+
+        Returns:
+            Offset the data was written at
+        """
+        offset = self._end
+        try:
+            self._file.seek(offset)
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except IOError as e:
+            raise ImageWriteError(f"Failed to write file: {e}", self._partial_path) from e
+        self._end += len(data)
+        return offset
+
+    def _patch(self, offset: int, data: bytes) -> None:
+        """Overwrite bytes already in the image."""
+        try:
+            self._file.seek(offset)
+            self._file.write(data)
+            self._file.flush()
+        except IOError as e:
+            raise ImageWriteError(f"Failed to write file: {e}", self._partial_path) from e
+
+    def _read(self, offset: int, size: int) -> bytes:
+        """Read bytes back from the partial image."""
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    def close(self) -> None:
+        """
+        Finish the image and move it to its final path.
+
+        Raises:
+            ImageWriteError: If the image cannot be finished
+        """
+        if self._file is None:
+            return
+
+        self._finish()
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._close_file()
+            os.replace(self._partial_path, self._filepath)
+            Path(self._source_path).unlink(missing_ok=True)
+        except IOError as e:
+            raise ImageWriteError(f"Failed to finish file: {e}", self._filepath) from e
+
+    def abort(self) -> None:
+        """Close the partial file without finishing it, so it can be resumed."""
+        if self._file is not None:
+            logger.info("Leaving partial image %s (%d tracks)",
+                        self._partial_path, len(self.completed_tracks))
+        self._close_file()
+
+    def _close_file(self) -> None:
+        """Close the underlying file, if open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SCPStreamWriter(FluxStreamWriter):
+    """
+    Write an SCP image track by track.
+
+    The header and a zeroed track offset table are written first. Each
+    track is appended as it arrives and its offset table entry filled in;
+    the checksum is written by close().
+
+    Example:
+        with SCPStreamWriter("disk.scp", cylinders=80, heads=2) as writer:
+            for cyl in range(80):
+                for head in range(2):
+                    writer.write_track(cyl, head, device.read_track(cyl, head))
+    """
+
+    def __init__(self, filepath: str, cylinders: int = 80, heads: int = 2,
+                 revolutions: int = 2, resume: bool = False,
+                 header: Optional[SCPHeader] = None,
+                 source: Optional[Dict[str, int]] = None):
+        """
+        Open an SCP image for streaming.
+
+        Args:
+            filepath: Path of the finished image
+            cylinders: Number of cylinders
+            heads: Number of heads
+            revolutions: Revolutions stored per track
+            resume: Continue an existing partial file if there is one
+            header: Header to write, instead of one built from the geometry
+            source: Fingerprint of the disk being read
+        """
+        if header is None:
+            header = SCPHeader(
+                num_revolutions=revolutions,
+                start_track=0,
+                end_track=(cylinders - 1) * 2 + (heads - 1),
+                heads=0 if heads == 2 else heads,
+            )
+        self._header = header
+        self._num_tracks = header.end_track - header.start_track + 1
+        self._table = bytearray(self._num_tracks * 4)
+        self._data_sum = 0
+        super().__init__(filepath, resume, source)
+
+    @property
+    def completed_tracks(self) -> List[Tuple[int, int]]:
+        """(cylinder, head) of every track written, in table order."""
+        offsets = struct.unpack_from(f'<{self._num_tracks}I', self._table)
+        return [divmod(self._header.start_track + i, 2)
+                for i, offset in enumerate(offsets) if offset]
+
+    def write_track(self, cyl: int, head: int, flux: 'FluxData') -> None:
+        """
+        Append a captured track.
+
+        The capture is resampled to the header resolution and split into
+        revolutions on its index pulses; up to the header's revolution
+        count are stored.
+
+        Args:
+            cyl: Cylinder number
+            head: Head number
+            flux: Captured flux
+        """
+        flux = flux.resample(scp_sample_freq(self._header.resolution))
+        revs = flux.split_revolutions(self._header.num_revolutions)
+        self.write_track_data(
+            cyl * 2 + head,
+            [encode_scp_flux(rev.flux_array) for rev in revs],
+            [int(rev.index_array[-1]) for rev in revs],
+        )
+
+    def write_track_data(self, track_num: int, revs: List[bytes],
+                         index_times: Optional[List[int]] = None) -> None:
+        """
+        Append a track given as encoded revolutions.
+
+        Args:
+            track_num: SCP track number
+            revs: Flux cell bytes per revolution
+            index_times: Duration of each revolution in ticks, computed
+                        from the flux if not given
+        """
+        index = track_num - self._header.start_track
+        if not 0 <= index < self._num_tracks:
+            raise ValueError(
+                f"Track {track_num} outside image range "
+                f"{self._header.start_track}-{self._header.end_track}"
+            )
+
+        revs = revs[:self._header.num_revolutions]
+        if index_times is None:
+            index_times = [int(decode_scp_flux(rev).sum(dtype=np.int64)) for rev in revs]
+
+        # Track header: "TRK" + track number, then one revolution header
+        # per revolution in the file header. Revolutions the capture does
+        # not have are stored empty.
+        block = bytearray(b'TRK')
+        block.append(track_num & 0xFF)
+        data_offset = SCP_TRACK_HEADER_SIZE + self._header.num_revolutions * 12
+        for rev in range(self._header.num_revolutions):
+            if rev < len(revs):
+                length = len(revs[rev]) // 2
+                index_time = index_times[rev]
+            else:
+                length = index_time = 0
+            block += struct.pack('<III', index_time, length, data_offset)
+            data_offset += length * 2
+        for rev_bytes in revs:
+            block += rev_bytes
+
+        offset = self._append(bytes(block))
+        self._data_sum += int(np.frombuffer(block, dtype=np.uint8).sum(dtype=np.int64))
+
+        struct.pack_into('<I', self._table, index * 4, offset)
+        self._patch(SCP_HEADER_SIZE + index * 4, self._table[index * 4:index * 4 + 4])
+
+    def _start(self) -> int:
+        """Write the header and an empty offset table."""
+        self._file.write(self._pack_header(0))
+        self._file.write(self._table)
+        self._file.flush()
+        return SCP_HEADER_SIZE + len(self._table)
+
+    def _resume(self) -> int:
+        """Read the offset table back and find the end of the last track."""
+        header = self._read(0, SCP_HEADER_SIZE)
+        if header[:12] != self._pack_header(0)[:12]:
+            raise ImageWriteError(
+                "Partial image does not match the image being written; "
+                "delete it or write without resuming",
+                self._partial_path
+            )
+        table_end = SCP_HEADER_SIZE + len(self._table)
+        table = self._read(SCP_HEADER_SIZE, len(self._table))
+        if len(table) != len(self._table):
+            raise ImageCorruptError("Partial image truncated", self._partial_path)
+
+        self._table[:] = table
+        end = table_end
+        offsets = struct.unpack_from(f'<{self._num_tracks}I', self._table)
+        for offset in offsets:
+            if offset:
+                headers = self._read(offset + SCP_TRACK_HEADER_SIZE,
+                                     self._header.num_revolutions * 12)
+                rev_ends = [data_offset + length * 2 for _, length, data_offset
+                            in struct.iter_unpack('<III', headers)]
+                end = max(end, offset + max(rev_ends, default=SCP_TRACK_HEADER_SIZE))
+
+        data = np.frombuffer(self._read(table_end, end - table_end), dtype=np.uint8)
+        self._data_sum = int(data.sum(dtype=np.int64))
+        return end
+
+    def _finish(self) -> None:
+        """Write the checksum of everything after the header."""
+        checksum = (self._data_sum + sum(self._table)) & 0xFFFFFFFF
+        self._patch(0, self._pack_header(checksum))
+
+    def _pack_header(self, checksum: int) -> bytes:
+        """Pack the file header."""
+        header = bytearray(SCP_HEADER_SIZE)
+        header[0:3] = SCP_MAGIC
+        header[3] = self._header.version
+        header[4] = self._header.disk_type
+        header[5] = self._header.num_revolutions
+        header[6] = self._header.start_track
+        header[7] = self._header.end_track
+        header[8] = self._header.flags
+        header[9] = self._header.bit_cell_width
+        header[10] = self._header.heads
+        header[11] = self._header.resolution
+        struct.pack_into('<I', header, 12, checksum)
+        return bytes(header)
+
+
+class HFEStreamWriter(FluxStreamWriter):
+    """
+    Write an HFE image cylinder by cylinder.
+
+    HFE interleaves both sides of a cylinder, so the first side read is
+    held until the other arrives (or another cylinder starts), then the
+    cylinder is appended and its lookup table entry filled in.
+
+    Example:
+        with HFEStreamWriter("disk.hfe", cylinders=80, heads=2) as writer:
+            for cyl in range(80):
+                for head in range(2):
+                    writer.write_track(cyl, head, device.read_track(cyl, head))
+    """
+
+    def __init__(self, filepath: str, cylinders: int = 80, heads: int = 2,
+                 bit_rate: int = 250000, resume: bool = False,
+                 header: Optional[HFEHeader] = None,
+                 source: Optional[Dict[str, int]] = None):
+        """
+        Open an HFE image for streaming.
+
+        Args:
+            filepath: Path of the finished image
+            cylinders: Number of cylinders
+            heads: Number of heads
+            bit_rate: Bit rate in bps
+            resume: Continue an existing partial file if there is one
+            header: Header to write, instead of one built from the geometry
+            source: Fingerprint of the disk being read
+        """
+        if header is None:
+            header = HFEHeader(num_tracks=cylinders, num_sides=heads,
+                               bit_rate=bit_rate // 250)
+        self._header = header
+        self._lut = bytearray(HFE_TRACK_LUT_SIZE)
+        self._cylinder: Optional[int] = None
+        self._sides: Dict[int, bytes] = {}
+        super().__init__(filepath, resume, source)
+
+    @property
+    def completed_tracks(self) -> List[Tuple[int, int]]:
+        """(cylinder, head) of every track written, in cylinder order."""
+        return [(cyl, head)
+                for cyl in range(self._header.num_tracks)
+                if struct.unpack_from('<H', self._lut, cyl * 4)[0]
+                for head in range(self._header.num_sides)]
+
+    def write_track(self, cyl: int, head: int, flux: 'FluxData') -> None:
+        """
+        Add a captured track.
+
+        Args:
+            cyl: Cylinder number
+            head: Head number
+            flux: Captured flux
+        """
+        if self._cylinder is not None and cyl != self._cylinder:
+            self._flush_cylinder()
+
+        self._cylinder = cyl
+        self._sides[head] = _flux_to_hfe_bits(flux, self._header.bit_rate * 250)
+        if len(self._sides) >= self._header.num_sides:
+            self._flush_cylinder()
+
+    def write_cylinder_data(self, cyl: int, sides: List[bytes]) -> None:
+        """
+        Append a cylinder given as bit stream bytes per side.
+
+        Args:
+            cyl: Cylinder number
+            sides: Bit stream of each side, head 0 first
+        """
+        if not 0 <= cyl < self._header.num_tracks:
+            raise ValueError(f"Cylinder {cyl} outside image range 0-{self._header.num_tracks - 1}")
+
+        side0_data = sides[0] if sides else b''
+        side1_data = sides[1] if len(sides) >= 2 and self._header.num_sides >= 2 else b''
+
+        # Pad to 256-byte boundary
+        block_count = (max(len(side0_data), len(side1_data)) + 255) // 256
+        if block_count == 0:
+            return
+        padded_len = block_count * 256
+
+        side0_padded = side0_data.ljust(padded_len, b'\x00')
+        side1_padded = side1_data.ljust(padded_len, b'\x00')
+
+        # Interleave into 512-byte blocks
+        track_interleaved = bytearray()
+        for i in range(block_count):
+            track_interleaved.extend(side0_padded[i * 256:(i + 1) * 256])
+            track_interleaved.extend(side1_padded[i * 256:(i + 1) * 256])
+
+        offset = self._append(bytes(track_interleaved))
+
+        struct.pack_into('<HH', self._lut, cyl * 4, offset // 512, len(track_interleaved))
+        self._patch(HFE_HEADER_SIZE + cyl * 4, self._lut[cyl * 4:cyl * 4 + 4])
+
+    def _flush_cylinder(self) -> None:
+        """Append the cylinder being collected."""
+        if self._cylinder is not None and self._sides:
+            self.write_cylinder_data(
+                self._cylinder,
+                [self._sides.get(head, b'') for head in range(self._header.num_sides)]
+            )
+        self._cylinder = None
+        self._sides = {}
+
+    def _start(self) -> int:
+        """Write the header and an empty lookup table."""
+        self._file.write(self._pack_header())
+        self._file.write(self._lut)
+        self._file.flush()
+        return HFE_HEADER_SIZE + HFE_TRACK_LUT_SIZE
+
+    def _resume(self) -> int:
+        """Read the lookup table back and find the end of the last cylinder."""
+        if self._read(0, HFE_HEADER_SIZE) != self._pack_header():
+            raise ImageWriteError(
+                "Partial image does not match the image being written; "
+                "delete it or write without resuming",
+                self._partial_path
+            )
+        lut = self._read(HFE_HEADER_SIZE, HFE_TRACK_LUT_SIZE)
+        if len(lut) != HFE_TRACK_LUT_SIZE:
+            raise ImageCorruptError("Partial image truncated", self._partial_path)
+
+        self._lut[:] = lut
+        end = HFE_HEADER_SIZE + HFE_TRACK_LUT_SIZE
+        for block, length in struct.iter_unpack('<HH', self._lut[:self._header.num_tracks * 4]):
+            if block:
+                end = max(end, block * 512 + (length + 511) // 512 * 512)
+        return end
+
+    def _finish(self) -> None:
+        """Append a cylinder still waiting for its other side."""
+        self._flush_cylinder()
+
+    def _pack_header(self) -> bytes:
+        """Pack the file header."""
+        header = bytearray(HFE_HEADER_SIZE)
+        header[0:8] = HFE_MAGIC
+        header[8] = self._header.revision
+        header[9] = self._header.num_tracks
+        header[10] = self._header.num_sides
+        header[11] = self._header.track_encoding
+        struct.pack_into('<H', header, 12, self._header.bit_rate)
+        struct.pack_into('<H', header, 14, self._header.rpm)
+        header[16] = self._header.interface_mode
+        header[17] = 1  # Reserved
+        struct.pack_into('<H', header, 18, 1)  # Track list at block 1
+        # Write enable flag
+        header[20] = 0xFF
+        # Single/double step mode
+        header[21] = 0xFF
+        return bytes(header)
+
+
 # =============================================================================
 # Conversion Functions
 # =============================================================================
@@ -1286,7 +1956,7 @@ def convert_flux_to_sector(flux_image: FluxImage) -> 'SectorImage':
 
             for sector in sectors:
                 try:
-                    if sector.is_good and 1 <= sector.sector <= sector_image.sectors_per_track:
+                    if sector.is_recovered and 1 <= sector.sector <= sector_image.sectors_per_track:
                         sector_image.set_sector(cyl, head, sector.sector, sector.data)
                 except (ValueError, IndexError):
                     pass
@@ -1384,21 +2054,31 @@ def convert_format(input_path: str, output_path: str,
 def read_disk_to_image(device: 'GreaseweazleDevice',
                        output_path: str,
                        format_type: ImageFormat,
-                       progress_callback: Optional[callable] = None) -> ImageMetadata:
+                       progress_callback: Optional[callable] = None,
+                       resume: bool = False) -> ImageMetadata:
     """
     Read entire disk and save to image file.
 
+    Flux images are written track by track as they are read (see
+    FluxStreamWriter), so memory use does not grow with the disk and an
+    interrupted read leaves a partial file that a call with resume=True
+    continues. C0 H0 is read first to fingerprint the disk, and a partial
+    file read from another disk is not resumed.
+
     Args:
         device: Connected GreaseweazleDevice
         output_path: Path to save image
         format_type: Format to save as
         progress_callback: Optional callback(track, total, status)
+        resume: Skip tracks already in a partial flux image left by an
+               interrupted read of the same disk
 
     Returns:
         ImageMetadata for saved image
 
     Raises:
-        ImageWriteError: If save fails
+        ImageWriteError: If save fails, or the partial image is from
+                        another disk
     """
     from floppy_formatter.hardware import decode_flux_data
     from .sector_image import SectorImage
@@ -1414,27 +2094,41 @@ def read_disk_to_image(device: 'GreaseweazleDevice',
     is_flux_format = format_type in (ImageFormat.SCP, ImageFormat.HFE)
 
     if is_flux_format:
-        # Read flux data
-        captures = {}
+        if progress_callback:
+            progress_callback(0, total_tracks, "Reading C0 H0")
+        first_track = device.read_track(0, 0, revolutions=2.0)
+        source = disk_fingerprint(first_track)
 
-        for cyl in range(cylinders):
-            for head in range(heads):
-                track_num = cyl * heads + head
+        if format_type == ImageFormat.SCP:
+            writer = SCPStreamWriter(output_path, cylinders, heads,
+                                     resume=resume, source=source)
+        else:
+            writer = HFEStreamWriter(output_path, cylinders, heads,
+                                     resume=resume, source=source)
 
-                if progress_callback:
-                    progress_callback(track_num, total_tracks, f"Reading C{cyl} H{head}")
+        # Append each track to the image as it is read
+        with writer:
+            for cyl in range(cylinders):
+                for head in range(heads):
+                    track_num = cyl * heads + head
 
-                flux = device.read_track(cyl, head, revolutions=2.0)
-                captures[(cyl, head)] = flux
+                    if writer.has_track(cyl, head):
+                        if progress_callback:
+                            progress_callback(track_num, total_tracks,
+                                              f"C{cyl} H{head} already read")
+                        continue
 
-        # Save flux image
-        if format_type == ImageFormat.SCP:
-            image = SCPImage.from_flux_captures(captures)
-        else:
-            image = HFEImage.from_flux_captures(captures)
+                    if (cyl, head) == (0, 0):
+                        writer.write_track(cyl, head, first_track)
+                        continue
+
+                    if progress_callback:
+                        progress_callback(track_num, total_tracks, f"Reading C{cyl} H{head}")
+
+                    flux = device.read_track(cyl, head, revolutions=2.0)
+                    writer.write_track(cyl, head, flux)
 
-        image.save(output_path)
-        return image.get_metadata()
+        return read_metadata(output_path)
 
     else:
         # Read and decode to sectors
@@ -1452,7 +2146,7 @@ def read_disk_to_image(device: 'GreaseweazleDevice',
                 sectors = decode_flux_data(flux)
 
                 for sector in sectors:
-                    if sector.is_good and 1 <= sector.sector <= sector_image.sectors_per_track:
+                    if sector.is_recovered and 1 <= sector.sector <= sector_image.sectors_per_track:
                         sector_image.set_sector(cyl, head, sector.sector, sector.data)
 
         sector_image.save(output_path, format_type)
@@ -1638,7 +2332,7 @@ def compare_image_to_disk(image_path: str,
                     for sector in sectors:
                         if sector.sector == sec:
                             found = True
-                            if sector.is_good and sector.data == expected:
+                            if sector.is_recovered and sector.data == expected:
                                 result.identical_sectors += 1
                             else:
                                 result.different_sectors += 1
@@ -1686,10 +2380,18 @@ __all__ = [
     'convert_sector_to_flux',
     'convert_flux_to_sector',
     'convert_format',
+    # Streaming writers
+    'FluxStreamWriter',
+    'SCPStreamWriter',
+    'HFEStreamWriter',
     # Disk operations
     'read_disk_to_image',
     'write_image_to_disk',
     'compare_image_to_disk',
+    # SCP flux encoding
+    'decode_scp_flux',
+    'encode_scp_flux',
+    'scp_sample_freq',
     # Constants
     'SCP_HEADER_SIZE',
     'HFE_HEADER_SIZE',
@@ -12,6 +12,8 @@ Recovery Levels:
 
 Modules:
 - multi_capture: Multi-revolution flux capture and statistical bit voting
+- capture_store: Per-track store of revolutions read since the last write
+- scheduler: Cost-aware ordering of recovery techniques with a time budget
 - pll_tuning: PLL parameter optimization for marginal sectors
 - bit_slip_recovery: Synchronization loss detection and correction
 - surface_treatment: Degaussing and magnetic domain refresh
@@ -26,9 +28,11 @@ from .multi_capture import (
     AlignedCaptures,
     ReconstructedSector,
     ReconstructedFlux,
+    IncrementalCaptureResult,
 
     # Main functions
     capture_multiple_revolutions,
+    capture_until_converged,
     align_flux_captures,
     reconstruct_from_captures,
     multi_capture_recover_track,
@@ -39,6 +43,10 @@ from .multi_capture import (
     estimate_recovery_potential,
 )
 
+from .capture_store import TrackCaptureStore
+
+from .scheduler import TechniqueScheduler, TechniqueRecord
+
 from .pll_tuning import (
     # Dataclasses
     PLLParameters,
@@ -50,16 +58,20 @@ from .pll_tuning import (
 
     # Classes
     PLLDecoder,
+    PLLParameterMemory,
+    PLLSearchPool,
 
     # Main functions
     decode_with_pll,
     try_pll_variations,
+    adaptive_pll_search,
     find_optimal_pll,
     optimize_for_sector,
 
     # Utilities
     create_parameter_grid,
     default_pll_parameters,
+    default_search_workers,
 )
 
 from .bit_slip_recovery import (
@@ -121,7 +133,9 @@ __all__ = [
     'AlignedCaptures',
     'ReconstructedSector',
     'ReconstructedFlux',
+    'IncrementalCaptureResult',
     'capture_multiple_revolutions',
+    'capture_until_converged',
     'align_flux_captures',
     'reconstruct_from_captures',
     'multi_capture_recover_track',
@@ -129,6 +143,13 @@ __all__ = [
     'calculate_capture_quality',
     'estimate_recovery_potential',
 
+    # capture_store
+    'TrackCaptureStore',
+
+    # scheduler
+    'TechniqueScheduler',
+    'TechniqueRecord',
+
     # pll_tuning
     'PLLParameters',
     'DecodedSectorResult',
@@ -137,12 +158,16 @@ __all__ = [
     'OptimalPLLResult',
     'PLLState',
     'PLLDecoder',
+    'PLLParameterMemory',
+    'PLLSearchPool',
     'decode_with_pll',
     'try_pll_variations',
+    'adaptive_pll_search',
     'find_optimal_pll',
     'optimize_for_sector',
     'create_parameter_grid',
     'default_pll_parameters',
+    'default_search_workers',
 
     # bit_slip_recovery
     'SlipType',
@@ -0,0 +1,168 @@
+"""
+Per-track store of flux revolutions read during recovery.
+
+Recovery techniques that only process flux in software (bit voting, PLL
+tuning, bit-slip correction) gain nothing from re-reading a track that
+has not been written since the last read. This store accumulates every
+revolution read from a track so each technique can work on all of them
+and only read what it is missing. Writing a track invalidates its
+revolutions.
+
+Key Classes:
+    TrackCaptureStore: Revolutions read per track since its last write
+"""
+
+import logging
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from floppy_formatter.hardware.flux_io import FluxData
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Revolutions kept per track; the oldest are dropped beyond this
+STORE_MAX_REVOLUTIONS = 40
+
+# Tracks kept at once. Recovery works track by track, so only the most
+# recently read tracks are worth keeping (~400KB per HD revolution).
+STORE_MAX_TRACKS = 4
+
+
+# =============================================================================
+# Capture Store
+# =============================================================================
+
+class TrackCaptureStore:
+    """
+    Revolutions read from each track since it was last written.
+
+    Reads are split into single revolutions on their index pulses.
+    Tracks are kept in least-recently-used order up to max_tracks.
+
+    Example:
+        >>> store = TrackCaptureStore()
+        >>> store.add(read_track_flux(device, 40, 0, revolutions=3.2))
+        >>> flux = store.combined(40, 0)   # all 3 revolutions
+        >>> write_track_flux(device, 40, 0, new_flux)
+        >>> store.invalidate(40, 0)
+    """
+
+    def __init__(self, max_revolutions: int = STORE_MAX_REVOLUTIONS,
+                 max_tracks: int = STORE_MAX_TRACKS):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_revolutions: Revolutions kept per track
+            max_tracks: Tracks kept at once
+        """
+        self._max_revolutions = max_revolutions
+        self._max_tracks = max_tracks
+        self._tracks: 'OrderedDict[Tuple[int, int], List[FluxData]]' = OrderedDict()
+
+    def add(self, flux: FluxData) -> List[FluxData]:
+        """
+        Store the revolutions of a read.
+
+        Args:
+            flux: Flux read from the track given by its cylinder and head
+
+        Returns:
+            The single revolutions extracted from the read
+        """
+        revolutions = flux.split_revolutions()
+        if not revolutions:
+            return []
+
+        key = (flux.cylinder, flux.head)
+        stored = self._tracks.pop(key, [])
+        stored.extend(revolutions)
+        self._tracks[key] = stored[-self._max_revolutions:]
+
+        while len(self._tracks) > self._max_tracks:
+            self._tracks.popitem(last=False)
+
+        return revolutions
+
+    def revolutions(self, cylinder: int, head: int) -> List[FluxData]:
+        """
+        Get the stored revolutions of a track, oldest first.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+
+        Returns:
+            List of single-revolution FluxData
+        """
+        return list(self._tracks.get((cylinder, head), []))
+
+    def count(self, cylinder: int, head: int) -> int:
+        """Get the number of revolutions stored for a track."""
+        return len(self._tracks.get((cylinder, head), []))
+
+    def combined(self, cylinder: int, head: int,
+                 count: Optional[int] = None) -> Optional[FluxData]:
+        """
+        Join stored revolutions into one multi-revolution capture.
+
+        The capture is index cued and, like a Greaseweazle read, lists the
+        ticks of each revolution as its index intervals.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            count: Join only the most recent count revolutions
+
+        Returns:
+            FluxData with one index interval per revolution, or None if
+            nothing is stored for the track
+        """
+        revolutions = self._tracks.get((cylinder, head))
+        if not revolutions:
+            return None
+        if count is not None:
+            revolutions = revolutions[-count:]
+
+        return FluxData(
+            flux_times=np.concatenate([rev.flux_array for rev in revolutions]),
+            sample_freq=revolutions[0].sample_freq,
+            index_positions=[rev.total_samples for rev in revolutions],
+            cylinder=cylinder,
+            head=head,
+            revolutions=float(len(revolutions)),
+            index_cued=True,
+        )
+
+    def invalidate(self, cylinder: int, head: int) -> None:
+        """
+        Drop a track's revolutions after it has been written.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+        """
+        if self._tracks.pop((cylinder, head), None) is not None:
+            logger.debug("Dropped stored flux for C%d H%d", cylinder, head)
+
+    def clear(self) -> None:
+        """Drop all stored revolutions."""
+        self._tracks.clear()
+
+    def __len__(self) -> int:
+        """Number of tracks with stored revolutions."""
+        return len(self._tracks)
+
+
+__all__ = [
+    'TrackCaptureStore',
+    'STORE_MAX_REVOLUTIONS',
+    'STORE_MAX_TRACKS',
+]
@@ -16,6 +16,7 @@ at the flux level rather than the decoded sector level.
 
 Key Functions:
     capture_multiple_revolutions: Capture N revolutions of flux data
+    capture_until_converged: Capture revolution by revolution until the track decodes
     align_flux_captures: Time-align captures using index pulses
     reconstruct_from_captures: Statistical bit voting reconstruction
 """
@@ -23,11 +24,14 @@ Key Functions:
 import statistics
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, TYPE_CHECKING, Any
+from typing import List, Optional, Dict, Tuple, TYPE_CHECKING, Any, Callable, Iterable
+
+import numpy as np
 
 if TYPE_CHECKING:
     from floppy_formatter.hardware import FluxData
 
+from floppy_formatter.analysis.alignment import find_alignment_offset, index_alignment_offset
 from floppy_formatter.analysis.flux_analyzer import FluxCapture
 from floppy_formatter.analysis.signal_quality import calculate_snr
 
@@ -47,6 +51,12 @@ MAX_REVOLUTIONS_PER_CAPTURE = 20
 # Minimum captures for reliable voting
 MIN_CAPTURES_FOR_VOTING = 3
 
+# Incremental capture: sectors expected on a track (3.5" HD) and the
+# revolutions without a new sector or confidence gain before giving up
+DEFAULT_EXPECTED_SECTORS = tuple(range(1, 19))
+CONVERGENCE_PLATEAU_REVOLUTIONS = 3
+CONVERGENCE_MIN_CONFIDENCE_GAIN = 0.005
+
 # Confidence thresholds
 HIGH_CONFIDENCE_THRESHOLD = 0.9  # 90% agreement
 MEDIUM_CONFIDENCE_THRESHOLD = 0.7  # 70% agreement
@@ -55,6 +65,10 @@ LOW_CONFIDENCE_THRESHOLD = 0.5  # 50% agreement (majority)
 # Timing alignment tolerance (in sample counts, ~14ns per sample at 72MHz)
 ALIGNMENT_TOLERANCE_SAMPLES = 10
 
+# Vote weight of a capture whose quality weight is non-positive or not
+# finite; quality weights are normalized so the best capture has 1.0
+MIN_VOTE_WEIGHT = 0.01
+
 # Standard MFM bit cell timing (2us for HD)
 HD_BIT_CELL_US = 2.0
 HD_BIT_CELL_SAMPLES = 144  # 2us * 72MHz
@@ -145,7 +159,7 @@ class AlignedCaptures:
     time base using index pulses as reference.
 
     Attributes:
-        aligned_timings: List of aligned timing arrays (one per capture)
+        aligned_timings: Aligned timing array for each capture
         reference_index: Index of the reference capture used for alignment
         alignment_offsets: Sample offset applied to each capture
         common_length: Length of aligned data (samples)
@@ -155,7 +169,7 @@ class AlignedCaptures:
         capture_count: Number of aligned captures
         quality_weights: Quality weight for each capture (for weighted voting)
     """
-    aligned_timings: List[List[float]]  # Timing in microseconds
+    aligned_timings: List[np.ndarray]  # Timing in microseconds
     reference_index: int
     alignment_offsets: List[int]
     common_length: int
@@ -178,9 +192,23 @@ class AlignedCaptures:
         timings = []
         for capture_timings in self.aligned_timings:
             if position < len(capture_timings):
-                timings.append(capture_timings[position])
+                timings.append(float(capture_timings[position]))
         return timings
 
+    def timing_matrix(self) -> np.ndarray:
+        """
+        Get aligned timings as a (captures x positions) array.
+
+        Returns:
+            Float array with one row per capture and common_length columns.
+            Positions a capture has no data for are NaN.
+        """
+        matrix = np.full((len(self.aligned_timings), self.common_length), np.nan)
+        for row, capture_timings in zip(matrix, self.aligned_timings):
+            length = min(len(capture_timings), self.common_length)
+            row[:length] = capture_timings[:length]
+        return matrix
+
 
 @dataclass
 class BitVoteResult:
@@ -198,9 +226,15 @@ class ReconstructedSector:
     """A sector reconstructed from multi-capture voting."""
     sector_number: int
     data: bytes
-    crc_valid: bool
+    crc_valid: bool  # CRC matched the data as read; False for corrected sectors
     confidence: float  # Average confidence across all bits
     low_confidence_positions: List[int]  # Byte positions with low confidence
+    corrected: bool = False  # CRC only valid after bit correction or copy fusion
+
+    @property
+    def is_recovered(self) -> bool:
+        """Check if the sector data is usable: CRC-valid or corrected."""
+        return self.crc_valid or self.corrected
 
 
 @dataclass
@@ -270,6 +304,37 @@ class ReconstructedFlux:
         )
 
 
+@dataclass
+class IncrementalCaptureResult:
+    """
+    Result of capturing revolutions until the track decodes.
+
+    Attributes:
+        capture_result: Revolutions captured, as from capture_multiple_revolutions()
+        reconstructed: Reconstruction from the last vote, or None if fewer
+                      than MIN_CAPTURES_FOR_VOTING revolutions were needed
+        sectors: Best copy of each sector seen, CRC-valid copies preferred,
+                then corrected ones
+        expected_sectors: Sector numbers that had to decode
+        revolutions_used: Revolutions read from the drive (not counting
+                         stored revolutions passed in)
+        converged: True if every expected sector has a recovered copy
+        plateaued: True if capture stopped because voting stopped improving
+    """
+    capture_result: MultiCaptureResult
+    reconstructed: Optional[ReconstructedFlux]
+    sectors: List[ReconstructedSector]
+    expected_sectors: List[int]
+    revolutions_used: int
+    converged: bool
+    plateaued: bool = False
+
+    def get_missing_sectors(self) -> List[int]:
+        """Get expected sectors without a recovered copy."""
+        good = {s.sector_number for s in self.sectors if s.is_recovered}
+        return [n for n in self.expected_sectors if n not in good]
+
+
 # =============================================================================
 # Multi-Capture Functions
 # =============================================================================
@@ -309,7 +374,6 @@ def capture_multiple_revolutions(
 
     captures = []
     metadata = []
-    rpm_measurements = []
 
     # Capture in batches if needed
     remaining = count
@@ -334,29 +398,9 @@ def capture_multiple_revolutions(
             # Extract individual revolutions
             for rev in range(batch_size):
                 try:
-                    rev_flux = flux_data.get_revolution_data(rev)
-                    capture = FluxCapture.from_flux_data(rev_flux)
-
-                    # Calculate quality metrics
-                    snr_result = calculate_snr(capture)
-                    quality_score = _calculate_capture_quality(capture)
-
-                    # Get RPM for this revolution
-                    rpm = capture.calculate_rpm()
-                    if rpm:
-                        rpm_measurements.append(rpm)
-
-                    # Create metadata
-                    meta = CaptureMetadata(
-                        revolution_number=len(captures),
-                        index_position=capture.index_positions[0] if capture.index_positions else 0,
-                        duration_samples=sum(capture.raw_timings),
-                        duration_us=capture.duration_ms * 1000,
-                        snr_db=snr_result.snr_db,
-                        quality_score=quality_score,
-                        transition_count=capture.transition_count,
+                    capture, meta = _revolution_capture(
+                        flux_data.get_revolution_data(rev), len(captures)
                     )
-
                     captures.append(capture)
                     metadata.append(meta)
 
@@ -370,32 +414,147 @@ def capture_multiple_revolutions(
         remaining -= batch_size
         capture_batch += 1
 
-    # Calculate RPM statistics
-    if rpm_measurements:
-        average_rpm = statistics.mean(rpm_measurements)
-        rpm_stability = statistics.stdev(rpm_measurements) if len(rpm_measurements) > 1 else 0.0
-    else:
-        average_rpm = 300.0  # Default
-        rpm_stability = 0.0
+    result = _capture_result(captures, metadata, cyl, head)
 
     logger.info("Captured %d revolutions, avg RPM: %.1f (±%.2f)",
-                len(captures), average_rpm, rpm_stability)
+                len(captures), result.average_rpm, result.rpm_stability)
 
-    if captures:
-        cap0 = captures[0]
-        rate = getattr(cap0, 'sample_rate', None) or getattr(cap0, 'sample_freq', 72_000_000)
-    else:
-        rate = 72_000_000
+    return result
 
-    return MultiCaptureResult(
-        captures=captures,
-        metadata=metadata,
-        cylinder=cyl,
-        head=head,
-        total_revolutions=len(captures),
-        sample_rate=rate,
-        average_rpm=average_rpm,
-        rpm_stability=rpm_stability,
+
+def capture_until_converged(
+    device: Any,  # GreaseweazleDevice
+    cyl: int,
+    head: int,
+    max_revolutions: int = DEFAULT_REVOLUTION_COUNT,
+    expected_sectors: Optional[Iterable[int]] = None,
+    plateau_revolutions: int = CONVERGENCE_PLATEAU_REVOLUTIONS,
+    decoder: Optional[Callable[['FluxData'], List[Any]]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    stored_revolutions: Optional[List['FluxData']] = None,
+    reader: Optional[Callable[[], 'FluxData']] = None
+) -> IncrementalCaptureResult:
+    """
+    Capture revolutions one at a time until every expected sector decodes.
+
+    Each new revolution is decoded on its own, and once there are enough
+    revolutions for voting all captures so far are aligned and
+    reconstructed. Capture stops as soon as every expected sector has a
+    CRC-valid copy, when voting has not gained a sector or confidence
+    for plateau_revolutions revolutions, or at max_revolutions.
+
+    Revolutions already read from the track can be passed in as
+    stored_revolutions; they are used before anything is read.
+
+    Args:
+        device: Connected GreaseweazleDevice instance
+        cyl: Cylinder number
+        head: Head number
+        max_revolutions: Most revolutions to use, stored ones included
+        expected_sectors: Sector numbers that must decode (default 1-18)
+        plateau_revolutions: Revolutions without improvement before stopping
+        decoder: Decodes a single revolution's FluxData to sectors
+                (default decode_flux_data)
+        is_cancelled: Optional callable returning True to stop early
+        stored_revolutions: Single revolutions already read from the track
+        reader: Reads the next revolution from the drive
+               (default read_track_flux for 1.2 revolutions)
+
+    Returns:
+        IncrementalCaptureResult with the best sectors and revolutions used
+
+    Example:
+        >>> result = capture_until_converged(device, 40, 0, max_revolutions=20)
+        >>> print(f"{result.revolutions_used} revolutions, "
+        ...       f"missing: {result.get_missing_sectors()}")
+    """
+    from floppy_formatter.hardware import read_track_flux, decode_flux_data
+
+    decoder = decoder or decode_flux_data
+    if reader is None:
+        def reader():
+            return read_track_flux(device, cyl, head, revolutions=1.2)
+    expected = sorted(set(expected_sectors or DEFAULT_EXPECTED_SECTORS))
+
+    logger.info("Capturing up to %d revolutions from C%d H%d until %d sectors decode",
+                max_revolutions, cyl, head, len(expected))
+
+    stored = list(stored_revolutions or [])[:max_revolutions]
+    captures = []
+    metadata = []
+    best: Dict[int, ReconstructedSector] = {}
+    reconstructed = None
+    considered = 0
+    revolutions_used = 0
+    converged = False
+    plateaued = False
+
+    best_good = 0
+    best_confidence = 0.0
+    stale = 0
+
+    while considered < max_revolutions:
+        if is_cancelled is not None and is_cancelled():
+            break
+
+        considered += 1
+
+        try:
+            if stored:
+                rev_flux = stored.pop(0)
+            else:
+                revolutions_used += 1
+                rev_flux = reader().get_revolution_data(0)
+            capture, meta = _revolution_capture(rev_flux, len(captures))
+        except Exception as e:
+            logger.warning("Revolution %d capture failed: %s", considered, e)
+            continue
+
+        captures.append(capture)
+        metadata.append(meta)
+
+        # A clean read of this revolution alone may be enough
+        try:
+            _keep_best_sectors(best, _single_read_sectors(decoder(rev_flux)))
+        except Exception as e:
+            logger.debug("Revolution %d decode failed: %s", considered, e)
+
+        # Vote once the stored revolutions have all been taken in
+        if len(captures) >= MIN_CAPTURES_FOR_VOTING and not stored:
+            reconstructed = reconstruct_from_captures(align_flux_captures(captures))
+            _keep_best_sectors(best, reconstructed.sectors)
+
+        good = sum(1 for n in expected if n in best and best[n].is_recovered)
+        if good == len(expected):
+            converged = True
+            break
+
+        if reconstructed is not None:
+            confidence = reconstructed.get_overall_confidence()
+            if good > best_good or confidence > best_confidence + CONVERGENCE_MIN_CONFIDENCE_GAIN:
+                stale = 0
+            else:
+                stale += 1
+            best_good = max(best_good, good)
+            best_confidence = max(best_confidence, confidence)
+
+            if stale >= plateau_revolutions:
+                plateaued = True
+                break
+
+    logger.info("C%d H%d: %d/%d sectors after %d revolutions (%s)",
+                cyl, head, sum(1 for n in expected if n in best and best[n].is_recovered),
+                len(expected), revolutions_used,
+                "converged" if converged else "plateaued" if plateaued else "stopped")
+
+    return IncrementalCaptureResult(
+        capture_result=_capture_result(captures, metadata, cyl, head),
+        reconstructed=reconstructed,
+        sectors=[best[n] for n in sorted(best)],
+        expected_sectors=expected,
+        revolutions_used=revolutions_used,
+        converged=converged,
+        plateaued=plateaued,
     )
 
 
@@ -443,7 +602,7 @@ def align_flux_captures(captures: List[FluxCapture]) -> AlignedCaptures:
     reference = captures[reference_index]
 
     # Get reference timing in microseconds
-    ref_timings = reference.get_times_microseconds()
+    ref_timings = _timings_us(reference)
 
     # Calculate quality weights for weighted voting
     max_quality = max(quality_scores)
@@ -454,25 +613,29 @@ def align_flux_captures(captures: List[FluxCapture]) -> AlignedCaptures:
     alignment_offsets = []
 
     for i, capture in enumerate(captures):
-        timings = capture.get_times_microseconds()
+        timings = _timings_us(capture)
 
         if i == reference_index:
             # Reference capture - no alignment needed
             aligned_timings.append(timings)
             alignment_offsets.append(0)
         else:
-            # Find alignment offset using cross-correlation
-            offset = _find_alignment_offset(ref_timings, timings)
+            # Index pulses bound the search, then cross-correlation finds
+            # the exact offset
+            index_offset = index_alignment_offset(
+                reference.raw_timings, reference.index_positions,
+                capture.raw_timings, capture.index_positions
+            )
+            offset = _find_alignment_offset(ref_timings, timings, index_offset=index_offset)
             alignment_offsets.append(offset)
 
-            # Apply offset
+            # Apply offset: reference[offset + k] lines up with timings[k]
             if offset > 0:
-                # Capture is ahead of reference - trim start
-                aligned = timings[offset:]
+                # Capture starts later in the track - pad start with zeros
+                aligned = np.concatenate((np.zeros(offset), timings))
             elif offset < 0:
-                # Capture is behind reference - pad start with zeros
-                padding = [0.0] * abs(offset)
-                aligned = padding + timings
+                # Capture starts earlier in the track - trim start
+                aligned = timings[-offset:]
             else:
                 aligned = timings
 
@@ -508,7 +671,8 @@ def reconstruct_from_captures(captures: AlignedCaptures) -> ReconstructedFlux:
 
     For each bit position, examines all captures and uses majority
     voting to determine the most likely correct value. Weights votes
-    by capture quality if available.
+    by capture quality if available. Voting runs column-wise over the
+    (captures x positions) timing matrix.
 
     Args:
         captures: AlignedCaptures from align_flux_captures()
@@ -532,84 +696,21 @@ def reconstruct_from_captures(captures: AlignedCaptures) -> ReconstructedFlux:
     logger.debug("Reconstructing from %d captures, %d positions",
                  captures.capture_count, captures.common_length)
 
-    reconstructed_timings = []
-    confidence_map = []
-    vote_counts = []
-
-    high_conf = 0
-    medium_conf = 0
-    low_conf = 0
+    # One row per capture, one column per position
+    matrix = captures.timing_matrix()
+    weights = _voting_weights(captures.quality_weights, len(matrix))
 
-    # Process each position
-    for pos in range(captures.common_length):
-        # Get timing values from all captures at this position
-        timings_at_pos = captures.get_timing_at_position(pos)
+    timings, confidence, votes = _vote_on_positions(matrix, weights)
 
-        if not timings_at_pos:
-            reconstructed_timings.append(0.0)
-            confidence_map.append(0.0)
-            vote_counts.append(0)
-            low_conf += 1
-            continue
-
-        # Quantize timings to MFM pulse widths for voting
-        # MFM has 3 valid pulse widths: 2T (~4us), 3T (~6us), 4T (~8us)
-        quantized_votes = {}
+    high_conf = int(np.count_nonzero(confidence >= HIGH_CONFIDENCE_THRESHOLD))
+    medium_conf = int(np.count_nonzero(
+        (confidence >= MEDIUM_CONFIDENCE_THRESHOLD) & (confidence < HIGH_CONFIDENCE_THRESHOLD)
+    ))
+    low_conf = len(confidence) - high_conf - medium_conf
 
-        for timing in timings_at_pos:
-            # Quantize to nearest MFM pulse type
-            if timing < 5.0:
-                pulse_type = '2T'
-            elif timing < 7.0:
-                pulse_type = '3T'
-            else:
-                pulse_type = '4T'
-
-            quantized_votes[pulse_type] = quantized_votes.get(pulse_type, 0) + 1
-
-        # Find winning pulse type
-        if quantized_votes:
-            winning_type = max(
-                quantized_votes.keys(), key=lambda k: quantized_votes[k]
-            )
-            winning_votes = quantized_votes[winning_type]
-            total_votes = len(timings_at_pos)
-            confidence = winning_votes / total_votes
-
-            # Calculate reconstructed timing as weighted mean of matching captures
-            matching_timings = []
-            for i, timing in enumerate(timings_at_pos):
-                # Check if this timing matches winning type
-                if timing < 5.0 and winning_type == '2T':
-                    matching_timings.append(timing)
-                elif 5.0 <= timing < 7.0 and winning_type == '3T':
-                    matching_timings.append(timing)
-                elif timing >= 7.0 and winning_type == '4T':
-                    matching_timings.append(timing)
-
-            if matching_timings:
-                # Use median for robustness
-                reconstructed_timing = statistics.median(matching_timings)
-            else:
-                reconstructed_timing = statistics.median(timings_at_pos)
-
-            reconstructed_timings.append(reconstructed_timing)
-            confidence_map.append(confidence)
-            vote_counts.append(winning_votes)
-
-            # Categorize confidence
-            if confidence >= HIGH_CONFIDENCE_THRESHOLD:
-                high_conf += 1
-            elif confidence >= MEDIUM_CONFIDENCE_THRESHOLD:
-                medium_conf += 1
-            else:
-                low_conf += 1
-
-        else:
-            reconstructed_timings.append(0.0)
-            confidence_map.append(0.0)
-            vote_counts.append(0)
-            low_conf += 1
+    reconstructed_timings = timings.tolist()
+    confidence_map = confidence.tolist()
+    vote_counts = votes.tolist()
 
     # Decode sectors from reconstructed flux
     sectors = _decode_reconstructed_sectors(
@@ -678,94 +779,220 @@ def _calculate_capture_quality(capture: FluxCapture) -> float:
     return statistics.mean(scores) if scores else 0.0
 
 
+def _revolution_capture(rev_flux: 'FluxData',
+                        revolution_number: int) -> Tuple[FluxCapture, CaptureMetadata]:
+    """
+    Build a capture and its quality metadata from one revolution of flux.
+
+    Returns:
+        Tuple of (FluxCapture, CaptureMetadata)
+    """
+    capture = FluxCapture.from_flux_data(rev_flux)
+
+    # Calculate quality metrics
+    snr_result = calculate_snr(capture)
+    quality_score = _calculate_capture_quality(capture)
+
+    meta = CaptureMetadata(
+        revolution_number=revolution_number,
+        index_position=capture.index_positions[0] if capture.index_positions else 0,
+        duration_samples=sum(capture.raw_timings),
+        duration_us=capture.duration_ms * 1000,
+        snr_db=snr_result.snr_db,
+        quality_score=quality_score,
+        transition_count=capture.transition_count,
+    )
+    return capture, meta
+
+
+def _capture_result(captures: List[FluxCapture], metadata: List[CaptureMetadata],
+                    cyl: int, head: int) -> MultiCaptureResult:
+    """Collect captures into a MultiCaptureResult with RPM statistics."""
+    rpm_measurements = [rpm for rpm in (c.calculate_rpm() for c in captures) if rpm]
+
+    if rpm_measurements:
+        average_rpm = statistics.mean(rpm_measurements)
+        rpm_stability = statistics.stdev(rpm_measurements) if len(rpm_measurements) > 1 else 0.0
+    else:
+        average_rpm = 300.0  # Default
+        rpm_stability = 0.0
+
+    if captures:
+        cap0 = captures[0]
+        rate = getattr(cap0, 'sample_rate', None) or getattr(cap0, 'sample_freq', 72_000_000)
+    else:
+        rate = 72_000_000
+
+    return MultiCaptureResult(
+        captures=captures,
+        metadata=metadata,
+        cylinder=cyl,
+        head=head,
+        total_revolutions=len(captures),
+        sample_rate=rate,
+        average_rpm=average_rpm,
+        rpm_stability=rpm_stability,
+    )
+
+
+def _empty_reconstruction(cyl: int, head: int, source_captures: int = 0) -> ReconstructedFlux:
+    """Reconstruction with no positions, used when there was nothing to vote on."""
+    return ReconstructedFlux(
+        flux_timings=[],
+        confidence_map=[],
+        vote_counts=[],
+        total_positions=0,
+        high_confidence_count=0,
+        medium_confidence_count=0,
+        low_confidence_count=0,
+        sectors=[],
+        cylinder=cyl,
+        head=head,
+        source_captures=source_captures,
+    )
+
+
+def _single_read_sectors(decoded: List[Any]) -> List[ReconstructedSector]:
+    """Convert sectors decoded from a single revolution."""
+    return [
+        ReconstructedSector(
+            sector_number=s.sector,
+            data=s.data if s.data else bytes(512),
+            crc_valid=bool(s.is_good and s.data),
+            confidence=1.0 if s.is_recovered and s.data else 0.0,
+            low_confidence_positions=[],
+            corrected=bool(s.is_corrected and s.data),
+        )
+        for s in decoded
+    ]
+
+
+def _keep_best_sectors(best: Dict[int, ReconstructedSector],
+                       sectors: List[ReconstructedSector]) -> None:
+    """Keep the best copy of each sector: recovered, then CRC-valid as read first."""
+    for sector in sectors:
+        current = best.get(sector.sector_number)
+        if current is None or (sector.is_recovered, sector.crc_valid, sector.confidence) > (
+            current.is_recovered, current.crc_valid, current.confidence
+        ):
+            best[sector.sector_number] = sector
+
+
 def _find_alignment_offset(
     reference: List[float],
     target: List[float],
-    max_offset: int = 1000
+    max_offset: int = 1000,
+    index_offset: Optional[int] = None
 ) -> int:
     """
     Find the best alignment offset between two timing arrays.
 
     Uses cross-correlation to find the offset that maximizes
-    timing similarity between reference and target.
+    timing similarity between reference and target: a coarse pass
+    every 10 transitions, then every offset around the best one.
+
+    Args:
+        reference: Reference timings
+        target: Timings to align
+        max_offset: Largest offset to consider in either direction
+        index_offset: Offset implied by index pulses; bounds the search
 
     Returns:
-        Offset in samples (positive = target is ahead, negative = behind)
+        Offset in transitions: reference[offset + k] lines up with
+        target[k], so a positive offset means the target starts later
     """
-    if not reference or not target:
+    if len(reference) == 0 or len(target) == 0:
         return 0
 
     min_len = min(len(reference), len(target))
-    if min_len < 100:
+    if min_len - max_offset < 100:
         return 0
 
-    best_offset = 0
-    best_correlation = 0.0
+    offset, _ = find_alignment_offset(reference, target, max_offset,
+                                      coarse_step=10, index_offset=index_offset)
+    return offset
 
-    # Try different offsets
-    for offset in range(-max_offset, max_offset + 1, 10):  # Step by 10 for speed
-        if offset >= 0:
-            ref_slice = reference[offset:offset + min_len - max_offset]
-            tgt_slice = target[:min_len - max_offset]
-        else:
-            ref_slice = reference[:min_len - max_offset]
-            tgt_slice = target[-offset:-offset + min_len - max_offset]
 
-        if len(ref_slice) < 100 or len(tgt_slice) < 100:
-            continue
+def _timings_us(capture: FluxCapture) -> np.ndarray:
+    """Get capture timings in microseconds as an array."""
+    if not capture.sample_rate:
+        return np.zeros(0)
+    factor = 1_000_000.0 / capture.sample_rate
+    return np.asarray(capture.raw_timings, dtype=np.float64) * factor
 
-        # Calculate correlation
-        try:
-            correlation = _calculate_correlation(ref_slice, tgt_slice)
-            if correlation > best_correlation:
-                best_correlation = correlation
-                best_offset = offset
-        except (ValueError, ZeroDivisionError):
-            continue
 
-    # Fine-tune around best offset
-    for offset in range(best_offset - 10, best_offset + 11):
-        if offset >= 0:
-            ref_slice = reference[offset:offset + min_len - max_offset]
-            tgt_slice = target[:min_len - max_offset]
-        else:
-            ref_slice = reference[:min_len - max_offset]
-            tgt_slice = target[-offset:-offset + min_len - max_offset]
+def _voting_weights(quality_weights: List[float], capture_count: int) -> np.ndarray:
+    """
+    Get per-capture vote weights as a column vector.
 
-        if len(ref_slice) < 100 or len(tgt_slice) < 100:
-            continue
+    Non-positive or non-finite quality weights count as MIN_VOTE_WEIGHT,
+    so one bad capture does not discard the other weights. Falls back to
+    equal weights unless there is one quality weight per capture.
+    """
+    weights = np.asarray(quality_weights, dtype=np.float64)
+    if len(weights) != capture_count:
+        return np.ones((capture_count, 1))
+    valid = np.isfinite(weights) & (weights > 0)
+    weights = np.where(valid, np.maximum(weights, MIN_VOTE_WEIGHT), MIN_VOTE_WEIGHT)
+    return weights[:, np.newaxis]
+
+
+def _vote_on_positions(
+    matrix: np.ndarray,
+    weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vote on the MFM pulse width at every position of a timing matrix.
 
-        try:
-            correlation = _calculate_correlation(ref_slice, tgt_slice)
-            if correlation > best_correlation:
-                best_correlation = correlation
-                best_offset = offset
-        except (ValueError, ZeroDivisionError):
-            continue
+    Each timing is quantized to 2T (<5us), 3T (<7us) or 4T. The pulse type
+    with the greatest total weight wins; ties go to the type seen first in
+    capture order. The reconstructed timing is the median of the captures
+    that voted for the winner.
 
-    return best_offset
+    Args:
+        matrix: (captures x positions) timings in microseconds, NaN if missing
+        weights: (captures x 1) vote weights
 
+    Returns:
+        Tuple of (timings, confidence, vote_counts) arrays, one value per
+        position. Positions without data have zero for all three.
+    """
+    rows, columns = matrix.shape
+    present = ~np.isnan(matrix)
+    pulse_type = np.where(matrix < 5.0, 0, np.where(matrix < 7.0, 1, 2))
 
-def _calculate_correlation(x: List[float], y: List[float]) -> float:
-    """Calculate Pearson correlation coefficient between two sequences."""
-    n = min(len(x), len(y))
-    if n < 10:
-        return 0.0
+    best_type = np.full(columns, -1)
+    best_weight = np.zeros(columns)
+    best_first = np.full(columns, rows)
 
-    x = x[:n]
-    y = y[:n]
+    for candidate in range(3):
+        member = present & (pulse_type == candidate)
+        weight = (member * weights).sum(axis=0)
+        first = np.where(member.any(axis=0), member.argmax(axis=0), rows)
 
-    mean_x = statistics.mean(x)
-    mean_y = statistics.mean(y)
+        better = (first < rows) & (
+            (weight > best_weight) | ((weight == best_weight) & (first < best_first))
+        )
+        best_type[better] = candidate
+        best_weight[better] = weight[better]
+        best_first[better] = first[better]
 
-    std_x = statistics.stdev(x)
-    std_y = statistics.stdev(y)
+    # Median of the winning captures: sort them to the top of each column
+    winners = present & (pulse_type == best_type)
+    vote_counts = winners.sum(axis=0)
+    ordered = np.sort(np.where(winners, matrix, np.inf), axis=0)
 
-    if std_x == 0 or std_y == 0:
-        return 0.0
+    has_votes = vote_counts > 0
+    lower = np.maximum(vote_counts - 1, 0) // 2
+    upper = np.minimum(vote_counts // 2, rows - 1)
+    cols = np.arange(columns)
+    timings = np.where(has_votes, (ordered[lower, cols] + ordered[upper, cols]) / 2, 0.0)
 
-    covariance = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / n
-    return covariance / (std_x * std_y)
+    total_weight = (present * weights).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        confidence = np.where(has_votes, best_weight / total_weight, 0.0)
+
+    return timings, confidence, vote_counts
 
 
 def _decode_reconstructed_sectors(
@@ -786,7 +1013,9 @@ def _decode_reconstructed_sectors(
 
         # Convert microseconds back to sample counts
         factor = sample_rate / 1_000_000
-        flux_times = [max(1, int(t * factor)) for t in timings_us]
+        flux_times = np.maximum(
+            (np.asarray(timings_us, dtype=np.float64) * factor).astype(np.int64), 1
+        )
 
         flux_data = FluxData(
             flux_times=flux_times,
@@ -799,11 +1028,12 @@ def _decode_reconstructed_sectors(
 
         decoded = decode_flux_data(flux_data)
 
+        # Calculate confidence for each sector
+        # This is simplified - ideally we'd map flux positions to sector positions
+        sector_confidence = statistics.mean(confidence_map) if confidence_map else 0.0
+
         sectors = []
         for sector_data in decoded:
-            # Calculate confidence for this sector
-            # This is simplified - ideally we'd map flux positions to sector positions
-            sector_confidence = statistics.mean(confidence_map) if confidence_map else 0.0
 
             # Find low confidence positions (byte level approximation)
             bits_per_sector = 512 * 8 * 2  # Including MFM encoding overhead
@@ -819,9 +1049,10 @@ def _decode_reconstructed_sectors(
             sectors.append(ReconstructedSector(
                 sector_number=sector_data.sector,
                 data=sector_data.data if sector_data.data else bytes(512),
-                crc_valid=sector_data.crc_valid,
+                crc_valid=sector_data.is_good,
                 confidence=sector_confidence,
                 low_confidence_positions=low_conf_positions[:20],  # Limit list size
+                corrected=sector_data.is_corrected,
             ))
 
         return sectors
@@ -839,7 +1070,9 @@ def multi_capture_recover_track(
     device: Any,  # GreaseweazleDevice
     cyl: int,
     head: int,
-    revolution_count: int = DEFAULT_REVOLUTION_COUNT
+    revolution_count: int = DEFAULT_REVOLUTION_COUNT,
+    until_converged: bool = False,
+    expected_sectors: Optional[Iterable[int]] = None
 ) -> Tuple[ReconstructedFlux, List[ReconstructedSector]]:
     """
     Perform complete multi-capture recovery on a track.
@@ -851,7 +1084,11 @@ def multi_capture_recover_track(
         device: Connected GreaseweazleDevice instance
         cyl: Cylinder number
         head: Head number
-        revolution_count: Number of revolutions to capture
+        revolution_count: Number of revolutions to capture, or the most
+                         to capture when until_converged is set
+        until_converged: Capture one revolution at a time and stop once
+                        the expected sectors decode (see capture_until_converged)
+        expected_sectors: Sectors that must decode in until_converged mode
 
     Returns:
         Tuple of (ReconstructedFlux, List of ReconstructedSector)
@@ -859,30 +1096,26 @@ def multi_capture_recover_track(
     Example:
         >>> reconstructed, sectors = multi_capture_recover_track(device, 40, 0)
         >>> for sector in sectors:
-        ...     if sector.crc_valid:
+        ...     if sector.is_recovered:
         ...         print(f"Sector {sector.sector_number}: OK")
         ...     else:
         ...         print(f"Sector {sector.sector_number}: CRC error "
         ...               f"(confidence: {sector.confidence:.1%})")
     """
+    if until_converged:
+        result = capture_until_converged(device, cyl, head, revolution_count,
+                                         expected_sectors=expected_sectors)
+        reconstructed = result.reconstructed or _empty_reconstruction(
+            cyl, head, result.capture_result.total_revolutions
+        )
+        return reconstructed, result.sectors
+
     # Capture multiple revolutions
     capture_result = capture_multiple_revolutions(device, cyl, head, revolution_count)
 
     if not capture_result.captures:
         logger.error("No captures obtained for C%d H%d", cyl, head)
-        return ReconstructedFlux(
-            flux_timings=[],
-            confidence_map=[],
-            vote_counts=[],
-            total_positions=0,
-            high_confidence_count=0,
-            medium_confidence_count=0,
-            low_confidence_count=0,
-            sectors=[],
-            cylinder=cyl,
-            head=head,
-            source_captures=0,
-        ), []
+        return _empty_reconstruction(cyl, head), []
 
     # Align captures
     aligned = align_flux_captures(capture_result.captures)
@@ -898,7 +1131,8 @@ def multi_capture_recover_sector(
     cyl: int,
     head: int,
     sector_number: int,
-    revolution_count: int = DEFAULT_REVOLUTION_COUNT
+    revolution_count: int = DEFAULT_REVOLUTION_COUNT,
+    until_converged: bool = False
 ) -> Optional[ReconstructedSector]:
     """
     Perform multi-capture recovery for a specific sector.
@@ -912,18 +1146,20 @@ def multi_capture_recover_sector(
         head: Head number
         sector_number: Sector number to recover (1-based)
         revolution_count: Number of revolutions to capture
+        until_converged: Stop capturing once this sector decodes
 
     Returns:
         ReconstructedSector if found, None if sector not recoverable
 
     Example:
         >>> sector = multi_capture_recover_sector(device, 40, 0, 5)
-        >>> if sector and sector.crc_valid:
+        >>> if sector and sector.is_recovered:
         ...     print(f"Recovered sector 5 with confidence {sector.confidence:.1%}")
     """
     # Perform track-level recovery
     _, sectors = multi_capture_recover_track(
-        device, cyl, head, revolution_count
+        device, cyl, head, revolution_count,
+        until_converged=until_converged, expected_sectors=[sector_number]
     )
 
     # Find the requested sector
@@ -961,13 +1197,13 @@ def compare_multi_capture_to_single(
     # Single read
     single_flux = read_track_flux(device, cyl, head, revolutions=1.2)
     single_sectors = decode_flux_data(single_flux)
-    single_good = sum(1 for s in single_sectors if s.is_good)
+    single_good = sum(1 for s in single_sectors if s.is_recovered)
 
     # Multi-capture recovery
     reconstructed, multi_sectors = multi_capture_recover_track(
         device, cyl, head, revolution_count
     )
-    multi_good = sum(1 for s in multi_sectors if s.crc_valid)
+    multi_good = sum(1 for s in multi_sectors if s.is_recovered)
 
     return {
         'single_read_good_sectors': single_good,
@@ -997,24 +1233,18 @@ def calculate_capture_quality(capture: FluxCapture) -> float:
     Returns:
         Quality score from 0.0 (poor) to 1.0 (excellent)
     """
-    times = capture.get_times_microseconds()
-    if not times or len(times) < 100:
+    times = np.asarray(capture.get_times_microseconds(), dtype=np.float64)
+    if times.size < 100:
         return 0.0
 
-    # Calculate timing statistics
-    import statistics
-
     # Expected MFM pulse widths for HD: 4us, 6us, 8us
-    expected_widths = [4.0, 6.0, 8.0]
+    expected_widths = np.array([4.0, 6.0, 8.0])
 
     # Calculate how well pulses match expected widths
-    deviations = []
-    for t in times:
-        min_dev = min(abs(t - e) for e in expected_widths)
-        deviations.append(min_dev)
+    deviations = np.abs(times[:, np.newaxis] - expected_widths).min(axis=1)
 
-    avg_deviation = statistics.mean(deviations)
-    std_deviation = statistics.stdev(deviations) if len(deviations) > 1 else 0
+    avg_deviation = float(deviations.mean())
+    std_deviation = float(deviations.std(ddof=1))
 
     # Score based on average deviation (lower is better)
     # Perfect match = 0 deviation = score 1.0
@@ -1024,8 +1254,7 @@ def calculate_capture_quality(capture: FluxCapture) -> float:
     consistency_score = max(0.0, 1.0 - std_deviation / 2.0)
 
     # Check for noise (very short pulses < 2us)
-    noise_count = sum(1 for t in times if t < 2.0)
-    noise_ratio = noise_count / len(times)
+    noise_ratio = float(np.count_nonzero(times < 2.0)) / times.size
     noise_score = max(0.0, 1.0 - noise_ratio * 5)
 
     # Combined score
@@ -1072,17 +1301,13 @@ def estimate_recovery_potential(
     # Higher consistency = better recovery potential
     if len(captures) >= 2:
         # Compare timing patterns between captures
+        # Compare transition counts with the first capture
+        lengths = np.array([len(c.get_times_microseconds()) for c in captures])
         consistency_scores = []
-        ref_times = captures[0].get_times_microseconds()
-
-        for capture in captures[1:]:
-            other_times = capture.get_times_microseconds()
-            if ref_times and other_times:
-                # Compare lengths
-                min_len = min(len(ref_times), len(other_times))
-                max_len = max(len(ref_times), len(other_times))
-                len_ratio = min_len / max_len
-                consistency_scores.append(len_ratio)
+        if lengths[0]:
+            others = lengths[1:][lengths[1:] > 0]
+            consistency_scores = (np.minimum(others, lengths[0])
+                                  / np.maximum(others, lengths[0])).tolist()
 
         if consistency_scores:
             consistency = sum(consistency_scores) / len(consistency_scores)
@@ -1132,8 +1357,10 @@ __all__ = [
     'BitVoteResult',
     'ReconstructedSector',
     'ReconstructedFlux',
+    'IncrementalCaptureResult',
     # Functions
     'capture_multiple_revolutions',
+    'capture_until_converged',
     'align_flux_captures',
     'reconstruct_from_captures',
     'multi_capture_recover_track',
@@ -1143,6 +1370,7 @@ __all__ = [
     'estimate_recovery_potential',
     # Constants
     'DEFAULT_REVOLUTION_COUNT',
+    'DEFAULT_EXPECTED_SECTORS',
     'HIGH_CONFIDENCE_THRESHOLD',
     'MEDIUM_CONFIDENCE_THRESHOLD',
     'LOW_CONFIDENCE_THRESHOLD',
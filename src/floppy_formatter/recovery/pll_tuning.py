@@ -15,20 +15,30 @@ Key Classes:
     PLLParameters: PLL configuration parameters
     PLLSearchResult: Results from parameter search
     OptimalPLLResult: Best parameters found for a track
+    PLLParameterMemory: Per-disk memory of parameters used to warm start searches
+    PLLSearchPool: Worker processes reused across parameter searches
 
 Key Functions:
     try_pll_variations: Systematic parameter search
+    adaptive_pll_search: Coarse-to-fine search that stops once sectors decode
     find_optimal_pll: Find best parameters for difficult tracks
     decode_with_pll: Decode flux using specific PLL settings
+    default_search_workers: Process count for parallel parameter search
 """
 
 import math
+import multiprocessing
+import os
 import statistics
 import logging
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, Any
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Dict, Set, Tuple, Any
 from itertools import product
 
+import numpy as np
+
 # TYPE_CHECKING imports removed - FluxData and SectorData used via FluxCapture
 
 from floppy_formatter.analysis.flux_analyzer import FluxCapture
@@ -200,11 +210,17 @@ class PLLDecodeResult:
         """Get list of successfully decoded sector numbers."""
         return [r.sector_number for r in self.sector_results if r.crc_valid]
 
-    def get_failed_sectors(self) -> List[int]:
-        """Get list of sector numbers that failed to decode."""
+    def get_failed_sectors(self, sectors_per_track: int = 18) -> List[int]:
+        """
+        Get list of sector numbers that failed to decode.
+
+        Args:
+            sectors_per_track: Sectors on the track, numbered from 1
+                              (18 for a 1.44MB disk)
+        """
         decoded_sectors = {r.sector_number for r in self.sector_results}
-        all_sectors = set(range(1, 19))
-        return list(all_sectors - decoded_sectors)
+        all_sectors = set(range(1, sectors_per_track + 1))
+        return sorted(all_sectors - decoded_sectors)
 
 
 @dataclass
@@ -219,6 +235,8 @@ class PLLSearchResult:
         best_sector_count: Number of sectors recovered with best parameters
         total_combinations_tried: Number of parameter combinations tested
         search_time_seconds: Time taken for search
+        cancelled: Whether the search was stopped before completing
+        best_result: Decode result for best_params, when the search kept it
     """
     successful_params: List[PLLParameters]
     sectors_recovered: Dict[PLLParameters, List[int]]
@@ -226,6 +244,15 @@ class PLLSearchResult:
     best_sector_count: int
     total_combinations_tried: int
     search_time_seconds: float
+    cancelled: bool = False
+    best_result: Optional[PLLDecodeResult] = None
+
+    def get_recovered_sectors(self) -> List[int]:
+        """Get sector numbers recovered by any parameter set."""
+        recovered = set()
+        for sectors in self.sectors_recovered.values():
+            recovered.update(sectors)
+        return sorted(recovered)
 
     def get_summary(self) -> str:
         """Get human-readable summary of search results."""
@@ -255,6 +282,7 @@ class OptimalPLLResult:
         default_sectors: Sectors decoded with default parameters
         decode_result: Full decode result with best parameters
         confidence: Confidence in these being optimal (0.0-1.0)
+        evaluations: Number of decodes spent finding the parameters
     """
     parameters: PLLParameters
     sectors_decoded: List[int]
@@ -262,6 +290,7 @@ class OptimalPLLResult:
     default_sectors: List[int]
     decode_result: PLLDecodeResult
     confidence: float
+    evaluations: int = 0
 
     def get_summary(self) -> str:
         """Get human-readable summary."""
@@ -613,36 +642,16 @@ def _mfm_bits_to_byte(bits: List[int]) -> int:
 # PLL Parameter Search
 # =============================================================================
 
-def try_pll_variations(
-    flux: FluxCapture,
-    base_params: PLLParameters
-) -> PLLSearchResult:
+def _variation_grid(base_params: PLLParameters) -> List[PLLParameters]:
     """
-    Systematic search of PLL parameter space.
-
-    Generates a grid of parameter variations around the base
-    parameters and tries each combination to find ones that
-    successfully decode sectors.
+    Build the parameter grid searched by try_pll_variations.
 
     Args:
-        flux: FluxCapture to decode
         base_params: Base PLLParameters to vary around
 
     Returns:
-        PLLSearchResult with all successful parameter sets
-
-    Example:
-        >>> base = PLLParameters.for_hd()
-        >>> result = try_pll_variations(capture, base)
-        >>> print(f"Found {len(result.successful_params)} working parameter sets")
-        >>> if result.best_params:
-        ...     print(f"Best recovered {result.best_sector_count} sectors")
+        List of PLLParameters in search order
     """
-    import time
-    start_time = time.time()
-
-    logger.info("Starting PLL parameter search")
-
     # Generate parameter variations
     phase_offsets = [
         base_params.phase_offset + delta
@@ -665,85 +674,716 @@ def try_pll_variations(
     ]
 
     # Generate all combinations
-    combinations = list(product(
-        phase_offsets,
-        freq_variations,
-        bandwidth_variations,
-        damping_variations
-    ))
+    return [
+        PLLParameters(
+            phase_offset=phase,
+            frequency=freq,
+            bandwidth=max(0.01, min(0.2, bw)),
+            damping=max(0.4, min(1.5, damp)),
+            gain=base_params.gain,
+        )
+        for phase, freq, bw, damp in product(
+            phase_offsets,
+            freq_variations,
+            bandwidth_variations,
+            damping_variations
+        )
+    ]
+
+
+def try_pll_variations(
+    flux: FluxCapture,
+    base_params: PLLParameters,
+    workers: int = 1,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    target_sectors: Optional[Set[int]] = None,
+    pool: Optional['PLLSearchPool'] = None
+) -> PLLSearchResult:
+    """
+    Systematic search of PLL parameter space.
+
+    Generates a grid of parameter variations around the base
+    parameters and tries each combination to find ones that
+    successfully decode sectors.
+
+    With a PLLSearchPool, or workers > 1, the grid is split across a
+    process pool. The flux is placed in shared memory and copied once
+    into each worker, and results are merged as they arrive. The result
+    is the same as a sequential search. Pass a pool when searching many
+    tracks; with only workers a pool is started for this search alone.
 
-    logger.debug("Testing %d parameter combinations", len(combinations))
+    If target_sectors is given the search stops once every one of them
+    has decoded with a valid CRC under some parameter set.
+
+    Args:
+        flux: FluxCapture (or FluxData) to decode
+        base_params: Base PLLParameters to vary around
+        workers: Number of processes to use (1 = search in this process)
+        is_cancelled: Optional callable polled between evaluations; the
+                     search stops early when it returns True
+        progress_callback: Optional callback(evaluated, total)
+        target_sectors: Optional sectors whose recovery ends the search
+        pool: Optional PLLSearchPool to run the search in; overrides workers
+
+    Returns:
+        PLLSearchResult with all successful parameter sets
+
+    Example:
+        >>> base = PLLParameters.for_hd()
+        >>> result = try_pll_variations(capture, base, workers=default_search_workers())
+        >>> print(f"Found {len(result.successful_params)} working parameter sets")
+        >>> if result.best_params:
+        ...     print(f"Best recovered {result.best_sector_count} sectors")
+    """
+    import time
+    start_time = time.time()
+
+    logger.info("Starting PLL parameter search")
+
+    flux = _as_flux_capture(flux)
+    combinations = _variation_grid(base_params)
+
+    logger.debug("Testing %d parameter combinations with %d worker(s)",
+                 len(combinations), workers)
+
+    # Results keyed by grid index so parallel completion order does not
+    # change which parameter set wins a tie
+    results: Dict[int, PLLDecodeResult] = {}
+    recovered: Set[int] = set()
+    evaluated = 0
+
+    def record(index: int, result: Optional[PLLDecodeResult]) -> None:
+        nonlocal evaluated
+        evaluated += 1
+        if result is not None:
+            results[index] = result
+            recovered.update(result.get_good_sectors())
+        if progress_callback:
+            progress_callback(evaluated, len(combinations))
+
+    def target_complete() -> bool:
+        return bool(target_sectors) and set(target_sectors) <= recovered
+
+    def should_stop() -> bool:
+        return target_complete() or (is_cancelled is not None and is_cancelled())
+
+    if pool is not None and len(combinations) > 1:
+        stopped = pool.search(flux, combinations, should_stop, record)
+    elif workers > 1 and len(combinations) > 1:
+        with PLLSearchPool(min(workers, len(combinations))) as own_pool:
+            stopped = own_pool.search(flux, combinations, should_stop, record)
+    else:
+        stopped = False
+        for index, params in enumerate(combinations):
+            if should_stop():
+                stopped = True
+                break
+            record(index, _evaluate_params(flux, params))
+    cancelled = stopped and not target_complete()
 
     successful_params = []
     sectors_recovered = {}
     best_params = None
     best_count = 0
 
-    for phase, freq, bw, damp in combinations:
-        params = PLLParameters(
-            phase_offset=phase,
-            frequency=freq,
-            bandwidth=max(0.01, min(0.2, bw)),
-            damping=max(0.4, min(1.5, damp)),
-            gain=base_params.gain,
+    for index in sorted(results):
+        params = combinations[index]
+        result = results[index]
+
+        if result.sectors_with_valid_crc >= MIN_SECTORS_FOR_SUCCESS:
+            successful_params.append(params)
+            sectors_recovered[params] = result.get_good_sectors()
+
+            if result.sectors_with_valid_crc > best_count:
+                best_count = result.sectors_with_valid_crc
+                best_params = params
+
+    elapsed = time.time() - start_time
+
+    if cancelled:
+        logger.info("PLL search cancelled after %d of %d combinations",
+                    evaluated, len(combinations))
+
+    logger.info("PLL search complete: %d successful sets, best=%d sectors, %.1fs",
+                len(successful_params), best_count, elapsed)
+
+    return PLLSearchResult(
+        successful_params=successful_params,
+        sectors_recovered=sectors_recovered,
+        best_params=best_params,
+        best_sector_count=best_count,
+        total_combinations_tried=evaluated,
+        search_time_seconds=elapsed,
+        cancelled=cancelled,
+    )
+
+
+# =============================================================================
+# Parallel Search
+# =============================================================================
+
+# Grid points handed to a pool worker per task. Small enough that results
+# stream back steadily and cancellation is noticed quickly.
+SEARCH_TASK_SIZE = 8
+
+# How often the parent polls is_cancelled while waiting for results
+SEARCH_POLL_INTERVAL_S = 0.1
+
+# Flux capture copied into each pool worker by _load_search_flux, and the
+# key of the search it belongs to
+_worker_flux: Optional[FluxCapture] = None
+_worker_flux_key: Optional[Tuple[Any, ...]] = None
+_worker_cancel_event = None
+
+
+def default_search_workers() -> int:
+    """
+    Get the number of worker processes to use for a parameter search.
+
+    Leaves one core free so the GUI and device I/O stay responsive.
+
+    Returns:
+        Worker process count (at least 1)
+    """
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _as_flux_capture(flux: Any) -> FluxCapture:
+    """Accept hardware FluxData as well as FluxCapture."""
+    if isinstance(flux, FluxCapture):
+        return flux
+    return FluxCapture.from_flux_data(flux)
+
+
+def _evaluate_params(flux: FluxCapture,
+                     params: PLLParameters) -> Optional[PLLDecodeResult]:
+    """Decode with one parameter set, returning None if decoding fails."""
+    try:
+        return decode_with_pll(flux, params)
+    except Exception as e:
+        logger.debug("Parameter combination failed: %s", e)
+        return None
+
+
+def _init_search_worker(cancel_event) -> None:
+    """Pool initializer: keep the pool's cancel event."""
+    global _worker_cancel_event
+    _worker_cancel_event = cancel_event
+
+
+def _load_search_flux(flux_key: Tuple[Any, ...]) -> FluxCapture:
+    """Copy a search's flux out of shared memory, once per worker and search."""
+    global _worker_flux, _worker_flux_key
+
+    if flux_key != _worker_flux_key:
+        shm_name, _search_id, count, sample_rate, cylinder, head = flux_key
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            timings = np.ndarray((count,), dtype=np.int64, buffer=shm.buf).tolist()
+        finally:
+            shm.close()
+
+        _worker_flux = FluxCapture(
+            raw_timings=timings,
+            sample_rate=sample_rate,
+            cylinder=cylinder,
+            head=head,
         )
+        _worker_flux_key = flux_key
+    return _worker_flux
+
+
+def _evaluate_task(
+    flux_key: Tuple[Any, ...],
+    task: List[Tuple[int, PLLParameters]]
+) -> List[Tuple[int, Optional[PLLDecodeResult]]]:
+    """Pool task: evaluate a slice of the grid, stopping if cancelled."""
+    results = []
+    for index, params in task:
+        if _worker_cancel_event.is_set():
+            break
+        results.append((index, _evaluate_params(_load_search_flux(flux_key), params)))
+    return results
+
+
+class PLLSearchPool:
+    """
+    Worker processes and shared flux buffer reused across parameter searches.
 
+    Starting spawn processes costs far more than a search on one track,
+    so a worker that tunes many tracks keeps one pool for the whole
+    operation. Processes are started on the first search. Each search
+    copies its flux into a shared buffer, grown when a capture does not
+    fit, and every worker copies it out once before decoding.
+
+    Example:
+        with PLLSearchPool(default_search_workers()) as pool:
+            for flux in captures:
+                result = try_pll_variations(flux, base, pool=pool)
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize the pool without starting any processes.
+
+        Args:
+            workers: Number of worker processes (defaults to default_search_workers())
+        """
+        self.workers = workers or default_search_workers()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancel_event = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._searches = 0
+
+    def search(
+        self,
+        flux: FluxCapture,
+        combinations: List[PLLParameters],
+        should_stop: Callable[[], bool],
+        record: Callable[[int, Optional[PLLDecodeResult]], None]
+    ) -> bool:
+        """
+        Evaluate a parameter grid across the pool.
+
+        Returns only once no task of this search is running, so the shared
+        buffer can be reused by the next one.
+
+        Args:
+            flux: Flux capture to decode
+            combinations: Parameter sets to evaluate
+            should_stop: Polled while waiting; the search ends when it returns True
+            record: Called with (grid index, result) as each result arrives
+
+        Returns:
+            True if the search was stopped before completing
+        """
+        timings = np.asarray(flux.raw_timings, dtype=np.int64)
+        self._start()
+        self._share(timings)
+        self._cancel_event.clear()
+        self._searches += 1
+        flux_key = (self._shm.name, self._searches, len(timings),
+                    flux.sample_rate, flux.cylinder, flux.head)
+
+        indexed = list(enumerate(combinations))
+        pending = {
+            self._executor.submit(_evaluate_task, flux_key, indexed[i:i + SEARCH_TASK_SIZE])
+            for i in range(0, len(indexed), SEARCH_TASK_SIZE)
+        }
+
+        stopped = False
         try:
-            result = decode_with_pll(flux, params)
+            while pending:
+                if should_stop():
+                    stopped = True
+                    break
+
+                done, pending = wait(pending, timeout=SEARCH_POLL_INTERVAL_S,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, result in future.result():
+                        record(index, result)
+        finally:
+            if pending:
+                # Running tasks notice the event after their current decode
+                self._cancel_event.set()
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+
+        return stopped
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared buffer."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> 'PLLSearchPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Start the worker processes if not already running."""
+        if self._executor is not None:
+            return
+
+        # Spawn rather than fork: the GUI process has live Qt and USB threads
+        ctx = multiprocessing.get_context('spawn')
+        self._cancel_event = ctx.Event()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_search_worker,
+            initargs=(self._cancel_event,),
+        )
+        logger.debug("Started PLL search pool with %d worker(s)", self.workers)
+
+    def _share(self, timings: np.ndarray) -> None:
+        """Copy timings into the shared buffer, replacing it if too small."""
+        size = max(1, timings.nbytes)
+        if self._shm is not None and self._shm.size < size:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        np.ndarray(timings.shape, dtype=np.int64, buffer=self._shm.buf)[:] = timings
+
+
+# =============================================================================
+# Warm Start
+# =============================================================================
+
+# Furthest cylinder whose parameters are used to seed a search
+WARM_START_MAX_DISTANCE = 8
+
+# Cost of using parameters from the other head, in cylinders
+WARM_START_HEAD_PENALTY = 0.5
 
-            if result.sectors_with_valid_crc >= MIN_SECTORS_FOR_SUCCESS:
+# Initial search steps are scaled by this when starting from remembered
+# parameters, since the optimum is expected to be close
+WARM_START_STEP_SCALE = 0.5
+
+
+@dataclass
+class _RememberedParams:
+    """Best parameters found for one track."""
+    parameters: PLLParameters
+    sectors: int
+    sequence: int
+
+
+class PLLParameterMemory:
+    """
+    Best PLL parameters found per track during one disk session.
+
+    Adjacent tracks on the same disk are read by the same drive and have
+    similar media drift, so they usually want similar PLL settings. A
+    search for a new track starts from the parameters remembered for the
+    nearest track instead of from the defaults.
+
+    Example:
+        >>> memory = PLLParameterMemory()
+        >>> result = adaptive_pll_search(capture, memory=memory)
+        >>> memory.suggest(capture.cylinder + 1, capture.head)
+    """
+
+    def __init__(self, max_distance: int = WARM_START_MAX_DISTANCE):
+        """
+        Initialize an empty memory.
+
+        Args:
+            max_distance: Furthest cylinder to take parameters from
+        """
+        self.max_distance = max_distance
+        self._tracks: Dict[Tuple[int, int], _RememberedParams] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def record(self, cylinder: int, head: int,
+               params: PLLParameters, sectors: int) -> None:
+        """
+        Remember parameters that recovered sectors on a track.
+
+        Parameters already remembered for the track are only replaced by
+        ones that recovered at least as many sectors.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+            params: Parameters that worked
+            sectors: Number of sectors they recovered
+        """
+        if sectors < MIN_SECTORS_FOR_SUCCESS:
+            return
+        existing = self._tracks.get((cylinder, head))
+        if existing is not None and existing.sectors > sectors:
+            return
+        self._sequence += 1
+        self._tracks[(cylinder, head)] = _RememberedParams(params, sectors, self._sequence)
+
+    def suggest(self, cylinder: int, head: int) -> Optional[PLLParameters]:
+        """
+        Get starting parameters for a track from the nearest remembered one.
+
+        Ties are broken by sectors recovered, then by the most recent.
+
+        Args:
+            cylinder: Cylinder number
+            head: Head number
+
+        Returns:
+            Remembered PLLParameters, or None if no track is close enough
+        """
+        best_key = None
+        best = None
+        for (cyl, hd), entry in self._tracks.items():
+            if abs(cyl - cylinder) > self.max_distance:
+                continue
+            distance = abs(cyl - cylinder) + (0 if hd == head else WARM_START_HEAD_PENALTY)
+            key = (distance, -entry.sectors, -entry.sequence)
+            if best_key is None or key < best_key:
+                best_key, best = key, entry
+        return best.parameters if best is not None else None
+
+    def clear(self) -> None:
+        """Forget all remembered parameters."""
+        self._tracks.clear()
+
+
+# =============================================================================
+# Adaptive Search
+# =============================================================================
+
+# Starting and finest step sizes for the pattern search. Frequency steps
+# are fractions of the base frequency.
+ADAPTIVE_INITIAL_STEPS = {
+    'phase_offset': 200.0,
+    'frequency': 0.02,
+    'bandwidth': 0.02,
+    'damping': 0.2,
+}
+ADAPTIVE_MIN_STEPS = {
+    'phase_offset': 25.0,
+    'frequency': 0.0025,
+    'bandwidth': 0.0025,
+    'damping': 0.025,
+}
+
+# Decode budget for one adaptive search
+ADAPTIVE_MAX_EVALUATIONS = 120
+
+
+def _params_key(params: PLLParameters) -> Tuple[float, ...]:
+    """Key that treats parameter sets equal to within PLLParameters.__hash__ rounding."""
+    return (
+        round(params.phase_offset, 1),
+        round(params.frequency, 0),
+        round(params.bandwidth, 3),
+        round(params.damping, 3),
+        round(params.gain, 3),
+    )
+
+
+def _step_params(params: PLLParameters, base_frequency: float,
+                 dimension: str, step: float) -> PLLParameters:
+    """Move one parameter by a signed step."""
+    if dimension == 'phase_offset':
+        return params.with_variation(phase_delta=step)
+    if dimension == 'frequency':
+        return params.with_variation(freq_delta=base_frequency * step)
+    if dimension == 'bandwidth':
+        return params.with_variation(bandwidth_delta=step)
+    return params.with_variation(damping_delta=step)
+
+
+def adaptive_pll_search(
+    flux: FluxCapture,
+    base_params: Optional[PLLParameters] = None,
+    target_sectors: Optional[Set[int]] = None,
+    max_evaluations: int = ADAPTIVE_MAX_EVALUATIONS,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    initial_result: Optional[PLLDecodeResult] = None,
+    memory: Optional[PLLParameterMemory] = None,
+    sectors_per_track: Optional[int] = None
+) -> PLLSearchResult:
+    """
+    Coarse-to-fine pattern search of the PLL parameter space.
+
+    Starting from base_params, tries a step up and down in phase offset,
+    frequency, bandwidth and damping, moving to the first neighbour that
+    recovers more target sectors. When no neighbour improves, all steps
+    are halved, down to ADAPTIVE_MIN_STEPS. The search stops as soon as
+    every target sector has decoded with a valid CRC under some parameter
+    set, when the steps reach their minimum, or when the decode budget
+    is spent.
+
+    Without target_sectors the target is every sector of the track, so
+    callers pass sectors_per_track from the disk geometry. With neither,
+    the search has no target and runs until its steps or budget are
+    exhausted, keeping the parameters that decode the most sectors.
+
+    With a PLLParameterMemory the parameters that worked on the nearest
+    track are decoded as well; if they beat base_params the search starts
+    from them with smaller initial steps. The best parameters found are
+    remembered for this track.
+
+    Args:
+        flux: FluxCapture (or FluxData) to decode
+        base_params: Starting parameters (defaults to PLLParameters.for_hd())
+        target_sectors: Sectors that must be recovered
+        max_evaluations: Maximum number of decodes to perform
+        is_cancelled: Optional callable polled between evaluations
+        initial_result: Decode result already obtained for base_params
+        memory: Optional per-disk memory to warm start from and update
+        sectors_per_track: Sectors on the track, from the geometry; sets
+                          the target to all of them when target_sectors
+                          is not given
+
+    Returns:
+        PLLSearchResult; total_combinations_tried is the number of decodes
+        spent
+    """
+    import time
+    start_time = time.time()
+
+    flux = _as_flux_capture(flux)
+    base_params = base_params or PLLParameters.for_hd()
+    if target_sectors:
+        target = set(target_sectors)
+    elif sectors_per_track:
+        target = set(range(1, sectors_per_track + 1))
+    else:
+        target = set()
+
+    cache: Dict[Tuple[float, ...], Optional[PLLDecodeResult]] = {}
+    if initial_result is not None:
+        cache[_params_key(base_params)] = initial_result
+
+    successful_params: List[PLLParameters] = []
+    sectors_recovered: Dict[PLLParameters, List[int]] = {}
+    recovered: Set[int] = set()
+    evaluations = 0
+    cancelled = False
+
+    def evaluate(params: PLLParameters) -> Optional[PLLDecodeResult]:
+        nonlocal evaluations
+        key = _params_key(params)
+        if key not in cache:
+            evaluations += 1
+            cache[key] = _evaluate_params(flux, params)
+        result = cache[key]
+        if result is not None and result.sectors_with_valid_crc >= MIN_SECTORS_FOR_SUCCESS:
+            if params not in sectors_recovered:
                 successful_params.append(params)
                 sectors_recovered[params] = result.get_good_sectors()
+            recovered.update(result.get_good_sectors())
+        return result
+
+    def score(result: Optional[PLLDecodeResult]) -> Tuple[float, ...]:
+        if result is None:
+            return (-1, -1, 0.0)
+        good = set(result.get_good_sectors())
+        return (len(good & target), result.sectors_with_valid_crc, result.decode_quality)
+
+    def should_stop() -> bool:
+        nonlocal cancelled
+        if is_cancelled is not None and is_cancelled():
+            cancelled = True
+        complete = bool(target) and target <= recovered
+        return cancelled or complete or evaluations >= max_evaluations
+
+    steps = dict(ADAPTIVE_INITIAL_STEPS)
+    best_params = base_params
+    best_result = evaluate(base_params)
+
+    # A remembered set only replaces the defaults if it decodes better
+    warm_params = memory.suggest(flux.cylinder, flux.head) if memory is not None else None
+    if warm_params is not None and not should_stop():
+        warm_result = evaluate(warm_params)
+        if score(warm_result) > score(best_result):
+            logger.debug("Warm starting PLL search for C%d H%d from %s",
+                         flux.cylinder, flux.head, warm_params.to_dict())
+            best_params, best_result = warm_params, warm_result
+            steps = {d: max(ADAPTIVE_MIN_STEPS[d], step * WARM_START_STEP_SCALE)
+                     for d, step in steps.items()}
+
+    while not should_stop():
+        improved = False
+        for dimension in steps:
+            for sign in (1, -1):
+                if should_stop():
+                    break
+                candidate = _step_params(best_params, base_params.frequency,
+                                         dimension, sign * steps[dimension])
+                result = evaluate(candidate)
+                if score(result) > score(best_result):
+                    best_params, best_result = candidate, result
+                    improved = True
+                    break
 
-                if result.sectors_with_valid_crc > best_count:
-                    best_count = result.sectors_with_valid_crc
-                    best_params = params
-
-        except Exception as e:
-            logger.debug("Parameter combination failed: %s", e)
+        if improved:
             continue
+        if all(steps[d] <= ADAPTIVE_MIN_STEPS[d] for d in steps):
+            break
+        steps = {d: max(ADAPTIVE_MIN_STEPS[d], steps[d] / 2) for d in steps}
 
     elapsed = time.time() - start_time
+    best_count = best_result.sectors_with_valid_crc if best_result else 0
 
-    logger.info("PLL search complete: %d successful sets, best=%d sectors, %.1fs",
-                len(successful_params), best_count, elapsed)
+    if memory is not None:
+        memory.record(flux.cylinder, flux.head, best_params, best_count)
+
+    logger.info("Adaptive PLL search: best=%d sectors, %d/%d target sectors, "
+                "%d evaluations, %.1fs",
+                best_count, len(target & recovered), len(target), evaluations, elapsed)
 
     return PLLSearchResult(
         successful_params=successful_params,
         sectors_recovered=sectors_recovered,
-        best_params=best_params,
+        best_params=best_params if best_count >= MIN_SECTORS_FOR_SUCCESS else None,
         best_sector_count=best_count,
-        total_combinations_tried=len(combinations),
+        total_combinations_tried=evaluations,
         search_time_seconds=elapsed,
+        cancelled=cancelled,
+        best_result=best_result,
     )
 
 
 def find_optimal_pll(
     flux: FluxCapture,
-    target_sector: Optional[int] = None
+    target_sector: Optional[int] = None,
+    strategy: str = 'adaptive',
+    max_evaluations: int = ADAPTIVE_MAX_EVALUATIONS,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    memory: Optional[PLLParameterMemory] = None,
+    sectors_per_track: Optional[int] = None
 ) -> OptimalPLLResult:
     """
     Find best PLL parameters for difficult tracks.
 
-    Uses iterative refinement: coarse search followed by fine
-    tuning around the best result.
+    The default 'adaptive' strategy runs adaptive_pll_search, which stops
+    as soon as the target sector (or every one of sectors_per_track, if
+    no sector is given) has decoded. The 'grid' strategy is the exhaustive coarse grid search
+    followed by fine tuning around the best result.
 
     Args:
         flux: FluxCapture to optimize for
         target_sector: Optional specific sector to optimize for.
                       If None, optimizes for maximum total recovery.
+        strategy: 'adaptive' or 'grid'
+        max_evaluations: Decode budget for the adaptive strategy
+        is_cancelled: Optional callable polled between evaluations
+        memory: Optional per-disk memory used to warm start the adaptive
+               search and updated with its result, or with the defaults
+               if they already decode the target sector
+        sectors_per_track: Sectors on the track, from the geometry; the
+                          adaptive search stops once all of them decode
+                          when no target_sector is given
 
     Returns:
-        OptimalPLLResult with best parameters found
+        OptimalPLLResult with best parameters found and the number of
+        decodes spent
 
     Example:
-        >>> result = find_optimal_pll(capture)
+        >>> result = find_optimal_pll(capture, sectors_per_track=geometry.sectors_per_track)
         >>> print(result.get_summary())
         >>> # Use optimal parameters for decoding
         >>> decode_result = decode_with_pll(capture, result.parameters)
     """
-    logger.info("Finding optimal PLL for C%d H%d (target sector: %s)",
-                flux.cylinder, flux.head, target_sector)
+    flux = _as_flux_capture(flux)
+    logger.info("Finding optimal PLL for C%d H%d (target sector: %s, strategy: %s)",
+                flux.cylinder, flux.head, target_sector, strategy)
 
     # First, try with default parameters
     base_params = PLLParameters.for_hd()
@@ -754,6 +1394,9 @@ def find_optimal_pll(
 
     # If target sector specified and already decoded, we're done
     if target_sector is not None and target_sector in default_sectors:
+        if memory is not None:
+            memory.record(flux.cylinder, flux.head, base_params,
+                          default_result.sectors_with_valid_crc)
         return OptimalPLLResult(
             parameters=base_params,
             sectors_decoded=default_sectors,
@@ -761,10 +1404,27 @@ def find_optimal_pll(
             default_sectors=default_sectors,
             decode_result=default_result,
             confidence=1.0,
+            evaluations=1,
+        )
+
+    if strategy == 'adaptive':
+        search = adaptive_pll_search(
+            flux, base_params,
+            target_sectors={target_sector} if target_sector is not None else None,
+            max_evaluations=max_evaluations,
+            is_cancelled=is_cancelled,
+            initial_result=default_result,
+            memory=memory,
+            sectors_per_track=sectors_per_track,
         )
+        best_params = search.best_params or base_params
+        final_result = search.best_result if search.best_params else default_result
+        evaluations = 1 + search.total_combinations_tried
+        return _optimal_result(best_params, final_result, default_sectors, evaluations)
 
     # Coarse search
-    coarse_result = try_pll_variations(flux, base_params)
+    coarse_result = try_pll_variations(flux, base_params, is_cancelled=is_cancelled)
+    evaluations = 1 + coarse_result.total_combinations_tried
 
     if not coarse_result.best_params:
         # No improvement found
@@ -775,6 +1435,7 @@ def find_optimal_pll(
             default_sectors=default_sectors,
             decode_result=default_result,
             confidence=0.5,
+            evaluations=evaluations,
         )
 
     # Fine search around best coarse result
@@ -794,6 +1455,7 @@ def find_optimal_pll(
                 )
 
                 try:
+                    evaluations += 1
                     result = decode_with_pll(flux, params)
 
                     # Check if this is better
@@ -814,6 +1476,16 @@ def find_optimal_pll(
 
     # Get final result with best parameters
     final_result = decode_with_pll(flux, best_params)
+    return _optimal_result(best_params, final_result, default_sectors, evaluations + 1)
+
+
+def _optimal_result(
+    best_params: PLLParameters,
+    final_result: PLLDecodeResult,
+    default_sectors: List[int],
+    evaluations: int
+) -> OptimalPLLResult:
+    """Build an OptimalPLLResult, scoring confidence from the improvement."""
     final_sectors = final_result.get_good_sectors()
     improvement = len(final_sectors) - len(default_sectors)
 
@@ -827,8 +1499,8 @@ def find_optimal_pll(
     else:
         confidence = 0.4
 
-    logger.info("Optimal PLL found: %d sectors (+%d), confidence=%.0f%%",
-                len(final_sectors), improvement, confidence * 100)
+    logger.info("Optimal PLL found: %d sectors (+%d), confidence=%.0f%%, %d evaluations",
+                len(final_sectors), improvement, confidence * 100, evaluations)
 
     return OptimalPLLResult(
         parameters=best_params,
@@ -837,6 +1509,7 @@ def find_optimal_pll(
         default_sectors=default_sectors,
         decode_result=final_result,
         confidence=confidence,
+        evaluations=evaluations,
     )
 
 
@@ -852,7 +1525,7 @@ def optimize_for_sector(
 
     Args:
         flux: FluxCapture containing the track
-        sector_number: Sector number to recover (1-18)
+        sector_number: 1-based sector number to recover
         max_attempts: Maximum parameter combinations to try
 
     Returns:
@@ -1045,13 +1718,17 @@ __all__ = [
     'PLLState',
     # Classes
     'PLLDecoder',
+    'PLLParameterMemory',
     # Functions
     'decode_with_pll',
     'try_pll_variations',
+    'adaptive_pll_search',
     'find_optimal_pll',
     'optimize_for_sector',
     'create_parameter_grid',
     'default_pll_parameters',
+    'default_search_workers',
+    'PLLSearchPool',
     # Constants
     'DEFAULT_FREQUENCY_HZ',
     'DEFAULT_BANDWIDTH',
@@ -0,0 +1,281 @@
+"""
+Cost-aware scheduling of recovery techniques.
+
+Recovery techniques differ widely in cost (a format refresh takes a few
+revolutions, a PLL grid search can take minutes) and in how often they
+pay off on a given disk. The scheduler measures both during a run and
+orders the techniques for each track by expected sectors recovered per
+second, pruning those that have stopped paying and those that no longer
+fit in the time budget.
+
+Estimates start from per-technique priors and move towards the observed
+figures as attempts accumulate, so every technique is tried a few times
+before the measurements dominate.
+
+Key Classes:
+    TechniqueScheduler: Orders and prunes techniques by expected payoff
+    TechniqueRecord: Observed attempts, recoveries and cost of a technique
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Prior mean cost in seconds per track attempt (drive time + CPU time)
+DEFAULT_TECHNIQUE_COSTS: Dict[str, float] = {
+    'format_refresh': 2.0,
+    'multi_capture': 2.5,
+    'pll_tuning': 20.0,
+    'bit_slip': 3.0,
+    'maximum_effort': 8.0,
+}
+
+# Prior fraction of targeted sectors each technique recovers
+DEFAULT_TECHNIQUE_SUCCESS: Dict[str, float] = {
+    'format_refresh': 0.3,
+    'multi_capture': 0.3,
+    'pll_tuning': 0.2,
+    'bit_slip': 0.1,
+    'maximum_effort': 0.1,
+}
+
+# Prior for techniques without an entry above
+FALLBACK_TECHNIQUE_COST = 5.0
+FALLBACK_TECHNIQUE_SUCCESS = 0.1
+
+# Weight of the priors, in sectors (success) and attempts (cost)
+PRIOR_WEIGHT = 3.0
+
+# Attempts before a technique can be pruned for poor payoff
+MIN_ATTEMPTS_BEFORE_PRUNE = 5
+
+# A technique is pruned when its expected rate falls below this
+# fraction of the best data-recovery technique's rate
+PRUNE_RATE_FRACTION = 0.05
+
+# Techniques that rewrite the track. Their verify reads pass on the fill
+# patterns they wrote, so their rate is not the bar the data-recovery
+# techniques are pruned against.
+REFRESH_TECHNIQUES = frozenset({'format_refresh'})
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class TechniqueRecord:
+    """
+    Observed performance of one recovery technique.
+
+    Attributes:
+        attempts: Track attempts made
+        sectors_targeted: Bad sectors the technique was asked to recover
+        sectors_recovered: Sectors it recovered
+        seconds: Total time spent, drive and CPU
+    """
+    attempts: int = 0
+    sectors_targeted: int = 0
+    sectors_recovered: int = 0
+    seconds: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Observed fraction of targeted sectors recovered."""
+        if self.sectors_targeted == 0:
+            return 0.0
+        return self.sectors_recovered / self.sectors_targeted
+
+    @property
+    def mean_cost(self) -> float:
+        """Observed mean seconds per attempt."""
+        if self.attempts == 0:
+            return 0.0
+        return self.seconds / self.attempts
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+class TechniqueScheduler:
+    """
+    Order recovery techniques per track by expected sectors per second.
+
+    Example:
+        >>> scheduler = TechniqueScheduler(time_budget=3600)
+        >>> scheduler.start()
+        >>> for technique in scheduler.order(["format_refresh", "pll_tuning"], 4):
+        ...     started = time.monotonic()
+        ...     recovered = run(technique)
+        ...     scheduler.record(technique, 4, recovered, time.monotonic() - started)
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        prior_costs: Optional[Dict[str, float]] = None,
+        prior_success: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            time_budget: Seconds available for the whole run, or None for
+                        no limit. The clock starts at start().
+            prior_costs: Prior mean cost per technique in seconds
+            prior_success: Prior fraction of sectors recovered per technique
+        """
+        self._time_budget = time_budget
+        self._prior_costs = dict(DEFAULT_TECHNIQUE_COSTS, **(prior_costs or {}))
+        self._prior_success = dict(DEFAULT_TECHNIQUE_SUCCESS, **(prior_success or {}))
+        self._records: Dict[str, TechniqueRecord] = {}
+        self._started: Optional[float] = None
+
+    def start(self) -> None:
+        """Start the budget clock."""
+        self._started = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since start(), 0.0 if not started."""
+        if self._started is None:
+            return 0.0
+        return time.monotonic() - self._started
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget, or None if there is no budget."""
+        if self._time_budget is None:
+            return None
+        return max(0.0, self._time_budget - self.elapsed())
+
+    def budget_exhausted(self) -> bool:
+        """True once the time budget has been used up."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def record(self, technique: str, targeted: int, recovered: int,
+               seconds: float) -> None:
+        """
+        Record the outcome of one track attempt.
+
+        Args:
+            technique: Technique name
+            targeted: Bad sectors the technique was asked to recover
+            recovered: Sectors it recovered
+            seconds: Time the attempt took
+        """
+        record = self._records.setdefault(technique, TechniqueRecord())
+        record.attempts += 1
+        record.sectors_targeted += targeted
+        record.sectors_recovered += recovered
+        record.seconds += seconds
+
+    def get_record(self, technique: str) -> TechniqueRecord:
+        """Get the observed record of a technique."""
+        return self._records.get(technique, TechniqueRecord())
+
+    def expected_success(self, technique: str) -> float:
+        """Fraction of targeted sectors the technique is expected to recover."""
+        record = self.get_record(technique)
+        prior = self._prior_success.get(technique, FALLBACK_TECHNIQUE_SUCCESS)
+        return ((record.sectors_recovered + prior * PRIOR_WEIGHT)
+                / (record.sectors_targeted + PRIOR_WEIGHT))
+
+    def expected_cost(self, technique: str) -> float:
+        """Expected seconds for one track attempt."""
+        record = self.get_record(technique)
+        prior = self._prior_costs.get(technique, FALLBACK_TECHNIQUE_COST)
+        return (record.seconds + prior * PRIOR_WEIGHT) / (record.attempts + PRIOR_WEIGHT)
+
+    def expected_rate(self, technique: str, pending: int) -> float:
+        """
+        Expected sectors recovered per second on a track.
+
+        Args:
+            technique: Technique name
+            pending: Bad sectors left on the track
+
+        Returns:
+            Expected sectors per second
+        """
+        cost = max(self.expected_cost(technique), 1e-3)
+        return self.expected_success(technique) * pending / cost
+
+    def order(self, techniques: List[str], pending: int) -> List[str]:
+        """
+        Order techniques for a track, best expected rate first.
+
+        Techniques are dropped when their expected cost exceeds the
+        remaining budget, or when after MIN_ATTEMPTS_BEFORE_PRUNE attempts
+        their rate is below PRUNE_RATE_FRACTION of the best of the given
+        techniques outside REFRESH_TECHNIQUES. Ties keep the given order.
+
+        Only techniques still untried on the track should be passed, so
+        a technique that has just failed there does not set the bar for
+        the ones after it.
+
+        Args:
+            techniques: Techniques allowed and not yet tried on this track
+            pending: Bad sectors left on the track
+
+        Returns:
+            Techniques to try, in order
+        """
+        if not techniques or pending <= 0 or self.budget_exhausted():
+            return []
+
+        rates = {t: self.expected_rate(t, pending) for t in techniques}
+        best = max((rate for t, rate in rates.items() if t not in REFRESH_TECHNIQUES),
+                   default=0.0)
+        remaining = self.remaining()
+
+        scheduled = []
+        for technique in techniques:
+            if remaining is not None and self.expected_cost(technique) > remaining:
+                logger.debug("Skipping %s: expected %.1fs, %.1fs left",
+                             technique, self.expected_cost(technique), remaining)
+                continue
+            if (self.get_record(technique).attempts >= MIN_ATTEMPTS_BEFORE_PRUNE
+                    and rates[technique] < best * PRUNE_RATE_FRACTION):
+                logger.debug("Pruning %s: %.3f sectors/s vs best %.3f",
+                             technique, rates[technique], best)
+                continue
+            scheduled.append(technique)
+
+        scheduled.sort(key=lambda t: rates[t], reverse=True)
+        return scheduled
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get observed and expected figures per technique.
+
+        Returns:
+            Dictionary mapping technique to attempts, success rate (%),
+            mean cost (s) and expected sectors per second for one sector
+        """
+        return {
+            technique: {
+                'attempts': record.attempts,
+                'success_rate': record.success_rate * 100,
+                'mean_cost': record.mean_cost,
+                'expected_rate': self.expected_rate(technique, 1),
+            }
+            for technique, record in self._records.items()
+        }
+
+
+__all__ = [
+    'TechniqueScheduler',
+    'TechniqueRecord',
+    'DEFAULT_TECHNIQUE_COSTS',
+    'DEFAULT_TECHNIQUE_SUCCESS',
+    'REFRESH_TECHNIQUES',
+]
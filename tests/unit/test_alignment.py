@@ -0,0 +1,149 @@
+"""
+Unit tests for flux capture alignment.
+
+Tests FFT correlation against a direct per-offset computation and the
+offset search used by multi-capture recovery and forensics.
+"""
+
+import numpy as np
+import pytest
+
+from floppy_formatter.analysis.alignment import (
+    correlation_by_offset,
+    find_alignment_offset,
+    index_alignment_offset,
+)
+from floppy_formatter.analysis.flux_analyzer import FluxCapture
+from floppy_formatter.analysis.forensics import _find_best_alignment, compare_flux_captures
+from floppy_formatter.recovery.multi_capture import (
+    _find_alignment_offset,
+    align_flux_captures,
+)
+
+
+def _direct_correlation(reference, target, max_offset, offset):
+    """Per-offset correlation as the original alignment loops computed it."""
+    length = min(len(reference), len(target)) - max_offset
+    if offset >= 0:
+        x, y = reference[offset:offset + length], target[:length]
+    else:
+        x, y = reference[:length], target[-offset:-offset + length]
+    x, y = np.asarray(x), np.asarray(y)
+    if x.std() == 0 or y.std() == 0:
+        return np.nan
+    covariance = np.mean((x - x.mean()) * (y - y.mean()))
+    return covariance / (x.std(ddof=1) * y.std(ddof=1))
+
+
+def _shifted_pair(shift, length=3000, seed=0):
+    """Two noisy copies of an MFM-like sequence, the second shifted."""
+    rng = np.random.default_rng(seed)
+    track = rng.choice([4.0, 6.0, 8.0], length + 200)
+    reference = track[100:100 + length] + rng.normal(0, 0.1, length)
+    target = track[100 + shift:100 + shift + length] + rng.normal(0, 0.1, length)
+    return reference.tolist(), target.tolist()
+
+
+def _shifted_captures(shift, length=3000, seed=0):
+    """Two captures of one track, the second starting ``shift`` transitions later."""
+    rng = np.random.default_rng(seed)
+    track = rng.choice([144, 216, 288], length + 200)
+    reference = track[100:100 + length].tolist()
+    target = track[100 + shift:100 + shift + length].tolist()
+    return (
+        FluxCapture(raw_timings=reference, sample_rate=72_000_000, cylinder=0, head=0),
+        FluxCapture(raw_timings=target, sample_rate=72_000_000, cylinder=0, head=0),
+    )
+
+
+class TestCorrelation:
+    """Test FFT correlation against direct computation."""
+
+    def test_matches_direct(self):
+        """Test every offset matches the per-offset Pearson calculation."""
+        reference, target = _shifted_pair(7, length=600)
+
+        offsets, correlations = correlation_by_offset(reference, target, 50)
+
+        expected = [_direct_correlation(reference, target, 50, o) for o in offsets]
+        assert np.allclose(correlations, expected, rtol=1e-9, atol=1e-12)
+
+    def test_constant_window_is_nan(self):
+        """Test windows without variation have no correlation."""
+        offsets, correlations = correlation_by_offset([5.0] * 200, [5.0] * 200, 10)
+
+        assert len(offsets) == 21
+        assert np.isnan(correlations).all()
+
+
+class TestAlignmentOffset:
+    """Test the offset search."""
+
+    @pytest.mark.parametrize("shift", [-37, 0, 12, 55])
+    def test_finds_shift(self, shift):
+        """Test the known shift is recovered searching every offset."""
+        reference, target = _shifted_pair(shift)
+
+        assert find_alignment_offset(reference, target, 100)[0] == shift
+
+    def test_coarse_then_fine(self):
+        """Test the fine pass refines a peak found by the coarse pass."""
+        # Smooth the sequence so the correlation peak is wider than the step
+        reference, target = _shifted_pair(-33)
+        kernel = np.ones(8) / 8
+        reference = np.convolve(reference, kernel, 'valid')
+        target = np.convolve(target, kernel, 'valid')
+
+        assert find_alignment_offset(reference, target, 100, coarse_step=10)[0] == -33
+
+    def test_index_bounds_search(self):
+        """Test an index estimate restricts offsets to its window."""
+        reference, target = _shifted_pair(40)
+
+        offset, _ = find_alignment_offset(reference, target, 100,
+                                          index_offset=-50, index_window=20)
+
+        assert -70 <= offset <= -30
+
+    def test_index_alignment_offset(self):
+        """Test index pulses map to transition offsets."""
+        samples = [100] * 50
+
+        assert index_alignment_offset(samples, [1000], samples, [700]) == 3
+        assert index_alignment_offset(samples, [], samples, [700]) is None
+
+    def test_callers(self):
+        """Test multi-capture and forensics wrappers use the shared engine."""
+        reference, target = _shifted_pair(-30)
+
+        assert _find_alignment_offset(reference, target) == -30
+        offset, correlation = _find_best_alignment(reference, target)
+        assert offset == -30
+        assert correlation > 0.9
+        assert _find_alignment_offset(reference[:500], target[:500]) == 0
+
+
+class TestAppliedOffset:
+    """Test callers shift captures in the direction the offset reports."""
+
+    @pytest.mark.parametrize("shift", [-40, 40])
+    def test_align_flux_captures(self, shift):
+        """Test aligned timing rows match once padding is skipped."""
+        captures = _shifted_captures(shift)
+
+        aligned = align_flux_captures(list(captures))
+
+        padding = max(aligned.alignment_offsets)
+        first, second = aligned.aligned_timings
+        assert abs(aligned.alignment_offsets[1 - aligned.reference_index]) == 40
+        assert np.array_equal(first[padding:], second[padding:])
+
+    @pytest.mark.parametrize("shift", [-40, 40])
+    def test_compare_flux_captures(self, shift):
+        """Test shifted captures of one track compare as identical."""
+        first, second = _shifted_captures(shift)
+
+        comparison = compare_flux_captures(first, second)
+
+        assert comparison.match_percentage == 100.0
+        assert comparison.max_timing_diff_us == 0.0
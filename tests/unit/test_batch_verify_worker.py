@@ -0,0 +1,173 @@
+"""
+Unit tests for early-decision grading in the batch verify worker.
+
+Tests the sample order of tracks, the running grade bounds and a worker
+run that stops once the grade of the disk is decided.
+"""
+
+import numpy as np
+import pytest
+
+from floppy_formatter.core.geometry import DiskGeometry
+from floppy_formatter.gui.dialogs.batch_verify_config_dialog import FloppyDiskInfo
+from floppy_formatter.gui.workers.batch_verify_worker import (
+    BatchVerifyWorker,
+    DiskGrade,
+    GradeEstimator,
+    sequential_track_order,
+)
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+
+
+class TestSequentialTrackOrder:
+    """Test the order tracks are sampled in."""
+
+    def test_every_track_once(self):
+        """Test all tracks are returned exactly once."""
+        order = sequential_track_order(80, 2)
+
+        assert sorted(order) == [(c, h) for c in range(80) for h in range(2)]
+
+    def test_spreads_across_disk(self):
+        """Test outer and inner cylinders come first, then midpoints."""
+        order = sequential_track_order(80, 2)
+
+        assert [cyl for cyl, _ in order[:10:2]] == [0, 79, 39, 19, 59]
+        assert order[:2] == [(0, 0), (0, 1)]
+
+    def test_priority_tracks_first(self):
+        """Test known-weak tracks lead and invalid ones are dropped."""
+        order = sequential_track_order(80, 2, [(41, 1), (90, 0), (41, 1), (0, 0)])
+
+        assert order[:3] == [(41, 1), (0, 0), (0, 1)]
+        assert len(order) == 160
+
+
+class TestGradeEstimator:
+    """Test running grade bounds."""
+
+    def test_clean_disk_decided_early(self):
+        """Test a clean disk is graded A well before every track is read."""
+        estimator = GradeEstimator(total_tracks=160, sectors_per_track=18)
+
+        for _ in range(160):
+            estimator.observe(18, 18)
+            if estimator.is_decided():
+                break
+
+        assert estimator.tracks_read < 100
+        assert estimator.grade() == DiskGrade.EXCELLENT
+        assert estimator.projected_score() == pytest.approx(100.0)
+
+    def test_not_decided_before_min_sample(self):
+        """Test no statistical decision on a handful of tracks."""
+        estimator = GradeEstimator(total_tracks=160, sectors_per_track=18)
+        for _ in range(15):
+            estimator.observe(18, 18)
+
+        assert estimator.score_bounds() == (15 * 18 * 100 / 2880, 100.0)
+        assert not estimator.is_decided()
+
+    def test_certain_failure(self):
+        """Test a disk that cannot reach 50% is failed without statistics."""
+        estimator = GradeEstimator(total_tracks=20, sectors_per_track=18, min_sampled=100)
+        for _ in range(10):
+            estimator.observe(0, 18)
+        assert not estimator.is_decided()
+
+        estimator.observe(0, 18)
+
+        assert estimator.is_decided()
+        assert estimator.grade() == DiskGrade.FAILED
+
+    def test_priority_tracks_not_sampled(self):
+        """Test known-weak tracks count in the totals but not the error rate."""
+        estimator = GradeEstimator(total_tracks=160, sectors_per_track=18)
+        estimator.observe(0, 18, sampled=False)
+        estimator.observe(18, 18)
+
+        assert estimator.good_sectors == 18
+        assert estimator.sampled_tracks == 1
+        assert estimator.sampled_bad_tracks == 0
+
+
+class _FakeDevice:
+    """Device returning encoded tracks, except for tracks chosen to be blank."""
+
+    selected_drive = 0
+
+    def __init__(self, is_blank=lambda cylinder, head: False):
+        self.reads = []
+        self._is_blank = is_blank
+
+    def is_motor_on(self):
+        return True
+
+    def motor_on(self):
+        pass
+
+    def seek(self, cylinder, head):
+        pass
+
+    def read_track(self, cylinder, head, revolutions):
+        self.reads.append((cylinder, head))
+        if self._is_blank(cylinder, head):
+            return FluxData(flux_times=[4000] * 1000, cylinder=cylinder, head=head)
+        sectors = create_pattern_track(cylinder, head, bytes(range(32)))
+        track = MFMEncoder().encode_track(cylinder, head, sectors).flux_array
+        return FluxData(
+            flux_times=np.concatenate([track, track[:len(track) // 5]]),
+            index_positions=[0, int(track.sum())],
+            cylinder=cylinder, head=head,
+        )
+
+
+def _verify(device, early_decision):
+    """Run the worker over a 40-cylinder disk and return its result."""
+    geometry = DiskGeometry(media_type=0x0F, cylinders=40, heads=2,
+                            sectors_per_track=18, bytes_per_sector=512)
+    worker = BatchVerifyWorker(device, geometry, FloppyDiskInfo(index=0), "Quick",
+                               early_decision=early_decision)
+    results = []
+    worker.disk_verified.connect(results.append)
+    worker.run()
+    return results[0]
+
+
+class TestEarlyDecisionRun:
+    """Test the worker stops once the grade is decided."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    def test_clean_disk_stops_early(self):
+        """Test a clean disk is graded A without reading every track."""
+        device = _FakeDevice()
+
+        result = _verify(device, early_decision=True)
+
+        assert result.grade == DiskGrade.EXCELLENT
+        assert result.tracks_skipped > 0
+        assert len(result.track_results) + result.tracks_skipped == 80
+        assert result.grade_confidence == pytest.approx(0.99)
+        assert result.overall_score == pytest.approx(100.0)
+
+    def test_mostly_unreadable_disk_fails(self):
+        """Test a disk with most tracks unreadable is failed early."""
+        device = _FakeDevice(lambda cylinder, head: head == 1 or cylinder >= 20)
+
+        result = _verify(device, early_decision=True)
+
+        assert result.grade == DiskGrade.FAILED
+        assert result.tracks_skipped > 0
+
+    def test_without_early_decision_unchanged(self):
+        """Test the default mode still reads the depth's sample."""
+        device = _FakeDevice()
+
+        result = _verify(device, early_decision=False)
+
+        assert result.tracks_skipped == 0
+        assert len(result.track_results) == 10
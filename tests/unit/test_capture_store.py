@@ -0,0 +1,113 @@
+"""
+Unit tests for the per-track capture store.
+
+Tests splitting reads into revolutions, joining them back, and
+invalidation.
+"""
+
+import numpy as np
+
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.recovery.capture_store import TrackCaptureStore
+
+
+def _read(revolutions, cylinder=5, head=0, seed=0, length=1000):
+    """
+    A Greaseweazle-style read: not index cued, so the index list starts with
+    the partial revolution before the first pulse, then each revolution's ticks.
+    """
+    rng = np.random.default_rng(seed)
+    lead = rng.choice([288, 432, 576], 300)
+    revs = [rng.choice([288, 432, 576], length) for _ in range(revolutions)]
+    index_list = [int(lead.sum())] + [int(r.sum()) for r in revs]
+    return FluxData(flux_times=np.concatenate([lead] + revs + [revs[0][:100]]),
+                    index_positions=index_list, index_cued=False,
+                    cylinder=cylinder, head=head), revs
+
+
+class TestTrackCaptureStore:
+    """Test storing and reusing revolutions."""
+
+    def test_reads_accumulate(self):
+        """Test revolutions from several reads are joined with index pulses between them."""
+        store = TrackCaptureStore()
+        first, first_revs = _read(2)
+        second, second_revs = _read(1, seed=1)
+
+        assert len(store.add(first)) == 2
+        store.add(second)
+
+        assert store.count(5, 0) == 3
+        combined = store.combined(5, 0)
+        expected = np.concatenate(first_revs + second_revs)
+        assert np.array_equal(combined.flux_array, expected)
+        assert combined.index_array.tolist() == [
+            int(r.sum()) for r in first_revs + second_revs
+        ]
+        assert combined.index_cued
+        assert combined.revolutions == 3.0
+        # get_revolution_data also returns the transition spanning the index
+        assert np.array_equal(combined.get_revolution_data(2).flux_array[1:], second_revs[0])
+        assert np.array_equal(store.combined(5, 0, count=1).flux_array, second_revs[0])
+
+    def test_index_cued_intervals(self):
+        """Test an index-cued read lists one interval per revolution, none before."""
+        store = TrackCaptureStore()
+        revs = [np.full(500, 288 + 144 * i) for i in range(3)]
+
+        store.add(FluxData(flux_times=np.concatenate(revs),
+                           index_positions=[int(r.sum()) for r in revs], cylinder=5))
+
+        assert [len(r) for r in store.revolutions(5, 0)] == [500, 500, 500]
+        assert np.array_equal(store.revolutions(5, 0)[2].flux_array, revs[2])
+
+    def test_position_index(self):
+        """Test index positions from software-built captures still split."""
+        store = TrackCaptureStore()
+        revs = [np.full(500, 288), np.full(400, 432)]
+
+        store.add(FluxData(flux_times=np.concatenate(revs),
+                           index_positions=[0, 500 * 288, 500 * 288 + 400 * 432], cylinder=5))
+
+        assert [len(r) for r in store.revolutions(5, 0)] == [500, 400]
+
+    def test_invalidate(self):
+        """Test a write drops only that track's revolutions."""
+        store = TrackCaptureStore()
+        store.add(_read(2)[0])
+        store.add(_read(2, head=1)[0])
+
+        store.invalidate(5, 0)
+
+        assert store.count(5, 0) == 0
+        assert store.combined(5, 0) is None
+        assert store.count(5, 1) == 2
+
+    def test_limits(self):
+        """Test old revolutions and least recently read tracks are dropped."""
+        store = TrackCaptureStore(max_revolutions=3, max_tracks=2)
+        reads = [_read(2, seed=i)[1] for i in range(2)]
+        store.add(_read(2, seed=0)[0])
+        store.add(_read(2, seed=1)[0])
+
+        assert store.count(5, 0) == 3
+        assert np.array_equal(store.revolutions(5, 0)[0].flux_array, reads[0][1])
+
+        store.add(_read(1, cylinder=6)[0])
+        store.add(_read(1, cylinder=5)[0])
+        store.add(_read(1, cylinder=7)[0])
+
+        assert len(store) == 2
+        assert store.count(6, 0) == 0
+        assert store.count(5, 0) == 3
+
+    def test_read_without_index(self):
+        """Test a read without index pulses is kept as one revolution."""
+        store = TrackCaptureStore()
+        flux = FluxData(flux_times=[300] * 50, cylinder=1, head=1)
+
+        store.add(flux)
+        store.add(FluxData(cylinder=1, head=1))
+
+        assert store.count(1, 1) == 1
+        assert store.combined(1, 1).index_array.tolist() == [15000]
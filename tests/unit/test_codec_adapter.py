@@ -0,0 +1,78 @@
+"""
+Unit tests for the codec adapter decode cache.
+
+Tests that repeated decodes of identical flux are served from the shared
+content-keyed cache.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from floppy_formatter.hardware import SectorData, SectorStatus
+from floppy_formatter.hardware import codec_adapter
+from floppy_formatter.hardware.codec_adapter import CodecAdapter, DecodeCache
+from floppy_formatter.hardware.flux_io import FluxData
+
+
+def _flux(seed=0, index_positions=()):
+    """Small random capture."""
+    times = np.random.default_rng(seed).integers(100, 300, 5000)
+    return FluxData(flux_times=times, index_positions=list(index_positions))
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Adapter with a fresh cache and a decode that records its calls."""
+    monkeypatch.setattr(codec_adapter, "_decode_cache", DecodeCache(max_entries=4))
+    adapter = CodecAdapter.__new__(CodecAdapter)
+    adapter._gw_format = 'ibm.1440'
+    adapter._session = SimpleNamespace(sectors_per_track=18, bytes_per_sector=512)
+    adapter.calls = []
+
+    def decode(flux_data, cyl, head):
+        adapter.calls.append((cyl, head))
+        return [SectorData(cyl, head, 1, bytes(512), SectorStatus.GOOD, True, 1.0)]
+
+    adapter._decode_flux = decode
+    return adapter
+
+
+class TestDecodeCache:
+    """Test decode memoization."""
+
+    def test_repeat_decode_is_cached(self, adapter):
+        """Test the same and equal flux decode once."""
+        first = adapter.decode_track(_flux(), 3, 1)
+        again = adapter.decode_track(_flux(), 3, 1)
+
+        assert adapter.calls == [(3, 1)]
+        assert again[0].data == first[0].data
+        assert CodecAdapter.get_decode_cache().get_stats() == {
+            'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': 0
+        }
+
+    def test_key_covers_track_and_content(self, adapter):
+        """Test different tracks, flux or index pulses decode again."""
+        adapter.decode_track(_flux(), 3, 1)
+        adapter.decode_track(_flux(), 3, 0)
+        adapter.decode_track(_flux(seed=1), 3, 1)
+        adapter.decode_track(_flux(index_positions=[0, 1000]), 3, 1)
+
+        assert len(adapter.calls) == 4
+
+    def test_results_are_copies(self, adapter):
+        """Test changing a returned sector does not change the cache."""
+        adapter.decode_track(_flux(), 3, 1)[0].status = SectorStatus.CRC_ERROR
+
+        assert adapter.decode_track(_flux(), 3, 1)[0].status == SectorStatus.GOOD
+
+    def test_bounded(self, adapter):
+        """Test the oldest decode is evicted beyond the limit."""
+        for seed in range(5):
+            adapter.decode_track(_flux(seed), 0, 0)
+        adapter.decode_track(_flux(0), 0, 0)
+
+        assert len(adapter.calls) == 6
+        assert CodecAdapter.get_decode_cache().get_stats()['entries'] == 4
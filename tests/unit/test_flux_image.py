@@ -0,0 +1,412 @@
+"""
+Unit tests for flux-level disk images.
+
+Tests SCP flux cell encoding, SCP loading (both read in full and
+memory-mapped with tracks read on first access) and the streaming
+writers used while reading a disk.
+"""
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+from floppy_formatter.imaging.flux_image import (
+    FluxImage,
+    HFEImage,
+    HFEStreamWriter,
+    SCPImage,
+    SCPStreamWriter,
+    decode_scp_flux,
+    encode_scp_flux,
+    read_disk_to_image,
+)
+from floppy_formatter.imaging.image_formats import ImageFormat, ImageWriteError
+
+# Sample frequency of SCP images at the default resolution
+SCP_FREQ = 40_000_000
+
+
+def _track_flux(cyl, head):
+    """Distinct flux per track so tracks cannot be confused."""
+    flux_times = [144 + cyl, 216 + head, 288] * 50
+    return FluxData(flux_times=flux_times, sample_freq=SCP_FREQ, cylinder=cyl, head=head)
+
+
+@pytest.fixture
+def scp_path(tmp_path):
+    """SCP image with a few tracks written."""
+    image = SCPImage()
+    image.create_blank(cylinders=6, heads=2, revolutions=1)
+    for cyl in (0, 1, 5):
+        for head in (0, 1):
+            image.set_track_flux(cyl, head, _track_flux(cyl, head))
+    path = tmp_path / "disk.scp"
+    image.save(str(path))
+    return path
+
+
+class TestSCPFluxEncoding:
+    """Test SCP flux cell decoding and encoding."""
+
+    def test_decode_big_endian(self):
+        """Test cells are read as big-endian tick counts."""
+        flux = decode_scp_flux(bytes([0x00, 0x90, 0x01, 0x00]))
+
+        assert flux.dtype == np.uint32
+        assert flux.tolist() == [0x90, 0x100]
+
+    def test_decode_folds_overflow(self):
+        """Test zero cells add 65536 ticks to the following cell."""
+        cells = np.array([100, 0, 0, 200, 300, 0], dtype='>u2').tobytes()
+
+        assert decode_scp_flux(cells).tolist() == [100, 2 * 65536 + 200, 300]
+
+    def test_round_trip(self):
+        """Test long intervals survive encoding and decoding."""
+        intervals = [1, 144, 65535, 65536 + 7, 3 * 65536 + 65535, 216]
+
+        encoded = encode_scp_flux(intervals)
+
+        assert len(encoded) == 2 * (len(intervals) + 1 + 3)
+        assert decode_scp_flux(encoded).tolist() == intervals
+
+    def test_track_flux_with_overflow(self, tmp_path):
+        """Test a long no-flux region is kept through save and load."""
+        intervals = [144, 216, 200000, 288]
+        image = SCPImage()
+        image.create_blank(cylinders=1, heads=2, revolutions=1)
+        image.set_track_flux(0, 1, FluxData(flux_times=intervals, sample_freq=SCP_FREQ))
+        path = str(tmp_path / "gap.scp")
+        image.save(path)
+
+        loaded = SCPImage()
+        loaded.load(path)
+        flux = loaded.get_track_flux(0, 1)
+
+        assert flux.flux_times == intervals
+        assert flux.index_positions == [0, sum(intervals)]
+        assert loaded.get_revolution(0, 1, 0).flux_times == intervals
+
+    def test_resolution_sets_sample_freq(self, tmp_path):
+        """Test flux is resampled to the header resolution and read back at it."""
+        image = SCPImage()
+        image.create_blank(cylinders=1, heads=2, revolutions=1)
+        image._header.resolution = 1
+        image.set_track_flux(0, 0, FluxData(flux_times=[144, 216, 288] * 10))
+        path = str(tmp_path / "res.scp")
+        image.save(path)
+
+        loaded = SCPImage()
+        loaded.load(path)
+        flux = loaded.get_track_flux(0, 0)
+
+        assert flux.sample_freq == 20_000_000
+        assert flux.flux_times == [40, 60, 80] * 10
+        assert flux.duration_seconds == pytest.approx(648 * 10 / 72_000_000)
+
+    def test_legacy_little_endian_converted(self, tmp_path):
+        """Test images with little-endian 72MHz cells read as their flux."""
+        image = SCPImage()
+        image.create_blank(cylinders=1, heads=2, revolutions=1)
+        image._track_data[0] = [np.array([144, 216, 288] * 50, dtype='<u2').tobytes()]
+        path = str(tmp_path / "legacy.scp")
+        image.save(path)
+
+        loaded = SCPImage()
+        loaded.load(path)
+        flux = loaded.get_track_flux(0, 0)
+
+        assert flux.flux_times == [80, 120, 160] * 50
+        loaded.save(path)
+        resaved = SCPImage()
+        resaved.load(path)
+        assert resaved.get_track_flux(0, 0).flux_times == flux.flux_times
+
+
+class TestSCPMappedLoad:
+    """Test memory-mapped SCP loading."""
+
+    def test_matches_full_load(self, scp_path):
+        """Test mapped and fully read images return the same flux."""
+        full = SCPImage()
+        full.load(str(scp_path))
+
+        with SCPImage() as mapped:
+            mapped.load(str(scp_path), use_mmap=True)
+            assert mapped.is_mapped
+
+            for cyl in range(6):
+                for head in (0, 1):
+                    expected = full.get_track_flux(cyl, head)
+                    actual = mapped.get_track_flux(cyl, head)
+                    if expected is None:
+                        assert actual is None
+                    else:
+                        assert actual.flux_times == expected.flux_times
+                        assert actual.flux_times == _track_flux(cyl, head).flux_times
+
+        assert not mapped.is_mapped
+
+    def test_reads_tracks_on_access(self, scp_path):
+        """Test only the offset table is parsed until a track is used."""
+        with SCPImage() as scp:
+            scp.load(str(scp_path), use_mmap=True)
+            assert scp._track_data == {}
+
+            scp.get_revolution(1, 0, 0)
+
+            assert list(scp._track_data) == [2]
+
+    def test_save_over_mapped_file(self, scp_path):
+        """Test saving to the mapped file keeps every track."""
+        scp = FluxImage.open(str(scp_path), use_mmap=True)
+        scp.set_track_flux(2, 0, _track_flux(2, 0))
+        scp.save(str(scp_path))
+
+        assert not scp.is_mapped
+
+        reloaded = SCPImage()
+        reloaded.load(str(scp_path))
+        for cyl in (0, 1, 2, 5):
+            assert reloaded.get_track_flux(cyl, 0).flux_times == _track_flux(cyl, 0).flux_times
+
+    def test_checksum_and_validate(self, scp_path):
+        """Test whole-image operations see unread tracks."""
+        full = SCPImage()
+        full.load(str(scp_path))
+
+        with SCPImage() as mapped:
+            mapped.load(str(scp_path), use_mmap=True)
+
+            assert mapped.calculate_checksum() == full.calculate_checksum()
+            assert mapped.validate() == full.validate()
+
+
+def _capture(cyl, head, revolutions=2):
+    """Multi-revolution capture with index pulses at the revolution boundaries."""
+    rev = [144 + cyl, 216 + head, 288, 70000] * 20
+    return FluxData(flux_times=rev * revolutions, sample_freq=SCP_FREQ,
+                    index_positions=[sum(rev) * i for i in range(revolutions + 1)],
+                    cylinder=cyl, head=head)
+
+
+def _hardware_capture(cyl, head, index_cued):
+    """
+    Two revolutions as the drive returns them: index values are the ticks
+    between pulses, led by the partial revolution unless index cued.
+    """
+    revs = [[144 + cyl, 216 + head, 288, 70000] * 20, [288, 216, 144, 70000] * 20]
+    lead = [] if index_cued else [70000, 288] * 5
+    index_list = [sum(rev) for rev in revs]
+    if lead:
+        index_list.insert(0, sum(lead))
+    return FluxData(flux_times=lead + revs[0] + revs[1] + revs[0][:7], sample_freq=SCP_FREQ,
+                    index_positions=index_list, index_cued=index_cued,
+                    cylinder=cyl, head=head), revs
+
+
+class _FakeDevice:
+    """Device returning _capture() flux, optionally failing at one track."""
+
+    def __init__(self, cylinders=3, heads=2, fail_at=None):
+        self.reads = []
+        self._info = SimpleNamespace(cylinders=cylinders, heads=heads, sectors_per_track=18)
+        self._fail_at = fail_at
+
+    def get_drive_info(self):
+        return self._info
+
+    def read_track(self, cyl, head, revolutions=1.0):
+        if (cyl, head) == self._fail_at:
+            raise IOError("read failed")
+        self.reads.append((cyl, head))
+        return _capture(cyl, head)
+
+
+class _MFMDevice(_FakeDevice):
+    """Device returning MFM tracks filled with one byte, so disks can be told apart."""
+
+    def __init__(self, fill, cylinders=2, heads=2, fail_at=None):
+        super().__init__(cylinders, heads, fail_at)
+        self._fill = bytes([fill])
+
+    def read_track(self, cyl, head, revolutions=1.0):
+        super().read_track(cyl, head, revolutions)
+        sectors = create_pattern_track(cyl, head, self._fill)
+        track = MFMEncoder().encode_track(cyl, head, sectors).flux_array
+        return FluxData(flux_times=track, index_positions=[0, int(track.sum())],
+                        cylinder=cyl, head=head)
+
+
+class TestSCPStreamWriter:
+    """Test writing SCP images track by track."""
+
+    def test_round_trip(self, tmp_path):
+        """Test streamed revolutions, index times and checksum read back."""
+        path = str(tmp_path / "disk.scp")
+        with SCPStreamWriter(path, cylinders=2, heads=2, revolutions=2) as writer:
+            for cyl, head in [(0, 0), (0, 1), (1, 1)]:
+                writer.write_track(cyl, head, _capture(cyl, head))
+
+        assert not os.path.exists(path + ".partial")
+        data = open(path, 'rb').read()
+        assert int.from_bytes(data[12:16], 'little') == sum(data[16:]) & 0xFFFFFFFF
+
+        image = SCPImage()
+        image.load(path)
+        for cyl, head in [(0, 0), (0, 1), (1, 1)]:
+            flux = image.get_track_flux(cyl, head)
+            expected = _capture(cyl, head)
+            assert flux.flux_times == expected.flux_times
+            assert flux.index_positions == expected.index_positions
+        assert image.get_track_flux(1, 0) is None
+
+    @pytest.mark.parametrize("index_cued", [True, False])
+    def test_hardware_index_intervals(self, tmp_path, index_cued):
+        """Test a drive capture is stored as its full revolutions."""
+        path = str(tmp_path / "disk.scp")
+        capture, revs = _hardware_capture(0, 1, index_cued)
+        with SCPStreamWriter(path, cylinders=1, heads=2, revolutions=2) as writer:
+            writer.write_track(0, 1, capture)
+
+        image = SCPImage()
+        image.load(path)
+        flux = image.get_track_flux(0, 1)
+
+        assert flux.flux_times == revs[0] + revs[1]
+        assert flux.index_positions == [0, sum(revs[0]), sum(revs[0]) + sum(revs[1])]
+
+    def test_missing_revolutions_stored_empty(self, tmp_path):
+        """Test a capture with fewer revolutions than the header reads back whole."""
+        path = str(tmp_path / "disk.scp")
+        image = SCPImage()
+        image.create_blank(cylinders=1, heads=2, revolutions=3)
+        image.set_track_flux(0, 0, _capture(0, 0, revolutions=1))
+        image.save(path)
+
+        loaded = SCPImage()
+        loaded.load(path)
+
+        assert loaded.get_track_flux(0, 0).flux_times == _capture(0, 0, 1).flux_times
+        assert loaded.validate() == (True, [])
+
+    def test_resume_discards_incomplete_track(self, tmp_path):
+        """Test a resumed partial file keeps only whole tracks."""
+        path = str(tmp_path / "disk.scp")
+        with pytest.raises(RuntimeError):
+            with SCPStreamWriter(path, cylinders=2, heads=2) as writer:
+                writer.write_track(0, 0, _capture(0, 0))
+                raise RuntimeError("interrupted")
+
+        # Data of a track that was never entered in the offset table
+        with open(path + ".partial", 'ab') as f:
+            f.write(b'TRK\x01' + bytes(100))
+
+        with SCPStreamWriter(path, cylinders=2, heads=2, resume=True) as writer:
+            assert writer.completed_tracks == [(0, 0)]
+            writer.write_track(1, 1, _capture(1, 1))
+
+        data = open(path, 'rb').read()
+        assert int.from_bytes(data[12:16], 'little') == sum(data[16:]) & 0xFFFFFFFF
+        image = SCPImage()
+        image.load(path)
+        assert image.get_track_flux(0, 0).flux_times == _capture(0, 0).flux_times
+        assert image.get_track_flux(1, 1).flux_times == _capture(1, 1).flux_times
+
+    def test_resume_rejects_other_geometry(self, tmp_path):
+        """Test a partial file for a different image is not continued."""
+        path = str(tmp_path / "disk.scp")
+        SCPStreamWriter(path, cylinders=2, heads=2).abort()
+
+        with pytest.raises(ImageWriteError):
+            SCPStreamWriter(path, cylinders=80, heads=2, resume=True)
+
+
+class TestHFEStreamWriter:
+    """Test writing HFE images cylinder by cylinder."""
+
+    def test_matches_in_memory_image(self, tmp_path):
+        """Test streamed tracks read back as the in-memory encoding."""
+        path = str(tmp_path / "disk.hfe")
+        with HFEStreamWriter(path, cylinders=2, heads=2) as writer:
+            writer.write_track(0, 0, _capture(0, 0))
+            writer.write_track(0, 1, _capture(0, 1))
+            writer.write_track(1, 0, _capture(1, 0))
+
+        reference = HFEImage()
+        reference.create_blank(cylinders=2, heads=2)
+        loaded = HFEImage()
+        loaded.load(path)
+
+        for cyl, head in [(0, 0), (0, 1), (1, 0)]:
+            expected = reference._flux_to_bits(_capture(cyl, head))
+            track = loaded._track_data[(cyl, head)]
+            assert track[:len(expected)] == expected
+            assert not any(track[len(expected):])
+
+    def test_resume(self, tmp_path):
+        """Test completed cylinders survive an interrupted write."""
+        path = str(tmp_path / "disk.hfe")
+        with pytest.raises(RuntimeError):
+            with HFEStreamWriter(path, cylinders=2, heads=2) as writer:
+                writer.write_track(0, 0, _capture(0, 0))
+                writer.write_track(0, 1, _capture(0, 1))
+                writer.write_track(1, 0, _capture(1, 0))
+                raise RuntimeError("interrupted")
+
+        with HFEStreamWriter(path, cylinders=2, heads=2, resume=True) as writer:
+            assert writer.completed_tracks == [(0, 0), (0, 1)]
+            assert not writer.has_track(1, 0)
+
+
+class TestReadDiskToImage:
+    """Test reading a disk straight into a streamed image."""
+
+    @pytest.mark.parametrize("format_type", [ImageFormat.SCP, ImageFormat.HFE])
+    def test_resumes_after_failure(self, tmp_path, format_type):
+        """Test a second read only captures the tracks the first missed."""
+        path = str(tmp_path / f"disk.{format_type.name.lower()}")
+
+        first = _FakeDevice(fail_at=(2, 0))
+        with pytest.raises(IOError):
+            read_disk_to_image(first, path, format_type)
+        assert os.path.exists(path + ".partial")
+
+        second = _FakeDevice()
+        metadata = read_disk_to_image(second, path, format_type, resume=True)
+
+        # C0 H0 is read again to check the disk is the same one
+        assert second.reads == [(0, 0), (2, 0), (2, 1)]
+        assert metadata.cylinders == 3
+        assert not os.path.exists(path + ".partial")
+        image = FluxImage.open(path)
+        assert image.get_track_flux(2, 1) is not None
+
+    def test_starts_over_by_default(self, tmp_path):
+        """Test a partial image is only resumed when asked to."""
+        path = str(tmp_path / "disk.scp")
+        with pytest.raises(IOError):
+            read_disk_to_image(_FakeDevice(fail_at=(2, 0)), path, ImageFormat.SCP)
+
+        second = _FakeDevice()
+        read_disk_to_image(second, path, ImageFormat.SCP)
+
+        assert len(second.reads) == 6
+
+    @pytest.mark.parametrize("format_type", [ImageFormat.SCP, ImageFormat.HFE])
+    def test_rejects_partial_from_other_disk(self, tmp_path, format_type):
+        """Test a partial image read from another disk is not merged."""
+        path = str(tmp_path / f"disk.{format_type.name.lower()}")
+        with pytest.raises(IOError):
+            read_disk_to_image(_MFMDevice(0x11, fail_at=(1, 0)), path, format_type)
+
+        with pytest.raises(ImageWriteError, match="another disk"):
+            read_disk_to_image(_MFMDevice(0x22), path, format_type, resume=True)
+
+        same = _MFMDevice(0x11)
+        read_disk_to_image(same, path, format_type, resume=True)
+        assert same.reads == [(0, 0), (1, 0), (1, 1)]
@@ -0,0 +1,231 @@
+"""
+Unit tests for flux I/O data structures.
+
+Tests FluxData array storage, the list-compatible views, cached timing
+conversions and revolution extraction.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from floppy_formatter.hardware.flux_io import FluxData, merge_flux_captures
+
+
+def _revolution_flux(revolutions=3, per_rev=1000):
+    """Build flux with evenly sized revolutions and cumulative index positions."""
+    pattern = [144, 216, 288, 144]
+    flux_times = (pattern * (per_rev // len(pattern))) * revolutions
+    rev_samples = sum(pattern) * (per_rev // len(pattern))
+    index_positions = [rev_samples * i for i in range(revolutions + 1)]
+    return FluxData(flux_times=flux_times, index_positions=index_positions)
+
+
+class TestFluxDataStorage:
+    """Test array-backed storage and list compatibility."""
+
+    def test_stores_contiguous_arrays(self):
+        """Test flux and index values are stored as typed arrays."""
+        flux = FluxData(flux_times=[144, 216, 288], index_positions=[0, 648])
+
+        assert flux.flux_array.dtype == np.uint32
+        assert flux.index_array.dtype == np.int64
+        assert flux.flux_array.flags.c_contiguous
+        assert not flux.flux_array.flags.writeable
+
+    def test_list_api_compatibility(self):
+        """Test flux_times still behaves like a list of ints."""
+        flux = FluxData(flux_times=[144, 216, 288])
+
+        assert len(flux.flux_times) == 3
+        assert flux.flux_times[1] == 216
+        assert isinstance(flux.flux_times[0], int)
+        assert list(flux.flux_times) == [144, 216, 288]
+        assert flux.flux_times == [144, 216, 288]
+        assert flux.flux_times.copy() == [144, 216, 288]
+        assert flux.flux_times[1:] == [216, 288]
+        assert bool(flux.flux_times)
+        assert not FluxData().flux_times
+
+    def test_numpy_input_is_not_copied(self):
+        """Test arrays of the storage dtype are wrapped without copying."""
+        source = np.array([144, 216, 288], dtype=np.uint32)
+        flux = FluxData(flux_times=source)
+
+        assert np.shares_memory(flux.flux_array, source)
+        # The caller's array stays writeable
+        assert source.flags.writeable
+
+    def test_reassignment_invalidates_cache(self):
+        """Test replacing flux_times drops cached derived arrays."""
+        flux = FluxData(flux_times=[72, 144], sample_freq=72_000_000)
+        assert flux.get_times_microseconds().tolist() == [1.0, 2.0]
+
+        flux.flux_times = [216]
+
+        assert flux.get_times_microseconds().tolist() == [3.0]
+        assert flux.total_samples == 216
+
+    def test_content_digest(self):
+        """Test equal captures share a digest and any difference changes it."""
+        flux = FluxData(flux_times=[144, 216, 288], index_positions=[0, 648])
+        digest = flux.content_digest()
+
+        assert FluxData(flux_times=np.array([144, 216, 288]),
+                        index_positions=[0, 648]).content_digest() == digest
+        assert FluxData(flux_times=[144, 216, 289],
+                        index_positions=[0, 648]).content_digest() != digest
+        assert FluxData(flux_times=[144, 216, 288]).content_digest() != digest
+
+        flux.flux_times = [144, 216]
+        assert flux.content_digest() != digest
+
+    def test_pickle_round_trip(self):
+        """Test FluxData survives pickling with its arrays intact."""
+        flux = _revolution_flux()
+        restored = pickle.loads(pickle.dumps(flux))
+
+        assert restored == flux
+        assert not restored.flux_array.flags.writeable
+
+
+class TestFluxDataConversions:
+    """Test cached timing conversions and analysis helpers."""
+
+    def test_times_microseconds_cached(self):
+        """Test microsecond conversion is computed once and read-only."""
+        flux = FluxData(flux_times=[144, 216, 288], sample_freq=72_000_000)
+
+        times = flux.get_times_microseconds()
+
+        assert times.dtype == np.float64
+        assert times.tolist() == pytest.approx([2.0, 3.0, 4.0])
+        assert flux.get_times_microseconds() is times
+        assert not times.flags.writeable
+
+    def test_times_nanoseconds(self):
+        """Test nanosecond conversion."""
+        flux = FluxData(flux_times=[72], sample_freq=72_000_000)
+
+        assert flux.get_times_nanoseconds().tolist() == pytest.approx([1000.0])
+
+    def test_resample(self):
+        """Test resampling rescales positions without drift."""
+        flux = FluxData(flux_times=[100] * 9, index_positions=[0, 450, 900])
+
+        resampled = flux.resample(40_000_000)
+
+        assert resampled.sample_freq == 40_000_000
+        assert resampled.total_samples == 500
+        assert set(resampled.flux_times.tolist()) == {55, 56}
+        assert resampled.index_positions == [0, 250, 500]
+        assert flux.resample(72_000_000) is flux
+
+    def test_pulse_histogram_counts(self):
+        """Test histogram bins match a direct count."""
+        flux = FluxData(flux_times=[144] * 10 + [216] * 5 + [288] * 3)
+
+        centers, counts = flux.get_pulse_histogram(bins=50, min_us=1.0, max_us=6.0)
+
+        assert len(centers) == 50
+        assert sum(counts) == 18
+        assert max(counts) == 10
+
+    def test_quality_score_prefers_clean_timing(self):
+        """Test jittery timing scores lower than clean timing."""
+        rng = np.random.default_rng(1)
+        clean = _revolution_flux()
+        jitter = rng.normal(0, 40, len(clean.flux_times))
+        noisy = FluxData(
+            flux_times=np.clip(clean.flux_array + jitter, 1, None).astype(np.uint32),
+            index_positions=clean.index_positions,
+        )
+
+        assert isinstance(clean.calculate_quality_score(), float)
+        assert noisy.calculate_quality_score() < clean.calculate_quality_score()
+
+
+class TestRevolutionExtraction:
+    """Test per-revolution slicing."""
+
+    def test_revolution_matches_reference_loop(self):
+        """Test get_revolution_data matches the original cumulative scan."""
+        flux = _revolution_flux(revolutions=3)
+        times = flux.flux_times.tolist()
+
+        for rev in range(3):
+            start_pos = flux.index_positions[rev]
+            end_pos = flux.index_positions[rev + 1]
+            cumulative, start_idx, end_idx = 0, 0, len(times)
+            for i, t in enumerate(times):
+                if cumulative < start_pos:
+                    start_idx = i
+                cumulative += t
+                if cumulative >= end_pos:
+                    end_idx = i + 1
+                    break
+
+            rev_flux = flux.get_revolution_data(rev)
+
+            assert rev_flux.flux_times == times[start_idx:end_idx]
+            assert rev_flux.index_positions == [0, end_pos - start_pos]
+
+    def test_index_boundaries(self):
+        """Test hardware index intervals and software positions give pulse positions."""
+        flux = FluxData(flux_times=[100] * 10, index_positions=[300, 400, 400],
+                        index_cued=False)
+
+        assert flux.get_index_boundaries().tolist() == [300, 700, 1100]
+
+        flux.index_cued = True
+        assert flux.get_index_boundaries().tolist() == [0, 300, 700, 1100]
+
+        flux.index_positions = [0, 400, 800]
+        assert flux.get_index_boundaries().tolist() == [0, 400, 800]
+
+    def test_revolution_from_hardware_intervals(self):
+        """Test revolutions of a non-cued read start after the first index pulse."""
+        flux = FluxData(flux_times=[100] * 3 + [200] * 4 + [400] * 2,
+                        index_positions=[300, 800, 800], index_cued=False)
+
+        assert flux.get_revolution_data(0).flux_times == [100] + [200] * 4
+        assert flux.get_revolution_data(1).flux_times == [200] + [400] * 2
+
+        # Two 200ms revolutions at 72MHz
+        flux = FluxData(flux_times=[100], index_positions=[14_400_000] * 2)
+        assert flux.calculate_rpm() == pytest.approx(300.0)
+
+    def test_split_revolutions(self):
+        """Test revolutions partition the read between index pulses."""
+        flux = FluxData(flux_times=[100] * 3 + [200] * 4 + [400] * 2 + [50],
+                        index_positions=[300, 800, 800], index_cued=False)
+
+        revs = flux.split_revolutions()
+
+        assert [rev.flux_times for rev in revs] == [[200] * 4, [400] * 2]
+        assert [rev.index_positions for rev in revs] == [[0, 800], [0, 800]]
+        assert len(flux.split_revolutions(limit=1)) == 1
+
+        whole = FluxData(flux_times=[100] * 5).split_revolutions()
+        assert [rev.index_positions for rev in whole] == [[0, 500]]
+        assert FluxData().split_revolutions() == []
+
+    def test_revolution_out_of_range(self):
+        """Test requesting a missing revolution raises ValueError."""
+        flux = _revolution_flux(revolutions=2)
+
+        with pytest.raises(ValueError):
+            flux.get_revolution_data(2)
+
+    def test_merge_uses_median(self):
+        """Test merging captures takes the per-position median."""
+        captures = [
+            FluxData(flux_times=[144, 216]),
+            FluxData(flux_times=[146, 216]),
+            FluxData(flux_times=[400, 216, 288]),
+        ]
+
+        merged = merge_flux_captures(captures)
+
+        assert merged.flux_times == [146, 216]
@@ -0,0 +1,148 @@
+"""
+Unit tests for the format worker's track encoding.
+
+Tests that pattern tracks are encoded once per (track, pattern) through
+the shared cache, that the next track is encoded on the background
+encoder while the current one is written, and that the flux written is
+the flux the encoder produces.
+"""
+
+import threading
+
+import pytest
+
+from floppy_formatter.core.geometry import DiskGeometry
+from floppy_formatter.gui.workers import format_worker
+from floppy_formatter.gui.workers.format_worker import (
+    EncodedTrackCache,
+    FormatType,
+    FormatWorker,
+)
+from floppy_formatter.hardware import mfm_codec
+from floppy_formatter.hardware.flux_io import FluxData
+
+GEOMETRY = DiskGeometry(media_type=0x0F, cylinders=3, heads=2,
+                        sectors_per_track=18, bytes_per_sector=512)
+
+
+class _FakeDevice:
+    """Device that accepts seeks; writes are recorded by the patched helpers."""
+
+    selected_drive = 0
+
+    def is_motor_on(self):
+        return True
+
+    def motor_on(self):
+        pass
+
+    def seek(self, cylinder, head):
+        pass
+
+
+@pytest.fixture
+def format_run(monkeypatch):
+    """Run a format with recorded encodes and writes, returning the events."""
+    events = []
+    encoded = {}
+    overlap = threading.Event()
+    encode = mfm_codec.encode_sectors_to_flux
+
+    def recording_encode(cylinder, head, sectors):
+        events.append(('encode', cylinder, head, sectors[0].data[0],
+                       threading.current_thread().name))
+        encoded.setdefault((cylinder, head), threading.Event()).set()
+        return encode(cylinder, head, sectors)
+
+    def recording_write(device, cylinder, head, flux):
+        # Optionally hold the write of track N until track N+1 is encoded
+        following = (cylinder + head, 1 - head)
+        if overlap.is_set() and following[0] < GEOMETRY.cylinders:
+            encoded.setdefault(following, threading.Event()).wait(timeout=2.0)
+        events.append(('write', cylinder, head, flux))
+
+    monkeypatch.setattr(mfm_codec, 'encode_sectors_to_flux', recording_encode)
+    monkeypatch.setattr('floppy_formatter.hardware.write_track_flux', recording_write)
+    monkeypatch.setattr('floppy_formatter.hardware.erase_track_flux', lambda *args: None)
+    monkeypatch.setattr(format_worker, '_encoded_track_cache', EncodedTrackCache())
+
+    def run(format_type, wait_for_next=False):
+        if wait_for_next:
+            overlap.set()
+        worker = FormatWorker(_FakeDevice(), geometry=GEOMETRY, verify=False,
+                              format_type=format_type)
+        results = []
+        worker.format_complete.connect(results.append)
+        worker.run()
+        return results[0], events
+
+    return run
+
+
+class TestFormatEncoding:
+    """Test background encoding and the encoded track cache."""
+
+    def test_repeated_pattern_encoded_once(self, format_run):
+        """Test secure erase encodes its repeated pattern once per track."""
+        result, events = format_run(FormatType.SECURE_ERASE)
+
+        encodes = [e for e in events if e[0] == 'encode']
+        writes = [e for e in events if e[0] == 'write']
+        assert result.tracks_formatted == 6
+        assert len(encodes) == 6 * 4
+        assert len(writes) == 6 * 5
+
+        # Same flux object for both zero passes of a track
+        first_track = [w[3] for w in writes if w[1:3] == (0, 0)]
+        assert first_track[0] is first_track[4]
+
+    def test_next_track_encoded_in_background(self, format_run):
+        """Test encoding runs on the encoder thread ahead of the writes."""
+        _, events = format_run(FormatType.STANDARD, wait_for_next=True)
+
+        encodes = [e for e in events if e[0] == 'encode']
+        assert {e[4] for e in encodes} == {'track-encode_0'}
+
+        # Each track after the first is encoded before the previous write ends
+        tracks = [(c, h) for c in range(3) for h in range(2)]
+        for previous, track in zip(tracks, tracks[1:], strict=False):
+            encoded_at = events.index(next(e for e in encodes if e[1:3] == track))
+            written_at = next(i for i, e in enumerate(events)
+                              if e[0] == 'write' and e[1:3] == previous)
+            assert encoded_at < written_at
+
+    def test_written_flux_matches_encoder(self, format_run):
+        """Test the cached flux is what the encoder produces for the track."""
+        _, events = format_run(FormatType.STANDARD)
+
+        write = next(e for e in events if e[0] == 'write' and e[1:3] == (2, 1))
+        worker = FormatWorker(_FakeDevice(), geometry=GEOMETRY, verify=False)
+        expected = worker._encode_pattern(2, 1, format_worker.PATTERN_E5)
+
+        assert write[3].flux_times == expected.flux_times
+
+    def test_repeat_run_hits_cache(self, format_run):
+        """Test formatting again is served without encoding."""
+        format_run(FormatType.STANDARD)
+        _, events = format_run(FormatType.STANDARD)
+
+        assert len([e for e in events if e[0] == 'encode']) == 6
+        assert format_worker._encoded_track_cache.get_stats()['hits'] == 6
+
+
+class TestEncodedTrackCache:
+    """Test the memory bound of the encoded track cache."""
+
+    def test_evicts_oldest_over_budget(self):
+        """Test the least recently used entries go first."""
+        flux = FluxData(flux_times=[100] * 256)
+        cache = EncodedTrackCache(max_bytes=2 * flux.flux_array.nbytes)
+
+        cache.put('a', flux)
+        cache.put('b', flux)
+        cache.get('a')
+        cache.put('c', flux)
+
+        assert cache.get('b') is None
+        assert cache.get('a') is flux
+        assert cache.get_stats()['entries'] == 2
@@ -0,0 +1,250 @@
+"""
+Unit tests for position-aware seeking in the Greaseweazle device.
+
+Tests that seeks to the current track are skipped, head changes on the
+same cylinder only switch heads, reads after an explicit seek send no
+extra commands, idle drives are re-selected, and settle times are
+calibrated from reads taken right after the settle.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from floppy_formatter.hardware import GreaseweazleError, SeekError
+from floppy_formatter.hardware import drive_calibration, greaseweazle_device
+from floppy_formatter.hardware.drive_calibration import calibrate_settle_times
+from floppy_formatter.hardware.greaseweazle_device import (
+    GreaseweazleDevice,
+    HEAD_SETTLE_TIME,
+    SEEK_SETTLE_TIME,
+)
+
+REVOLUTION_SECONDS = 0.2
+
+
+class _FakeClock:
+    """Stands in for the time module; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _FakeUnit:
+    """
+    Greaseweazle unit recording commands.
+
+    If the head moved less than the required settle time before a read,
+    the first transitions read are damaged: pairs merge into one long
+    interval. By default 1% of the track is damaged.
+    """
+
+    def __init__(self, clock, step_needs=0.0, head_needs=0.0, transitions=1000,
+                 timings=None, damaged=None):
+        self.clock = clock
+        self.commands = []
+        self.needs = {'step': step_needs, 'head': head_needs}
+        self.timings = timings if timings is not None else [144] * transitions
+        self.damaged = damaged if damaged is not None else len(self.timings) // 100
+        self.fail_seek = False
+        self._moved = ('step', clock.now)
+
+    def drive_select(self, unit):
+        self.commands.append(('select', unit))
+
+    def seek(self, cylinder, head):
+        if self.fail_seek:
+            raise IOError("track 0 not found")
+        self.commands.append(('seek', cylinder, head))
+        self._moved = ('step', self.clock.now)
+
+    def _send_cmd(self, cmd):
+        self.commands.append(('head', cmd[2]))
+        self._moved = ('head', self.clock.now)
+
+    def read_track(self, revs):
+        self.commands.append(('read',))
+        kind, moved_at = self._moved
+        settled = self.clock.now - moved_at >= self.needs[kind] - 1e-9
+        timings = list(self.timings)
+        if not settled:
+            timings[:self.damaged] = [288] * (self.damaged // 2)
+        self.clock.now += revs * REVOLUTION_SECONDS
+        return SimpleNamespace(list=timings, sample_freq=72_000_000,
+                               index_list=[sum(timings)], index_cued=True)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(greaseweazle_device, 'time', fake)
+    monkeypatch.setattr(greaseweazle_device, 'GREASEWEAZLE_AVAILABLE', True)
+    return fake
+
+
+def _device(clock, **unit_kwargs):
+    """Connected device with drive 0 selected and the motor running."""
+    device = GreaseweazleDevice()
+    device._unit = _FakeUnit(clock, **unit_kwargs)
+    device._selected_drive = 0
+    device._motor_running = True
+    return device
+
+
+class TestSeek:
+    """Test position-aware seeking."""
+
+    def test_repeat_seek_skipped(self, clock):
+        """Test seeking to the current track sends nothing and does not settle."""
+        device = _device(clock)
+        device.seek(5, 0)
+        device._unit.commands.clear()
+        clock.sleeps.clear()
+
+        device.seek(5, 0)
+
+        assert device._unit.commands == []
+        assert clock.sleeps == []
+        stats = device.get_seek_stats()
+        assert (stats.requests, stats.skipped) == (2, 1)
+
+    def test_head_only_switch(self, clock):
+        """Test the other head of the same cylinder is selected without a seek."""
+        device = _device(clock)
+        device.seek(5, 0)
+        device._unit.commands.clear()
+        clock.sleeps.clear()
+
+        device.seek(5, 1)
+
+        assert device._unit.commands == [('head', 1)]
+        assert clock.sleeps == [HEAD_SETTLE_TIME]
+        assert device.get_current_position() == (5, 1)
+        assert device.get_seek_stats().head_switches == 1
+
+    def test_step_settles_longest_applicable_time(self, clock):
+        """Test a step that also changes head waits for the longer settle."""
+        device = _device(clock)
+        device.set_settle_times(step=0.004, head=0.008)
+        device.seek(5, 0)
+        clock.sleeps.clear()
+
+        device.seek(6, 0)
+        device.seek(7, 1)
+
+        assert clock.sleeps == [0.004, 0.008]
+        stats = device.get_seek_stats()
+        assert stats.cylinder_seeks == 3
+        assert stats.cylinders_stepped == 5 + 1 + 1
+        assert device.settle_times == (0.004, 0.008)
+
+    def test_read_after_seek_sends_only_read(self, clock):
+        """Test a read of the track just sought to re-sends neither seek nor head."""
+        device = _device(clock)
+        device.seek(12, 1)
+        device._unit.commands.clear()
+
+        flux = device.read_track(12, 1, revolutions=1)
+
+        assert device._unit.commands == [('read',)]
+        assert flux.transition_count == 1000
+
+    def test_idle_drive_reselected(self, clock):
+        """Test a drive left idle is re-selected and its head re-asserted."""
+        device = _device(clock)
+        device.seek(5, 0)
+        device._unit.commands.clear()
+
+        clock.now += 5.0
+        device.seek(5, 0)
+
+        assert device._unit.commands == [('select', 0), ('head', 0)]
+        assert device.get_seek_stats().reselects == 2
+
+    def test_failed_seek_forgets_position(self, clock):
+        """Test the next seek is not skipped after a failed one."""
+        device = _device(clock)
+        device.seek(5, 0)
+        device._unit.fail_seek = True
+
+        with pytest.raises(SeekError):
+            device.seek(9, 0)
+
+        assert device.get_current_position() == (None, None)
+
+    def test_negative_settle_time_rejected(self, clock):
+        """Test settle times cannot be negative."""
+        device = _device(clock)
+
+        with pytest.raises(ValueError):
+            device.set_settle_times(head=-0.001)
+        assert device.settle_times == (SEEK_SETTLE_TIME, HEAD_SETTLE_TIME)
+
+
+class TestCalibrateSettleTimes:
+    """Test settle time calibration."""
+
+    def test_shortest_passing_time_with_margin(self, clock):
+        """Test the shortest clean settle, plus margin, is applied to the device."""
+        device = _device(clock, step_needs=0.006, head_needs=0.010, transitions=100_000)
+
+        result = calibrate_settle_times(device)
+
+        assert result.step_settle_ms == pytest.approx(9.0)
+        assert result.head_settle_ms == pytest.approx(15.0)
+        assert result.saved_per_head_switch_ms == pytest.approx(15.0)
+        assert result.reference_transitions == 100_000
+        assert device.settle_times == pytest.approx((0.009, 0.015))
+
+    def test_damage_after_settle_detected(self, clock):
+        """Test flux lost just after the settle fails though the revolution count barely moves."""
+        device = _device(clock, step_needs=0.006, transitions=100_000)
+        device.set_settle_times(step=0.003)
+        device.seek(39, 0)
+        device.seek(40, 0)
+
+        unsettled = device.read_track(40, 0, revolutions=1).transition_count
+
+        assert unsettled == pytest.approx(100_000, rel=0.01)
+        assert calibrate_settle_times(device).step_settle_ms == pytest.approx(9.0)
+
+    def test_moderate_damage_in_first_window(self, clock):
+        """Test a first window 8% short fails though sparser parts of the track read lower."""
+        # 4ms windows hold 2000 transitions at the start, 1333 further in
+        timings = [144] * 3000 + [216] * 4000
+        device = _device(clock, step_needs=0.006, timings=timings, damaged=320)
+        device.set_settle_times(step=0.003)
+        device.seek(39, 0)
+        device.seek(40, 0)
+        unsettled = device.read_track(40, 0, revolutions=1)
+
+        width = drive_calibration.SETTLE_WINDOW_MS / 1000 * unsettled.sample_freq
+        assert drive_calibration._window_transitions(unsettled, 0, width) == 1840
+        assert calibrate_settle_times(device).step_settle_ms == pytest.approx(9.0)
+
+    def test_capped_at_defaults(self, clock):
+        """Test a drive needing long settles keeps the defaults."""
+        device = _device(clock, step_needs=0.011, head_needs=0.025, transitions=100_000)
+
+        result = calibrate_settle_times(device, apply=False)
+
+        assert result.step_settle_ms == pytest.approx(SEEK_SETTLE_TIME * 1000)
+        assert result.head_settle_ms == pytest.approx(HEAD_SETTLE_TIME * 1000)
+        assert device.settle_times == (SEEK_SETTLE_TIME, HEAD_SETTLE_TIME)
+
+    def test_blank_track_rejected(self, clock):
+        """Test calibration needs flux to compare against."""
+        device = _device(clock, transitions=0)
+        device.set_settle_times(step=0.005)
+
+        with pytest.raises(GreaseweazleError):
+            calibrate_settle_times(device)
+        assert device.settle_times == (0.005, HEAD_SETTLE_TIME)
@@ -0,0 +1,77 @@
+"""
+Unit tests for the shared LRU cache.
+
+Tests eviction by entry count and by memory, validity checks on lookup
+and the statistics kept across concurrent use.
+"""
+
+import threading
+
+import pytest
+
+from floppy_formatter.hardware.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test bounds, validity and statistics."""
+
+    def test_evicts_by_entries(self):
+        """Test the least recently used entry goes beyond max_entries."""
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get_stats() == {
+            'hits': 2, 'misses': 1, 'evictions': 1, 'entries': 2, 'bytes': 0
+        }
+
+    def test_evicts_by_bytes_keeps_newest(self):
+        """Test memory is bounded but an oversized newest entry stays."""
+        cache = LRUCache(max_bytes=10, size_of=len)
+        cache.put('a', b'x' * 6)
+        cache.put('a', b'x' * 4)
+        cache.put('b', b'x' * 6)
+        assert cache.get_stats()['bytes'] == 10
+
+        cache.put('c', b'x' * 20)
+
+        assert len(cache) == 1
+        assert cache.get_stats()['bytes'] == 20
+
+    def test_invalid_entry_is_miss(self):
+        """Test an entry rejected by is_valid is dropped on lookup."""
+        cache = LRUCache(is_valid=lambda value: value > 0)
+        cache.put('a', 0)
+
+        assert cache.get('a') is None
+        assert len(cache) == 0
+        assert cache.get_stats()['misses'] == 1
+
+    def test_max_bytes_needs_size(self):
+        """Test a memory bound without a size function is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_bytes=10)
+
+    def test_concurrent_use(self):
+        """Test counters and bounds hold with several threads."""
+        cache = LRUCache(max_entries=8)
+
+        def work(offset):
+            for i in range(500):
+                key = (offset + i) % 16
+                if cache.get(key) is None:
+                    cache.put(key, i)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats['hits'] + stats['misses'] == 2000
+        assert stats['entries'] == 8
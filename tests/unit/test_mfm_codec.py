@@ -0,0 +1,315 @@
+"""
+Unit tests for the MFM codec.
+
+Tests bit stream packing, flux-to-bit conversion, sync detection,
+encode/decode round trips and CRC error correction.
+"""
+
+import numpy as np
+import pytest
+from bitarray import bitarray
+
+from floppy_formatter.hardware import SectorStatus
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import (
+    A1_SYNC,
+    A1_SYNC_PATTERN,
+    MFMBitstream,
+    MFMDecoder,
+    MFMEncoder,
+    create_pattern_track,
+)
+from floppy_formatter.hardware.mfm_tables import (
+    MFM_DECODE_TABLE,
+    correct_crc_errors,
+    crc16_ccitt,
+    mfm_decode_bits,
+    mfm_decode_bytes,
+)
+
+
+def _reference_from_flux(times_us, bit_cell_us):
+    """Original per-transition flux-to-bits conversion."""
+    bits = []
+    accumulated = 0.0
+    for time_us in times_us:
+        accumulated += time_us
+        if accumulated < bit_cell_us * 1.25:
+            continue
+        num_cells = max(2, min(4, round(accumulated / bit_cell_us)))
+        bits.extend([0] * (num_cells - 1))
+        bits.append(1)
+        accumulated = 0.0
+    return bits
+
+
+def _crc_field(size=512, seed=0):
+    """A1 A1 A1 FB + random data + CRC."""
+    data = b'\xa1\xa1\xa1\xfb' + np.random.default_rng(seed).bytes(size)
+    crc = crc16_ccitt(data)
+    return data + bytes([crc >> 8, crc & 0xFF])
+
+
+def _flip(field, *positions):
+    """Flip bits of a field, MSB first."""
+    damaged = bytearray(field)
+    for position in positions:
+        damaged[position >> 3] ^= 0x80 >> (position & 7)
+    return bytes(damaged)
+
+
+def _shifted_track(*shifts):
+    """
+    Encode a track and move flux transitions by fractions of a bit cell.
+
+    Each shift is (length of pulse before, length of pulse after, cells):
+    the first transition after pulse 20000 between pulses of those
+    lengths (in cells) moves later by cells.
+    """
+    sectors = create_pattern_track(5, 1, bytes(range(32)))
+    track = MFMEncoder(bit_cell_us=1.0).encode_track(5, 1, sectors).flux_array.astype(np.int64)
+    cell = 72
+    start = 20000
+    for before, after, cells in shifts:
+        i = start
+        while not (track[i] == before * cell and track[i + 1] == after * cell):
+            i += 1
+        track[i] += round(cells * cell)
+        track[i + 1] -= round(cells * cell)
+        start = i + 300
+    return sectors, FluxData(flux_times=track.astype(np.uint32), cylinder=5, head=1)
+
+
+def _encoded_track(seed=0, jitter=3.0):
+    """Encode an 18-sector track and add timing jitter."""
+    sectors = create_pattern_track(5, 1, bytes(range(seed, seed + 32)))
+    flux = MFMEncoder(bit_cell_us=1.0).encode_track(5, 1, sectors)
+    rng = np.random.default_rng(seed)
+    times = flux.flux_array + rng.normal(0, jitter, len(flux.flux_array))
+    return sectors, FluxData(
+        flux_times=np.clip(times, 1, None).astype(np.uint32), cylinder=5, head=1
+    )
+
+
+class TestMFMTables:
+    """Test shared decode table and CRC helpers."""
+
+    def test_decode_table_uses_data_bits(self):
+        """Test every table entry matches a bit-by-bit decode."""
+        for word in range(0, 0x10000, 97):
+            expected = 0
+            for i in range(8):
+                expected = (expected << 1) | ((word >> (14 - 2 * i)) & 1)
+            assert MFM_DECODE_TABLE[word] == expected
+
+    def test_decode_bytes_ignores_trailing_byte(self):
+        """Test raw MFM words decode and an odd trailing byte is dropped."""
+        assert mfm_decode_bytes(b'\x44\x89\x55\x54\x12') == b'\xa1\xfe'
+
+    def test_decode_bits_unaligned(self):
+        """Test decoding from a bit offset that is not byte aligned."""
+        stream = MFMBitstream()
+        stream.write_bytes(b'\x4e')
+        stream.bits.insert(0, 0)
+        stream.bits.insert(0, 1)
+        stream.bits.insert(0, 1)
+        stream.write_bytes(b'\x12\x34')
+
+        assert mfm_decode_bits(stream.bits, 3, 3) == b'\x4e\x12\x34'
+
+    def test_crc_ccitt_check_value(self):
+        """Test the standard CRC-CCITT-FALSE check value and zero residue."""
+        assert crc16_ccitt(b'123456789') == 0x29B1
+        assert crc16_ccitt(b'56789', crc16_ccitt(b'1234')) == 0x29B1
+        assert crc16_ccitt(b'123456789\x29\xb1') == 0
+
+
+class TestMFMBitstream:
+    """Test packed bit stream behaviour."""
+
+    def test_bits_are_packed(self):
+        """Test bits are stored in a bitarray, including list input."""
+        stream = MFMBitstream(bits=[0, 1, 0, 1])
+
+        assert isinstance(stream.bits, bitarray)
+        assert stream.read_bits(4) == [0, 1, 0, 1]
+
+    def test_sync_pattern_decodes_to_a1(self):
+        """Test the written sync mark is 0x4489 and carries A1 data bits."""
+        stream = MFMBitstream()
+        stream.write_a1_sync()
+
+        assert int(stream.bits.to01(), 2) == A1_SYNC_PATTERN
+        assert stream.read_byte() == A1_SYNC
+
+    def test_find_a1_sync(self):
+        """Test sync search honours the current position."""
+        stream = MFMBitstream()
+        stream.write_bytes(b'\x4e' * 4)
+        stream.write_a1_sync()
+        stream.write_bytes(b'\x00' * 2)
+        stream.write_a1_sync()
+        stream.write_bytes(b'\x00')
+
+        first = stream.find_a1_sync()
+        stream.seek(first + 1)
+        second = stream.find_a1_sync()
+
+        assert first == 64
+        assert second == 64 + 16 + 32
+        stream.seek(second + 1)
+        assert stream.find_a1_sync() == -1
+
+    @pytest.mark.parametrize("noise", [0, 40])
+    def test_from_flux_matches_reference(self, noise):
+        """Test vectorized conversion matches the per-transition loop."""
+        rng = np.random.default_rng(noise)
+        times = rng.choice([144, 216, 288], 5000).astype(float)
+        times += rng.normal(0, 12, len(times))
+        if noise:
+            times[rng.choice(len(times), noise, replace=False)] = rng.uniform(5, 80, noise)
+        flux = FluxData(flux_times=np.clip(times, 1, None).astype(np.uint32))
+
+        stream = MFMBitstream.from_flux(flux, 1.0)
+
+        expected = _reference_from_flux(flux.get_times_microseconds().tolist(), 1.0)
+        assert stream.bits.tolist() == expected
+
+    def test_to_flux_round_trip(self):
+        """Test bits survive conversion to flux and back."""
+        stream = MFMBitstream()
+        stream.write_a1_sync()
+        stream.write_bytes(bytes(range(64)), previous_bit=1)
+        stream.write_a1_sync()
+
+        flux = stream.to_flux(72_000_000, 1.0)
+        restored = MFMBitstream.from_flux(flux, 1.0)
+
+        assert restored.bits == stream.bits
+
+
+class TestMFMDecoder:
+    """Test full track decoding."""
+
+    def test_decode_encoded_track(self):
+        """Test an encoded track decodes with every sector CRC-valid."""
+        sectors, flux = _encoded_track()
+
+        decoded = MFMDecoder(1.0).decode_track(flux)
+
+        assert [s.sector for s in decoded] == list(range(1, 19))
+        assert all(s.crc_valid for s in decoded)
+        assert decoded[0].data == sectors[0].data
+
+
+class TestCRCCorrection:
+    """Test CRC syndrome error correction."""
+
+    @pytest.mark.parametrize("position", [32, 1000, 4127, 4143])
+    def test_single_bit(self, position):
+        """Test any single flipped bit rated suspect is corrected."""
+        field = _crc_field()
+        confidence = np.ones(len(field) * 8)
+        confidence[position] = 0.1
+
+        corrected, positions = correct_crc_errors(_flip(field, position), 32, confidence)
+
+        assert corrected == field
+        assert positions == [position]
+
+    def test_header_single_bit_blind(self):
+        """Test a single flipped bit of a header is corrected without confidence."""
+        field = _crc_field(size=4)
+
+        corrected, positions = correct_crc_errors(_flip(field, 50), 32)
+
+        assert corrected == field
+        assert positions == [50]
+
+    def test_adjacent_bits(self):
+        """Test two adjacent suspect bits are corrected."""
+        field = _crc_field()
+        confidence = np.ones(len(field) * 8)
+        confidence[1990:2010] = 0.2
+
+        corrected, positions = correct_crc_errors(_flip(field, 2000, 2001), 32, confidence)
+
+        assert corrected == field
+        assert positions == [2000, 2001]
+
+    def test_data_field_not_corrected_blind(self):
+        """Test data fields are never corrected without per-bit confidence."""
+        field = _crc_field()
+        rng = np.random.default_rng(1)
+
+        assert correct_crc_errors(_flip(field, 1000), 32) is None
+        for _ in range(200):
+            damaged = bytearray(field)
+            for offset in rng.choice(np.arange(4, 516), 6, replace=False):
+                damaged[offset] ^= int(rng.integers(1, 256))
+            assert correct_crc_errors(bytes(damaged), 32) is None
+
+    def test_header_double_bit(self):
+        """Test any two bits of a header field are corrected."""
+        field = _crc_field(size=4)
+
+        corrected, positions = correct_crc_errors(_flip(field, 35, 70), 32)
+
+        assert corrected == field
+        assert positions == [35, 70]
+
+    def test_confidence_selects_pair(self):
+        """Test per-bit confidence picks out distant flipped bits."""
+        field = _crc_field()
+        damaged = _flip(field, 500, 3000)
+        confidence = np.ones(len(field) * 8)
+        confidence[[500, 3000]] = 0.1
+
+        assert correct_crc_errors(damaged, 32) is None
+        assert correct_crc_errors(damaged, 32, confidence)[0] == field
+
+    def test_confident_bits_not_flipped(self):
+        """Test a bit rated reliable is not blamed for the error."""
+        damaged = _flip(_crc_field(), 1000)
+
+        assert correct_crc_errors(damaged, 32, np.ones(len(damaged) * 8)) is None
+
+    def test_uncorrectable(self):
+        """Test intact fields and errors in the prefix are left alone."""
+        field = _crc_field()
+
+        assert correct_crc_errors(field, 32) is None
+        assert correct_crc_errors(_flip(field, 10), 32) is None
+
+    def test_decoder_corrects_weak_transition(self):
+        """Test a transition shifted off the cell grid is corrected in decode."""
+        sectors, flux = _shifted_track((3, 3, 0.6))
+
+        decoded = MFMDecoder(1.0).decode_track(flux)
+
+        fixed = [s for s in decoded if s.corrected_bits]
+        assert len(fixed) == 1
+        assert fixed[0].data == sectors[fixed[0].sector - 1].data
+        assert fixed[0].status == SectorStatus.CORRECTED
+        assert not fixed[0].crc_valid and not fixed[0].is_good
+        assert fixed[0].signal_quality < 1.0
+        assert all(s.crc_valid for s in decoded if s is not fixed[0])
+
+    def test_decoder_uses_timing_confidence(self):
+        """Test two distant weak transitions are located by their timing."""
+        sectors, flux = _shifted_track((3, 3, 0.6), (3, 3, 0.6))
+
+        decoded = MFMDecoder(1.0).decode_track(flux)
+
+        fixed = [s for s in decoded if s.corrected_bits]
+        assert [s.corrected_bits for s in fixed] == [2]
+        assert fixed[0].data == sectors[fixed[0].sector - 1].data
+
+    def test_decoder_rejects_bit_slip(self):
+        """Test a sector damaged beyond two bits stays a CRC error."""
+        _, flux = _shifted_track((4, 3, 0.6))
+
+        decoded = MFMDecoder(1.0).decode_track(flux)
+
+        assert any(not s.crc_valid for s in decoded)
+        assert not any(s.corrected_bits for s in decoded)
@@ -0,0 +1,321 @@
+"""
+Unit tests for multi-capture recovery.
+
+Tests column-wise bit voting against a per-position reference, the
+aligned timing matrix, capturing until a track converges and capture
+quality scoring.
+"""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from floppy_formatter.hardware import SectorData, SectorStatus
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+from floppy_formatter.recovery import multi_capture
+from floppy_formatter.recovery.multi_capture import (
+    AlignedCaptures,
+    calculate_capture_quality,
+    capture_until_converged,
+    estimate_recovery_potential,
+    multi_capture_recover_sector,
+    reconstruct_from_captures,
+)
+
+
+def _aligned(timings, quality_weights=None):
+    """Wrap per-capture timing arrays in AlignedCaptures."""
+    return AlignedCaptures(
+        aligned_timings=[np.asarray(t, dtype=np.float64) for t in timings],
+        reference_index=0,
+        alignment_offsets=[0] * len(timings),
+        common_length=min(len(t) for t in timings),
+        sample_rate=72_000_000,
+        cylinder=0,
+        head=0,
+        capture_count=len(timings),
+        quality_weights=quality_weights or [],
+    )
+
+
+def _vote_position(timings):
+    """Per-position vote as the original reconstruction loop computed it."""
+    def pulse(t):
+        return '2T' if t < 5.0 else '3T' if t < 7.0 else '4T'
+
+    votes = {}
+    for t in timings:
+        votes[pulse(t)] = votes.get(pulse(t), 0) + 1
+    winner = max(votes, key=lambda k: votes[k])
+    matching = [t for t in timings if pulse(t) == winner]
+    return statistics.median(matching), votes[winner] / len(timings), votes[winner]
+
+
+def _noisy_captures(count, length=2000, seed=0):
+    """MFM-like captures with jitter and some unstable positions."""
+    rng = np.random.default_rng(seed)
+    track = rng.choice([4.0, 6.0, 8.0], length)
+    captures = []
+    for _ in range(count):
+        timings = track + rng.normal(0, 0.4, length)
+        weak = rng.choice(length, 100, replace=False)
+        timings[weak] = rng.uniform(2.0, 10.0, 100)
+        captures.append(timings)
+    return captures
+
+
+class TestBitVoting:
+    """Test column-wise voting."""
+
+    @pytest.mark.parametrize("count", [2, 3, 4, 11])
+    def test_matches_per_position_vote(self, count):
+        """Test timings, confidence and votes match the per-position vote."""
+        captures = _noisy_captures(count)
+
+        result = reconstruct_from_captures(_aligned(captures))
+
+        expected = [_vote_position([c[i] for c in captures]) for i in range(2000)]
+        assert result.flux_timings == [e[0] for e in expected]
+        assert result.confidence_map == [e[1] for e in expected]
+        assert result.vote_counts == [e[2] for e in expected]
+        assert (result.high_confidence_count + result.medium_confidence_count
+                + result.low_confidence_count) == 2000
+
+    def test_tie_goes_to_first_capture(self):
+        """Test a tied vote picks the pulse type of the earliest capture."""
+        result = reconstruct_from_captures(_aligned([[6.1, 4.0], [4.1, 6.0]]))
+
+        assert result.flux_timings == [6.1, 4.0]
+        assert result.confidence_map == [0.5, 0.5]
+
+    def test_quality_weights(self):
+        """Test a high-quality capture outvotes two poor ones."""
+        captures = [[8.0] * 5, [4.0] * 5, [4.2] * 5]
+
+        unweighted = reconstruct_from_captures(_aligned(captures))
+        weighted = reconstruct_from_captures(_aligned(captures, [1.0, 0.3, 0.3]))
+
+        assert unweighted.flux_timings == [4.1] * 5
+        assert weighted.flux_timings == [8.0] * 5
+        assert weighted.vote_counts == [1] * 5
+        assert weighted.confidence_map[0] == pytest.approx(1.0 / 1.6)
+
+    @pytest.mark.parametrize("poor", [-0.5, 0.0, float('nan'), float('inf')])
+    def test_invalid_weight_clamped(self, poor):
+        """Test an invalid quality weight is floored without discarding the others."""
+        captures = [[8.0] * 5, [4.0] * 5, [4.2] * 5]
+
+        result = reconstruct_from_captures(_aligned(captures, [1.0, poor, 0.3]))
+
+        assert result.flux_timings == [8.0] * 5
+        assert result.confidence_map[0] == pytest.approx(1.0 / (1.3 + multi_capture.MIN_VOTE_WEIGHT))
+
+    def test_mismatched_weights_are_ignored(self):
+        """Test quality weights not matching the captures fall back to equal votes."""
+        captures = [[8.0] * 5, [4.0] * 5, [4.2] * 5]
+
+        result = reconstruct_from_captures(_aligned(captures, [1.0, 0.3]))
+
+        assert result.flux_timings == [4.1] * 5
+
+
+class TestTimingMatrix:
+    """Test the aligned timing matrix."""
+
+    def test_ragged_captures_are_nan(self):
+        """Test positions missing from a capture are NaN."""
+        aligned = _aligned([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        aligned.aligned_timings[1] = aligned.aligned_timings[1][:2]
+
+        matrix = aligned.timing_matrix()
+
+        assert matrix.shape == (2, 3)
+        assert np.isnan(matrix[1, 2])
+        assert aligned.get_timing_at_position(2) == [3.0]
+
+
+class _FakeDevice:
+    """Device whose reads return a jittered encoded track.
+
+    With a drift, each read starts that many transitions later in the
+    track than the one before, as when the index sensor wanders.
+    """
+
+    def __init__(self, jitter=4, seed=0, drift=0):
+        sectors = create_pattern_track(2, 0, bytes(range(32)))
+        self.track = MFMEncoder().encode_track(2, 0, sectors).flux_array
+        self.rng = np.random.default_rng(seed)
+        self.jitter = jitter
+        self.drift = drift
+        self.reads = 0
+
+    def read_track(self, cylinder, head, revolutions):
+        track = np.roll(self.track, -self.drift * self.reads)
+        self.reads += 1
+        times = track + self.rng.integers(-self.jitter, self.jitter + 1, len(track))
+        tail = times[:len(times) // 5]
+        return FluxData(
+            flux_times=np.concatenate((times, tail)),
+            index_positions=[0, int(times.sum())],
+            cylinder=cylinder, head=head,
+        )
+
+
+def _decoder(good_by_read, corrected=()):
+    """Decoder reporting the given CRC-valid (and corrected) sectors on successive reads."""
+    reads = iter(good_by_read)
+
+    def decode(flux):
+        good = next(reads)
+        sectors = []
+        for n in range(1, 19):
+            if n in corrected:
+                status = SectorStatus.CORRECTED
+            else:
+                status = SectorStatus.GOOD if n in good else SectorStatus.CRC_ERROR
+            sectors.append(SectorData(2, 0, n, bytes([n]) * 512, status,
+                                      status == SectorStatus.GOOD, 1.0))
+        return sectors
+
+    return decode
+
+
+@pytest.fixture
+def no_vote_decode(monkeypatch):
+    """Make reconstruction decode no sectors so only single reads count."""
+    monkeypatch.setattr(multi_capture, "_decode_reconstructed_sectors",
+                        lambda *args: [])
+
+
+class TestCaptureUntilConverged:
+    """Test incremental capture."""
+
+    def test_stops_after_clean_revolution(self):
+        """Test a healthy track needs a single revolution."""
+        device = _FakeDevice()
+
+        result = capture_until_converged(device, 2, 0)
+
+        assert result.converged
+        assert result.revolutions_used == device.reads == 1
+        assert result.reconstructed is None
+        assert result.get_missing_sectors() == []
+        assert len(result.sectors) == 18
+        assert result.capture_result.total_revolutions == 1
+
+    def test_collects_sectors_across_revolutions(self, no_vote_decode):
+        """Test sectors good on different revolutions combine."""
+        all_but_5 = set(range(1, 19)) - {5}
+        decoder = _decoder([all_but_5, all_but_5 - {9}, {5}])
+
+        result = capture_until_converged(_FakeDevice(), 2, 0, decoder=decoder)
+
+        assert result.converged
+        assert result.revolutions_used == 3
+        assert all(s.crc_valid for s in result.sectors)
+
+    def test_vote_recovers_shifted_revolutions(self):
+        """Test aligned voting recovers sectors no single revolution decodes."""
+        device = _FakeDevice(drift=15)
+        decoder = _decoder([set()] * 20)
+
+        result = capture_until_converged(device, 2, 0, decoder=decoder)
+
+        assert result.converged
+        assert result.revolutions_used == multi_capture.MIN_CAPTURES_FOR_VOTING
+        assert all(s.crc_valid for s in result.sectors)
+        assert len(result.sectors) == 18
+
+    def test_expected_sectors(self, no_vote_decode):
+        """Test only the expected sectors need to decode."""
+        decoder = _decoder([{1}, {3}])
+
+        result = capture_until_converged(_FakeDevice(), 2, 0, expected_sectors=[3],
+                                         decoder=decoder)
+
+        assert result.converged
+        assert result.revolutions_used == 2
+        assert result.expected_sectors == [3]
+
+    def test_corrected_sector_counts(self, no_vote_decode):
+        """Test a corrected copy counts as recovered but a good copy replaces it."""
+        decoder = _decoder([set(range(1, 19)) - {5}], corrected={5})
+
+        result = capture_until_converged(_FakeDevice(), 2, 0, decoder=decoder)
+
+        assert result.converged and result.revolutions_used == 1
+        corrected, = [s for s in result.sectors if s.sector_number == 5]
+        assert corrected.is_recovered and corrected.corrected
+        assert not corrected.crc_valid
+
+        best = {5: corrected}
+        multi_capture._keep_best_sectors(best, multi_capture._single_read_sectors(
+            _decoder([{5}])(None)))
+        assert not best[5].corrected
+
+    def test_plateau(self, no_vote_decode):
+        """Test capture stops once voting stops improving."""
+        device = _FakeDevice(jitter=0)
+        decoder = _decoder([set(range(1, 18))] * 20)
+
+        result = capture_until_converged(device, 2, 0, max_revolutions=20,
+                                         decoder=decoder)
+
+        assert not result.converged
+        assert result.plateaued
+        assert result.get_missing_sectors() == [18]
+        # First vote at revolution 3, then three revolutions without gain
+        assert result.revolutions_used == 6
+        assert result.reconstructed.source_captures == 6
+
+    def test_max_revolutions_and_cancel(self, no_vote_decode):
+        """Test the revolution limit and cancellation stop capture."""
+        decoder = _decoder([set()] * 20)
+
+        limited = capture_until_converged(_FakeDevice(), 2, 0, max_revolutions=2,
+                                          decoder=decoder)
+        cancelled = capture_until_converged(_FakeDevice(), 2, 0, decoder=decoder,
+                                            is_cancelled=lambda: True)
+
+        assert limited.revolutions_used == 2
+        assert not limited.converged and not limited.plateaued
+        assert cancelled.revolutions_used == 0
+
+    def test_recover_sector(self):
+        """Test single-sector recovery stops once that sector decodes."""
+        device = _FakeDevice()
+
+        sector = multi_capture_recover_sector(device, 2, 0, 7, until_converged=True)
+
+        assert sector.crc_valid
+        assert device.reads == 1
+
+
+class TestCaptureQuality:
+    """Test quality scoring of FluxData captures."""
+
+    def test_clean_capture(self):
+        """Test pulses exactly on the MFM widths score 1.0."""
+        assert calculate_capture_quality(FluxData(flux_times=np.full(500, 288))) == 1.0
+
+    def test_noisy_and_short_captures(self):
+        """Test noise lowers the score and short captures score 0.0."""
+        times = np.full(500, 288)
+        times[::10] = 72
+
+        assert 0.0 < calculate_capture_quality(FluxData(flux_times=times)) < 1.0
+        assert calculate_capture_quality(FluxData(flux_times=np.full(50, 288))) == 0.0
+
+    def test_recovery_potential(self):
+        """Test consistency compares transition counts with the first capture."""
+        flux = FluxData(flux_times=np.full(500, 288))
+        shorter = FluxData(flux_times=np.full(400, 288))
+
+        same = estimate_recovery_potential([flux, flux])
+        mixed = estimate_recovery_potential([flux, shorter, FluxData(flux_times=[])])
+
+        assert same['consistency'] == 1.0
+        assert mixed['consistency'] == pytest.approx(0.8)
+        assert same['overall_potential'] > mixed['overall_potential']
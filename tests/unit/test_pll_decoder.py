@@ -0,0 +1,148 @@
+"""
+Unit tests for the PLL decoder.
+
+Tests that the batched PLL engine matches the per-transition loop and
+that PLL-decoded tracks yield valid sectors, with small header errors
+corrected and damaged data never reported good.
+"""
+
+import numpy as np
+import pytest
+
+from floppy_formatter.hardware import SectorStatus, pll_decoder
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+from floppy_formatter.hardware.pll_decoder import (
+    MFMSectorDecoder,
+    PLLConfig,
+    PLLDecoder,
+    decode_flux_with_pll,
+)
+
+
+def _track_flux(revolutions=2, jitter=8.0, noise=0, with_index=True, seed=0):
+    """Encode a track repeated over several revolutions with jitter and noise."""
+    sectors = create_pattern_track(2, 0, bytes(range(32)))
+    track = MFMEncoder(bit_cell_us=1.0).encode_track(2, 0, sectors).flux_array
+    rng = np.random.default_rng(seed)
+    revs = []
+    for _ in range(revolutions):
+        times = track + rng.normal(0, jitter, len(track))
+        if noise:
+            times[rng.choice(len(times), noise, replace=False)] = rng.uniform(5, 40, noise)
+        revs.append(np.clip(times, 1, None).astype(np.uint32))
+    index_positions = []
+    if with_index:
+        index_positions = [0] + np.cumsum([int(r.sum()) for r in revs]).tolist()
+    return FluxData(
+        flux_times=np.concatenate(revs), index_positions=index_positions,
+        cylinder=2, head=0
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Run the compiled kernels in small batches so state crosses batches."""
+    monkeypatch.setattr(pll_decoder, "PLL_BATCH_SIZE", 4096)
+
+
+class TestBatchedPLL:
+    """Test the batched engine against the per-transition loop."""
+
+    @pytest.mark.parametrize("kwargs,lowpass", [
+        ({}, None),
+        ({"jitter": 25.0, "noise": 100}, None),
+        ({"with_index": False}, None),
+        ({"noise": 200, "seed": 3}, 0.4e-6),
+    ])
+    def test_matches_loop(self, engine, kwargs, lowpass):
+        """Test bits, bit times and revolutions are identical to the loop."""
+        flux = _track_flux(**kwargs)
+
+        bits, times, revs = PLLDecoder(
+            1e-6, PLLConfig(lowpass_thresh=lowpass)
+        ).flux_to_bitcells(flux)
+        ref_bits, ref_times, ref_revs = PLLDecoder(
+            1e-6, PLLConfig(lowpass_thresh=lowpass, batched=False)
+        ).flux_to_bitcells(flux)
+
+        assert bits == ref_bits
+        assert revs == ref_revs
+        assert np.array_equal(times, ref_times)
+
+    def test_revolutions_follow_index(self, engine):
+        """Test one revolution is reported per index interval."""
+        flux = _track_flux(revolutions=3, jitter=0.0)
+
+        bits, _, revs = PLLDecoder(1e-6).flux_to_bitcells(flux)
+
+        assert len(revs) in (3, 4)
+        assert all(abs(r - 200_000) <= 2 for r in revs[:3])
+        assert sum(revs) == len(bits)
+
+    def test_times_can_be_omitted(self, engine):
+        """Test with_times=False skips the time array but keeps the bits."""
+        flux = _track_flux()
+        pll = PLLDecoder(1e-6)
+
+        bits, times, revs = pll.flux_to_bitcells(flux, with_times=False)
+        full_bits, full_times, full_revs = pll.flux_to_bitcells(flux)
+
+        assert times is None
+        assert len(full_times) == len(full_bits)
+        assert bits == full_bits
+        assert revs == full_revs
+
+    def test_empty_flux(self, engine):
+        """Test empty flux yields no bits."""
+        bits, times, revs = PLLDecoder(1e-6).flux_to_bitcells(FluxData())
+
+        assert len(bits) == 0
+        assert len(times) == 0
+        assert revs == []
+
+
+class TestPLLTrackDecode:
+    """Test sector decoding from PLL-decoded tracks."""
+
+    def test_decode_flux_with_pll(self):
+        """Test a jittered multi-revolution track decodes every sector."""
+        sectors = decode_flux_with_pll(_track_flux(jitter=3.0), bit_cell_us=1.0)
+
+        valid = {s.sector for s in sectors if s.crc_valid}
+        assert valid == set(range(1, 19))
+
+    @pytest.mark.parametrize("cells", [1, 2])
+    def test_shifted_data_transition_not_reported_good(self, cells):
+        """Test a data field damaged by a shifted transition stays a CRC error."""
+        sectors = create_pattern_track(2, 0, bytes(range(32)))
+        track = MFMEncoder(bit_cell_us=1.0).encode_track(2, 0, sectors).flux_array.astype(np.int64)
+        i = 20000
+        while not (track[i] == 144 and track[i + 1] == 288):
+            i += 1
+        track[i] += cells * 72
+        track[i + 1] -= cells * 72
+
+        decoded = decode_flux_with_pll(FluxData(flux_times=track, cylinder=2, head=0),
+                                       bit_cell_us=1.0)
+
+        bad = [s for s in decoded if not s.crc_valid]
+        assert len(bad) == 1
+        assert bad[0].status == SectorStatus.CRC_ERROR
+        assert not any(s.corrected_bits for s in decoded)
+
+    def test_corrects_header_bit(self):
+        """Test a flipped bit in an ID field is corrected and flagged."""
+        sectors = create_pattern_track(2, 0, bytes(range(32)))
+        track = MFMEncoder(bit_cell_us=1.0).encode_track(2, 0, sectors)
+        bits, _, _ = PLLDecoder(1e-6).flux_to_bitcells(track, with_times=False)
+        decoder = MFMSectorDecoder()
+        idam = next(offs for offs in bits.search(decoder.mfm_sync)
+                    if bits[offs + 3 * 16:offs + 4 * 16].tobytes() == b'\x55\x54')
+        bits[idam + 4 * 16 + 1] ^= 1  # MSB data cell of the cylinder byte
+
+        decoded = decoder.decode_track(bits)
+
+        fixed = [d for d in decoded if d.corrected_bits]
+        assert len(fixed) == 1
+        assert (fixed[0].idam.c, fixed[0].idam.corrected_bits) == (2, 1)
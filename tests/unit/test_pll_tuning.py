@@ -0,0 +1,318 @@
+"""
+Unit tests for PLL parameter tuning.
+
+Tests the parameter grid, parallel search, cancellation, the adaptive
+search and warm starting from neighbouring tracks.
+"""
+
+import numpy as np
+import pytest
+
+from floppy_formatter.analysis.flux_analyzer import FluxCapture
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.recovery import pll_tuning
+from floppy_formatter.recovery.pll_tuning import (
+    DecodedSectorResult,
+    PLLDecodeResult,
+    PLLParameterMemory,
+    PLLParameters,
+    PLLSearchPool,
+    adaptive_pll_search,
+    find_optimal_pll,
+    try_pll_variations,
+)
+
+
+def _capture(transitions=400, seed=0, cylinder=4, head=1):
+    """Build a small capture with MFM-like timing."""
+    rng = np.random.default_rng(seed)
+    timings = rng.choice([288, 432, 576], transitions) + rng.integers(-20, 20, transitions)
+    return FluxCapture(raw_timings=timings.tolist(), sample_rate=72_000_000,
+                       cylinder=cylinder, head=head)
+
+
+def _fake_decode(flux, params):
+    """Decode that recovers more sectors the closer params are to an optimum."""
+    distance = (
+        abs(params.phase_offset - 150) / 100
+        + abs(params.frequency / 500_000 - 1.01) / 0.01
+        + abs(params.bandwidth - 0.07) / 0.02
+    )
+    count = max(0, 18 - int(distance * 4))
+    sectors = [
+        DecodedSectorResult(n, True, True, bytes(512), 0.8, 0.0)
+        for n in range(1, count + 1)
+    ]
+    return PLLDecodeResult(params, count, count, sectors, 0.0, 1.0 / (1 + distance))
+
+
+@pytest.fixture
+def fake_decode(monkeypatch):
+    """Replace the PLL decode with a fast synthetic objective."""
+    calls = []
+
+    def decode(flux, params):
+        calls.append(params)
+        return _fake_decode(flux, params)
+
+    monkeypatch.setattr(pll_tuning, "decode_with_pll", decode)
+    return calls
+
+
+@pytest.fixture
+def small_grid(monkeypatch):
+    """Limit the search grid so tests run quickly."""
+    full_grid = pll_tuning._variation_grid
+
+    def grid(base_params):
+        return full_grid(base_params)[:12]
+
+    monkeypatch.setattr(pll_tuning, "_variation_grid", grid)
+
+
+class TestVariationGrid:
+    """Test the search grid."""
+
+    def test_grid_size_and_clamping(self):
+        """Test the full 7x7x6x5 grid is generated within limits."""
+        grid = pll_tuning._variation_grid(PLLParameters.for_hd())
+
+        assert len(grid) == 7 * 7 * 6 * 5
+        assert all(0.01 <= p.bandwidth <= 0.2 for p in grid)
+        assert all(0.4 <= p.damping <= 1.5 for p in grid)
+
+
+class TestDecodeResult:
+    """Test per-decode sector reporting."""
+
+    def test_failed_sectors(self):
+        """Test failed sectors default to an 18-sector track."""
+        result = _fake_decode(None, PLLParameters(phase_offset=150, frequency=505_000,
+                                                  bandwidth=0.07))
+
+        assert result.get_failed_sectors() == []
+        assert result.get_failed_sectors(21) == [19, 20, 21]
+
+
+class TestParallelSearch:
+    """Test process-pool search and cancellation."""
+
+    def test_parallel_matches_sequential(self, small_grid):
+        """Test the pool reports the same result as the sequential search."""
+        flux = _capture()
+        progress = []
+
+        sequential = try_pll_variations(flux, PLLParameters.for_hd())
+        parallel = try_pll_variations(
+            flux, PLLParameters.for_hd(), workers=2,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert parallel.total_combinations_tried == 12
+        assert parallel.sectors_recovered == sequential.sectors_recovered
+        assert parallel.best_params == sequential.best_params
+        assert not parallel.cancelled
+        assert progress[-1] == (12, 12)
+
+    def test_accepts_flux_data(self, small_grid):
+        """Test hardware FluxData is accepted as input."""
+        capture = _capture()
+        flux = FluxData(flux_times=capture.raw_timings, cylinder=4, head=1)
+
+        result = try_pll_variations(flux, PLLParameters.for_hd())
+
+        assert result.total_combinations_tried == 12
+
+    def test_sequential_cancellation(self, small_grid):
+        """Test the sequential search stops when cancelled."""
+        calls = []
+
+        def is_cancelled():
+            calls.append(1)
+            return len(calls) > 3
+
+        result = try_pll_variations(_capture(), PLLParameters.for_hd(),
+                                    is_cancelled=is_cancelled)
+
+        assert result.cancelled
+        assert result.total_combinations_tried == 3
+
+    def test_pool_cancellation(self):
+        """Test a cancelled pool search stops without evaluating the grid."""
+        result = try_pll_variations(_capture(), PLLParameters.for_hd(), workers=2,
+                                    is_cancelled=lambda: True)
+
+        assert result.cancelled
+        assert result.total_combinations_tried < 7 * 7 * 6 * 5
+
+    def test_pool_reused_across_tracks(self, small_grid):
+        """Test one pool searches several captures, growing its shared buffer."""
+        captures = [_capture(cylinder=4), _capture(transitions=800, seed=1, cylinder=5)]
+
+        with PLLSearchPool(2) as pool:
+            results = [try_pll_variations(flux, PLLParameters.for_hd(), pool=pool)
+                       for flux in captures]
+            executor = pool._executor
+            # A cancelled search leaves the pool usable for the next
+            try_pll_variations(captures[0], PLLParameters.for_hd(), pool=pool,
+                               is_cancelled=lambda: True)
+            again = try_pll_variations(captures[0], PLLParameters.for_hd(), pool=pool)
+
+            assert pool._executor is executor
+        assert pool._executor is None and pool._shm is None
+
+        for flux, result in zip(captures, results, strict=True):
+            expected = try_pll_variations(flux, PLLParameters.for_hd())
+            assert result.sectors_recovered == expected.sectors_recovered
+            assert result.total_combinations_tried == 12
+        assert again.sectors_recovered == results[0].sectors_recovered
+
+
+class TestAdaptiveSearch:
+    """Test the coarse-to-fine search and early termination."""
+
+    def test_finds_all_sectors_quickly(self, fake_decode):
+        """Test the search reaches a full track in far fewer decodes than the grid."""
+        result = adaptive_pll_search(_capture(), PLLParameters.for_hd(),
+                                     sectors_per_track=18)
+
+        assert result.best_sector_count == 18
+        assert result.get_recovered_sectors() == list(range(1, 19))
+        assert result.total_combinations_tried == len(fake_decode)
+        assert result.total_combinations_tried < 60
+
+    def test_target_follows_geometry(self, fake_decode):
+        """Test a 9-sector track stops once its own sectors decode."""
+        hd = adaptive_pll_search(_capture(), PLLParameters.for_hd(), sectors_per_track=18)
+        fake_decode.clear()
+
+        dd = adaptive_pll_search(_capture(), PLLParameters.for_hd(), sectors_per_track=9)
+
+        assert set(range(1, 10)) <= set(dd.get_recovered_sectors())
+        assert dd.best_sector_count < 18
+        assert dd.total_combinations_tried < hd.total_combinations_tried
+
+    def test_no_target_searches_for_most_sectors(self, fake_decode):
+        """Test without a target or geometry the search runs to convergence."""
+        result = adaptive_pll_search(_capture(), PLLParameters.for_hd())
+
+        assert result.best_sector_count == 18
+        assert result.total_combinations_tried > 1
+
+    def test_stops_when_target_recovered(self, fake_decode):
+        """Test the search ends as soon as the target sector decodes."""
+        result = adaptive_pll_search(_capture(), PLLParameters.for_hd(),
+                                     target_sectors={10})
+
+        # Only the final decode recovered the target
+        earlier = [_fake_decode(None, p).get_good_sectors() for p in fake_decode[:-1]]
+        assert all(10 not in good for good in earlier)
+        assert 10 in result.get_recovered_sectors()
+        assert result.best_sector_count < 18
+
+    def test_respects_budget(self, fake_decode):
+        """Test the decode budget caps evaluations."""
+        result = adaptive_pll_search(_capture(), PLLParameters.for_hd(), max_evaluations=5)
+
+        assert result.total_combinations_tried == 5
+        assert not result.cancelled
+
+    def test_cancellation(self, fake_decode):
+        """Test a cancelled search reports cancelled."""
+        result = adaptive_pll_search(_capture(), PLLParameters.for_hd(),
+                                     is_cancelled=lambda: True)
+
+        assert result.cancelled
+        assert result.total_combinations_tried == 1
+
+    def test_find_optimal_reports_evaluations(self, fake_decode):
+        """Test find_optimal_pll reports decodes spent, reusing the default decode."""
+        result = find_optimal_pll(_capture(), sectors_per_track=18)
+
+        assert len(result.sectors_decoded) == 18
+        assert result.improvement > 0
+        assert result.evaluations == len(fake_decode)
+
+    def test_grid_stops_at_target(self, fake_decode):
+        """Test the grid search ends once target sectors are recovered."""
+        result = try_pll_variations(_capture(), PLLParameters.for_hd(),
+                                    target_sectors={1})
+
+        assert 1 in result.get_recovered_sectors()
+        assert not result.cancelled
+        assert result.total_combinations_tried == len(fake_decode) < 7 * 7 * 6 * 5
+
+
+class TestParameterMemory:
+    """Test per-disk warm start."""
+
+    def test_suggest_nearest_track(self):
+        """Test suggestions come from the nearest track, same head preferred."""
+        memory = PLLParameterMemory(max_distance=4)
+        near = PLLParameters(phase_offset=100)
+        other_head = PLLParameters(phase_offset=200)
+        memory.record(10, 0, near, 12)
+        memory.record(12, 1, other_head, 12)
+
+        assert memory.suggest(11, 0) is near
+        assert memory.suggest(12, 0) is other_head
+        assert memory.suggest(11, 1) is other_head
+        assert memory.suggest(20, 0) is None
+
+    def test_record_keeps_better_result(self):
+        """Test a track keeps the parameters that recovered more sectors."""
+        memory = PLLParameterMemory()
+        best = PLLParameters(phase_offset=100)
+        memory.record(3, 0, best, 15)
+        memory.record(3, 0, PLLParameters(phase_offset=-100), 4)
+        memory.record(4, 0, PLLParameters(), 0)
+
+        assert len(memory) == 1
+        assert memory.suggest(3, 0) is best
+
+    def test_warm_start_reduces_evaluations(self, fake_decode):
+        """Test a neighbouring track's parameters make the next search cheaper."""
+        memory = PLLParameterMemory()
+
+        first = adaptive_pll_search(_capture(cylinder=10), memory=memory,
+                                    sectors_per_track=18)
+        second = adaptive_pll_search(_capture(cylinder=11), memory=memory,
+                                     sectors_per_track=18)
+
+        assert first.best_sector_count == second.best_sector_count == 18
+        assert second.total_combinations_tried < first.total_combinations_tried
+        assert memory.suggest(11, 1) is not None
+
+    def test_poor_memory_does_not_replace_defaults(self, fake_decode):
+        """Test remembered parameters that decode worse than the defaults are not used."""
+        memory = PLLParameterMemory()
+        poor = PLLParameters(phase_offset=-300, bandwidth=0.15)
+        memory.record(4, 1, poor, 12)
+        base = PLLParameters.for_hd()
+
+        result = adaptive_pll_search(_capture(), base, memory=memory)
+
+        assert fake_decode[:2] == [base, poor]
+        assert abs(fake_decode[2].phase_offset - base.phase_offset) == \
+            pll_tuning.ADAPTIVE_INITIAL_STEPS['phase_offset']
+        assert result.best_sector_count == 18
+
+    def test_fast_path_recorded(self, fake_decode):
+        """Test defaults that already decode the target sector are remembered."""
+        memory = PLLParameterMemory()
+
+        result = find_optimal_pll(_capture(cylinder=6), target_sector=1, memory=memory)
+
+        assert result.evaluations == 1
+        assert memory.suggest(6, 1) == PLLParameters.for_hd()
+
+    def test_find_optimal_uses_memory(self, fake_decode):
+        """Test find_optimal_pll records into and warm starts from the memory."""
+        memory = PLLParameterMemory()
+        find_optimal_pll(_capture(cylinder=2), memory=memory, sectors_per_track=18)
+        fake_decode.clear()
+
+        result = find_optimal_pll(_capture(cylinder=3), memory=memory, sectors_per_track=18)
+
+        assert len(result.sectors_decoded) == 18
+        assert result.evaluations <= 2
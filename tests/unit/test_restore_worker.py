@@ -0,0 +1,270 @@
+"""
+Unit tests for the restore worker.
+
+Tests that recovery passes work a track at a time, running each
+technique once per track and crediting every sector it recovers, and
+that flux read since the last write is reused.
+"""
+
+import numpy as np
+import pytest
+
+from floppy_formatter.core.geometry import DiskGeometry
+from floppy_formatter.gui.workers import restore_worker
+from floppy_formatter.gui.workers.restore_worker import (
+    RecoveryLevel,
+    RestoreConfig,
+    RestoreWorker,
+)
+from floppy_formatter.hardware import SectorData, SectorStatus
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+from floppy_formatter.recovery import pll_tuning
+from floppy_formatter.recovery.pll_tuning import PLLSearchResult
+from floppy_formatter.recovery.scheduler import TechniqueScheduler
+
+
+class _FakeDevice:
+    """Device that counts seeks and reads and returns an encoded track."""
+
+    def __init__(self):
+        self.seeks = 0
+        self.reads = 0
+        self.revolutions = []
+
+    def seek(self, cylinder, head):
+        self.seeks += 1
+
+    def read_track(self, cylinder, head, revolutions):
+        self.reads += 1
+        self.revolutions.append(int(revolutions))
+        sectors = create_pattern_track(cylinder, head, bytes(range(32)))
+        track = MFMEncoder().encode_track(cylinder, head, sectors).flux_array
+        count = max(1, int(revolutions))
+        return FluxData(
+            flux_times=np.concatenate([track] * count + [track[:len(track) // 5]]),
+            index_positions=[i * int(track.sum()) for i in range(count + 1)],
+            cylinder=cylinder, head=head,
+        )
+
+
+@pytest.fixture
+def worker():
+    """Restore worker on a 1.44MB geometry with a fake device."""
+    geometry = DiskGeometry(media_type=0x0F, cylinders=80, heads=2,
+                            sectors_per_track=18, bytes_per_sector=512)
+    config = RestoreConfig(recovery_level=RecoveryLevel.FORENSIC, pll_tuning=True)
+    return RestoreWorker(_FakeDevice(), geometry=geometry, config=config)
+
+
+def _linear(cylinder, head, sector):
+    """Linear sector number on a 1.44MB disk."""
+    return (cylinder * 2 + head) * 18 + sector - 1
+
+
+class TestTrackRecovery:
+    """Test track-granular recovery passes."""
+
+    def test_technique_runs_once_per_track(self, worker, monkeypatch):
+        """Test each technique runs once per track and later ones see only pending sectors.
+
+        After the first track, multi-capture's successes move it ahead of
+        format refresh, which recovered nothing.
+        """
+        calls = []
+
+        def technique(name, good):
+            def run(cylinder, head, sectors):
+                calls.append((name, cylinder, head, set(sectors)))
+                return good & sectors
+            return run
+
+        # Cheapest first, all equally likely to succeed
+        worker._scheduler = TechniqueScheduler(
+            prior_costs={"format_refresh": 0.5, "multi_capture": 1.0,
+                         "pll_tuning": 2.0, "maximum_effort": 3.0},
+            prior_success=dict.fromkeys(
+                ["format_refresh", "multi_capture", "pll_tuning", "maximum_effort"], 0.3
+            ),
+        )
+        monkeypatch.setattr(worker, "_try_format_refresh", lambda c, h: False)
+        monkeypatch.setattr(worker, "_try_multi_capture", technique("multi", {2, 3, 4}))
+        monkeypatch.setattr(worker, "_try_pll_tuning", technique("pll", {5, 9}))
+        monkeypatch.setattr(worker, "_try_maximum_effort", technique("max", set()))
+
+        bad = [_linear(3, 1, s) for s in (2, 3, 4, 5, 7)] + [_linear(4, 0, 9)]
+        worker._bad_sectors = list(bad)
+
+        stats = worker._run_recovery_pass(1)
+
+        assert calls == [
+            ("multi", 3, 1, {2, 3, 4, 5, 7}),
+            ("pll", 3, 1, {5, 7}),
+            ("max", 3, 1, {7}),
+            ("multi", 4, 0, {9}),
+            ("pll", 4, 0, {9}),
+        ]
+        assert stats.sectors_recovered == 5
+        assert worker._bad_sectors == [_linear(3, 1, 7)]
+        techniques = {r.sector: r.technique for r in worker._recovered_sectors}
+        assert techniques == {2: "multi_capture", 3: "multi_capture", 4: "multi_capture",
+                              5: "pll_tuning", 9: "pll_tuning"}
+
+    def test_reorders_after_failed_attempt(self, worker, monkeypatch):
+        """Test a refresh that fails on a track does not prune the fallbacks there."""
+        for _ in range(20):
+            worker._scheduler.record("format_refresh", 4, 4, 2.0)
+        for _ in range(5):
+            worker._scheduler.record("pll_tuning", 4, 1, 20.0)
+        calls = []
+        monkeypatch.setattr(worker, "_try_format_refresh",
+                            lambda c, h: calls.append("refresh") or False)
+        monkeypatch.setattr(worker, "_try_pll_tuning",
+                            lambda c, h, s: calls.append("pll") or set(s))
+
+        recovered = worker._recover_track(
+            5, 0, [_linear(5, 0, 1)], ["format_refresh", "pll_tuning"]
+        )
+
+        assert calls == ["refresh", "pll"]
+        assert recovered == {_linear(5, 0, 1): "pll_tuning"}
+
+    def test_time_budget(self, worker, monkeypatch):
+        """Test no technique runs once the time budget is used up."""
+        worker._scheduler = TechniqueScheduler(time_budget=0.0)
+        worker._scheduler.start()
+        monkeypatch.setattr(worker, "_try_format_refresh",
+                            lambda c, h: pytest.fail("technique ran"))
+
+        assert worker._recover_track(1, 0, [_linear(1, 0, 1)], ["format_refresh"]) == {}
+
+    def test_format_refresh_verifies_once(self, worker, monkeypatch):
+        """Test a refreshed track is verified with a single read."""
+        verifies = []
+        monkeypatch.setattr(worker, "_try_format_refresh", lambda c, h: True)
+        monkeypatch.setattr(worker, "_verify_track",
+                            lambda c, h: verifies.append((c, h)) or set(range(1, 19)))
+
+        recovered = worker._recover_track(
+            10, 0, [_linear(10, 0, s) for s in range(1, 11)], ["format_refresh"]
+        )
+
+        assert verifies == [(10, 0)]
+        assert set(recovered.values()) == {"format_refresh"}
+        assert len(recovered) == 10
+
+    def test_multi_capture_reads_track_once(self, worker):
+        """Test multi-capture recovers every target sector from one revolution."""
+        recovered = worker._try_multi_capture(2, 0, {1, 6, 18})
+
+        assert recovered == {1, 6, 18}
+        assert worker._device.seeks == 1
+        assert worker._device.reads == 1
+
+
+class TestInitialScan:
+    """Test which sectors the scan queues for recovery."""
+
+    def test_corrected_sectors_queued(self, monkeypatch):
+        """Test a sector that only reads after correction is queued for refresh."""
+        geometry = DiskGeometry(media_type=0x0F, cylinders=1, heads=1,
+                                sectors_per_track=18, bytes_per_sector=512)
+        worker = RestoreWorker(_FakeDevice(), geometry=geometry, config=RestoreConfig())
+
+        def decode(flux):
+            return [SectorData(0, 0, n, bytes(512),
+                               SectorStatus.CORRECTED if n == 3 else SectorStatus.GOOD,
+                               n != 3, 1.0)
+                    for n in range(1, 19)]
+
+        monkeypatch.setattr(restore_worker, "decode_flux_data", decode)
+
+        assert worker._perform_initial_scan() == [2]
+        assert worker._corrected_sectors == {2}
+
+
+class TestFluxReuse:
+    """Test reuse of revolutions read since the last write."""
+
+    def test_techniques_share_revolutions(self, worker):
+        """Test later techniques only read the revolutions they are missing."""
+        device = worker._device
+
+        assert worker._verify_track(2, 0) == set(range(1, 19))
+        assert worker._try_multi_capture(2, 0, {4}) == {4}
+        assert device.reads == 1
+
+        flux = worker._stored_flux(2, 0, 3)
+        assert flux.revolutions == 3.0
+        assert len(flux.get_index_boundaries()) == 4
+        assert device.revolutions == [1, 2]
+
+        worker._stored_flux(2, 0, 3)
+        assert device.reads == 2
+
+    def test_scan_read_reused(self, monkeypatch):
+        """Test recovery after the scan starts from the revolution it read."""
+        geometry = DiskGeometry(media_type=0x0F, cylinders=1, heads=1,
+                                sectors_per_track=18, bytes_per_sector=512)
+        worker = RestoreWorker(_FakeDevice(), geometry=geometry, config=RestoreConfig())
+        monkeypatch.setattr(restore_worker, "decode_flux_data", lambda flux: [])
+
+        assert len(worker._perform_initial_scan()) == 18
+        assert worker._captures.count(0, 0) == 1
+
+        worker._stored_flux(0, 0, 3)
+        assert worker._device.revolutions == [1, 2]
+
+    def test_unsplittable_read_used_directly(self, worker, monkeypatch):
+        """Test techniques still get flux when a read cannot be stored."""
+        empty = FluxData(cylinder=2, head=0)
+        monkeypatch.setattr(worker._device, "read_track", lambda *args: empty)
+
+        assert worker._stored_flux(2, 0, 3) is empty
+
+    def test_write_invalidates(self, worker, monkeypatch):
+        """Test a format refresh drops the track's stored revolutions."""
+        monkeypatch.setattr("floppy_formatter.hardware.erase_track_flux", lambda *a: None)
+        monkeypatch.setattr("floppy_formatter.hardware.write_track_flux", lambda *a: None)
+        worker._verify_track(2, 0)
+        worker._verify_track(3, 0)
+
+        assert worker._try_format_refresh(2, 0)
+
+        assert worker._captures.count(2, 0) == 0
+        assert worker._captures.count(3, 0) == 1
+
+
+class TestPLLPool:
+    """Test the PLL search pool lives for the whole restore."""
+
+    def test_pool_shared_across_tracks(self, worker, monkeypatch):
+        """Test full-grid searches on different tracks reuse one pool, closed by run()."""
+        pools = []
+        closed = []
+
+        def nothing(*args, **kwargs):
+            return PLLSearchResult([], {}, None, 0, 1, 0.0)
+
+        def grid(flux, base, **kwargs):
+            pools.append(kwargs['pool'])
+            return nothing()
+
+        monkeypatch.setattr(pll_tuning, "adaptive_pll_search", nothing)
+        monkeypatch.setattr(pll_tuning, "try_pll_variations", grid)
+        monkeypatch.setattr(pll_tuning.PLLSearchPool, "close",
+                            lambda pool: closed.append(pool))
+
+        def restore():
+            worker._try_pll_tuning(2, 0, {3})
+            worker._try_pll_tuning(7, 1, {5})
+            raise RuntimeError("device lost")
+
+        monkeypatch.setattr(worker, "_run_restore", restore)
+
+        with pytest.raises(RuntimeError):
+            worker.run()
+
+        assert len(pools) == 2 and pools[0] is pools[1]
+        assert closed == [pools[0]]
+        assert worker._pll_pool is None
@@ -0,0 +1,65 @@
+"""
+Unit tests for the scan worker.
+
+Tests how decoded sectors are counted: a sector that only reads after
+correction or fusion of copies is good and reported as corrected.
+"""
+
+from floppy_formatter.core.geometry import DiskGeometry
+from floppy_formatter.gui.workers import scan_worker
+from floppy_formatter.gui.workers.scan_worker import ScanWorker
+from floppy_formatter.hardware import SectorData, SectorStatus
+from floppy_formatter.hardware.flux_io import FluxData
+
+
+class _FakeDevice:
+    """Device returning empty flux for the decoder under test."""
+
+    selected_drive = 0
+
+    def is_motor_on(self):
+        return True
+
+    def motor_on(self):
+        pass
+
+    def seek(self, cylinder, head):
+        pass
+
+    def read_track(self, cylinder, head, revolutions):
+        return FluxData(flux_times=[144] * 100, index_positions=[0, 14400],
+                        cylinder=cylinder, head=head)
+
+
+class TestSectorCounting:
+    """Test sector counting per track."""
+
+    def test_fused_sector_counted_good(self, monkeypatch):
+        """Test a sector recovered by fusion is good and reported as corrected."""
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        geometry = DiskGeometry(media_type=0x0F, cylinders=1, heads=1,
+                                sectors_per_track=18, bytes_per_sector=512)
+
+        def decode(flux):
+            sectors = [
+                SectorData(flux.cylinder, flux.head, n, bytes(512), SectorStatus.GOOD, True, 1.0)
+                for n in range(2, 19)
+            ]
+            return sectors + [
+                SectorData(flux.cylinder, flux.head, 1, bytes(512), SectorStatus.CRC_ERROR,
+                           False, 0.5),
+                SectorData(flux.cylinder, flux.head, 1, bytes(512), SectorStatus.CORRECTED,
+                           False, 0.8),
+            ]
+
+        monkeypatch.setattr(scan_worker, "decode_flux_data", decode)
+        worker = ScanWorker(_FakeDevice(), geometry=geometry)
+        tracks = []
+        results = []
+        worker.track_scanned.connect(lambda cyl, head, result: tracks.append(result))
+        worker.scan_complete.connect(results.append)
+        worker.run()
+
+        assert tracks[0].good_count == 18 and tracks[0].corrected_count == 1
+        assert results[0].bad_sectors == []
+        assert results[0].corrected_sectors == [0]
@@ -0,0 +1,100 @@
+"""
+Unit tests for the recovery technique scheduler.
+
+Tests ordering by expected sectors per second, learning from recorded
+attempts, pruning and the time budget.
+"""
+
+from floppy_formatter.recovery import scheduler as scheduler_module
+from floppy_formatter.recovery.scheduler import TechniqueScheduler
+
+
+TECHNIQUES = ["format_refresh", "multi_capture", "pll_tuning", "maximum_effort"]
+
+
+class TestOrdering:
+    """Test technique ordering."""
+
+    def test_priors(self):
+        """Test cheap, likely techniques come first before anything is measured."""
+        scheduler = TechniqueScheduler()
+
+        assert scheduler.order(TECHNIQUES, 3) == [
+            "format_refresh", "multi_capture", "maximum_effort", "pll_tuning"
+        ]
+
+    def test_ties_keep_order(self):
+        """Test equal expected rates keep the given order."""
+        scheduler = TechniqueScheduler(prior_costs=dict.fromkeys(TECHNIQUES, 1.0),
+                                       prior_success=dict.fromkeys(TECHNIQUES, 0.2))
+
+        assert scheduler.order(TECHNIQUES[::-1], 1) == TECHNIQUES[::-1]
+
+    def test_learns_from_attempts(self):
+        """Test measured payoff overrides the priors."""
+        scheduler = TechniqueScheduler()
+        for _ in range(4):
+            scheduler.record("format_refresh", 5, 0, 3.0)
+            scheduler.record("pll_tuning", 5, 5, 4.0)
+
+        assert scheduler.order(["format_refresh", "pll_tuning"], 5) == [
+            "pll_tuning", "format_refresh"
+        ]
+        assert scheduler.get_record("pll_tuning").success_rate == 1.0
+        assert scheduler.get_record("pll_tuning").mean_cost == 4.0
+        assert scheduler.get_summary()["format_refresh"]["success_rate"] == 0.0
+
+    def test_prunes_unproductive(self):
+        """Test a technique that keeps failing is dropped after enough attempts."""
+        scheduler = TechniqueScheduler()
+        for _ in range(scheduler_module.MIN_ATTEMPTS_BEFORE_PRUNE):
+            assert "maximum_effort" in scheduler.order(TECHNIQUES, 2)
+            scheduler.record("maximum_effort", 20, 0, 60.0)
+            scheduler.record("multi_capture", 2, 2, 1.0)
+
+        assert "maximum_effort" not in scheduler.order(TECHNIQUES, 2)
+
+    def test_refresh_read_backs_do_not_prune(self):
+        """Test a refresh that verifies every time does not prune data recovery."""
+        scheduler = TechniqueScheduler()
+        for _ in range(20):
+            scheduler.record("format_refresh", 4, 4, 2.0)
+        for _ in range(scheduler_module.MIN_ATTEMPTS_BEFORE_PRUNE):
+            scheduler.record("pll_tuning", 4, 1, 20.0)
+
+        assert "pll_tuning" in scheduler.order(TECHNIQUES, 4)
+        assert "pll_tuning" in scheduler.order(["pll_tuning"], 4)
+
+    def test_nothing_pending(self):
+        """Test no techniques are scheduled for a track without bad sectors."""
+        assert TechniqueScheduler().order(TECHNIQUES, 0) == []
+
+
+class TestTimeBudget:
+    """Test the overall time budget."""
+
+    def test_skips_techniques_that_do_not_fit(self, monkeypatch):
+        """Test techniques costing more than the remaining time are skipped."""
+        now = [100.0]
+        monkeypatch.setattr(scheduler_module.time, "monotonic", lambda: now[0])
+        scheduler = TechniqueScheduler(time_budget=30.0)
+        scheduler.start()
+
+        assert "pll_tuning" in scheduler.order(TECHNIQUES, 1)
+
+        now[0] += 15.0
+        assert scheduler.remaining() == 15.0
+        assert "pll_tuning" not in scheduler.order(TECHNIQUES, 1)
+        assert "format_refresh" in scheduler.order(TECHNIQUES, 1)
+
+        now[0] += 15.0
+        assert scheduler.budget_exhausted()
+        assert scheduler.order(TECHNIQUES, 1) == []
+
+    def test_no_budget(self):
+        """Test without a budget nothing is skipped for time."""
+        scheduler = TechniqueScheduler()
+        scheduler.start()
+
+        assert scheduler.remaining() is None
+        assert not scheduler.budget_exhausted()
@@ -0,0 +1,213 @@
+"""
+Unit tests for the sector adapter track cache.
+
+Tests that decoded tracks are served from a per-device LRU cache, that
+the cache stays within its memory budget and that every device write,
+including surface treatment and failed writes, invalidates its track.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from floppy_formatter.core import recovery, sector_adapter
+from floppy_formatter.hardware import SectorData, SectorStatus, greaseweazle_device
+from floppy_formatter.hardware.flux_io import FluxData, FluxWriter
+from floppy_formatter.hardware.greaseweazle_device import GreaseweazleDevice
+
+
+class _FakeUnit:
+    """Greaseweazle unit accepting head moves, writes and erases."""
+
+    def drive_select(self, unit):
+        pass
+
+    def seek(self, cylinder, head):
+        pass
+
+    def _send_cmd(self, cmd):
+        pass
+
+    def write_track(self, flux_list, terminate_at_index=True):
+        pass
+
+    def erase_track(self, ticks):
+        pass
+
+
+def _write_fault(flux_list, terminate_at_index=True):
+    """Unit write that fails part way through the track."""
+    raise IOError("write fault")
+
+
+def _device():
+    """Connected device with drive 0 selected and the motor running."""
+    device = GreaseweazleDevice()
+    device._unit = _FakeUnit()
+    device._selected_drive = 0
+    device._motor_running = True
+    return device
+
+
+def _sectors(cylinder, head):
+    """Eighteen good sectors of a track."""
+    return [
+        SectorData(cylinder, head, n, bytes([n]) * 512, SectorStatus.GOOD, True, 1.0)
+        for n in range(1, 19)
+    ]
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Replace flux reads, decoding and encoding; record the tracks read."""
+    calls = []
+
+    def read_track_flux(device, cylinder, head, revolutions=1.2):
+        calls.append((cylinder, head))
+        return FluxData(flux_times=np.full(1000, 200, dtype=np.uint32),
+                        cylinder=cylinder, head=head)
+
+    monkeypatch.setattr(greaseweazle_device, "GREASEWEAZLE_AVAILABLE", True)
+    monkeypatch.setattr(greaseweazle_device.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(sector_adapter, "read_track_flux", read_track_flux)
+    monkeypatch.setattr(sector_adapter, "decode_flux_data",
+                        lambda flux: _sectors(flux.cylinder, flux.head))
+    monkeypatch.setattr(sector_adapter, "encode_sectors_to_flux",
+                        lambda *args: FluxData(flux_times=[200] * 100))
+    return calls
+
+
+class TestTrackCache:
+    """Test the per-device track cache."""
+
+    def test_alternating_tracks_read_once(self, reads):
+        """Test reads alternating between two tracks capture each once."""
+        device = _device()
+        geometry = SimpleNamespace(sectors_per_track=18, heads=2)
+
+        for _ in range(3):
+            assert sector_adapter.read_sector_by_lba(device, 0, geometry)[0]
+            assert sector_adapter.read_sector_by_lba(device, 40, geometry)[0]
+
+        assert reads == [(0, 0), (1, 0)]
+        stats = sector_adapter.get_track_cache_stats(device)
+        assert stats['hits'] == 4
+        assert stats['misses'] == 2
+        assert stats['entries'] == 2
+
+    def test_devices_have_separate_caches(self, reads):
+        """Test a track cached for one device is read again for another."""
+        sector_adapter.read_sector(_device(), 3, 1, 1)
+        sector_adapter.read_sector(_device(), 3, 1, 1)
+
+        assert reads == [(3, 1), (3, 1)]
+
+    def test_write_invalidates_track(self, reads):
+        """Test writing a sector drops only that track."""
+        device = _device()
+        sector_adapter.read_sector(device, 5, 0, 1)
+        sector_adapter.read_sector(device, 6, 0, 1)
+
+        assert sector_adapter.write_sector(device, 5, 0, 2, bytes(512))[0]
+        sector_adapter.read_sector(device, 5, 0, 1)
+        sector_adapter.read_sector(device, 6, 0, 1)
+
+        assert reads == [(5, 0), (6, 0), (5, 0)]
+
+    def test_format_rereads_track(self, reads):
+        """Test a low-level format verifies from a fresh read."""
+        device = _device()
+        geometry = SimpleNamespace(sectors_per_track=18, bytes_per_sector=512)
+        sector_adapter.read_sector(device, 7, 1, 1)
+
+        success, bad_count, _, _ = sector_adapter.format_track_low_level(device, 7, 1, geometry)
+
+        assert success and bad_count == 0
+        assert reads == [(7, 1), (7, 1)]
+
+    @pytest.mark.parametrize("fails", [False, True])
+    def test_surface_treatment_rereads_track(self, reads, monkeypatch, fails):
+        """Test a sector re-read after surface treatment is not served stale."""
+        device = _device()
+        sector_adapter.read_sector(device, 9, 1, 4)
+
+        def treat_weak_sector(device, cyl, head, sector):
+            if fails:
+                device._unit.write_track = _write_fault
+            FluxWriter(device).write_track(cyl, head, FluxData(flux_times=[200] * 100))
+            return SimpleNamespace(success=True, final_crc_valid=True)
+
+        monkeypatch.setattr(recovery, "_get_surface_treatment",
+                            lambda: {'treat_weak_sector': treat_weak_sector})
+        stats = SimpleNamespace(sectors_refreshed=0, recovered_by_surface_treatment=0)
+
+        assert recovery._apply_surface_treatment(device, 9, 1, 4, None, stats) is not fails
+        sector_adapter.read_sector(device, 9, 1, 4)
+
+        assert reads == [(9, 1), (9, 1)]
+
+    def test_flush_clears_device(self, reads):
+        """Test flushing drops every track of the device."""
+        device = _device()
+        sector_adapter.read_sector(device, 1, 0, 1)
+        sector_adapter.flush_flux_cache(device)
+        sector_adapter.read_sector(device, 1, 0, 1)
+
+        assert reads == [(1, 0), (1, 0)]
+
+
+class TestCorrectedSectors:
+    """Test sectors recovered by correction or fusion are returned."""
+
+    def test_corrected_copy_is_read(self, reads, monkeypatch):
+        """Test a corrected copy beats a CRC error copy and is reported."""
+        def decode(flux):
+            sectors = _sectors(flux.cylinder, flux.head)
+            sectors[0] = SectorData(flux.cylinder, flux.head, 1, b"x" * 512,
+                                    SectorStatus.CRC_ERROR, False, 0.4)
+            sectors.append(SectorData(flux.cylinder, flux.head, 1, bytes([1]) * 512,
+                                      SectorStatus.CORRECTED, False, 0.8))
+            return sectors
+
+        monkeypatch.setattr(sector_adapter, "decode_flux_data", decode)
+        device = _device()
+        geometry = SimpleNamespace(sectors_per_track=18, bytes_per_sector=512)
+
+        assert sector_adapter.read_sector(device, 2, 0, 1) == (True, bytes([1]) * 512, 0)
+        _, results = sector_adapter.read_track(device, 2, 0, geometry)
+        assert results[0]['success'] and results[0]['corrected']
+        assert not any(r['corrected'] for r in results[1:])
+
+
+class TestTrackCacheLRU:
+    """Test LRU eviction by memory."""
+
+    def _entry(self, cylinder):
+        flux = FluxData(flux_times=np.zeros(1000, dtype=np.uint32), cylinder=cylinder)
+        return sector_adapter.TrackCache(cylinder, 0, {}, flux, timestamp=1e12)
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used track goes when over budget."""
+        size = self._entry(0).size_bytes
+        cache = sector_adapter.TrackCacheLRU(max_bytes=2 * size)
+        cache.put((0, 0), self._entry(0))
+        cache.put((1, 0), self._entry(1))
+        cache.get((0, 0))
+
+        cache.put((2, 0), self._entry(2))
+
+        assert cache.get((1, 0)) is None
+        assert cache.get((0, 0)) is not None
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['bytes'] == 2 * size
+
+    def test_expired_entry_is_miss(self):
+        """Test an entry past its age is read again."""
+        cache = sector_adapter.TrackCacheLRU()
+        entry = self._entry(0)
+        entry.timestamp = 0.0
+        cache.put((0, 0), entry)
+
+        assert cache.get((0, 0)) is None
+        assert len(cache) == 0
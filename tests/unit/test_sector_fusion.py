@@ -0,0 +1,171 @@
+"""
+Unit tests for consensus fusion of CRC-failed sector copies.
+
+Tests bitwise voting, CRC-guided resolution of disputed bits, and fusion
+in the PLL decoder and the Greaseweazle codec adapter.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from floppy_formatter.hardware import SectorStatus
+from floppy_formatter.hardware.codec_adapter import CodecAdapter
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+from floppy_formatter.hardware.mfm_tables import crc16_ccitt, stored_crc_from_syndrome
+from floppy_formatter.hardware.pll_decoder import decode_flux_with_pll
+from floppy_formatter.hardware.sector_fusion import fuse_dam_copies, fuse_field_copies
+
+
+def _field(seed=0):
+    """A1 A1 A1 FB + random data + CRC."""
+    data = b'\xa1\xa1\xa1\xfb' + np.random.default_rng(seed).bytes(512)
+    crc = crc16_ccitt(data)
+    return data + bytes([crc >> 8, crc & 0xFF])
+
+
+def _flip(field, *positions):
+    """Flip bits of a field, MSB first."""
+    damaged = bytearray(field)
+    for position in positions:
+        damaged[position >> 3] ^= 0x80 >> (position & 7)
+    return bytes(damaged)
+
+
+def _dam_copy(field):
+    """A field as decoders keep it: (mark, data, syndrome)."""
+    return field[3], field[4:-2], crc16_ccitt(field)
+
+
+class TestFieldFusion:
+    """Test fusion of field copies."""
+
+    def test_majority_vote(self):
+        """Test three copies damaged in different places vote to the original."""
+        field = _field()
+        copies = [_flip(field, 100, 900, 2000), _flip(field, 300, 3000, 3001),
+                  _flip(field, 50, 1234, 4000)]
+
+        assert fuse_field_copies(copies) == (field, 0)
+
+    def test_two_copies_resolved_by_crc(self):
+        """Test disagreements between two copies are settled against the CRC."""
+        field = _field()
+        copies = [_flip(field, 100, 900, 2000), _flip(field, 300, 3000, 3001, 4100)]
+
+        fused, flipped = fuse_field_copies(copies)
+
+        assert fused == field
+        assert flipped == 3
+
+    def test_shared_damage_not_fused(self):
+        """Test damage common to every copy cannot be voted away."""
+        field = _field()
+        copies = [_flip(field, 100, 700), _flip(field, 100, 2500)]
+
+        assert fuse_field_copies(copies) is None
+
+    def test_too_many_disputed_bits_not_fused(self):
+        """Test copies disagreeing in more places than can be searched give no fusion."""
+        field = _field()
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            positions = rng.choice(np.arange(32, len(field) * 8), size=16, replace=False)
+            copies = [_flip(field, *positions[:8]), _flip(field, *positions[8:])]
+
+            assert fuse_field_copies(copies) is None
+
+    def test_flip_budget(self):
+        """Test a combination flipping more bits than allowed is rejected."""
+        field = _field()
+        copies = [_flip(field, 100, 900, 2000), _flip(field, 300, 3000, 3001, 4100)]
+
+        assert fuse_field_copies(copies, max_flipped=2) is None
+
+    def test_needs_two_copies(self):
+        """Test a single copy or mismatched lengths give no fusion."""
+        field = _field()
+
+        assert fuse_field_copies([_flip(field, 100)]) is None
+        assert fuse_field_copies([_flip(field, 100), field[:-1]]) is None
+
+    def test_dam_copies(self):
+        """Test copies given as data and syndrome fuse to the original data."""
+        field = _field()
+        copies = [_dam_copy(_flip(field, 40, 999)), _dam_copy(_flip(field, 1500, 1501, 4000))]
+
+        fused, _ = fuse_dam_copies(copies)
+
+        assert fused == field[4:-2]
+
+    def test_stored_crc_from_syndrome(self):
+        """Test the on-disk CRC is recovered from data and syndrome."""
+        field = _flip(_field(), 200)
+
+        assert stored_crc_from_syndrome(field[:-2], crc16_ccitt(field)) == \
+            int.from_bytes(field[-2:], 'big')
+
+
+class TestDecoderFusion:
+    """Test fusion in the track decoders."""
+
+    def test_pll_decoder_fuses_revolutions(self):
+        """Test a sector failing CRC in every revolution is fused from them."""
+        sectors = create_pattern_track(2, 0, bytes(range(32)))
+        track = MFMEncoder(bit_cell_us=1.0).encode_track(2, 0, sectors).flux_array.astype(np.int64)
+
+        def damaged(start):
+            revolution = track.copy()
+            i = start
+            for _ in range(4):
+                while not (revolution[i] == 144 and revolution[i + 1] == 288):
+                    i += 1
+                revolution[i] += 72
+                revolution[i + 1] -= 72
+                i += 150
+            return revolution
+
+        revs = [damaged(20000), damaged(20500)]
+        flux = FluxData(
+            flux_times=np.concatenate(revs),
+            index_positions=[0, int(revs[0].sum()), int(revs[0].sum() + revs[1].sum())],
+            cylinder=2, head=0
+        )
+
+        decoded = decode_flux_with_pll(flux, bit_cell_us=1.0)
+
+        fused = [s for s in decoded if s.status == SectorStatus.CORRECTED]
+        assert len(fused) == 1
+        assert not fused[0].crc_valid
+        assert fused[0].data == sectors[fused[0].sector - 1].data
+        assert fused[0].corrected_bits > 0
+
+    def test_codec_adapter_fuses_raw_copies(self):
+        """Test the adapter fuses failed copies kept by the raw decode."""
+        field = _field()
+        idam = SimpleNamespace(c=0, h=0, r=1, n=2, crc=0)
+
+        def raw_sector(damaged):
+            mark, data, syndrome = _dam_copy(damaged)
+            return SimpleNamespace(idam=idam, crc=syndrome,
+                                   dam=SimpleNamespace(mark=mark, data=data, crc=syndrome))
+
+        placeholder = SimpleNamespace(
+            idam=SimpleNamespace(c=0, h=0, r=1, n=2, crc=0xFFFF), crc=0xFFFF,
+            dam=SimpleNamespace(mark=0xFB, data=bytes(512), crc=0xFFFF)
+        )
+        track = SimpleNamespace(
+            nsec=1, sectors=[placeholder],
+            raw=SimpleNamespace(sectors=[raw_sector(_flip(field, 100, 900)),
+                                         raw_sector(_flip(field, 2000, 3000, 3001))]),
+            get_img_track=lambda: None,
+        )
+        adapter = CodecAdapter.__new__(CodecAdapter)
+        adapter._session = SimpleNamespace(sectors_per_track=1, bytes_per_sector=512)
+
+        sector, = adapter._extract_sectors(track, 0, 0)
+
+        assert sector.status == SectorStatus.CORRECTED
+        assert not sector.crc_valid
+        assert sector.data == field[4:-2]
@@ -0,0 +1,65 @@
+"""
+Unit tests for signal quality analysis.
+
+Tests weak bit detection across multiple captures.
+"""
+
+import statistics
+
+import numpy as np
+
+from floppy_formatter.analysis.flux_analyzer import FluxCapture
+from floppy_formatter.analysis.signal_quality import WeakBitType, detect_weak_bits
+
+
+def _captures(count=8, length=1000, weak_positions=(), seed=0):
+    """Jittered captures of one track with unstable transitions."""
+    rng = np.random.default_rng(seed)
+    track = rng.choice([288, 432, 576], length)
+    captures = []
+    for _ in range(count):
+        timings = track + rng.integers(-10, 10, length)
+        for pos in weak_positions:
+            timings[pos] = rng.integers(100, 900)
+        captures.append(FluxCapture(raw_timings=timings.tolist(), sample_rate=72_000_000,
+                                    cylinder=3, head=1))
+    return captures
+
+
+class TestWeakBitDetection:
+    """Test column-wise weak bit detection."""
+
+    def test_flags_unstable_positions(self):
+        """Test unstable transitions are found with per-position statistics."""
+        captures = _captures(weak_positions=(10, 500, 990))
+
+        weak_bits = detect_weak_bits(captures)
+
+        assert sorted(wb.flux_index for wb in weak_bits) == [10, 500, 990]
+        variances = [wb.variance for wb in weak_bits]
+        assert variances == sorted(variances, reverse=True)
+
+        wb = next(wb for wb in weak_bits if wb.flux_index == 500)
+        column = [c.get_timings_microseconds()[500] for c in captures]
+        assert np.isclose(wb.variance, statistics.stdev(column) / statistics.mean(column))
+        assert np.isclose(wb.timing_spread_ns, (max(column) - min(column)) * 1000)
+        assert wb.sample_count == 8
+        assert (wb.cylinder, wb.head) == (3, 1)
+
+        positions = np.cumsum(np.mean([c.get_timings_microseconds() for c in captures], axis=0))
+        assert np.isclose(wb.position_us, positions[500])
+
+        splice = next(wb for wb in weak_bits if wb.flux_index == 10)
+        assert splice.weak_type == WeakBitType.WRITE_SPLICE
+
+    def test_uses_shortest_capture(self):
+        """Test captures of different lengths are compared up to the shortest."""
+        captures = _captures(weak_positions=(900,))
+        captures[0] = FluxCapture(raw_timings=captures[0].raw_timings[:800],
+                                  sample_rate=72_000_000)
+
+        assert detect_weak_bits(captures) == []
+
+    def test_needs_two_captures(self):
+        """Test a single capture yields no weak bits."""
+        assert detect_weak_bits(_captures(count=1, weak_positions=(5,))) == []
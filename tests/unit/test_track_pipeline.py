@@ -0,0 +1,191 @@
+"""
+Unit tests for the capture/decode track pipeline.
+
+Tests that capture overlaps processing, outcomes arrive in track order
+with errors attached to their track, capture stays a bounded distance
+ahead, and the scan worker reports tracks through the pipeline as it did
+sequentially.
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from floppy_formatter.core.geometry import DiskGeometry
+from floppy_formatter.gui.workers.scan_worker import ScanWorker
+from floppy_formatter.gui.workers.track_pipeline import TrackPipeline
+from floppy_formatter.hardware.codec_adapter import _suppress_stdout
+from floppy_formatter.hardware.flux_io import FluxData
+from floppy_formatter.hardware.mfm_codec import MFMEncoder, create_pattern_track
+
+TRACKS = [(cyl, head) for cyl in range(4) for head in range(2)]
+
+
+class TestTrackPipeline:
+    """Test ordering, overlap and error handling."""
+
+    def test_outcomes_in_track_order(self):
+        """Test outcomes follow track order however long processing takes."""
+        def process(cyl, head, data):
+            time.sleep(0.02 if head == 0 else 0.0)
+            return data * 10
+
+        pipeline = TrackPipeline(lambda cyl, head: cyl * 2 + head, process, workers=2)
+
+        outcomes = list(pipeline.run(TRACKS))
+
+        assert [(o.cylinder, o.head) for o in outcomes] == TRACKS
+        assert [o.unwrap() for o in outcomes] == [t * 10 for t in range(len(TRACKS))]
+        assert all(o.capture_seconds >= 0 and o.process_seconds >= 0 for o in outcomes)
+
+    def test_capture_overlaps_processing(self):
+        """Test the next track is captured while the previous one is processed."""
+        second_captured = threading.Event()
+
+        def capture(cyl, head):
+            if (cyl, head) == (0, 1):
+                second_captured.set()
+            return None
+
+        def process(cyl, head, data):
+            if (cyl, head) == (0, 0):
+                # Only returns if capture carried on without us
+                assert second_captured.wait(timeout=2.0)
+            return True
+
+        pipeline = TrackPipeline(capture, process)
+
+        assert all(o.unwrap() for o in pipeline.run(TRACKS[:3]))
+
+    def test_errors_stay_with_their_track(self):
+        """Test failed captures and processing do not stop later tracks."""
+        def capture(cyl, head):
+            if (cyl, head) == (1, 0):
+                raise IOError("no index")
+            return cyl
+
+        def process(cyl, head, data):
+            if (cyl, head) == (2, 1):
+                raise ValueError("bad flux")
+            return data
+
+        outcomes = {(o.cylinder, o.head): o for o in TrackPipeline(capture, process).run(TRACKS)}
+
+        assert len(outcomes) == len(TRACKS)
+        assert isinstance(outcomes[(1, 0)].error, IOError)
+        with pytest.raises(ValueError):
+            outcomes[(2, 1)].unwrap()
+        assert outcomes[(3, 1)].unwrap() == 3
+
+    def test_capture_bounded_ahead(self):
+        """Test capture waits for delivery instead of running ahead."""
+        captured = []
+        pipeline = TrackPipeline(lambda cyl, head: captured.append((cyl, head)),
+                                 lambda cyl, head, data: data, depth=2)
+
+        outcomes = pipeline.run(TRACKS)
+        next(outcomes)
+        time.sleep(0.2)
+        ahead = len(captured)
+        outcomes.close()
+
+        # Two queued for processing, two captured and waiting, one delivered
+        assert ahead <= 1 + 2 * 2
+
+    def test_cancel_stops_capture(self):
+        """Test no track is captured after cancellation."""
+        cancelled = threading.Event()
+        captured = []
+
+        def capture(cyl, head):
+            captured.append((cyl, head))
+            if len(captured) == 2:
+                cancelled.set()
+
+        pipeline = TrackPipeline(capture, lambda cyl, head, data: None,
+                                 is_cancelled=cancelled.is_set)
+
+        assert len(list(pipeline.run(TRACKS))) == 2
+        assert captured == TRACKS[:2]
+
+
+class _FakeDevice:
+    """Device returning an encoded track and recording the reading thread."""
+
+    selected_drive = 0
+
+    def __init__(self):
+        self.threads = set()
+
+    def is_motor_on(self):
+        return True
+
+    def motor_on(self):
+        pass
+
+    def seek(self, cylinder, head):
+        self.threads.add(threading.current_thread().name)
+
+    def read_track(self, cylinder, head, revolutions):
+        sectors = create_pattern_track(cylinder, head, bytes(range(32)))
+        track = MFMEncoder().encode_track(cylinder, head, sectors).flux_array
+        return FluxData(
+            flux_times=np.concatenate([track, track[:len(track) // 5]]),
+            index_positions=[0, int(track.sum())],
+            cylinder=cylinder, head=head,
+        )
+
+
+class TestScanWorkerPipeline:
+    """Test the scan worker through the pipeline."""
+
+    def test_scan_reports_tracks_in_order(self, monkeypatch):
+        """Test every track is reported in order with all sectors good."""
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        geometry = DiskGeometry(media_type=0x0F, cylinders=3, heads=2,
+                                sectors_per_track=18, bytes_per_sector=512)
+        device = _FakeDevice()
+        worker = ScanWorker(device, geometry=geometry)
+
+        scanned = []
+        results = []
+        worker.track_scanned.connect(lambda cyl, head, result: scanned.append((cyl, head)))
+        worker.scan_complete.connect(results.append)
+        worker.run()
+
+        assert scanned == [(cyl, head) for cyl in range(3) for head in range(2)]
+        assert len(results[0].good_sectors) == 3 * 2 * 18
+        assert results[0].bad_sectors == []
+        assert device.threads == {"track-capture"}
+
+
+class TestSuppressStdout:
+    """Test stdout suppression from concurrent decodes."""
+
+    def test_overlapping_threads_restore_stdout(self):
+        """Test stdout is restored when suppressions overlap across threads."""
+        original = sys.stdout
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+
+        def first():
+            with _suppress_stdout():
+                first_entered.set()
+                second_entered.wait(timeout=2.0)
+
+        def second():
+            first_entered.wait(timeout=2.0)
+            with _suppress_stdout():
+                second_entered.set()
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sys.stdout is original
@@ -0,0 +1,82 @@
+"""
+Unit tests for seek-aware track ordering.
+
+Tests step counting, elevator ordering from the head position, both
+heads per cylinder before stepping, and sweeps that alternate direction
+across passes.
+"""
+
+from types import SimpleNamespace
+
+from floppy_formatter.hardware.track_scheduler import TrackScheduler, count_steps
+
+
+class TestCountSteps:
+    """Test step counting."""
+
+    def test_counts_cylinder_distance(self):
+        """Test steps are the cylinder distance travelled, heads free."""
+        tracks = [(0, 0), (0, 1), (5, 0), (2, 1)]
+
+        assert count_steps(tracks) == 8
+        assert count_steps(tracks, start_cylinder=5) == 13
+
+
+class TestTrackScheduler:
+    """Test track ordering."""
+
+    def test_nearer_end_first(self):
+        """Test the sweep goes first towards the end that costs fewer steps."""
+        scheduler = TrackScheduler(start_cylinder=30)
+        tracks = [(10, 0), (35, 1), (35, 0), (80, 0), (29, 1)]
+
+        ordered = scheduler.order(tracks)
+
+        assert ordered == [(29, 1), (10, 0), (35, 0), (35, 1), (80, 0)]
+        assert scheduler.total_steps == 90
+        assert count_steps([(35, 0), (35, 1), (80, 0), (29, 1), (10, 0)], 30) == 120
+
+    def test_both_heads_before_stepping(self):
+        """Test every head of a cylinder is visited before the next cylinder."""
+        ordered = TrackScheduler().sweep([3, 1, 2], heads=2)
+
+        assert ordered == [(1, 0), (1, 1), (2, 0), (2, 1), (3, 0), (3, 1)]
+
+    def test_serpentine_across_passes(self):
+        """Test a second pass sweeps back from where the first ended."""
+        scheduler = TrackScheduler()
+
+        first = scheduler.sweep(range(80), heads=2)
+        second = scheduler.sweep(range(80), heads=2)
+
+        assert first[0] == (0, 0) and first[-1] == (79, 1)
+        assert second[0] == (79, 0) and second[-1] == (0, 1)
+        assert scheduler.total_steps == 79 * 2
+        assert not scheduler.ascending
+
+    def test_starts_from_device_position(self):
+        """Test the device's current cylinder is the starting point."""
+        device = SimpleNamespace(current_cylinder=60)
+        scheduler = TrackScheduler(device)
+
+        ordered = scheduler.order([(10, 0), (70, 0), (65, 1)])
+
+        assert ordered == [(65, 1), (70, 0), (10, 0)]
+        assert scheduler.total_steps == 70
+
+    def test_orders_dict_items(self):
+        """Test items of a dict keyed by track are ordered by their track."""
+        groups = {(40, 1): [1441], (2, 0): [72], (40, 0): [1440]}
+
+        ordered = TrackScheduler(start_cylinder=50).order(groups.items())
+
+        assert [track for track, _ in ordered] == [(40, 0), (40, 1), (2, 0)]
+        assert ordered[0][1] == [1440]
+
+    def test_unknown_device_position(self):
+        """Test a device without a known position falls back to the last sweep."""
+        device = SimpleNamespace(current_cylinder=None)
+        scheduler = TrackScheduler(device, start_cylinder=79)
+
+        assert scheduler.order([(0, 0), (79, 0)]) == [(79, 0), (0, 0)]
+        assert scheduler.position == 0